@@ -8,7 +8,10 @@
 
 import os
 import sys
+import queue
 import logging
+import threading
+import collections
 from . import version, config, option, output, extractor, job, util, exception
 
 __author__ = "Mike Fährmann"
@@ -135,6 +138,9 @@ def main():
         if separator := config.get((), "format-separator"):
             from . import formatter
             formatter._SEPARATOR = separator
+        if config.get((), "format-compile"):
+            from . import formatter
+            formatter._FORMATTERS["S"] = formatter.CompiledStringFormatter
 
         # eval globals
         if path := config.get((), "globals"):
@@ -317,6 +323,24 @@ Entries:
             else:
                 extractor._module_iter = iter(modules[0])
 
+        if catmap := config.interpolate(("extractor",), "category-map"):
+            if catmap == "compat":
+                catmap = {
+                    "coomer"       : "coomerparty",
+                    "kemono"       : "kemonoparty",
+                    "turbo"        : "saint",
+                    "naver-blog"   : "naver",
+                    "naver-chzzk"  : "chzzk",
+                    "naver-webtoon": "naverwebtoon",
+                    "pixiv-novel"  : "pixiv",
+                    "pixiv-novel:novel"   : ("pixiv", "novel"),
+                    "pixiv-novel:user"    : ("pixiv", "novel-user"),
+                    "pixiv-novel:series"  : ("pixiv", "novel-series"),
+                    "pixiv-novel:bookmark": ("pixiv", "novel-bookmark"),
+                }
+            from .extractor import common
+            common.CATEGORY_MAP = catmap
+
         if args.list_modules:
             extractor.modules.append("")
             sys.stdout.write("\n".join(extractor.modules))
@@ -340,6 +364,10 @@ Entries:
                     extr.example,
                 ))
 
+        elif args.serve:
+            from . import server
+            return server.serve(args.serve, args.jobtype)
+
         else:
             if input_files := config.get((), "input-files"):
                 for input_file in input_files:
@@ -401,25 +429,10 @@ Entries:
                     args.loglevel < logging.ERROR:
                 input_manager.progress(pformat)
 
-            if catmap := config.interpolate(("extractor",), "category-map"):
-                if catmap == "compat":
-                    catmap = {
-                        "coomer"       : "coomerparty",
-                        "kemono"       : "kemonoparty",
-                        "turbo"        : "saint",
-                        "naver-blog"   : "naver",
-                        "naver-chzzk"  : "chzzk",
-                        "naver-webtoon": "naverwebtoon",
-                        "pixiv-novel"  : "pixiv",
-                        "pixiv-novel:novel"   : ("pixiv", "novel"),
-                        "pixiv-novel:user"    : ("pixiv", "novel-user"),
-                        "pixiv-novel:series"  : ("pixiv", "novel-series"),
-                        "pixiv-novel:bookmark": ("pixiv", "novel-bookmark"),
-                    }
-                from .extractor import common
-                common.CATEGORY_MAP = catmap
-
             # process input URLs
+            if args.jobs and args.jobs > 1 and len(input_manager.urls) > 1:
+                return JobScheduler(jobtype, input_manager, args.jobs).run()
+
             retval = 0
             for url in input_manager:
                 try:
@@ -428,7 +441,7 @@ Entries:
                     if isinstance(url, ExtendedUrl):
                         for opts in url.gconfig:
                             config.set(*opts)
-                        with config.apply(url.lconfig):
+                        with config.local(url.lconfig):
                             status = jobtype(url.value).run()
                     else:
                         status = jobtype(url).run()
@@ -604,28 +617,49 @@ class InputManager():
             pformat += "\n"
         self._pformat = pformat.format_map
 
+    def report(self, index, url):
+        if self._pformat:
+            output.stderr_write(self._pformat({
+                "total"  : len(self.urls),
+                "current": index + 1,
+                "url"    : url,
+            }))
+
     def next(self):
         self._index += 1
 
-    def success(self):
-        if self._item:
-            self._rewrite()
+    def current(self):
+        """Return (index, url, item) of the current input URL"""
+        return (self._index, self._url, self._item)
 
-    def error(self):
+    def entries(self):
+        """Yield (index, url, item) for all input URLs"""
+        for index, url in enumerate(self.urls):
+            if isinstance(url, tuple):
+                yield (index, url[0], url)
+            else:
+                yield (index, url, None)
+
+    def success(self, state=None):
+        if item := (state or self.current())[2]:
+            self._rewrite(item)
+
+    def error(self, state=None):
         if self.err:
-            if self._item:
-                url, path, action, indicies = self._item
+            _, url, item = state or self.current()
+            if item:
+                url, path, action, indicies = item
                 lines = self.files[path]
                 out = "".join(lines[i] for i in indicies)
                 if out and out[-1] == "\n":
                     out = out[:-1]
-                self._rewrite()
+                self._rewrite(item)
             else:
-                out = str(self._url)
+                out = str(url)
             self.err.info(out)
 
-    def _rewrite(self):
-        url, path, action, indicies = self._item
+    def _rewrite(self, item):
+        url, path, action, indicies = item
         path_tmp = path + ".tmp"
         lines = self.files[path]
         action(lines, indicies)
@@ -664,15 +698,145 @@ class InputManager():
             self._item = None
         self._url = url
 
-        if self._pformat:
-            output.stderr_write(self._pformat({
-                "total"  : len(self.urls),
-                "current": self._index + 1,
-                "url"    : url,
-            }))
+        self.report(self._index, url)
         return url
 
 
+class JobScheduler():
+    """Run jobs for multiple input URLs concurrently"""
+
+    def __init__(self, jobtype, input_manager, workers):
+        self.log = logging.getLogger("gallery-dl")
+        self.jobtype = jobtype
+        self.input_manager = input_manager
+        self.workers = workers
+        self.results = queue.Queue()
+        self.active = {}
+        self.limits = {}
+        self.threads = {}
+        self.retval = 0
+
+    def run(self):
+        try:
+            return self._schedule()
+        except KeyboardInterrupt:
+            self.abort()
+            raise
+
+    def abort(self):
+        """Terminate all running jobs and wait until they are finalized"""
+        if not self.threads:
+            return
+        self.log.info("Waiting for %s running job(s) to finish",
+                      len(self.threads))
+
+        for flags in self.threads.values():
+            flags.FILE = flags.POST = flags.CHILD = \
+                flags.DOWNLOAD = "terminate"
+        for thread in self.threads:
+            thread.join()
+        self.threads.clear()
+
+    def _schedule(self):
+        entries = self.input_manager.entries()
+        pending = collections.deque()
+        running = 0
+
+        while True:
+            while running < self.workers and (
+                    entry := self._next(pending, entries)):
+                self._start(*entry)
+                running += 1
+            if not running:
+                return self.retval
+
+            state, category, result = self.results.get()
+            self.active[category] -= 1
+            running -= 1
+
+            if isinstance(result, BaseException):
+                if isinstance(result, exception.RestartExtraction):
+                    self.log.debug("Restarting '%s'", state[1])
+                    if extr := self._find(state):
+                        pending.appendleft((state, extr))
+                elif not isinstance(result, exception.ControlException):
+                    raise result
+            elif result:
+                self.retval |= result
+                self.input_manager.error(state)
+            else:
+                self.input_manager.success(state)
+
+    def _next(self, pending, entries):
+        """Return the next entry whose category has a free job slot"""
+        for index, entry in enumerate(pending):
+            if self._available(entry[1].category):
+                del pending[index]
+                return entry
+
+        for state in entries:
+            if isinstance(url := state[1], ExtendedUrl):
+                for opts in url.gconfig:
+                    config.set(*opts)
+            if not (extr := self._find(state)):
+                continue
+            if self._available(extr.category):
+                return state, extr
+            pending.append((state, extr))
+
+        return None
+
+    def _find(self, state):
+        """Return an extractor instance for the URL in 'state'"""
+        url = state[1]
+        if isinstance(url, ExtendedUrl):
+            with config.local(url.lconfig):
+                extr = extractor.find(url.value)
+        else:
+            extr = extractor.find(url)
+
+        if not extr:
+            self.log.error("Unsupported URL '%s'", url)
+            self.retval |= 64
+            self.input_manager.error(state)
+        return extr
+
+    def _available(self, category):
+        """Return True if another job for 'category' may be started"""
+        if (limit := self.limits.get(category)) is None:
+            limit = self.limits[category] = config.interpolate(
+                ("extractor", category), "jobs-limit", 1)
+        return not limit or self.active.get(category, 0) < limit
+
+    def _start(self, state, extr):
+        self.active[extr.category] = self.active.get(extr.category, 0) + 1
+        self.input_manager.report(state[0], state[1])
+        self.threads = {t: f for t, f in self.threads.items()
+                        if t.is_alive()}
+        # separate flags for each job, so that 'flag' actions
+        # and 'abort()' only affect the job they are meant for
+        flags = util.Flags()
+        thread = threading.Thread(
+            target=self._run,
+            args=(state, extr, flags),
+            daemon=True,
+        )
+        self.threads[thread] = flags
+        thread.start()
+
+    def _run(self, state, extr, flags):
+        url = state[1]
+        util.FLAGS.use(flags)
+        try:
+            self.log.debug("Starting %s for '%s'", self.jobtype.__name__, url)
+            with config.local(url.lconfig if isinstance(
+                    url, ExtendedUrl) else None):
+                result = self.jobtype(extr).run()
+        except BaseException as exc:
+            result = exc
+        self.results.put((state, extr.category, result))
+
+
 class ExtendedUrl():
     """URL with attached config key-value pairs"""
     __slots__ = ("value", "gconfig", "lconfig")
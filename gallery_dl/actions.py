@@ -238,7 +238,7 @@ def action_flag(opts):
         value = value.lower()
 
     def _flag(args):
-        util.FLAGS.__dict__[flag] = value
+        setattr(util.FLAGS, flag, value)
     return _flag, None
 
 
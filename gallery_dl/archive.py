@@ -9,20 +9,28 @@
 """Download Archives"""
 
 import os
+import math
+import time
+import hashlib
 import logging
+import threading
 from . import util, formatter
 
 log = logging.getLogger("archive")
 
 
-def connect(path, prefix, format,
-            table=None, mode=None, pragma=None, pathfmt=None, cache_key=None):
+def connect(path, prefix, format, table=None, mode=None, pragma=None,
+            pathfmt=None, cache_key=None, bloom=None, batch=None):
     keygen = formatter.parse(prefix + format).format_map
 
     if isinstance(path, str) and path.startswith(
             ("postgres://", "postgresql://")):
-        cls = (DownloadArchivePostgresqlMemory if mode == "memory" else
-               DownloadArchivePostgresql)
+        if mode == "memory":
+            cls = DownloadArchivePostgresqlMemory
+        elif mode == "batch":
+            cls = DownloadArchivePostgresqlBatch
+        else:
+            cls = DownloadArchivePostgresql
     else:
         if isinstance(path, list):
             path = pathfmt.generate_path(path)
@@ -32,12 +40,23 @@ def connect(path, prefix, format,
                           "no longer supported. Use a list of strings "
                           "instead.")
             path = util.expand_path(path)
-        cls = DownloadArchiveMemory if mode == "memory" else DownloadArchive
+        if mode == "memory":
+            cls = DownloadArchiveMemory
+        elif mode == "batch":
+            cls = DownloadArchiveBatch
+        else:
+            cls = DownloadArchive
 
     if pathfmt is not None and table:
         table = formatter.parse(table).format_map(pathfmt.kwdict)
 
-    return cls(path, keygen, table, pragma, cache_key)
+    archive = cls(path, keygen, table, pragma, cache_key)
+    if mode == "batch" and batch:
+        archive._batch_size, archive._batch_interval = batch
+    if bloom:
+        archive = DownloadArchiveBloom(
+            archive, 0.001 if bloom is True else bloom)
+    return archive
 
 
 def sanitize(name):
@@ -65,6 +84,7 @@ class DownloadArchive():
         self.close = con.close
         self.cursor = cursor = con.cursor()
         self._cache_key = cache_key or "_archive_key"
+        self._prefetched = Prefetched()
 
         table = "archive" if table is None else sanitize(table)
         self._stmt_select = (
@@ -72,6 +92,12 @@ class DownloadArchive():
             f"FROM {table} "
             f"WHERE entry=? "
             f"LIMIT 1")
+        self._stmt_select_many = (
+            f"SELECT entry "
+            f"FROM {table} "
+            f"WHERE entry IN ")
+        self._stmt_count = f"SELECT count(*) FROM {table}"
+        self._stmt_entries = f"SELECT entry FROM {table}"
         self._stmt_insert = (
             f"INSERT OR IGNORE INTO {table} "
             f"(entry) VALUES (?)")
@@ -91,14 +117,72 @@ class DownloadArchive():
     def add(self, kwdict):
         """Add item described by 'kwdict' to archive"""
         key = kwdict.get(self._cache_key) or self.keygen(kwdict)
+        self._prefetched.add(key)
         self.cursor.execute(self._stmt_insert, (key,))
 
     def check(self, kwdict):
         """Return True if the item described by 'kwdict' exists in archive"""
         key = kwdict[self._cache_key] = self.keygen(kwdict)
+        if self._prefetched and \
+                (result := self._prefetched.pop(key)) is not None:
+            return result
         self.cursor.execute(self._stmt_select, (key,))
         return self.cursor.fetchone()
 
+    def check_many(self, kwdicts):
+        """Check all items described by 'kwdicts' in as few queries as possible
+
+        Return a list of bools in the same order as 'kwdicts'
+        and remember results for subsequent check() calls.
+        """
+        keys = self._keys(kwdicts)
+        found = self._select_many(set(keys))
+        return self._prefetch(keys, found)
+
+    def _keys(self, kwdicts):
+        keygen = self.keygen
+        cache_key = self._cache_key
+        keys = []
+        for kwdict in kwdicts:
+            key = kwdict[cache_key] = keygen(kwdict)
+            keys.append(key)
+        return keys
+
+    def _prefetch(self, keys, found):
+        if found is None:
+            return [False] * len(keys)
+        results = [key in found for key in keys]
+        self._prefetched.update(keys, results)
+        return results
+
+    def _select_many(self, keys, chunk_size=500):
+        # stay below SQLITE_MAX_VARIABLE_NUMBER (999 before SQLite 3.32)
+        found = set()
+        keys = list(keys)
+        # use a separate cursor, since this might get called
+        # from an extractor's 'prefetch' thread
+        cursor = self.connection.cursor()
+        for i in range(0, len(keys), chunk_size):
+            chunk = keys[i:i+chunk_size]
+            cursor.execute(f"{self._stmt_select_many}"
+                           f"({','.join('?' * len(chunk))})", chunk)
+            found.update(row[0] for row in cursor)
+        cursor.close()
+        return found
+
+    def count(self):
+        """Return the number of archive entries"""
+        self.cursor.execute(self._stmt_count)
+        return self.cursor.fetchone()[0]
+
+    def entries(self):
+        """Iterate over all archive entries"""
+        cursor = self.connection.cursor()
+        cursor.execute(self._stmt_entries)
+        for row in cursor:
+            yield row[0]
+        cursor.close()
+
     def finalize(self):
         pass
 
@@ -111,17 +195,27 @@ class DownloadArchiveMemory(DownloadArchive):
         self.keys = set()
 
     def add(self, kwdict):
-        self.keys.add(
-            kwdict.get(self._cache_key) or
-            self.keygen(kwdict))
+        key = kwdict.get(self._cache_key) or self.keygen(kwdict)
+        self._prefetched.add(key)
+        self.keys.add(key)
 
     def check(self, kwdict):
         key = kwdict[self._cache_key] = self.keygen(kwdict)
+        if self._prefetched and \
+                (result := self._prefetched.pop(key)) is not None:
+            return result
         if key in self.keys:
             return True
         self.cursor.execute(self._stmt_select, (key,))
         return self.cursor.fetchone()
 
+    def check_many(self, kwdicts):
+        keys = self._keys(kwdicts)
+        if (found := self._select_many(
+                set(keys).difference(self.keys))) is not None:
+            found.update(self.keys.intersection(keys))
+        return self._prefetch(keys, found)
+
     def finalize(self):
         if not self.keys:
             return
@@ -141,6 +235,42 @@ class DownloadArchiveMemory(DownloadArchive):
                 cursor.executemany(stmt, ((key,) for key in self.keys))
 
 
+class DownloadArchiveBatch(DownloadArchiveMemory):
+    """Write IDs in one transaction every N entries or T seconds"""
+    _batch_size = 100
+    _batch_interval = 10.0
+
+    def __init__(self, path, keygen, table=None, pragma=None, cache_key=None):
+        DownloadArchiveMemory.__init__(
+            self, path, keygen, table, pragma, cache_key)
+        self.close = self._close
+        self._flushed = time.monotonic()
+
+    def add(self, kwdict):
+        key = kwdict.get(self._cache_key) or self.keygen(kwdict)
+        self._prefetched.add(key)
+        self.keys.add(key)
+
+        if len(self.keys) >= self._batch_size or \
+                time.monotonic() - self._flushed >= self._batch_interval:
+            self.flush()
+
+    def flush(self):
+        """Write all buffered IDs to the archive database"""
+        self._write()
+        self.keys.clear()
+        self._flushed = time.monotonic()
+
+    def _close(self):
+        try:
+            self.flush()
+        finally:
+            self.connection.close()
+
+    finalize = flush
+    _write = DownloadArchiveMemory.finalize
+
+
 class DownloadArchivePostgresql():
     _psycopg = None
 
@@ -153,6 +283,7 @@ class DownloadArchivePostgresql():
         self.close = con.close
         self.keygen = keygen
         self._cache_key = cache_key or "_archive_key"
+        self._prefetched = Prefetched()
 
         table = "archive" if table is None else sanitize(table)
         self._stmt_select = (
@@ -160,6 +291,12 @@ class DownloadArchivePostgresql():
             f"FROM {table} "
             f"WHERE entry=%s "
             f"LIMIT 1")
+        self._stmt_select_many = (
+            f"SELECT entry "
+            f"FROM {table} "
+            f"WHERE entry = ANY(%s)")
+        self._stmt_count = f"SELECT count(*) FROM {table}"
+        self._stmt_entries = f"SELECT entry FROM {table}"
         self._stmt_insert = (
             f"INSERT INTO {table} (entry) "
             f"VALUES (%s) "
@@ -177,6 +314,7 @@ class DownloadArchivePostgresql():
 
     def add(self, kwdict):
         key = kwdict.get(self._cache_key) or self.keygen(kwdict)
+        self._prefetched.add(key)
         try:
             self.cursor.execute(self._stmt_insert, (key,))
             self.connection.commit()
@@ -187,6 +325,9 @@ class DownloadArchivePostgresql():
 
     def check(self, kwdict):
         key = kwdict[self._cache_key] = self.keygen(kwdict)
+        if self._prefetched and \
+                (result := self._prefetched.pop(key)) is not None:
+            return result
         try:
             self.cursor.execute(self._stmt_select, (key,))
             return self.cursor.fetchone()
@@ -196,6 +337,35 @@ class DownloadArchivePostgresql():
             self.connection.rollback()
             return False
 
+    check_many = DownloadArchive.check_many
+    _keys = DownloadArchive._keys
+    _prefetch = DownloadArchive._prefetch
+
+    def _select_many(self, keys):
+        if not keys:
+            return set()
+        try:
+            with self.connection.cursor() as cursor:
+                cursor.execute(self._stmt_select_many, (list(keys),))
+                return {row[0] for row in cursor}
+        except Exception as exc:
+            log.error("%s: %s when checking entries: %s",
+                      self.connection, exc.__class__.__name__, exc)
+            self.connection.rollback()
+
+    def count(self):
+        with self.connection.cursor() as cursor:
+            cursor.execute(self._stmt_count)
+            return cursor.fetchone()[0]
+
+    def entries(self):
+        # server-side cursor to avoid loading all rows at once
+        with self.connection.cursor("gallery_dl_archive") as cursor:
+            cursor.execute(self._stmt_entries)
+            for row in cursor:
+                yield row[0]
+        self.connection.commit()
+
     def finalize(self):
         pass
 
@@ -208,12 +378,15 @@ class DownloadArchivePostgresqlMemory(DownloadArchivePostgresql):
         self.keys = set()
 
     def add(self, kwdict):
-        self.keys.add(
-            kwdict.get(self._cache_key) or
-            self.keygen(kwdict))
+        key = kwdict.get(self._cache_key) or self.keygen(kwdict)
+        self._prefetched.add(key)
+        self.keys.add(key)
 
     def check(self, kwdict):
         key = kwdict[self._cache_key] = self.keygen(kwdict)
+        if self._prefetched and \
+                (result := self._prefetched.pop(key)) is not None:
+            return result
         if key in self.keys:
             return True
         try:
@@ -225,6 +398,8 @@ class DownloadArchivePostgresqlMemory(DownloadArchivePostgresql):
             self.connection.rollback()
             return False
 
+    check_many = DownloadArchiveMemory.check_many
+
     def finalize(self):
         if not self.keys:
             return
@@ -237,3 +412,172 @@ class DownloadArchivePostgresqlMemory(DownloadArchivePostgresql):
             log.error("%s: %s when writing entries: %s",
                       self.connection, exc.__class__.__name__, exc)
             self.connection.rollback()
+
+
+class DownloadArchivePostgresqlBatch(DownloadArchivePostgresqlMemory):
+    _batch_size = DownloadArchiveBatch._batch_size
+    _batch_interval = DownloadArchiveBatch._batch_interval
+
+    def __init__(self, path, keygen, table=None, pragma=None, cache_key=None):
+        DownloadArchivePostgresqlMemory.__init__(
+            self, path, keygen, table, pragma, cache_key)
+        self.close = self._close
+        self._flushed = time.monotonic()
+
+    add = DownloadArchiveBatch.add
+    flush = DownloadArchiveBatch.flush
+    _close = DownloadArchiveBatch._close
+
+    finalize = flush
+    _write = DownloadArchivePostgresqlMemory.finalize
+
+
+class DownloadArchiveBloom():
+    """Bloom filter in front of a download archive
+
+    Keys not in the filter definitely do not exist in the archive
+    and can be answered without a database query.
+    """
+
+    def __init__(self, archive, error_rate=0.001):
+        self.archive = archive
+        self.keygen = archive.keygen
+        self.close = archive.close
+        self._cache_key = archive._cache_key
+
+        time_start = time.monotonic()
+        num = archive.count()
+        self.bloom = bloom = BloomFilter(
+            int(num * 1.25) + 1024, error_rate)
+        add = bloom.add
+        for key in archive.entries():
+            add(key)
+
+        log.debug("Loaded %s archive entries into Bloom filter "
+                  "(%s, %.2fs, %.4f%% false positive rate)",
+                  num, util.format_value(len(bloom.bits)) + "B",
+                  time.monotonic() - time_start, bloom.error_rate() * 100)
+
+    def add(self, kwdict):
+        self.bloom.add(
+            kwdict.get(self._cache_key) or self.keygen(kwdict))
+        self.archive.add(kwdict)
+
+    def check(self, kwdict):
+        key = kwdict[self._cache_key] = self.keygen(kwdict)
+        if key not in self.bloom:
+            return False
+        return self.archive.check(kwdict)
+
+    def check_many(self, kwdicts):
+        bloom = self.bloom
+        keygen = self.keygen
+        cache_key = self._cache_key
+
+        maybe = []
+        results = []
+        for kwdict in kwdicts:
+            key = kwdict[cache_key] = keygen(kwdict)
+            if key in bloom:
+                maybe.append(kwdict)
+                results.append(None)
+            else:
+                results.append(False)
+
+        if maybe:
+            found = iter(self.archive.check_many(maybe))
+            results = [next(found) if result is None else result
+                       for result in results]
+        return results
+
+    def finalize(self):
+        self.archive.finalize()
+
+
+class Prefetched():
+    """Results of 'check_many()' calls waiting for their 'check()'
+
+    Keep at most 'maxsize' entries and drop the oldest ones beyond that,
+    since not every prefetched key gets checked afterwards,
+    e.g. files skipped by 'image-filter' or 'image-range'.
+
+    Keys added to the archive while a 'check_many()' query was running
+    on another thread are remembered as well, so its (now stale)
+    results cannot bring them back as not-found.
+    """
+
+    def __init__(self, maxsize=10000):
+        self.maxsize = maxsize
+        self.results = {}
+        self.added = {}
+        self.lock = threading.Lock()
+
+    def __bool__(self):
+        return True if self.results else False
+
+    def __len__(self):
+        return len(self.results)
+
+    def pop(self, key, default=None):
+        with self.lock:
+            return self.results.pop(key, default)
+
+    def add(self, key):
+        with self.lock:
+            self.results.pop(key, None)
+            added = self.added
+            added.pop(key, None)
+            added[key] = True
+            if len(added) > self.maxsize:
+                del added[next(iter(added))]
+
+    def update(self, keys, values):
+        with self.lock:
+            results = self.results
+            added = self.added
+            for key, value in zip(keys, values):
+                # move already known keys to the end
+                results.pop(key, None)
+                results[key] = value or key in added
+
+            # never drop entries of the current window
+            if (excess := len(results) - max(self.maxsize, len(keys))) > 0:
+                for key in tuple(results)[:excess]:
+                    del results[key]
+
+
+class BloomFilter():
+    """Probabilistic set membership test with no false negatives"""
+
+    def __init__(self, capacity, error_rate=0.001):
+        self.size = size = max(int(
+            -capacity * math.log(error_rate) / (math.log(2) ** 2)), 64)
+        self.hashes = max(round(size / capacity * math.log(2)), 1)
+        self.bits = bytearray((size + 7) // 8)
+        self.count = 0
+
+    def __contains__(self, key):
+        bits = self.bits
+        for idx in self._indices(key):
+            if not bits[idx >> 3] & (1 << (idx & 7)):
+                return False
+        return True
+
+    def add(self, key):
+        bits = self.bits
+        for idx in self._indices(key):
+            bits[idx >> 3] |= 1 << (idx & 7)
+        self.count += 1
+
+    def error_rate(self):
+        """Return the expected false positive rate at the current fill"""
+        return (1.0 - math.exp(
+            -self.hashes * self.count / self.size)) ** self.hashes
+
+    def _indices(self, key):
+        # double hashing: h1 + i*h2 (Kirsch & Mitzenmacher)
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        size = self.size
+        return [(h1 + i * h2) % size for i in range(self.hashes)]
@@ -63,6 +63,14 @@ def path():
     return PATH
 
 
+def sibling(name):
+    """Return the path of file 'name' next to the cache database"""
+    path_ = path()
+    if not path_ or path_ == ":memory:":
+        return ":memory:"
+    return os.path.join(os.path.dirname(path_), name)
+
+
 def error(ret=1):
     log.error("No database connection (%s: %s)", ERR.__class__.__name__, ERR)
     return ret
@@ -11,6 +11,7 @@
 import sys
 import os.path
 import logging
+import threading
 from . import util
 
 log = logging.getLogger("config")
@@ -20,6 +21,7 @@ log = logging.getLogger("config")
 # internals
 
 _config = {}
+_local = threading.local()
 _files = []
 _type = "json"
 _load = util.json_loads
@@ -251,8 +253,34 @@ def clear():
     _config.clear()
 
 
-def get(path, key, default=None, conf=_config):
+def _root():
+    """Return the configuration dict of the current thread"""
+    return getattr(_local, "root", _config)
+
+
+def inherit():
+    """Return a function applying this thread's configuration to another
+
+    Pass it as 'initializer' to thread pools or call it at the start of
+    a thread to make 'local' options and the current job's 'util.FLAGS'
+    visible there.
+    """
+    root = getattr(_local, "root", None)
+    flags = util.FLAGS.get()
+    if root is None and flags is None:
+        return util.noop
+
+    def init():
+        if root is not None:
+            _local.root = root
+        util.FLAGS.use(flags)
+    return init
+
+
+def get(path, key, default=None, conf=None):
     """Get the value of property 'key' or a default value"""
+    if conf is None:
+        conf = _root()
     try:
         for p in path:
             conf = conf[p]
@@ -261,8 +289,10 @@ def get(path, key, default=None, conf=_config):
         return default
 
 
-def interpolate(path, key, default=None, conf=_config):
+def interpolate(path, key, default=None, conf=None):
     """Interpolate the value of 'key'"""
+    if conf is None:
+        conf = _root()
     if key in conf:
         return conf[key]
     try:
@@ -275,10 +305,12 @@ def interpolate(path, key, default=None, conf=_config):
     return default
 
 
-def interpolate_common(common, paths, key, default=None, conf=_config):
+def interpolate_common(common, paths, key, default=None, conf=None):
     """Interpolate the value of 'key'
     using multiple 'paths' along a 'common' ancestor
     """
+    if conf is None:
+        conf = _root()
     if key in conf:
         return conf[key]
 
@@ -307,8 +339,10 @@ def interpolate_common(common, paths, key, default=None, conf=_config):
     return default
 
 
-def accumulate(path, key, conf=_config):
+def accumulate(path, key, conf=None):
     """Accumulate the values of 'key' along 'path'"""
+    if conf is None:
+        conf = _root()
     result = []
     try:
         if key in conf:
@@ -330,8 +364,10 @@ def accumulate(path, key, conf=_config):
     return result
 
 
-def set(path, key, value, conf=_config):
+def set(path, key, value, conf=None):
     """Set the value of property 'key' for this session"""
+    if conf is None:
+        conf = _root()
     for p in path:
         try:
             conf = conf[p]
@@ -340,8 +376,10 @@ def set(path, key, value, conf=_config):
     conf[key] = value
 
 
-def setdefault(path, key, value, conf=_config):
+def setdefault(path, key, value, conf=None):
     """Set the value of property 'key' if it doesn't exist"""
+    if conf is None:
+        conf = _root()
     for p in path:
         try:
             conf = conf[p]
@@ -350,8 +388,10 @@ def setdefault(path, key, value, conf=_config):
     return conf.setdefault(key, value)
 
 
-def unset(path, key, conf=_config):
+def unset(path, key, conf=None):
     """Unset the value of property 'key'"""
+    if conf is None:
+        conf = _root()
     try:
         for p in path:
             conf = conf[p]
@@ -360,6 +400,45 @@ def unset(path, key, conf=_config):
         pass
 
 
+class local():
+    """Context Manager: apply key-value pairs for the current thread only
+
+    Other threads keep using the regular, global configuration.
+    """
+
+    def __init__(self, kvlist):
+        self.kvlist = kvlist
+        self.original = None
+
+    def __enter__(self):
+        self.original = root = _root()
+        if not self.kvlist:
+            return
+
+        # copy all dicts along each option path
+        root = root.copy()
+        copies = {id(root)}
+        for path, key, value in self.kvlist:
+            conf = root
+            for p in path:
+                sub = conf.get(p)
+                if not isinstance(sub, dict):
+                    conf[p] = sub = {}
+                    copies.add(id(sub))
+                elif id(sub) not in copies:
+                    conf[p] = sub = sub.copy()
+                    copies.add(id(sub))
+                conf = sub
+            conf[key] = value
+        _local.root = root
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.original is _config:
+            _local.__dict__.pop("root", None)
+        else:
+            _local.root = self.original
+
+
 class apply():
     """Context Manager: apply a collection of key-value pairs"""
 
@@ -10,7 +10,6 @@
 
 import os
 from .. import config, util
-_config = config._config
 
 
 class DownloaderBase():
@@ -51,8 +50,8 @@ class DownloaderBase():
         """Interpolate downloader config value for 'key'"""
         return config.interpolate(("downloader", self.scheme), key, default)
 
-    def config_opts(self, key, default=None, conf=_config):
-        if key in conf:
+    def config_opts(self, key, default=None):
+        if key in (conf := config._root()):
             return conf[key]
         value = self.opts.get(key, util.SENTINEL)
         if value is not util.SENTINEL:
@@ -8,8 +8,10 @@
 
 """Downloader module for http:// and https:// URLs"""
 
+import os
 import time
 import mimetypes
+import threading
 from requests.exceptions import RequestException, ConnectionError, Timeout
 from .common import DownloaderBase
 from .. import text, util, output, exception
@@ -40,6 +42,8 @@ class HttpDownloader(DownloaderBase):
         self.verify = self.config("verify", extractor._verify)
         self.mtime = self.config("mtime", True)
         self.rate = self.config("rate")
+        self.segments = self.config("segments", 1)
+        self.segments_min = self.config("segments-min", "10M")
         interval_429 = self.config("sleep-429")
 
         if self.config("consume-content", False):
@@ -82,6 +86,19 @@ class HttpDownloader(DownloaderBase):
             else:
                 self.log.warning("Invalid rate limit (%r)", self.rate)
                 self.rate = False
+        if self.segments and self.segments > 1:
+            if not hasattr(os, "pwrite"):
+                self.log.warning(
+                    "Segmented downloads are not supported on this platform")
+                self.segments = 0
+            elif self.rate:
+                self.log.warning(
+                    "Segmented downloads cannot be used with a rate limit")
+                self.segments = 0
+            elif isinstance(self.segments_min, str):
+                self.segments_min = text.parse_bytes(self.segments_min)
+        else:
+            self.segments = 0
         if self.progress is not None:
             self.receive = self._receive_rate
             if self.progress < 0.0:
@@ -120,6 +137,8 @@ class HttpDownloader(DownloaderBase):
             "_http_expected_status", ())
         adjust_extension = kwdict.get(
             "_http_adjust_extension", self.adjust_extension)
+        tees = kwdict.get("_http_tee")
+        sink = kwdict.get("_http_sink")
 
         if self.part and not metadata:
             pathfmt.part_enable(self.partdir)
@@ -318,6 +337,48 @@ class HttpDownloader(DownloaderBase):
                     response.close()
                     return True
 
+            # write content directly to a post processor's file object
+            if sink is not None and not offset and not file_size and \
+                    (fp := sink(pathfmt, size)) is not None:
+                self.downloading = True
+                try:
+                    msg = self._download_sink(
+                        fp, pathfmt, content, file_header, size, tees)
+                except exception.StopExtraction:
+                    response.close()
+                    return False
+                except exception.DownloadComplete:
+                    response.close()
+                    break
+                except exception.ControlException:
+                    response.close()
+                    raise
+                if msg:
+                    continue
+                break
+
+            # download in multiple segments over parallel connections
+            if self.segments and not offset and size and \
+                    size >= self.segments_min and \
+                    response.headers.get("Accept-Ranges") == "bytes" and \
+                    "_http_segmented" not in kwdict and \
+                    "_http_data" not in kwdict and \
+                    kwdict.get("_http_method", "GET") == "GET":
+                if tees:
+                    # segments get written out of order
+                    self.log.debug(
+                        "Segmented download; hashing its content "
+                        "requires reading the file afterwards")
+                    del kwdict["_http_tee"]
+                    tees = None
+                self.downloading = True
+                if msg := self._download_segments(
+                        pathfmt, response, content, file_header,
+                        size, headers):
+                    output.stderr_write("\n")
+                    continue
+                break
+
             # set open mode
             if not offset:
                 mode = "w+b"
@@ -344,7 +405,9 @@ class HttpDownloader(DownloaderBase):
 
                 self.out.start(pathfmt.path)
                 try:
-                    self.receive(fp, content, size, offset)
+                    self.receive(
+                        TeeWriter(fp, tees, offset, size) if tees else fp,
+                        content, size, offset)
                 except (RequestException, SSLError) as exc:
                     msg = str(exc)
                     output.stderr_write("\n")
@@ -352,6 +415,9 @@ class HttpDownloader(DownloaderBase):
                 except exception.StopExtraction:
                     response.close()
                     return False
+                except exception.DownloadComplete:
+                    response.close()
+                    break
                 except exception.ControlException:
                     response.close()
                     raise
@@ -393,6 +459,181 @@ class HttpDownloader(DownloaderBase):
                 "closing the connection anyway", exc.__class__.__name__, exc)
             response.close()
 
+    def _download_sink(self, fp, pathfmt, content, file_header, size, tees):
+        """Write response content to a '_http_sink' file object
+
+        Return an error message on failure.
+        """
+        try:
+            writer = TeeWriter(fp, tees, 0, size) if tees else fp
+            if file_header:
+                writer.write(file_header)
+            self.out.start(pathfmt.path)
+            self.receive(writer, content, size, fp.tell())
+        except (RequestException, SSLError) as exc:
+            fp.abort()
+            output.stderr_write("\n")
+            return str(exc)
+        except BaseException:
+            fp.abort()
+            raise
+
+        if size and (fsize := fp.tell()) < size:
+            fp.abort()
+            output.stderr_write("\n")
+            return f"file size mismatch ({fsize} < {size})"
+
+        fp.close()
+        # there is no separate file to move into place or set the mtime of;
+        # handle it like a file a post processor stored and deleted
+        pathfmt.temppath = pathfmt.realpath
+        pathfmt.delete = True
+
+    def _download_segments(self, pathfmt, response, content, file_header,
+                           size, headers):
+        """Download 'size' bytes using multiple parallel range requests
+
+        Return an error message on failure
+        """
+        length = -(-size // self.segments)
+        ranges = [(start, min(start + length, size))
+                  for start in range(0, size, length)]
+        done = [0] * len(ranges)
+        errors = [None] * len(ranges)
+        stop = threading.Event()
+        url = response.url
+
+        self.log.debug("Downloading %s bytes in %s segments",
+                       size, len(ranges))
+
+        with pathfmt.open("w+b") as fp:
+            fp.truncate(size)
+            fd = fp.fileno()
+
+            if file_header:
+                file_header = file_header[:length]
+                os.pwrite(fd, file_header, 0)
+                done[0] = len(file_header)
+
+            threads = []
+            try:
+                for index, (start, end) in enumerate(ranges):
+                    thread = threading.Thread(
+                        target=self._download_segment,
+                        args=(url, headers, fd, index, start, end,
+                              done, errors, stop),
+                        kwargs={"response": response, "content": content}
+                        if not index else {},
+                        daemon=True,
+                    )
+                    thread.start()
+                    threads.append(thread)
+
+                self.out.start(pathfmt.path)
+                progress = self.progress
+                time_start = time.monotonic()
+                for thread in threads:
+                    while thread.is_alive():
+                        thread.join(progress or 1.0)
+                        if FLAGS.DOWNLOAD is not None:
+                            # segment threads do not see this job's flags
+                            stop.set()
+                        elif progress is not None and (
+                                elapsed := time.monotonic() - time_start):
+                            downloaded = sum(done)
+                            self.out.progress(
+                                size, downloaded, int(downloaded / elapsed))
+            finally:
+                # threads must not write to 'fd' after it got closed
+                # and its number possibly reused for another file
+                stop.set()
+                for thread in threads:
+                    thread.join()
+
+            if FLAGS.DOWNLOAD is not None:
+                msg = "Download interrupted"
+            elif msg := next(filter(None, errors), None):
+                pass
+            elif sum(done) != size or os.fstat(fd).st_size != size:
+                msg = f"file size mismatch ({sum(done)} != {size})"
+            else:
+                return None
+
+            # only keep the contiguous part at the start of the file
+            # to be able to resume this download
+            fp.truncate(done[0])
+            return msg
+
+    def _download_segment(self, url, headers, fd, index, start, end,
+                          done, errors, stop, response=None, content=None):
+        """Download bytes 'start' to 'end' of 'url' into 'fd'"""
+        tries = 0
+        msg = ""
+        pos = start + done[index]
+
+        while pos < end:
+            if stop.is_set():
+                return
+
+            if response is None:
+                if tries:
+                    self.log.debug("Segment %s: %s (%s/%s)",
+                                   index, msg, tries, self.retries+1)
+                    if tries > self.retries:
+                        break
+                    time.sleep(tries)
+                tries += 1
+
+                headers_range = headers.copy()
+                headers_range["Range"] = f"bytes={pos}-{end - 1}"
+                try:
+                    response = self.session.request(
+                        "GET", url,
+                        stream=True,
+                        headers=headers_range,
+                        timeout=self.timeout,
+                        proxies=self.proxies,
+                        verify=self.verify,
+                    )
+                except (RequestException, SSLError) as exc:
+                    msg = str(exc)
+                    continue
+
+                code = response.status_code
+                if code != 206 or not response.headers.get(
+                        "Content-Range", "").startswith(f"bytes {pos}-"):
+                    msg = f"'{code} {response.reason}' for '{url}'"
+                    response.close()
+                    response = None
+                    if code in self.retry_codes or 500 <= code < 600:
+                        continue
+                    break
+                content = response.iter_content(self.chunk_size)
+
+            try:
+                for data in content:
+                    if stop.is_set():
+                        break
+                    if len(data) > end - pos:
+                        data = data[:end - pos]
+                    os.pwrite(fd, data, pos)
+                    pos += len(data)
+                    done[index] = pos - start
+                    if pos >= end:
+                        break
+                else:
+                    if pos < end:
+                        msg = "Connection closed prematurely"
+            except (RequestException, SSLError) as exc:
+                msg = str(exc)
+            response.close()
+            response = None
+        else:
+            return
+
+        errors[index] = msg
+        stop.set()
+
     def receive(self, fp, content, bytes_total, bytes_start):
         write = fp.write
         for data in content:
@@ -460,6 +701,20 @@ class HttpDownloader(DownloaderBase):
         return False
 
 
+class TeeWriter():
+    """Pass all data written to 'fp' to the update functions of 'tees'"""
+    __slots__ = ("write_file", "updates")
+
+    def __init__(self, fp, tees, offset, size):
+        self.write_file = fp.write
+        self.updates = [tee.start(fp, offset, size) for tee in tees]
+
+    def write(self, data):
+        for update in self.updates:
+            update(data)
+        return self.write_file(data)
+
+
 MIME_TYPES = {
     "image/jpeg"    : "jpg",
     "image/jpg"     : "jpg",
@@ -32,6 +32,7 @@ Exception
            ├── TerminateExtraction
            ├── RestartExtraction
            └── StopDownload
+                └── DownloadComplete
 """
 
 
@@ -200,3 +201,7 @@ class RestartExtraction(ControlException):
 
 class StopDownload(ControlException):
     """Cancel a file download"""
+
+
+class DownloadComplete(StopDownload):
+    """Stop a file download whose content is already complete"""
@@ -269,6 +269,11 @@ modules = [
 
 def find(url):
     """Find a suitable extractor for the given URL"""
+    if _index_data is not False:
+        for cls in _index_classes(url):
+            if match := cls.pattern.match(url):
+                return cls(match)
+
     for cls in _list_classes():
         if match := cls.pattern.match(url):
             return cls(match)
@@ -277,6 +282,9 @@ def find(url):
 
 def add(cls):
     """Add 'cls' to the list of available extractors"""
+    global _index_data
+    _index_data = False
+
     if isinstance(cls.pattern, str):
         cls.pattern = re_compile(cls.pattern)
     _cache.append(cls)
@@ -315,6 +323,84 @@ def _list_classes():
     globals()["_list_classes"] = lambda : _cache
 
 
+def _index_classes(url):
+    """Yield extractor classes whose pattern matches 'url'
+
+    Patterns get tested before importing their extractor module,
+    so usually only the module of the returned class gets imported.
+    """
+    if (index := _index_data) is None:
+        if not (index := _index_load()):
+            return
+
+    get = index.INDEX.get
+    positions = index.OTHER
+    for label in _index_labels(_index_match(url)[1].lower()):
+        if label_positions := get(label):
+            positions = (*positions, *label_positions)
+    if positions is not index.OTHER:
+        positions = sorted(set(positions))
+
+    classes = _index_cache
+    patterns = _index_patterns
+    for pos in positions:
+        if (pattern := patterns.get(pos)) is None:
+            pattern = patterns[pos] = re_compile(index.PATTERNS[pos])
+        if not pattern.match(url):
+            continue
+
+        if (cls := classes.get(pos)) is None:
+            _index_import(index, pos)
+            if (cls := classes.get(pos)) is None:
+                continue
+        yield cls
+
+
+def _index_load():
+    """Load the prebuilt URL index if it applies to the current setup"""
+    global _index_data
+    _index_data = False
+
+    try:
+        from . import _index as index
+    except ImportError:
+        return None
+
+    # custom module lists, additional BaseExtractor instances,
+    # or options changing patterns make the index unreliable;
+    # fall back to checking all modules
+    if tuple(modules) != index.MODULES or \
+            getattr(_module_iter, "gi_code", None) is not \
+            _modules_internal.__code__:
+        return None
+    from .. import config
+    for basecategory in index.BASECATEGORIES:
+        if config.get(("extractor",), basecategory):
+            return None
+    for category, option in index.CONFIG:
+        if config.get(("extractor", category), option):
+            return None
+
+    _index_data = index
+    return index
+
+
+def _index_import(index, pos):
+    """Import the module of the class at 'pos' and cache all its classes"""
+    mod = index.CLASSES[pos][0]
+    module = __import__(index.MODULES[mod], globals(), None, None, 1)
+
+    classes = {}
+    for cls in _get_classes(module):
+        if isinstance(cls.pattern, str):
+            cls.pattern = re_compile(cls.pattern)
+        classes[cls.__name__] = cls
+
+    for idx, (cmod, name) in enumerate(index.CLASSES):
+        if cmod == mod and name in classes:
+            _index_cache[idx] = classes[name]
+
+
 def _modules_internal():
     globals_ = globals()
     for module_name in modules:
@@ -344,3 +430,8 @@ def _get_classes(module):
 
 _cache = []
 _module_iter = _modules_internal()
+_index_data = None
+_index_cache = {}
+_index_patterns = {}
+_index_match = re_compile(r"(?i)(?:https?://)?([^/?#]*)").match
+_index_labels = re_compile(r"[.:]").split
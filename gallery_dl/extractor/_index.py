@@ -0,0 +1,3513 @@
+# -*- coding: utf-8 -*-
+
+# auto-generated by scripts/extractor_index.py
+# Do not edit manually
+
+MODULES = (
+    "2ch",
+    "2chan",
+    "2chen",
+    "35photo",
+    "3dbooru",
+    "4chan",
+    "4archive",
+    "4chanarchives",
+    "500px",
+    "8chan",
+    "8muses",
+    "adultempire",
+    "agnph",
+    "ahottie",
+    "allporncomic",
+    "ao3",
+    "arcalive",
+    "architizer",
+    "arena",
+    "artstation",
+    "aryion",
+    "audiochan",
+    "bbc",
+    "behance",
+    "bellazon",
+    "bilibili",
+    "blogger",
+    "bluesky",
+    "boosty",
+    "booth",
+    "bunkr",
+    "catbox",
+    "cfake",
+    "chevereto",
+    "cien",
+    "civitai",
+    "comedywildlifephoto",
+    "comick",
+    "comicvine",
+    "cyberdrop",
+    "cyberfile",
+    "danbooru",
+    "dandadan",
+    "dankefuerslesen",
+    "desktopography",
+    "deviantart",
+    "discord",
+    "dynastyscans",
+    "e621",
+    "eporner",
+    "erome",
+    "everia",
+    "facebook",
+    "fanbox",
+    "fansly",
+    "fantia",
+    "fapello",
+    "fapachi",
+    "fikfap",
+    "filester",
+    "fitnakedgirls",
+    "flickr",
+    "foriio",
+    "furaffinity",
+    "furry34",
+    "fuskator",
+    "gelbooru",
+    "gelbooru_v01",
+    "gelbooru_v02",
+    "girlsreleased",
+    "girlswithmuscle",
+    "gofile",
+    "hatenablog",
+    "hentai2read",
+    "hentaicosplays",
+    "hentaihere",
+    "hiperdex",
+    "hotleak",
+    "idolcomplex",
+    "imagebam",
+    "imagechest",
+    "imagefap",
+    "imagepond",
+    "imageshack",
+    "imgbb",
+    "imgbox",
+    "imgpile",
+    "imgth",
+    "imgur",
+    "imhentai",
+    "inkbunny",
+    "instagram",
+    "issuu",
+    "itaku",
+    "itchio",
+    "iwara",
+    "joyreactor",
+    "jschan",
+    "kabeuchi",
+    "kaliscan",
+    "keenspot",
+    "kemono",
+    "khinsider",
+    "komikcast",
+    "koofr",
+    "leakgallery",
+    "lensdump",
+    "lexica",
+    "lightroom",
+    "listal",
+    "livedoor",
+    "lofter",
+    "luscious",
+    "lynxchan",
+    "madokami",
+    "mangadex",
+    "mangafire",
+    "mangafox",
+    "mangafreak",
+    "mangahere",
+    "manganelo",
+    "mangapark",
+    "mangaread",
+    "mangareader",
+    "mangataro",
+    "mangatown",
+    "mangoxo",
+    "misskey",
+    "mixdrop",
+    "motherless",
+    "myhentaigallery",
+    "myportfolio",
+    "naverblog",
+    "naverchzzk",
+    "naverwebtoon",
+    "nekohouse",
+    "newgrounds",
+    "nijie",
+    "nitter",
+    "nozomi",
+    "nsfwalbum",
+    "nudostar",
+    "okporn",
+    "paheal",
+    "patreon",
+    "pexels",
+    "philomena",
+    "pholder",
+    "photovogue",
+    "picarto",
+    "picazor",
+    "pictoa",
+    "piczel",
+    "pillowfort",
+    "pinterest",
+    "pixeldrain",
+    "pixiv",
+    "pixnet",
+    "plurk",
+    "poipiku",
+    "poringa",
+    "pornhub",
+    "pornpics",
+    "pornstarstube",
+    "postmill",
+    "rawkuma",
+    "reactor",
+    "readcomiconline",
+    "realbooru",
+    "reddit",
+    "redgifs",
+    "rule34us",
+    "rule34vault",
+    "rule34xyz",
+    "s3ndpics",
+    "sankaku",
+    "sankakucomplex",
+    "scatbooru",
+    "scrolller",
+    "seiga",
+    "senmanga",
+    "sexcom",
+    "shimmie2",
+    "simplyhentai",
+    "sizebooru",
+    "skeb",
+    "slickpic",
+    "slideshare",
+    "smugmug",
+    "soundgasm",
+    "speakerdeck",
+    "steamgriddb",
+    "subscribestar",
+    "sxypix",
+    "szurubooru",
+    "tapas",
+    "tcbscans",
+    "telegraph",
+    "tenor",
+    "thefap",
+    "thehentaiworld",
+    "tiktok",
+    "tmohentai",
+    "toyhouse",
+    "tumblr",
+    "tumblrgallery",
+    "tungsten",
+    "turbo",
+    "twibooru",
+    "twitter",
+    "urlgalleries",
+    "unsplash",
+    "uploadir",
+    "urlshortener",
+    "vanillarock",
+    "vichan",
+    "vipergirls",
+    "vk",
+    "vsco",
+    "wallhaven",
+    "wallpapercave",
+    "warosu",
+    "weasyl",
+    "webmshare",
+    "webtoons",
+    "weebcentral",
+    "weebdex",
+    "weibo",
+    "whyp",
+    "wikiart",
+    "wikifeet",
+    "wikimedia",
+    "xasiat",
+    "xenforo",
+    "xfolio",
+    "xhamster",
+    "xvideos",
+    "yiffverse",
+    "yourlesbians",
+    "zerochan",
+    "booru",
+    "moebooru",
+    "foolfuuka",
+    "foolslide",
+    "mastodon",
+    "shopify",
+    "lolisafe",
+    "imagehosts",
+    "directlink",
+    "recursive",
+    "oauth",
+    "noop",
+    "ytdl",
+    "generic",
+)
+
+CLASSES = (
+    (0, "_2chThreadExtractor"),
+    (0, "_2chBoardExtractor"),
+    (1, "_2chanThreadExtractor"),
+    (2, "_2chenThreadExtractor"),
+    (2, "_2chenBoardExtractor"),
+    (3, "_35photoUserExtractor"),
+    (3, "_35photoTagExtractor"),
+    (3, "_35photoGenreExtractor"),
+    (3, "_35photoImageExtractor"),
+    (4, "_3dbooruTagExtractor"),
+    (4, "_3dbooruPoolExtractor"),
+    (4, "_3dbooruPostExtractor"),
+    (4, "_3dbooruPopularExtractor"),
+    (5, "_4chanThreadExtractor"),
+    (5, "_4chanBoardExtractor"),
+    (6, "_4archiveThreadExtractor"),
+    (6, "_4archiveBoardExtractor"),
+    (7, "_4chanarchivesThreadExtractor"),
+    (7, "_4chanarchivesBoardExtractor"),
+    (8, "_500pxUserExtractor"),
+    (8, "_500pxGalleryExtractor"),
+    (8, "_500pxFavoriteExtractor"),
+    (8, "_500pxImageExtractor"),
+    (9, "_8chanThreadExtractor"),
+    (9, "_8chanBoardExtractor"),
+    (10, "_8musesAlbumExtractor"),
+    (11, "AdultempireGalleryExtractor"),
+    (12, "AgnphTagExtractor"),
+    (12, "AgnphPostExtractor"),
+    (13, "AhottieGalleryExtractor"),
+    (13, "AhottieTagExtractor"),
+    (13, "AhottieSearchExtractor"),
+    (14, "AllporncomicChapterExtractor"),
+    (14, "AllporncomicMangaExtractor"),
+    (14, "AllporncomicTagExtractor"),
+    (15, "Ao3WorkExtractor"),
+    (15, "Ao3SeriesExtractor"),
+    (15, "Ao3TagExtractor"),
+    (15, "Ao3SearchExtractor"),
+    (15, "Ao3UserExtractor"),
+    (15, "Ao3UserWorksExtractor"),
+    (15, "Ao3UserSeriesExtractor"),
+    (15, "Ao3UserBookmarkExtractor"),
+    (15, "Ao3SubscriptionsExtractor"),
+    (16, "ArcalivePostExtractor"),
+    (16, "ArcaliveBoardExtractor"),
+    (16, "ArcaliveUserExtractor"),
+    (17, "ArchitizerProjectExtractor"),
+    (17, "ArchitizerFirmExtractor"),
+    (18, "ArenaChannelExtractor"),
+    (19, "ArtstationUserExtractor"),
+    (19, "ArtstationAlbumExtractor"),
+    (19, "ArtstationLikesExtractor"),
+    (19, "ArtstationCollectionExtractor"),
+    (19, "ArtstationCollectionsExtractor"),
+    (19, "ArtstationChallengeExtractor"),
+    (19, "ArtstationSearchExtractor"),
+    (19, "ArtstationArtworkExtractor"),
+    (19, "ArtstationImageExtractor"),
+    (19, "ArtstationFollowingExtractor"),
+    (20, "AryionGalleryExtractor"),
+    (20, "AryionFavoriteExtractor"),
+    (20, "AryionWatchExtractor"),
+    (20, "AryionTagExtractor"),
+    (20, "AryionSearchExtractor"),
+    (20, "AryionPostExtractor"),
+    (21, "AudiochanAudioExtractor"),
+    (21, "AudiochanUserExtractor"),
+    (21, "AudiochanCollectionExtractor"),
+    (21, "AudiochanSearchExtractor"),
+    (22, "BbcGalleryExtractor"),
+    (22, "BbcProgrammeExtractor"),
+    (23, "BehanceGalleryExtractor"),
+    (23, "BehanceUserExtractor"),
+    (23, "BehanceCollectionExtractor"),
+    (24, "BellazonPostExtractor"),
+    (24, "BellazonThreadExtractor"),
+    (24, "BellazonForumExtractor"),
+    (25, "BilibiliArticleExtractor"),
+    (25, "BilibiliUserArticlesExtractor"),
+    (25, "BilibiliUserArticlesFavoriteExtractor"),
+    (26, "BloggerPostExtractor"),
+    (26, "BloggerBlogExtractor"),
+    (26, "BloggerSearchExtractor"),
+    (26, "BloggerLabelExtractor"),
+    (27, "BlueskyUserExtractor"),
+    (27, "BlueskyPostsExtractor"),
+    (27, "BlueskyRepliesExtractor"),
+    (27, "BlueskyMediaExtractor"),
+    (27, "BlueskyVideoExtractor"),
+    (27, "BlueskyLikesExtractor"),
+    (27, "BlueskyFeedExtractor"),
+    (27, "BlueskyListExtractor"),
+    (27, "BlueskyFollowingExtractor"),
+    (27, "BlueskyPostExtractor"),
+    (27, "BlueskyInfoExtractor"),
+    (27, "BlueskyAvatarExtractor"),
+    (27, "BlueskyBackgroundExtractor"),
+    (27, "BlueskySearchExtractor"),
+    (27, "BlueskyHashtagExtractor"),
+    (27, "BlueskyBookmarkExtractor"),
+    (28, "BoostyUserExtractor"),
+    (28, "BoostyMediaExtractor"),
+    (28, "BoostyFeedExtractor"),
+    (28, "BoostyPostExtractor"),
+    (28, "BoostyFollowingExtractor"),
+    (28, "BoostyDirectMessagesExtractor"),
+    (29, "BoothItemExtractor"),
+    (29, "BoothShopExtractor"),
+    (29, "BoothCategoryExtractor"),
+    (30, "BunkrAlbumExtractor"),
+    (30, "BunkrMediaExtractor"),
+    (31, "CatboxAlbumExtractor"),
+    (31, "CatboxFileExtractor"),
+    (32, "CfakeCelebrityExtractor"),
+    (32, "CfakeCategoryExtractor"),
+    (32, "CfakeCreatedExtractor"),
+    (32, "CfakeCountryExtractor"),
+    (33, "CheveretoFileExtractor"),
+    (33, "CheveretoAlbumExtractor"),
+    (33, "CheveretoCategoryExtractor"),
+    (33, "CheveretoUserExtractor"),
+    (34, "CienArticleExtractor"),
+    (34, "CienCreatorExtractor"),
+    (34, "CienRecentExtractor"),
+    (34, "CienFollowingExtractor"),
+    (35, "CivitaiModelExtractor"),
+    (35, "CivitaiImageExtractor"),
+    (35, "CivitaiCollectionExtractor"),
+    (35, "CivitaiPostExtractor"),
+    (35, "CivitaiTagExtractor"),
+    (35, "CivitaiSearchModelsExtractor"),
+    (35, "CivitaiSearchImagesExtractor"),
+    (35, "CivitaiModelsExtractor"),
+    (35, "CivitaiImagesExtractor"),
+    (35, "CivitaiVideosExtractor"),
+    (35, "CivitaiPostsExtractor"),
+    (35, "CivitaiUserExtractor"),
+    (35, "CivitaiUserModelsExtractor"),
+    (35, "CivitaiUserPostsExtractor"),
+    (35, "CivitaiUserImagesExtractor"),
+    (35, "CivitaiUserVideosExtractor"),
+    (35, "CivitaiUserCollectionsExtractor"),
+    (35, "CivitaiGeneratedExtractor"),
+    (36, "ComedywildlifephotoGalleryExtractor"),
+    (37, "ComickCoversExtractor"),
+    (37, "ComickChapterExtractor"),
+    (37, "ComickMangaExtractor"),
+    (38, "ComicvineTagExtractor"),
+    (39, "CyberdropAlbumExtractor"),
+    (39, "CyberdropMediaExtractor"),
+    (40, "CyberfileFolderExtractor"),
+    (40, "CyberfileSharedExtractor"),
+    (40, "CyberfileFileExtractor"),
+    (41, "DanbooruTagExtractor"),
+    (41, "DanbooruRandomExtractor"),
+    (41, "DanbooruPoolExtractor"),
+    (41, "DanbooruFavgroupExtractor"),
+    (41, "DanbooruPostExtractor"),
+    (41, "DanbooruMediaassetExtractor"),
+    (41, "DanbooruPopularExtractor"),
+    (41, "DanbooruArtistExtractor"),
+    (41, "DanbooruArtistSearchExtractor"),
+    (42, "DandadanChapterExtractor"),
+    (42, "DandadanMangaExtractor"),
+    (43, "DankefuerslesenChapterExtractor"),
+    (43, "DankefuerslesenMangaExtractor"),
+    (44, "DesktopographySiteExtractor"),
+    (44, "DesktopographyExhibitionExtractor"),
+    (44, "DesktopographyEntryExtractor"),
+    (45, "DeviantartUserExtractor"),
+    (45, "DeviantartGalleryExtractor"),
+    (45, "DeviantartAvatarExtractor"),
+    (45, "DeviantartBackgroundExtractor"),
+    (45, "DeviantartFolderExtractor"),
+    (45, "DeviantartStashExtractor"),
+    (45, "DeviantartFavoriteExtractor"),
+    (45, "DeviantartCollectionExtractor"),
+    (45, "DeviantartJournalExtractor"),
+    (45, "DeviantartStatusExtractor"),
+    (45, "DeviantartTagExtractor"),
+    (45, "DeviantartWatchExtractor"),
+    (45, "DeviantartWatchPostsExtractor"),
+    (45, "DeviantartDeviationExtractor"),
+    (45, "DeviantartScrapsExtractor"),
+    (45, "DeviantartSearchExtractor"),
+    (45, "DeviantartGallerySearchExtractor"),
+    (45, "DeviantartFollowingExtractor"),
+    (46, "DiscordChannelExtractor"),
+    (46, "DiscordMessageExtractor"),
+    (46, "DiscordServerAssetsExtractor"),
+    (46, "DiscordServerSearchExtractor"),
+    (46, "DiscordServerExtractor"),
+    (46, "DiscordDirectMessagesExtractor"),
+    (46, "DiscordDirectMessageExtractor"),
+    (47, "DynastyscansChapterExtractor"),
+    (47, "DynastyscansMangaExtractor"),
+    (47, "DynastyscansSearchExtractor"),
+    (47, "DynastyscansImageExtractor"),
+    (47, "DynastyscansAnthologyExtractor"),
+    (48, "E621TagExtractor"),
+    (48, "E621PoolExtractor"),
+    (48, "E621PostExtractor"),
+    (48, "E621PopularExtractor"),
+    (48, "E621ArtistExtractor"),
+    (48, "E621ArtistSearchExtractor"),
+    (48, "E621FavoriteExtractor"),
+    (48, "E621FrontendExtractor"),
+    (49, "EpornerGalleryExtractor"),
+    (50, "EromeAlbumExtractor"),
+    (50, "EromeUserExtractor"),
+    (50, "EromeSearchExtractor"),
+    (51, "EveriaPostExtractor"),
+    (51, "EveriaTagExtractor"),
+    (51, "EveriaCategoryExtractor"),
+    (51, "EveriaDateExtractor"),
+    (51, "EveriaSearchExtractor"),
+    (52, "FacebookPhotoExtractor"),
+    (52, "FacebookSetExtractor"),
+    (52, "FacebookVideoExtractor"),
+    (52, "FacebookInfoExtractor"),
+    (52, "FacebookAlbumsExtractor"),
+    (52, "FacebookPhotosExtractor"),
+    (52, "FacebookAvatarExtractor"),
+    (52, "FacebookUserExtractor"),
+    (53, "FanboxCreatorExtractor"),
+    (53, "FanboxTagExtractor"),
+    (53, "FanboxPostExtractor"),
+    (53, "FanboxHomeExtractor"),
+    (53, "FanboxSupportingExtractor"),
+    (53, "FanboxRedirectExtractor"),
+    (54, "FanslyPostExtractor"),
+    (54, "FanslyHomeExtractor"),
+    (54, "FanslyListExtractor"),
+    (54, "FanslyListsExtractor"),
+    (54, "FanslyCreatorPostsExtractor"),
+    (54, "FanslyCreatorMediaExtractor"),
+    (55, "FantiaCreatorExtractor"),
+    (55, "FantiaPostExtractor"),
+    (55, "FantiaSupportingExtractor"),
+    (56, "FapelloPostExtractor"),
+    (56, "FapelloModelExtractor"),
+    (56, "FapelloPathExtractor"),
+    (57, "FapachiPostExtractor"),
+    (57, "FapachiUserExtractor"),
+    (58, "FikfapPostExtractor"),
+    (58, "FikfapUserExtractor"),
+    (58, "FikfapHashtagExtractor"),
+    (59, "FilesterFileExtractor"),
+    (59, "FilesterFolderExtractor"),
+    (60, "FitnakedgirlsGalleryExtractor"),
+    (60, "FitnakedgirlsCategoryExtractor"),
+    (60, "FitnakedgirlsTagExtractor"),
+    (60, "FitnakedgirlsVideoExtractor"),
+    (60, "FitnakedgirlsBlogExtractor"),
+    (61, "FlickrImageExtractor"),
+    (61, "FlickrAlbumExtractor"),
+    (61, "FlickrGalleryExtractor"),
+    (61, "FlickrGroupExtractor"),
+    (61, "FlickrUserExtractor"),
+    (61, "FlickrFavoriteExtractor"),
+    (61, "FlickrSearchExtractor"),
+    (62, "ForiioWorkExtractor"),
+    (62, "ForiioUserExtractor"),
+    (63, "FuraffinityGalleryExtractor"),
+    (63, "FuraffinityFolderExtractor"),
+    (63, "FuraffinityScrapsExtractor"),
+    (63, "FuraffinityFavoriteExtractor"),
+    (63, "FuraffinitySearchExtractor"),
+    (63, "FuraffinityPostExtractor"),
+    (63, "FuraffinityUserExtractor"),
+    (63, "FuraffinityFollowingExtractor"),
+    (63, "FuraffinitySubmissionsExtractor"),
+    (64, "Furry34PostExtractor"),
+    (64, "Furry34PlaylistExtractor"),
+    (64, "Furry34TagExtractor"),
+    (65, "FuskatorGalleryExtractor"),
+    (65, "FuskatorSearchExtractor"),
+    (66, "GelbooruTagExtractor"),
+    (66, "GelbooruPoolExtractor"),
+    (66, "GelbooruFavoriteExtractor"),
+    (66, "GelbooruPostExtractor"),
+    (66, "GelbooruRedirectExtractor"),
+    (67, "GelbooruV01TagExtractor"),
+    (67, "GelbooruV01FavoriteExtractor"),
+    (67, "GelbooruV01PostExtractor"),
+    (68, "GelbooruV02TagExtractor"),
+    (68, "GelbooruV02PoolExtractor"),
+    (68, "GelbooruV02FavoriteExtractor"),
+    (68, "GelbooruV02PostExtractor"),
+    (69, "GirlsreleasedSetExtractor"),
+    (69, "GirlsreleasedModelExtractor"),
+    (69, "GirlsreleasedSiteExtractor"),
+    (70, "GirlswithmusclePostExtractor"),
+    (70, "GirlswithmuscleSearchExtractor"),
+    (71, "GofileFolderExtractor"),
+    (72, "HatenablogEntryExtractor"),
+    (72, "HatenablogHomeExtractor"),
+    (72, "HatenablogArchiveExtractor"),
+    (72, "HatenablogSearchExtractor"),
+    (73, "Hentai2readChapterExtractor"),
+    (73, "Hentai2readMangaExtractor"),
+    (74, "HentaicosplaysGalleryExtractor"),
+    (75, "HentaihereChapterExtractor"),
+    (75, "HentaihereMangaExtractor"),
+    (76, "HiperdexChapterExtractor"),
+    (76, "HiperdexMangaExtractor"),
+    (76, "HiperdexArtistExtractor"),
+    (77, "HotleakPostExtractor"),
+    (77, "HotleakCreatorExtractor"),
+    (77, "HotleakCategoryExtractor"),
+    (77, "HotleakSearchExtractor"),
+    (78, "IdolcomplexTagExtractor"),
+    (78, "IdolcomplexPoolExtractor"),
+    (78, "IdolcomplexPostExtractor"),
+    (79, "ImagebamGalleryExtractor"),
+    (79, "ImagebamImageExtractor"),
+    (80, "ImagechestGalleryExtractor"),
+    (80, "ImagechestUserExtractor"),
+    (81, "ImagefapGalleryExtractor"),
+    (81, "ImagefapImageExtractor"),
+    (81, "ImagefapFolderExtractor"),
+    (81, "ImagefapUserExtractor"),
+    (82, "ImagepondFileExtractor"),
+    (82, "ImagepondAlbumExtractor"),
+    (82, "ImagepondUserExtractor"),
+    (83, "ImageshackImageExtractor"),
+    (83, "ImageshackGalleryExtractor"),
+    (83, "ImageshackUserExtractor"),
+    (84, "ImgbbAlbumExtractor"),
+    (84, "ImgbbImageExtractor"),
+    (84, "ImgbbUserExtractor"),
+    (85, "ImgboxGalleryExtractor"),
+    (85, "ImgboxImageExtractor"),
+    (86, "ImgpilePostExtractor"),
+    (86, "ImgpileUserExtractor"),
+    (87, "ImgthGalleryExtractor"),
+    (88, "ImgurImageExtractor"),
+    (88, "ImgurAlbumExtractor"),
+    (88, "ImgurGalleryExtractor"),
+    (88, "ImgurUserExtractor"),
+    (88, "ImgurFavoriteExtractor"),
+    (88, "ImgurFavoriteFolderExtractor"),
+    (88, "ImgurMeExtractor"),
+    (88, "ImgurSubredditExtractor"),
+    (88, "ImgurTagExtractor"),
+    (88, "ImgurSearchExtractor"),
+    (89, "ImhentaiGalleryExtractor"),
+    (89, "ImhentaiTagExtractor"),
+    (89, "ImhentaiSearchExtractor"),
+    (90, "InkbunnyUserExtractor"),
+    (90, "InkbunnyPoolExtractor"),
+    (90, "InkbunnyFavoriteExtractor"),
+    (90, "InkbunnyUnreadExtractor"),
+    (90, "InkbunnySearchExtractor"),
+    (90, "InkbunnyFollowingExtractor"),
+    (90, "InkbunnyPostExtractor"),
+    (91, "InstagramPostExtractor"),
+    (91, "InstagramUserExtractor"),
+    (91, "InstagramPostsExtractor"),
+    (91, "InstagramReelsExtractor"),
+    (91, "InstagramTaggedExtractor"),
+    (91, "InstagramGuideExtractor"),
+    (91, "InstagramSavedExtractor"),
+    (91, "InstagramCollectionExtractor"),
+    (91, "InstagramStoriesTrayExtractor"),
+    (91, "InstagramStoriesExtractor"),
+    (91, "InstagramHighlightsExtractor"),
+    (91, "InstagramFollowersExtractor"),
+    (91, "InstagramFollowingExtractor"),
+    (91, "InstagramTagExtractor"),
+    (91, "InstagramInfoExtractor"),
+    (91, "InstagramAvatarExtractor"),
+    (92, "IssuuPublicationExtractor"),
+    (92, "IssuuUserExtractor"),
+    (93, "ItakuGalleryExtractor"),
+    (93, "ItakuPostsExtractor"),
+    (93, "ItakuStarsExtractor"),
+    (93, "ItakuFollowingExtractor"),
+    (93, "ItakuFollowersExtractor"),
+    (93, "ItakuBookmarksExtractor"),
+    (93, "ItakuUserExtractor"),
+    (93, "ItakuImageExtractor"),
+    (93, "ItakuPostExtractor"),
+    (93, "ItakuSearchExtractor"),
+    (94, "ItchioGameExtractor"),
+    (95, "IwaraUserExtractor"),
+    (95, "IwaraUserImagesExtractor"),
+    (95, "IwaraUserVideosExtractor"),
+    (95, "IwaraUserPlaylistsExtractor"),
+    (95, "IwaraFollowingExtractor"),
+    (95, "IwaraFollowersExtractor"),
+    (95, "IwaraImageExtractor"),
+    (95, "IwaraVideoExtractor"),
+    (95, "IwaraPlaylistExtractor"),
+    (95, "IwaraFavoriteExtractor"),
+    (95, "IwaraSearchExtractor"),
+    (95, "IwaraTagExtractor"),
+    (96, "JoyreactorPostExtractor"),
+    (96, "JoyreactorTagExtractor"),
+    (96, "JoyreactorUserExtractor"),
+    (96, "JoyreactorSearchExtractor"),
+    (97, "JschanThreadExtractor"),
+    (97, "JschanBoardExtractor"),
+    (98, "KabeuchiUserExtractor"),
+    (99, "KaliscanChapterExtractor"),
+    (99, "KaliscanMangaExtractor"),
+    (100, "KeenspotComicExtractor"),
+    (101, "KemonoUserExtractor"),
+    (101, "KemonoPostsExtractor"),
+    (101, "KemonoPostExtractor"),
+    (101, "KemonoDiscordExtractor"),
+    (101, "KemonoDiscordServerExtractor"),
+    (101, "KemonoFavoriteExtractor"),
+    (101, "KemonoArtistsExtractor"),
+    (102, "KhinsiderSoundtrackExtractor"),
+    (103, "KomikcastChapterExtractor"),
+    (103, "KomikcastMangaExtractor"),
+    (104, "KoofrSharedExtractor"),
+    (105, "LeakgalleryUserExtractor"),
+    (105, "LeakgalleryTrendingExtractor"),
+    (105, "LeakgalleryMostlikedExtractor"),
+    (105, "LeakgalleryPostExtractor"),
+    (106, "LensdumpAlbumExtractor"),
+    (106, "LensdumpAlbumsExtractor"),
+    (106, "LensdumpImageExtractor"),
+    (107, "LexicaSearchExtractor"),
+    (108, "LightroomGalleryExtractor"),
+    (109, "ListalImageExtractor"),
+    (109, "ListalPeopleExtractor"),
+    (110, "LivedoorBlogExtractor"),
+    (110, "LivedoorPostExtractor"),
+    (111, "LofterPostExtractor"),
+    (111, "LofterBlogPostsExtractor"),
+    (112, "LusciousAlbumExtractor"),
+    (112, "LusciousSearchExtractor"),
+    (113, "LynxchanThreadExtractor"),
+    (113, "LynxchanBoardExtractor"),
+    (114, "MadokamiMangaExtractor"),
+    (115, "MangadexCoversExtractor"),
+    (115, "MangadexChapterExtractor"),
+    (115, "MangadexMangaExtractor"),
+    (115, "MangadexFeedExtractor"),
+    (115, "MangadexFollowingExtractor"),
+    (115, "MangadexListExtractor"),
+    (115, "MangadexAuthorExtractor"),
+    (116, "MangafireChapterExtractor"),
+    (116, "MangafireMangaExtractor"),
+    (117, "MangafoxChapterExtractor"),
+    (117, "MangafoxMangaExtractor"),
+    (118, "MangafreakChapterExtractor"),
+    (118, "MangafreakMangaExtractor"),
+    (119, "MangahereChapterExtractor"),
+    (119, "MangahereMangaExtractor"),
+    (120, "ManganeloChapterExtractor"),
+    (120, "ManganeloMangaExtractor"),
+    (120, "ManganeloBookmarkExtractor"),
+    (121, "MangaparkChapterExtractor"),
+    (121, "MangaparkMangaExtractor"),
+    (122, "MangareadChapterExtractor"),
+    (122, "MangareadMangaExtractor"),
+    (123, "MangareaderChapterExtractor"),
+    (123, "MangareaderMangaExtractor"),
+    (124, "MangataroChapterExtractor"),
+    (124, "MangataroMangaExtractor"),
+    (125, "MangatownChapterExtractor"),
+    (125, "MangatownMangaExtractor"),
+    (126, "MangoxoAlbumExtractor"),
+    (126, "MangoxoChannelExtractor"),
+    (127, "MisskeyUserExtractor"),
+    (127, "MisskeyNotesExtractor"),
+    (127, "MisskeyInfoExtractor"),
+    (127, "MisskeyAvatarExtractor"),
+    (127, "MisskeyBackgroundExtractor"),
+    (127, "MisskeyFollowingExtractor"),
+    (127, "MisskeyNoteExtractor"),
+    (127, "MisskeyFavoriteExtractor"),
+    (128, "MixdropFileExtractor"),
+    (129, "MotherlessMediaExtractor"),
+    (129, "MotherlessGalleryExtractor"),
+    (129, "MotherlessGroupExtractor"),
+    (130, "MyhentaigalleryGalleryExtractor"),
+    (130, "MyhentaigalleryTagExtractor"),
+    (131, "MyportfolioGalleryExtractor"),
+    (132, "NaverBlogPostExtractor"),
+    (132, "NaverBlogBlogExtractor"),
+    (133, "NaverChzzkCommentExtractor"),
+    (133, "NaverChzzkCommunityExtractor"),
+    (134, "NaverWebtoonEpisodeExtractor"),
+    (134, "NaverWebtoonComicExtractor"),
+    (135, "NekohousePostExtractor"),
+    (135, "NekohouseUserExtractor"),
+    (136, "NewgroundsImageExtractor"),
+    (136, "NewgroundsMediaExtractor"),
+    (136, "NewgroundsArtExtractor"),
+    (136, "NewgroundsAudioExtractor"),
+    (136, "NewgroundsMoviesExtractor"),
+    (136, "NewgroundsGamesExtractor"),
+    (136, "NewgroundsUserExtractor"),
+    (136, "NewgroundsFavoriteExtractor"),
+    (136, "NewgroundsFollowingExtractor"),
+    (136, "NewgroundsSearchExtractor"),
+    (137, "NijieUserExtractor"),
+    (137, "NijieIllustrationExtractor"),
+    (137, "NijieDoujinExtractor"),
+    (137, "NijieFavoriteExtractor"),
+    (137, "NijieNuitaExtractor"),
+    (137, "NijieFeedExtractor"),
+    (137, "NijieFollowedExtractor"),
+    (137, "NijieImageExtractor"),
+    (138, "NitterTweetsExtractor"),
+    (138, "NitterRepliesExtractor"),
+    (138, "NitterMediaExtractor"),
+    (138, "NitterSearchExtractor"),
+    (138, "NitterTweetExtractor"),
+    (139, "NozomiPostExtractor"),
+    (139, "NozomiIndexExtractor"),
+    (139, "NozomiTagExtractor"),
+    (139, "NozomiSearchExtractor"),
+    (140, "NsfwalbumAlbumExtractor"),
+    (141, "NudostarModelExtractor"),
+    (141, "NudostarImageExtractor"),
+    (142, "OkpornGalleryExtractor"),
+    (143, "PahealTagExtractor"),
+    (143, "PahealPostExtractor"),
+    (144, "PatreonCollectionExtractor"),
+    (144, "PatreonCreatorExtractor"),
+    (144, "PatreonUserExtractor"),
+    (144, "PatreonPostExtractor"),
+    (145, "PexelsCollectionExtractor"),
+    (145, "PexelsSearchExtractor"),
+    (145, "PexelsUserExtractor"),
+    (145, "PexelsImageExtractor"),
+    (146, "PhilomenaPostExtractor"),
+    (146, "PhilomenaSearchExtractor"),
+    (146, "PhilomenaGalleryExtractor"),
+    (147, "PholderSubredditExtractor"),
+    (147, "PholderUserExtractor"),
+    (147, "PholderSearchExtractor"),
+    (148, "PhotovogueUserExtractor"),
+    (149, "PicartoGalleryExtractor"),
+    (150, "PicazorUserExtractor"),
+    (151, "PictoaImageExtractor"),
+    (151, "PictoaAlbumExtractor"),
+    (152, "PiczelUserExtractor"),
+    (152, "PiczelFolderExtractor"),
+    (152, "PiczelImageExtractor"),
+    (153, "PillowfortPostExtractor"),
+    (153, "PillowfortUserExtractor"),
+    (154, "PinterestUserExtractor"),
+    (154, "PinterestAllpinsExtractor"),
+    (154, "PinterestCreatedExtractor"),
+    (154, "PinterestSectionExtractor"),
+    (154, "PinterestSearchExtractor"),
+    (154, "PinterestPinExtractor"),
+    (154, "PinterestBoardExtractor"),
+    (154, "PinterestRelatedPinExtractor"),
+    (154, "PinterestRelatedBoardExtractor"),
+    (154, "PinterestPinitExtractor"),
+    (155, "PixeldrainFileExtractor"),
+    (155, "PixeldrainAlbumExtractor"),
+    (155, "PixeldrainFolderExtractor"),
+    (156, "PixivUserExtractor"),
+    (156, "PixivArtworksExtractor"),
+    (156, "PixivAvatarExtractor"),
+    (156, "PixivBackgroundExtractor"),
+    (156, "PixivMeExtractor"),
+    (156, "PixivWorkExtractor"),
+    (156, "PixivUnlistedExtractor"),
+    (156, "PixivFavoriteExtractor"),
+    (156, "PixivRankingExtractor"),
+    (156, "PixivSearchExtractor"),
+    (156, "PixivFollowedExtractor"),
+    (156, "PixivPixivisionExtractor"),
+    (156, "PixivSeriesExtractor"),
+    (156, "PixivSketchExtractor"),
+    (156, "PixivNovelNovelExtractor"),
+    (156, "PixivNovelUserExtractor"),
+    (156, "PixivNovelSeriesExtractor"),
+    (156, "PixivNovelBookmarkExtractor"),
+    (157, "PixnetImageExtractor"),
+    (157, "PixnetSetExtractor"),
+    (157, "PixnetFolderExtractor"),
+    (157, "PixnetUserExtractor"),
+    (158, "PlurkTimelineExtractor"),
+    (158, "PlurkPostExtractor"),
+    (159, "PoipikuUserExtractor"),
+    (159, "PoipikuPostExtractor"),
+    (160, "PoringaPostExtractor"),
+    (160, "PoringaUserExtractor"),
+    (160, "PoringaSearchExtractor"),
+    (161, "PornhubGalleryExtractor"),
+    (161, "PornhubGifExtractor"),
+    (161, "PornhubUserExtractor"),
+    (161, "PornhubPhotosExtractor"),
+    (161, "PornhubGifsExtractor"),
+    (162, "PornpicsGalleryExtractor"),
+    (162, "PornpicsTagExtractor"),
+    (162, "PornpicsSearchExtractor"),
+    (162, "PornpicsListingExtractor"),
+    (162, "PornpicsCategoryExtractor"),
+    (163, "PornstarstubeGalleryExtractor"),
+    (164, "PostmillPostExtractor"),
+    (164, "PostmillShortURLExtractor"),
+    (164, "PostmillHomeExtractor"),
+    (164, "PostmillForumExtractor"),
+    (164, "PostmillUserSubmissionsExtractor"),
+    (164, "PostmillTagExtractor"),
+    (164, "PostmillSearchExtractor"),
+    (165, "RawkumaChapterExtractor"),
+    (165, "RawkumaMangaExtractor"),
+    (166, "ReactorTagExtractor"),
+    (166, "ReactorSearchExtractor"),
+    (166, "ReactorUserExtractor"),
+    (166, "ReactorPostExtractor"),
+    (167, "ReadcomiconlineIssueExtractor"),
+    (167, "ReadcomiconlineComicExtractor"),
+    (167, "ReadcomiconlineTagExtractor"),
+    (168, "RealbooruTagExtractor"),
+    (168, "RealbooruFavoriteExtractor"),
+    (168, "RealbooruPoolExtractor"),
+    (168, "RealbooruPostExtractor"),
+    (169, "RedditSubredditExtractor"),
+    (169, "RedditHomeExtractor"),
+    (169, "RedditUserExtractor"),
+    (169, "RedditSubmissionExtractor"),
+    (169, "RedditImageExtractor"),
+    (169, "RedditRedirectExtractor"),
+    (170, "RedgifsUserExtractor"),
+    (170, "RedgifsCollectionExtractor"),
+    (170, "RedgifsCollectionsExtractor"),
+    (170, "RedgifsNichesExtractor"),
+    (170, "RedgifsSearchExtractor"),
+    (170, "RedgifsImageExtractor"),
+    (171, "Rule34usTagExtractor"),
+    (171, "Rule34usPostExtractor"),
+    (172, "Rule34vaultPostExtractor"),
+    (172, "Rule34vaultPlaylistExtractor"),
+    (172, "Rule34vaultTagExtractor"),
+    (173, "Rule34xyzPostExtractor"),
+    (173, "Rule34xyzPlaylistExtractor"),
+    (173, "Rule34xyzTagExtractor"),
+    (174, "S3ndpicsPostExtractor"),
+    (174, "S3ndpicsUserExtractor"),
+    (174, "S3ndpicsSearchExtractor"),
+    (175, "SankakuTagExtractor"),
+    (175, "SankakuPoolExtractor"),
+    (175, "SankakuPostExtractor"),
+    (175, "SankakuBooksExtractor"),
+    (176, "SankakucomplexArticleExtractor"),
+    (176, "SankakucomplexTagExtractor"),
+    (177, "ScatbooruTagExtractor"),
+    (177, "ScatbooruFavoriteExtractor"),
+    (177, "ScatbooruPostExtractor"),
+    (178, "ScrolllerSubredditExtractor"),
+    (178, "ScrolllerUserExtractor"),
+    (178, "ScrolllerFollowingExtractor"),
+    (178, "ScrolllerPostExtractor"),
+    (179, "SeigaUserExtractor"),
+    (179, "SeigaImageExtractor"),
+    (180, "SenmangaChapterExtractor"),
+    (181, "SexcomPinExtractor"),
+    (181, "SexcomRelatedPinExtractor"),
+    (181, "SexcomPinsExtractor"),
+    (181, "SexcomLikesExtractor"),
+    (181, "SexcomBoardExtractor"),
+    (181, "SexcomFeedExtractor"),
+    (181, "SexcomSearchExtractor"),
+    (182, "Shimmie2TagExtractor"),
+    (182, "Shimmie2PostExtractor"),
+    (183, "SimplyhentaiSeriesExtractor"),
+    (183, "SimplyhentaiMangaExtractor"),
+    (183, "SimplyhentaiTagExtractor"),
+    (183, "SimplyhentaiLanguageExtractor"),
+    (183, "SimplyhentaiGalleryExtractor"),
+    (184, "SizebooruPostExtractor"),
+    (184, "SizebooruTagExtractor"),
+    (184, "SizebooruGalleryExtractor"),
+    (184, "SizebooruUserExtractor"),
+    (184, "SizebooruFavoriteExtractor"),
+    (185, "SkebPostExtractor"),
+    (185, "SkebWorksExtractor"),
+    (185, "SkebSentrequestsExtractor"),
+    (185, "SkebUserExtractor"),
+    (185, "SkebSearchExtractor"),
+    (185, "SkebFollowingExtractor"),
+    (185, "SkebFollowingUsersExtractor"),
+    (186, "SlickpicAlbumExtractor"),
+    (186, "SlickpicUserExtractor"),
+    (187, "SlidesharePresentationExtractor"),
+    (188, "SmugmugAlbumExtractor"),
+    (188, "SmugmugImageExtractor"),
+    (188, "SmugmugPathExtractor"),
+    (189, "SoundgasmAudioExtractor"),
+    (189, "SoundgasmUserExtractor"),
+    (190, "SpeakerdeckPresentationExtractor"),
+    (191, "SteamgriddbAssetExtractor"),
+    (191, "SteamgriddbGridsExtractor"),
+    (191, "SteamgriddbHeroesExtractor"),
+    (191, "SteamgriddbLogosExtractor"),
+    (191, "SteamgriddbIconsExtractor"),
+    (192, "SubscribestarUserExtractor"),
+    (192, "SubscribestarPostExtractor"),
+    (193, "SxypixGalleryExtractor"),
+    (194, "SzurubooruTagExtractor"),
+    (194, "SzurubooruPostExtractor"),
+    (195, "TapasEpisodeExtractor"),
+    (195, "TapasSeriesExtractor"),
+    (195, "TapasCreatorExtractor"),
+    (196, "TcbscansChapterExtractor"),
+    (196, "TcbscansMangaExtractor"),
+    (197, "TelegraphGalleryExtractor"),
+    (198, "TenorImageExtractor"),
+    (198, "TenorSearchExtractor"),
+    (198, "TenorUserExtractor"),
+    (199, "ThefapPostExtractor"),
+    (199, "ThefapModelExtractor"),
+    (200, "ThehentaiworldTagExtractor"),
+    (200, "ThehentaiworldPostExtractor"),
+    (201, "TiktokPostExtractor"),
+    (201, "TiktokVmpostExtractor"),
+    (201, "TiktokUserExtractor"),
+    (201, "TiktokAvatarExtractor"),
+    (201, "TiktokPostsExtractor"),
+    (201, "TiktokRepostsExtractor"),
+    (201, "TiktokStoriesExtractor"),
+    (201, "TiktokLikesExtractor"),
+    (201, "TiktokSavedExtractor"),
+    (201, "TiktokFollowingExtractor"),
+    (202, "TmohentaiGalleryExtractor"),
+    (203, "ToyhouseArtExtractor"),
+    (203, "ToyhouseImageExtractor"),
+    (204, "TumblrUserExtractor"),
+    (204, "TumblrPostExtractor"),
+    (204, "TumblrTagExtractor"),
+    (204, "TumblrDayExtractor"),
+    (204, "TumblrLikesExtractor"),
+    (204, "TumblrFollowingExtractor"),
+    (204, "TumblrFollowersExtractor"),
+    (204, "TumblrSearchExtractor"),
+    (205, "TumblrgalleryTumblrblogExtractor"),
+    (205, "TumblrgalleryPostExtractor"),
+    (205, "TumblrgallerySearchExtractor"),
+    (206, "TungstenPostExtractor"),
+    (206, "TungstenModelExtractor"),
+    (206, "TungstenUserExtractor"),
+    (207, "TurboAlbumExtractor"),
+    (207, "TurboMediaExtractor"),
+    (208, "TwibooruPostExtractor"),
+    (208, "TwibooruSearchExtractor"),
+    (208, "TwibooruGalleryExtractor"),
+    (209, "TwitterHomeExtractor"),
+    (209, "TwitterNotificationsExtractor"),
+    (209, "TwitterSearchExtractor"),
+    (209, "TwitterHashtagExtractor"),
+    (209, "TwitterUserExtractor"),
+    (209, "TwitterTimelineExtractor"),
+    (209, "TwitterTweetsExtractor"),
+    (209, "TwitterWithRepliesExtractor"),
+    (209, "TwitterHighlightsExtractor"),
+    (209, "TwitterMediaExtractor"),
+    (209, "TwitterLikesExtractor"),
+    (209, "TwitterBookmarkExtractor"),
+    (209, "TwitterListExtractor"),
+    (209, "TwitterListMembersExtractor"),
+    (209, "TwitterFollowingExtractor"),
+    (209, "TwitterFollowersExtractor"),
+    (209, "TwitterCommunityExtractor"),
+    (209, "TwitterCommunitiesExtractor"),
+    (209, "TwitterEventExtractor"),
+    (209, "TwitterTweetExtractor"),
+    (209, "TwitterQuotesExtractor"),
+    (209, "TwitterInfoExtractor"),
+    (209, "TwitterAvatarExtractor"),
+    (209, "TwitterBackgroundExtractor"),
+    (209, "TwitterImageExtractor"),
+    (210, "UrlgalleriesGalleryExtractor"),
+    (211, "UnsplashImageExtractor"),
+    (211, "UnsplashUserExtractor"),
+    (211, "UnsplashFavoriteExtractor"),
+    (211, "UnsplashCollectionExtractor"),
+    (211, "UnsplashSearchExtractor"),
+    (212, "UploadirFileExtractor"),
+    (213, "UrlshortenerLinkExtractor"),
+    (214, "VanillarockPostExtractor"),
+    (214, "VanillarockTagExtractor"),
+    (215, "VichanThreadExtractor"),
+    (215, "VichanBoardExtractor"),
+    (216, "VipergirlsThreadExtractor"),
+    (216, "VipergirlsPostExtractor"),
+    (217, "VkPhotosExtractor"),
+    (217, "VkAlbumExtractor"),
+    (217, "VkTaggedExtractor"),
+    (217, "VkWallPostExtractor"),
+    (218, "VscoUserExtractor"),
+    (218, "VscoGalleryExtractor"),
+    (218, "VscoCollectionExtractor"),
+    (218, "VscoSpaceExtractor"),
+    (218, "VscoSpacesExtractor"),
+    (218, "VscoAvatarExtractor"),
+    (218, "VscoImageExtractor"),
+    (218, "VscoVideoExtractor"),
+    (219, "WallhavenSearchExtractor"),
+    (219, "WallhavenCollectionExtractor"),
+    (219, "WallhavenUserExtractor"),
+    (219, "WallhavenCollectionsExtractor"),
+    (219, "WallhavenUploadsExtractor"),
+    (219, "WallhavenImageExtractor"),
+    (220, "WallpapercaveImageExtractor"),
+    (221, "WarosuThreadExtractor"),
+    (222, "WeasylSubmissionExtractor"),
+    (222, "WeasylSubmissionsExtractor"),
+    (222, "WeasylFolderExtractor"),
+    (222, "WeasylJournalExtractor"),
+    (222, "WeasylJournalsExtractor"),
+    (222, "WeasylFavoriteExtractor"),
+    (223, "WebmshareVideoExtractor"),
+    (224, "WebtoonsEpisodeExtractor"),
+    (224, "WebtoonsComicExtractor"),
+    (224, "WebtoonsArtistExtractor"),
+    (225, "WeebcentralChapterExtractor"),
+    (225, "WeebcentralMangaExtractor"),
+    (226, "WeebdexChapterExtractor"),
+    (226, "WeebdexMangaExtractor"),
+    (227, "WeiboUserExtractor"),
+    (227, "WeiboHomeExtractor"),
+    (227, "WeiboFeedExtractor"),
+    (227, "WeiboVideosExtractor"),
+    (227, "WeiboNewvideoExtractor"),
+    (227, "WeiboArticleExtractor"),
+    (227, "WeiboAlbumExtractor"),
+    (227, "WeiboStatusExtractor"),
+    (228, "WhypAudioExtractor"),
+    (228, "WhypUserExtractor"),
+    (228, "WhypCollectionExtractor"),
+    (229, "WikiartArtistExtractor"),
+    (229, "WikiartImageExtractor"),
+    (229, "WikiartArtworksExtractor"),
+    (229, "WikiartArtistsExtractor"),
+    (230, "WikifeetGalleryExtractor"),
+    (231, "WikimediaArticleExtractor"),
+    (231, "WikimediaWikiExtractor"),
+    (232, "XasiatAlbumExtractor"),
+    (232, "XasiatTagExtractor"),
+    (232, "XasiatCategoryExtractor"),
+    (232, "XasiatModelExtractor"),
+    (233, "XenforoPostExtractor"),
+    (233, "XenforoThreadExtractor"),
+    (233, "XenforoForumExtractor"),
+    (233, "XenforoMediaUserExtractor"),
+    (233, "XenforoMediaAlbumExtractor"),
+    (233, "XenforoMediaCategoryExtractor"),
+    (233, "XenforoMediaItemExtractor"),
+    (233, "XenforoProfileExtractor"),
+    (234, "XfolioWorkExtractor"),
+    (234, "XfolioUserExtractor"),
+    (234, "XfolioSeriesExtractor"),
+    (235, "XhamsterGalleryExtractor"),
+    (235, "XhamsterUserExtractor"),
+    (236, "XvideosGalleryExtractor"),
+    (236, "XvideosUserExtractor"),
+    (237, "YiffversePostExtractor"),
+    (237, "YiffversePlaylistExtractor"),
+    (237, "YiffverseTagExtractor"),
+    (238, "YourlesbiansAlbumExtractor"),
+    (239, "ZerochanTagExtractor"),
+    (239, "ZerochanImageExtractor"),
+    (241, "MoebooruTagExtractor"),
+    (241, "MoebooruPoolExtractor"),
+    (241, "MoebooruPostExtractor"),
+    (241, "MoebooruPopularExtractor"),
+    (242, "FoolfuukaThreadExtractor"),
+    (242, "FoolfuukaBoardExtractor"),
+    (242, "FoolfuukaSearchExtractor"),
+    (242, "FoolfuukaGalleryExtractor"),
+    (243, "FoolslideChapterExtractor"),
+    (243, "FoolslideMangaExtractor"),
+    (244, "MastodonUserExtractor"),
+    (244, "MastodonBookmarkExtractor"),
+    (244, "MastodonFavoriteExtractor"),
+    (244, "MastodonListExtractor"),
+    (244, "MastodonHashtagExtractor"),
+    (244, "MastodonFollowingExtractor"),
+    (244, "MastodonStatusExtractor"),
+    (245, "ShopifyCollectionExtractor"),
+    (245, "ShopifyProductExtractor"),
+    (246, "LolisafeAlbumExtractor"),
+    (247, "ImxtoImageExtractor"),
+    (247, "ImxtoGalleryExtractor"),
+    (247, "AcidimgImageExtractor"),
+    (247, "ImagevenueImageExtractor"),
+    (247, "ImagetwistImageExtractor"),
+    (247, "ImagetwistGalleryExtractor"),
+    (247, "ImgadultImageExtractor"),
+    (247, "ImgspiceImageExtractor"),
+    (247, "PixhostImageExtractor"),
+    (247, "PixhostGalleryExtractor"),
+    (247, "PostimgImageExtractor"),
+    (247, "PostimgGalleryExtractor"),
+    (247, "TurboimagehostImageExtractor"),
+    (247, "TurboimagehostGalleryExtractor"),
+    (247, "ViprImageExtractor"),
+    (247, "ImgclickImageExtractor"),
+    (247, "FappicImageExtractor"),
+    (247, "PicstateImageExtractor"),
+    (247, "ImgdriveImageExtractor"),
+    (247, "SilverpicImageExtractor"),
+    (247, "ImgpvImageExtractor"),
+    (248, "DirectlinkExtractor"),
+    (249, "RecursiveExtractor"),
+    (250, "OAuthFlickr"),
+    (250, "OAuthSmugmug"),
+    (250, "OAuthTumblr"),
+    (250, "OAuthDeviantart"),
+    (250, "OAuthReddit"),
+    (250, "OAuthMastodon"),
+    (250, "OAuthPixiv"),
+    (251, "NoopExtractor"),
+    (252, "YoutubeDLExtractor"),
+    (253, "GenericExtractor"),
+)
+
+PATTERNS = (
+    "(?:https?://)?2ch\\.(org|su|life|hk)/([^/?#]+)/res/(\\d+)",
+    "(?:https?://)?2ch\\.(org|su|life|hk)/([^/?#]+)/?$",
+    "(?:https?://)?([\\w-]+)\\.2chan\\.net/([^/?#]+)/res/(\\d+)",
+    "(?:2chen:(https?://[^/?#]+)|(?:https?://)?(?:(?:sturdychan\\.help|2che"
+    "n\\.(?:moe|club))()|schan\\.help()))/([^/?#]+)/(\\d+)",
+    "(?:2chen:(https?://[^/?#]+)|(?:https?://)?(?:(?:sturdychan\\.help|2che"
+    "n\\.(?:moe|club))()|schan\\.help()))/([^/?#]+)(?:/catalog|/?$)",
+    "(?:https?://)?(?:[a-z]+\\.)?35photo\\.pro/(?!photo_|genre_|tags/|ratin"
+    "g/)([^/?#]+)",
+    "(?:https?://)?(?:[a-z]+\\.)?35photo\\.pro/tags/([^/?#]+)",
+    "(?:https?://)?(?:[a-z]+\\.)?35photo\\.pro/genre_(\\d+)(/new/)?",
+    "(?:https?://)?(?:[a-z]+\\.)?35photo\\.pro/photo_(\\d+)",
+    "(?:https?://)?(?:www\\.)?behoimi\\.org/post(?:/(?:index)?)?\\?tags=(?P"
+    "<tags>[^&#]+)",
+    "(?:https?://)?(?:www\\.)?behoimi\\.org/pool/show/(?P<pool>\\d+)",
+    "(?:https?://)?(?:www\\.)?behoimi\\.org/post/show/(?P<post>\\d+)",
+    "(?:https?://)?(?:www\\.)?behoimi\\.org/post/popular_(?P<scale>by_(?:da"
+    "y|week|month)|recent)(?:\\?(?P<query>[^#]*))?",
+    "(?:https?://)?boards\\.4chan(?:nel)?\\.org/([^/]+)/thread/(\\d+)",
+    "(?:https?://)?boards\\.4chan(?:nel)?\\.org/([^/?#]+)/\\d*$",
+    "(?:https?://)?4archive\\.org/board/([^/?#]+)/thread/(\\d+)",
+    "(?:https?://)?4archive\\.org/board/([^/?#]+)(?:/(\\d+))?/?$",
+    "(?:https?://)?4chanarchives\\.com/board/([^/?#]+)/thread/(\\d+)",
+    "(?:https?://)?4chanarchives\\.com/board/([^/?#]+)(?:/(\\d+))?/?$",
+    "(?:https?://)?(?:web\\.)?500px\\.com/(?!photo/|liked)(?:p/)?([^/?#]+)/"
+    "?(?:$|[?#])",
+    "(?:https?://)?(?:web\\.)?500px\\.com/(?!photo/)(?:p/)?([^/?#]+)/galler"
+    "ies/([^/?#]+)",
+    "(?:https?://)?(?:web\\.)?500px\\.com/liked/?$",
+    "(?:https?://)?(?:web\\.)?500px\\.com/photo/(\\d+)",
+    "(?:https?://)?8chan\\.(moe|se|cc)/([^/?#]+)/(?:res|last)/(\\d+)",
+    "(?:https?://)?8chan\\.(moe|se|cc)/([^/?#]+)/(?:(\\d+)\\.html)?$",
+    "(?:https?://)?(?:comics\\.|www\\.)?8muses\\.com(/comics/album/[^?#]+)("
+    "\\?[^#]+)?",
+    "(?:https?://)?(?:www\\.)?adult(?:dvd)?empire\\.com(/(\\d+)/gallery\\.h"
+    "tml)",
+    "(?:https?://)?agn\\.ph/gallery/post/(?:\\?([^#]+))?$",
+    "(?:https?://)?agn\\.ph/gallery/post/show/(\\d+)",
+    "(?:https?://)?(?:www\\.)?ahottie\\.top(/albums/(\\w+))",
+    "(?:https?://)?(?:www\\.)?ahottie\\.top/tags/([^/?#]+)",
+    "(?:https?://)?(?:www\\.)?ahottie\\.top/search/?\\?([^#]+)",
+    "(?:https?://)?(?:www\\.)?allporncomic\\.com(/porncomic/([^/?#]+)/(\\d+"
+    "(?:-\\d+)?)?([^/?#]+))",
+    "(?:https?://)?(?:www\\.)?allporncomic\\.com/porncomic/([^/?#]+)",
+    "(?:https?://)?(?:www\\.)?allporncomic\\.com(/(?:porncomic-)?(?:genre|s"
+    "eries|group|artist|characters)/[^/?#]+(?:/page/\\d+)?)(/?\\?[^#]+)?",
+    "(?:https?://)?(?:www\\.)?a(?:rchiveofourown|o3)\\.(?:org|com|net)/work"
+    "s/(\\d+)",
+    "(?:https?://)?(?:www\\.)?a(?:rchiveofourown|o3)\\.(?:org|com|net)(/ser"
+    "ies/(\\d+))",
+    "(?:https?://)?(?:www\\.)?a(?:rchiveofourown|o3)\\.(?:org|com|net)(/tag"
+    "s/([^/?#]+)/works(?:/?\\?.+)?)",
+    "(?:https?://)?(?:www\\.)?a(?:rchiveofourown|o3)\\.(?:org|com|net)(/wor"
+    "ks/search/?\\?.+)",
+    "(?:https?://)?(?:www\\.)?a(?:rchiveofourown|o3)\\.(?:org|com|net)/user"
+    "s/([^/?#]+(?:/pseuds/[^/?#]+)?)(?:/profile)?/?(?:$|\\?|#)",
+    "(?:https?://)?(?:www\\.)?a(?:rchiveofourown|o3)\\.(?:org|com|net)(/use"
+    "rs/([^/?#]+)/(?:pseuds/([^/?#]+)/)?works(?:/?\\?.+)?)",
+    "(?:https?://)?(?:www\\.)?a(?:rchiveofourown|o3)\\.(?:org|com|net)(/use"
+    "rs/([^/?#]+)/(?:pseuds/([^/?#]+)/)?series(?:/?\\?.+)?)",
+    "(?:https?://)?(?:www\\.)?a(?:rchiveofourown|o3)\\.(?:org|com|net)(/use"
+    "rs/([^/?#]+)/(?:pseuds/([^/?#]+)/)?bookmarks(?:/?\\?.+)?)",
+    "(?:https?://)?(?:www\\.)?a(?:rchiveofourown|o3)\\.(?:org|com|net)(/use"
+    "rs/([^/?#]+)/subscriptions(?:/?\\?.+)?)",
+    "(?:https?://)?(?:www\\.)?arca\\.live/b/(?:\\w+)/(\\d+)",
+    "(?:https?://)?(?:www\\.)?arca\\.live/b/([^/?#]+)/?(?:\\?([^#]+))?$",
+    "(?:https?://)?(?:www\\.)?arca\\.live/u/@([^/?#]+)/?(?:\\?([^#]+))?$",
+    "(?:https?://)?architizer\\.com/projects/([^/?#]+)",
+    "(?:https?://)?architizer\\.com/firms/([^/?#]+)",
+    "(?:https?://)?(?:www\\.)?are\\.na/[^/?#]+/([^/?#]+)",
+    "(?:https?://)?(?:(?:www\\.)?artstation\\.com/(?!artwork|projects|searc"
+    "h)([^/?#]+)(?:/albums/all)?|((?!www)[\\w-]+)\\.artstation\\.com(?:/pro"
+    "jects)?)/?$",
+    "(?:https?://)?(?:(?:www\\.)?artstation\\.com/(?!artwork|projects|searc"
+    "h)([^/?#]+)|((?!www)[\\w-]+)\\.artstation\\.com)/albums/(\\d+)",
+    "(?:https?://)?(?:www\\.)?artstation\\.com/(?!artwork|projects|search)("
+    "[^/?#]+)/likes",
+    "(?:https?://)?(?:www\\.)?artstation\\.com/(?!artwork|projects|search)("
+    "[^/?#]+)/collections/(\\d+)",
+    "(?:https?://)?(?:www\\.)?artstation\\.com/(?!artwork|projects|search)("
+    "[^/?#]+)/collections/?$",
+    "(?:https?://)?(?:www\\.)?artstation\\.com/c(?:hallenges|ontests)/[^/?#"
+    "]+/c(?:ategori|halleng)es/(\\d+)/?(?:\\?sorting=([a-z]+))?",
+    "(?:https?://)?(?:\\w+\\.)?artstation\\.com/search/?\\?([^#]+)",
+    "(?:https?://)?(?:\\w+\\.)?artstation\\.com/artwork/?\\?([^#]+)",
+    "(?:https?://)?(?:(?:[\\w-]+\\.)?artstation\\.com/(?:artwork|projects|s"
+    "earch)|artstn\\.co/p)/(\\w+)",
+    "(?:https?://)?(?:www\\.)?artstation\\.com/(?!artwork|projects|search)("
+    "[^/?#]+)/following",
+    "(?:https?://)?(?:www\\.)?aryion\\.com/g4/(?:gallery/|user/|latest.php"
+    "\\?name=)([^/?#]+)",
+    "(?:https?://)?(?:www\\.)?aryion\\.com/g4/favorites/([^/?#]+)(?:/([^?#]"
+    "+))?",
+    "(?:https?://)?(?:www\\.)?aryion\\.com/g4/messagepage\\.php()",
+    "(?:https?://)?(?:www\\.)?aryion\\.com/g4/tags\\.php\\?([^#]+)",
+    "(?:https?://)?(?:www\\.)?aryion\\.com/g4/search\\.php\\?([^#]+)",
+    "(?:https?://)?(?:www\\.)?aryion\\.com/g4/view/(\\d+)",
+    "(?:https?://)?(?:www\\.)?audiochan\\.com/a/([^/?#]+)",
+    "(?:https?://)?(?:www\\.)?audiochan\\.com/u/([^/?#]+)",
+    "(?:https?://)?(?:www\\.)?audiochan\\.com/c/([^/?#]+)",
+    "(?:https?://)?(?:www\\.)?audiochan\\.com/search/?\\?([^#]+)",
+    "(?:https?://)?(?:www\\.)?bbc\\.co\\.uk(/programmes/[^/?#]+(?!/gallerie"
+    "s)(?:/[^/?#]+)?)$",
+    "(?:https?://)?(?:www\\.)?bbc\\.co\\.uk(/programmes/[^/?#]+/galleries)("
+    "?:/?\\?page=(\\d+))?",
+    "(?:https?://)?(?:www\\.)?behance\\.net/gallery/(\\d+)",
+    "(?:https?://)?(?:www\\.)?behance\\.net/([^/?#]+)/?$",
+    "(?:https?://)?(?:www\\.)?behance\\.net/collection/(\\d+)",
+    "(?:https?://)?(?:www\\.)?bellazon\\.com/main(/topic/\\d+-[^/?#]+(?:/pa"
+    "ge/\\d+)?)/?#(?:findC|c)omment-(\\d+)",
+    "(?:https?://)?(?:www\\.)?bellazon\\.com/main(/topic/\\d+-[^/?#]+)(?:/p"
+    "age/(\\d+))?",
+    "(?:https?://)?(?:www\\.)?bellazon\\.com/main(/forum/\\d+-[^/?#]+)(?:/p"
+    "age/(\\d+))?",
+    "(?:https?://)?(?:t\\.bilibili\\.com|(?:www\\.)?bilibili.com/opus)/(\\d"
+    "+)",
+    "(?:https?://)?space\\.bilibili\\.com/(\\d+)/(?:article|upload/opus|dyn"
+    "amic)",
+    "(?:https?://)?space\\.bilibili\\.com/(\\d+)/favlist\\?fid=opus",
+    "(?:blogger:(https?://[^/?#]+)|(?:https?://)?(?:[\\w-]+\\.blogspot\\.co"
+    "m()))(/\\d\\d\\d\\d/\\d\\d/[^/?#]+\\.html)",
+    "(?:blogger:(https?://[^/?#]+)|(?:https?://)?(?:[\\w-]+\\.blogspot\\.co"
+    "m()))/?$",
+    "(?:blogger:(https?://[^/?#]+)|(?:https?://)?(?:[\\w-]+\\.blogspot\\.co"
+    "m()))/search/?\\?q=([^&#]+)",
+    "(?:blogger:(https?://[^/?#]+)|(?:https?://)?(?:[\\w-]+\\.blogspot\\.co"
+    "m()))/search/label/([^/?#]+)",
+    "(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky"
+    "\\.dev)/profile/([^/?#]+)$",
+    "(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky"
+    "\\.dev)/profile/([^/?#]+)/posts",
+    "(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky"
+    "\\.dev)/profile/([^/?#]+)/replies",
+    "(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky"
+    "\\.dev)/profile/([^/?#]+)/media",
+    "(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky"
+    "\\.dev)/profile/([^/?#]+)/video",
+    "(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky"
+    "\\.dev)/profile/([^/?#]+)/likes",
+    "(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky"
+    "\\.dev)/profile/([^/?#]+)/feed/([^/?#]+)",
+    "(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky"
+    "\\.dev)/profile/([^/?#]+)/lists/([^/?#]+)",
+    "(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky"
+    "\\.dev)/profile/([^/?#]+)/follows",
+    "(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky"
+    "\\.dev)/profile/([^/?#]+)/post/([^/?#]+)",
+    "(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky"
+    "\\.dev)/profile/([^/?#]+)/info",
+    "(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky"
+    "\\.dev)/profile/([^/?#]+)/avatar",
+    "(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky"
+    "\\.dev)/profile/([^/?#]+)/ba(?:nner|ckground)",
+    "(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky"
+    "\\.dev)/search(?:/|\\?q=)(.+)",
+    "(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky"
+    "\\.dev)/hashtag/([^/?#]+)(?:/(top|latest))?",
+    "(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky"
+    "\\.dev)/saved",
+    "(?:https?://)?boosty\\.to/([^/?#]+)(?:\\?([^#]+))?$",
+    "(?:https?://)?boosty\\.to/([^/?#]+)/media/([^/?#]+)(?:\\?([^#]+))?",
+    "(?:https?://)?boosty\\.to/(?:\\?([^#]+))?(?:$|#)",
+    "(?:https?://)?boosty\\.to/([^/?#]+)/posts/([0-9a-f-]+)",
+    "(?:https?://)?boosty\\.to/app/settings/subscriptions",
+    "(?:https?://)?boosty\\.to/app/messages/?\\?dialogId=(\\d+)",
+    "(?:https?://)?(?:[\\w-]+\\.)?booth\\.pm/(?:[a-z]{2}(?:-[^/?#]+)?/)?ite"
+    "ms/(\\d+)",
+    "(?:https?://)?([\\w-]+\\.)booth\\.pm/",
+    "(?:https?://)?booth\\.pm(/[a-z]{2}(?:-[^/?#]+)?/browse/.+)",
+    "(?:bunkr:(?:https?://)?([^/?#]+)|(?:https?://)?(?:app\\.)?(bunkr+\\.(?"
+    ":s[kiu]|c[ir]|fi|p[hks]|ru|la|is|to|a[cx]|black|cat|media|red|site|ws|"
+    "org)))/a/([^/?#]+)",
+    "(?:bunkr:(?:https?://)?([^/?#]+)|(?:https?://)?(?:app\\.)?(bunkr+\\.(?"
+    ":s[kiu]|c[ir]|fi|p[hks]|ru|la|is|to|a[cx]|black|cat|media|red|site|ws|"
+    "org)))(/[fvid]/[^/?#]+)",
+    "(?:https?://)?(?:www\\.)?catbox\\.moe(/c/[^/?#]+)",
+    "(?:https?://)?(?:files|litter|de)\\.catbox\\.moe/([^/?#]+)",
+    "(?:https?://)?(?:www\\.)?cfake\\.com/images/(celebrity)/([^/?#]+)/(\\d"
+    "+)()(?:/p(\\d+))?",
+    "(?:https?://)?(?:www\\.)?cfake\\.com/images/(categories)/([^/?#]+)/(\\"
+    "d+)()(?:/p(\\d+))?",
+    "(?:https?://)?(?:www\\.)?cfake\\.com/images/(created)/([^/?#]+)/(\\d+)"
+    "/(\\d+)(?:/p(\\d+))?",
+    "(?:https?://)?(?:www\\.)?cfake\\.com/images/(country)/([^/?#]+)/(\\d+)"
+    "/(\\d+)(?:/p(\\d+))?",
+    "(?:chevereto:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?jpe?g\\d?"
+    "\\.(?:cr|su|pet|fish(?:ing)?|church)()|(?:www\\.)?imglike\\.com()|(?:w"
+    "ww\\.)?putme(?:ga\\.com|\\.ga)()))(/(?:im(?:g|age)|video|i)/[^/?#]+)",
+    "(?:chevereto:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?jpe?g\\d?"
+    "\\.(?:cr|su|pet|fish(?:ing)?|church)()|(?:www\\.)?imglike\\.com()|(?:w"
+    "ww\\.)?putme(?:ga\\.com|\\.ga)()))(/a(?:lbum)?/[^/?#]+(?:/sub)?)",
+    "(?:chevereto:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?jpe?g\\d?"
+    "\\.(?:cr|su|pet|fish(?:ing)?|church)()|(?:www\\.)?imglike\\.com()|(?:w"
+    "ww\\.)?putme(?:ga\\.com|\\.ga)()))(/category/[^/?#]+)",
+    "(?:chevereto:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?jpe?g\\d?"
+    "\\.(?:cr|su|pet|fish(?:ing)?|church)()|(?:www\\.)?imglike\\.com()|(?:w"
+    "ww\\.)?putme(?:ga\\.com|\\.ga)()))(/[^/?#]+(?:/albums)?)",
+    "(?:https?://)?ci-en\\.(?:net|dlsite\\.com)/creator/(\\d+)/article/(\\d"
+    "+)",
+    "(?:https?://)?ci-en\\.(?:net|dlsite\\.com)/creator/(\\d+)(?:/article(?"
+    ":\\?([^#]+))?)?/?$",
+    "(?:https?://)?ci-en\\.(?:net|dlsite\\.com)/mypage/recent(?:\\?([^#]+))"
+    "?",
+    "(?:https?://)?ci-en\\.(?:net|dlsite\\.com)/mypage/subscription(/follow"
+    "ing)?",
+    "(?:https?://)?civitai\\.com/models/(\\d+)(?:/?\\?modelVersionId=(\\d+)"
+    ")?",
+    "(?:https?://)?civitai\\.com/images/(\\d+)",
+    "(?:https?://)?civitai\\.com/collections/(\\d+)",
+    "(?:https?://)?civitai\\.com/posts/(\\d+)",
+    "(?:https?://)?civitai\\.com/tag/([^/?&#]+)",
+    "(?:https?://)?civitai\\.com/search/models\\?([^#]+)",
+    "(?:https?://)?civitai\\.com/search/images\\?([^#]+)",
+    "(?:https?://)?civitai\\.com/models(?:/?\\?([^#]+))?(?:$|#)",
+    "(?:https?://)?civitai\\.com/images(?:/?\\?([^#]+))?(?:$|#)",
+    "(?:https?://)?civitai\\.com/videos(?:/?\\?([^#]+))?(?:$|#)",
+    "(?:https?://)?civitai\\.com/posts(?:/?\\?([^#]+))?(?:$|#)",
+    "(?:https?://)?civitai\\.com/user/([^/?#]+)/?(?:$|\\?|#)",
+    "(?:https?://)?civitai\\.com/user/([^/?#]+)/models/?(?:\\?([^#]+))?",
+    "(?:https?://)?civitai\\.com/user/([^/?#]+)/posts/?(?:\\?([^#]+))?",
+    "(?:https?://)?civitai\\.com/user/([^/?#]+)/images/?(?:\\?([^#]+))?",
+    "(?:https?://)?civitai\\.com/user/([^/?#]+)/videos/?(?:\\?([^#]+))?",
+    "(?:https?://)?civitai\\.com/user/([^/?#]+)/collections/?(?:\\?([^#]+))"
+    "?",
+    "(?:https?://)?civitai\\.com/generate",
+    "(?:https?://)?(?:www\\.)?comedywildlifephoto\\.com(/gallery/[^/?#]+/[^"
+    "/?#]+\\.php)",
+    "(?:https?://)?(?:www\\.)?comick\\.io/comic/([\\w-]+)/cover",
+    "(?:https?://)?(?:www\\.)?comick\\.io/comic/([\\w-]+)/(\\w+(?:-(?:chapt"
+    "er|volume)-[^/?#]+)?)",
+    "(?:https?://)?(?:www\\.)?comick\\.io/comic/([\\w-]+)/?(?:\\?([^#]+))?",
+    "(?:https?://)?comicvine\\.gamespot\\.com(/([^/?#]+)/(\\d+-\\d+)/images"
+    "/.*)",
+    "(?:https?://)?(?:www\\.)?cyberdrop\\.(?:cr|me|to)/a/([^/?#]+)",
+    "(?:https?://)?(?:www\\.)?cyberdrop\\.(?:cr|me|to)/[ef]/([^/?#]+)",
+    "(?:https?://)?(?:www\\.)?cyberfile\\.me/folder/([0-9a-f]+)",
+    "(?:https?://)?(?:www\\.)?cyberfile\\.me/shared/([a-zA-Z0-9]+)",
+    "(?:https?://)?(?:www\\.)?cyberfile\\.me/([a-zA-Z0-9]+)",
+    "(?:Danbooru:(https?://[^/?#]+)|(?:https?://)?(?:(?:(?:danbooru|hijirib"
+    "e|sonohara|safebooru)\\.donmai\\.us|donmai\\.moe)()|booru\\.allthefall"
+    "en\\.moe()|(?:safe\\.|general\\.)?aibooru\\.(?:online|download)()|boor"
+    "u\\.borvar\\.art()))/posts\\?(?:[^&#]*&)*tags=([^&#]*)",
+    "(?:Danbooru:(https?://[^/?#]+)|(?:https?://)?(?:(?:(?:danbooru|hijirib"
+    "e|sonohara|safebooru)\\.donmai\\.us|donmai\\.moe)()|booru\\.allthefall"
+    "en\\.moe()|(?:safe\\.|general\\.)?aibooru\\.(?:online|download)()|boor"
+    "u\\.borvar\\.art()))/posts/random(?:\\?(?:[^&#]*&)*tags=([^&#]*))?",
+    "(?:Danbooru:(https?://[^/?#]+)|(?:https?://)?(?:(?:(?:danbooru|hijirib"
+    "e|sonohara|safebooru)\\.donmai\\.us|donmai\\.moe)()|booru\\.allthefall"
+    "en\\.moe()|(?:safe\\.|general\\.)?aibooru\\.(?:online|download)()|boor"
+    "u\\.borvar\\.art()))/pool(?:s|/show)/(\\d+)",
+    "(?:Danbooru:(https?://[^/?#]+)|(?:https?://)?(?:(?:(?:danbooru|hijirib"
+    "e|sonohara|safebooru)\\.donmai\\.us|donmai\\.moe)()|booru\\.allthefall"
+    "en\\.moe()|(?:safe\\.|general\\.)?aibooru\\.(?:online|download)()|boor"
+    "u\\.borvar\\.art()))/favorite_group(?:s|/show)/(\\d+)",
+    "(?:Danbooru:(https?://[^/?#]+)|(?:https?://)?(?:(?:(?:danbooru|hijirib"
+    "e|sonohara|safebooru)\\.donmai\\.us|donmai\\.moe)()|booru\\.allthefall"
+    "en\\.moe()|(?:safe\\.|general\\.)?aibooru\\.(?:online|download)()|boor"
+    "u\\.borvar\\.art()))/post(?:s|/show)/(\\d+)",
+    "(?:Danbooru:(https?://[^/?#]+)|(?:https?://)?(?:(?:(?:danbooru|hijirib"
+    "e|sonohara|safebooru)\\.donmai\\.us|donmai\\.moe)()|booru\\.allthefall"
+    "en\\.moe()|(?:safe\\.|general\\.)?aibooru\\.(?:online|download)()|boor"
+    "u\\.borvar\\.art()))/media_assets/(\\d+)",
+    "(?:Danbooru:(https?://[^/?#]+)|(?:https?://)?(?:(?:(?:danbooru|hijirib"
+    "e|sonohara|safebooru)\\.donmai\\.us|donmai\\.moe)()|booru\\.allthefall"
+    "en\\.moe()|(?:safe\\.|general\\.)?aibooru\\.(?:online|download)()|boor"
+    "u\\.borvar\\.art()))/(?:explore/posts/)?popular(?:\\?([^#]*))?",
+    "(?:Danbooru:(https?://[^/?#]+)|(?:https?://)?(?:(?:(?:danbooru|hijirib"
+    "e|sonohara|safebooru)\\.donmai\\.us|donmai\\.moe)()|booru\\.allthefall"
+    "en\\.moe()|(?:safe\\.|general\\.)?aibooru\\.(?:online|download)()|boor"
+    "u\\.borvar\\.art()))/artists/(\\d+)",
+    "(?:Danbooru:(https?://[^/?#]+)|(?:https?://)?(?:(?:(?:danbooru|hijirib"
+    "e|sonohara|safebooru)\\.donmai\\.us|donmai\\.moe)()|booru\\.allthefall"
+    "en\\.moe()|(?:safe\\.|general\\.)?aibooru\\.(?:online|download)()|boor"
+    "u\\.borvar\\.art()))/artists/?\\?([^#]+)",
+    "(?:https?://)?(?:www\\.)?dandadan\\.net(/manga/dandadan-chapter-([^/?#"
+    "]+)/?)",
+    "(?:https?://)?(?:www\\.)?dandadan\\.net(/)",
+    "(?:https?://)?(?:www\\.)?danke\\.moe/read(?:er)?/(?:manga|series)/([\\"
+    "w-]+)/([\\w-]+)",
+    "(?:https?://)?(?:www\\.)?danke\\.moe/read(?:er)?/(?:manga|series)/([\\"
+    "w-]+)",
+    "(?:https?://)?desktopography\\.net/$",
+    "(?:https?://)?desktopography\\.net/exhibition-([^/?#]+)/",
+    "(?:https?://)?desktopography\\.net/portfolios/([\\w-]+)",
+    "(?:https?://)?(?:(?:www\\.)?(?:fx)?deviantart\\.com/(?!watch/)([\\w-]+"
+    ")|(?!www\\.)([\\w-]+)\\.(?:fx)?deviantart\\.com)/?$",
+    "(?:https?://)?(?:(?:www\\.)?(?:fx)?deviantart\\.com/(?!watch/)([\\w-]+"
+    ")|(?!www\\.)([\\w-]+)\\.(?:fx)?deviantart\\.com)/gallery(?:/all|/recom"
+    "mended-for-you)?/?(\\?(?!q=|catpath=scraps).*)?$",
+    "(?:https?://)?(?:(?:www\\.)?(?:fx)?deviantart\\.com/(?!watch/)([\\w-]+"
+    ")|(?!www\\.)([\\w-]+)\\.(?:fx)?deviantart\\.com)/avatar",
+    "(?:https?://)?(?:(?:www\\.)?(?:fx)?deviantart\\.com/(?!watch/)([\\w-]+"
+    ")|(?!www\\.)([\\w-]+)\\.(?:fx)?deviantart\\.com)/ba(?:nner|ckground)",
+    "(?:https?://)?(?:(?:www\\.)?(?:fx)?deviantart\\.com/(?!watch/)([\\w-]+"
+    ")|(?!www\\.)([\\w-]+)\\.(?:fx)?deviantart\\.com)/gallery/([^/?#]+)/([^"
+    "/?#]+)",
+    "(?:https?://)?(?:(?:www\\.)?deviantart\\.com/stash|sta\\.s(h))/([a-z0-"
+    "9]+)",
+    "(?:https?://)?(?:(?:www\\.)?(?:fx)?deviantart\\.com/(?!watch/)([\\w-]+"
+    ")|(?!www\\.)([\\w-]+)\\.(?:fx)?deviantart\\.com)/favourites(?:/all|/?"
+    "\\?catpath=)?/?$",
+    "(?:https?://)?(?:(?:www\\.)?(?:fx)?deviantart\\.com/(?!watch/)([\\w-]+"
+    ")|(?!www\\.)([\\w-]+)\\.(?:fx)?deviantart\\.com)/favourites/([^/?#]+)/"
+    "([^/?#]+)",
+    "(?:https?://)?(?:(?:www\\.)?(?:fx)?deviantart\\.com/(?!watch/)([\\w-]+"
+    ")|(?!www\\.)([\\w-]+)\\.(?:fx)?deviantart\\.com)/(?:posts(?:/journals)"
+    "?|journal)/?(?:\\?.*)?$",
+    "(?:https?://)?(?:(?:www\\.)?(?:fx)?deviantart\\.com/(?!watch/)([\\w-]+"
+    ")|(?!www\\.)([\\w-]+)\\.(?:fx)?deviantart\\.com)/posts/statuses",
+    "(?:https?://)?www\\.deviantart\\.com/tag/([^/?#]+)",
+    "(?:https?://)?(?:www\\.)?deviantart\\.com/(?:watch/deviations|notifica"
+    "tions/watch)()()",
+    "(?:https?://)?(?:www\\.)?deviantart\\.com/watch/posts()()",
+    "(?:https?://)?(?:(?:www\\.)?(?:fx)?deviantart\\.com/(?!watch/)([\\w-]+"
+    ")|(?!www\\.)([\\w-]+)\\.(?:fx)?deviantart\\.com)/(art|journal)/(?:[^/?"
+    "#]+-)?(\\d+)|(?:https?://)?(?:www\\.)?(?:fx)?deviantart\\.com/(?:view/"
+    "|deviation/|view(?:-full)?\\.php/*\\?(?:[^#]+&)?id=)(\\d+)|(?:https?:/"
+    "/)?fav\\.me/d([0-9a-z]+)",
+    "(?:https?://)?(?:(?:www\\.)?(?:fx)?deviantart\\.com/(?!watch/)([\\w-]+"
+    ")|(?!www\\.)([\\w-]+)\\.(?:fx)?deviantart\\.com)/gallery/(?:\\?catpath"
+    "=)?scraps\\b",
+    "(?:https?://)?www\\.deviantart\\.com/search(?:/deviations)?/?\\?([^#]+"
+    ")",
+    "(?:https?://)?(?:(?:www\\.)?(?:fx)?deviantart\\.com/(?!watch/)([\\w-]+"
+    ")|(?!www\\.)([\\w-]+)\\.(?:fx)?deviantart\\.com)/gallery/?\\?(q=[^#]+)",
+    "(?:https?://)?(?:(?:www\\.)?(?:fx)?deviantart\\.com/(?!watch/)([\\w-]+"
+    ")|(?!www\\.)([\\w-]+)\\.(?:fx)?deviantart\\.com)/(?:about#)?watching",
+    "(?:https?://)?discord\\.com/channels/(\\d+)/(?:\\d+/threads/)?(\\d+)/?"
+    "$",
+    "(?:https?://)?discord\\.com/channels/(\\d+)/(\\d+)/(\\d+)/?$",
+    "(?:https?://)?discord\\.com/channels/(\\d+)/(?:assets?|files)(?:/([\\w"
+    "-]+))?/?$",
+    "(?:https?://)?discord\\.com/channels/(\\d+)/search/?\\?([^#]+)",
+    "(?:https?://)?discord\\.com/channels/(\\d+)/?$",
+    "(?:https?://)?discord\\.com/channels/@me/(\\d+)/?$",
+    "(?:https?://)?discord\\.com/channels/@me/(\\d+)/(\\d+)/?$",
+    "(?:https?://)?(?:www\\.)?dynasty-scans\\.com(/chapters/[^/?#]+)",
+    "(?:https?://)?(?:www\\.)?dynasty-scans\\.com(/series/[^/?#]+)",
+    "(?:https?://)?(?:www\\.)?dynasty-scans\\.com/images/?(?:\\?([^#]+))?$",
+    "(?:https?://)?(?:www\\.)?dynasty-scans\\.com/images/(\\d+)",
+    "(?:https?://)?(?:www\\.)?dynasty-scans\\.com/anthologies/([^/?#]+)",
+    "(?:E621:(https?://[^/?#]+)|(?:https?://)?(?:e621\\.(?:net|cc)()|e926\\"
+    ".net()|e6ai\\.net()))/posts?(?:\\?[^#]*?tags=|/index/\\d+/)([^&#]*)",
+    "(?:E621:(https?://[^/?#]+)|(?:https?://)?(?:e621\\.(?:net|cc)()|e926\\"
+    ".net()|e6ai\\.net()))/pool(?:s|/show)/(\\d+)",
+    "(?:E621:(https?://[^/?#]+)|(?:https?://)?(?:e621\\.(?:net|cc)()|e926\\"
+    ".net()|e6ai\\.net()))/p(?:ost(?:s|/show)/(\\d+)|/(\\w+))",
+    "(?:E621:(https?://[^/?#]+)|(?:https?://)?(?:e621\\.(?:net|cc)()|e926\\"
+    ".net()|e6ai\\.net()))/explore/posts/popular(?:\\?([^#]*))?",
+    "(?:E621:(https?://[^/?#]+)|(?:https?://)?(?:e621\\.(?:net|cc)()|e926\\"
+    ".net()|e6ai\\.net()))/artists/(\\d+)",
+    "(?:E621:(https?://[^/?#]+)|(?:https?://)?(?:e621\\.(?:net|cc)()|e926\\"
+    ".net()|e6ai\\.net()))/artists/?\\?([^#]+)",
+    "(?:E621:(https?://[^/?#]+)|(?:https?://)?(?:e621\\.(?:net|cc)()|e926\\"
+    ".net()|e6ai\\.net()))/favorites(?:\\?([^#]*))?",
+    "(?:https?://)?e621\\.(?:cc/\\?tags|anthro\\.fr/\\?q)=([^&#]*)",
+    "(?:https?://)?(?:www\\.)?eporner\\.com/gallery/(\\w+)(?:/([\\w-]+))?",
+    "(?:https?://)?(?:www\\.)?erome\\.com/a/(\\w+)",
+    "(?:https?://)?(?:www\\.)?erome\\.com/(?!a/|search\\?)([^/?#]+)(?:/?\\?"
+    "([^#]+))?",
+    "(?:https?://)?(?:www\\.)?erome\\.com/search/?\\?(q=[^#]+)",
+    "(?:https?://)?everia\\.club(/\\d{4}/\\d{2}/\\d{2}/[^/?#]+)",
+    "(?:https?://)?everia\\.club(/tag/[^/?#]+)",
+    "(?:https?://)?everia\\.club(/category/[^/?#]+)",
+    "(?:https?://)?everia\\.club(/\\d{4}(?:/\\d{2})?(?:/\\d{2})?)(?:/page/"
+    "\\d+)?/?$",
+    "(?:https?://)?everia\\.club/(?:page/\\d+/)?\\?s=([^&#]+)",
+    "(?:https?://)?(?:[\\w-]+\\.)?facebook\\.com/(?:[^/?#]+/photos/[^/?#]+/"
+    "|photo(?:.php)?/?\\?(?:[^&#]+&)*fbid=)([^/?&#]+)[^/?#]*(?<!&setextract"
+    ")$",
+    "(?:https?://)?(?:[\\w-]+\\.)?facebook\\.com/(?:(?:media/set|photo)/?\\"
+    "?(?:[^&#]+&)*set=([^&#]+)[^/?#]*(?<!&setextract)$|[^/?#]+/posts/([^/?#"
+    "]+)|photo/\\?(?:[^&#]+&)*fbid=([^/?&#]+)&set=([^/?&#]+)&setextract|(?:"
+    "groups/)?(?:[^/?#]+/)?(?:permalink|posts)(?:\\.php)?(?:/(\\d+)|\\?\\w+"
+    "=([^/?#]+))|events/[^/?#]+/\\??post_id=(\\d+))",
+    "(?:https?://)?(?:[\\w-]+\\.)?facebook\\.com/(?:[^/?#]+/videos/|watch/?"
+    "\\?v=)([^/?&#]+)",
+    "(?:https?://)?(?:[\\w-]+\\.)?facebook\\.com/(?!media/|photo/|photo.php"
+    "|watch/|permalink.php)(?:profile\\.php\\?id=|people/[^/?#]+/)?([^/?&#]"
+    "+)/info",
+    "(?:https?://)?(?:[\\w-]+\\.)?facebook\\.com/(?!media/|photo/|photo.php"
+    "|watch/|permalink.php)(?:profile\\.php\\?id=|people/[^/?#]+/)?([^/?&#]"
+    "+)/photos_albums(?:/([^/?#]+))?",
+    "(?:https?://)?(?:[\\w-]+\\.)?facebook\\.com/(?!media/|photo/|photo.php"
+    "|watch/|permalink.php)(?:profile\\.php\\?id=|people/[^/?#]+/)?([^/?&#]"
+    "+)/photos(?:_by)?",
+    "(?:https?://)?(?:[\\w-]+\\.)?facebook\\.com/(?!media/|photo/|photo.php"
+    "|watch/|permalink.php)(?:profile\\.php\\?id=|people/[^/?#]+/)?([^/?&#]"
+    "+)/avatar",
+    "(?:https?://)?(?:[\\w-]+\\.)?facebook\\.com/(?!media/|photo/|photo.php"
+    "|watch/|permalink.php)(?:profile\\.php\\?id=|people/[^/?#]+/)?([^/?&#]"
+    "+)/?(?:$|\\?|#)",
+    "(?:https?://)?(?:(?!www\\.)([\\w-]+)\\.fanbox\\.cc|(?:www\\.)?fanbox\\"
+    ".cc/@([\\w-]+))(?:/posts)?/?$",
+    "(?:https?://)?(?:(?!www\\.)([\\w-]+)\\.fanbox\\.cc|(?:www\\.)?fanbox\\"
+    ".cc/@([\\w-]+))/tags/([^/?#]+)",
+    "(?:https?://)?(?:(?!www\\.)([\\w-]+)\\.fanbox\\.cc|(?:www\\.)?fanbox\\"
+    ".cc/@([\\w-]+))/posts/(\\d+)",
+    "(?:https?://)?(?:www\\.)?fanbox\\.cc/?$",
+    "(?:https?://)?(?:www\\.)?fanbox\\.cc/home/supporting",
+    "(?:https?://)?(?:www\\.)?pixiv\\.net/fanbox/creator/(\\d+)",
+    "(?:https?://)?(?:www\\.)?fansly\\.com/post/(\\d+)",
+    "(?:https?://)?(?:www\\.)?fansly\\.com/home(?:/(?:subscribed()|list/(\\"
+    "d+)))?",
+    "(?:https?://)?(?:www\\.)?fansly\\.com/lists/(\\d+)",
+    "(?:https?://)?(?:www\\.)?fansly\\.com/lists",
+    "(?:https?://)?(?:www\\.)?fansly\\.com/([^/?#]+)/posts(?:/wall/(\\d+))?",
+    "(?:https?://)?(?:www\\.)?fansly\\.com/([^/?#]+)/media(?:/wall/(\\d+))?",
+    "(?:https?://)?(?:www\\.)?fantia\\.jp/fanclubs/(\\d+)",
+    "(?:https?://)?(?:www\\.)?fantia\\.jp/posts/(\\d+)",
+    "(?:https?://)?(?:www\\.)?fantia\\.jp/mypage/users/plans(?:\\?type=((?:"
+    "not_)?free))?",
+    "(?:https?://)?(?:www\\.)?fapello\\.(?:com|su)/(?!search/|popular_video"
+    "s/)([^/?#]+)/(\\d+)",
+    "(?:https?://)?(?:www\\.)?fapello\\.(?:com|su)/(?!top-(?:likes|follower"
+    "s)|popular_videos|videos|trending|search/?$)([^/?#]+)/?$",
+    "(?:https?://)?(?:www\\.)?fapello\\.(?:com|su)/(?!search/?$)(top-(?:lik"
+    "es|followers)|videos|trending|popular_videos/[^/?#]+)/?$",
+    "(?:https?://)?(?:www\\.)?fapachi\\.com/(?!search/)([^/?#]+)/media/(\\d"
+    "+)",
+    "(?:https?://)?(?:www\\.)?fapachi\\.com/(?!search(?:/|$))([^/?#]+)(?:/p"
+    "age/(\\d+))?$",
+    "(?:https?://)?(?:www\\.)?fikfap\\.com/(?:user/[^/?#]+/)?post/(\\d+)",
+    "(?:https?://)?(?:www\\.)?fikfap\\.com/user/([^/?#]+)",
+    "(?:https?://)?(?:www\\.)?fikfap\\.com/hash/([^/?#]+)",
+    "(?:https?://)?(?:www\\.)?filester\\.me/d/([^/?#]+)",
+    "(?:https?://)?(?:www\\.)?filester\\.me/f/([^/?#]+)",
+    "(?:https?://)?(?:www\\.)?fitnakedgirls\\.com/photos/gallery/([\\w-]+)/"
+    "?$",
+    "(?:https?://)?(?:www\\.)?fitnakedgirls\\.com/photos/gallery/category/("
+    "[\\w-]+)",
+    "(?:https?://)?(?:www\\.)?fitnakedgirls\\.com/photos/gallery/tag/([\\w-"
+    "]+)",
+    "(?:https?://)?(?:www\\.)?fitnakedgirls\\.com/videos/(\\d+)/(\\d+)/([\\"
+    "w-]+)",
+    "(?:https?://)?(?:www\\.)?fitnakedgirls\\.com/fitblog/([\\w-]+)",
+    "(?:https?://)?(?:(?:(?:www\\.|secure\\.|m\\.)?flickr\\.com/photos/[^/?"
+    "#]+/|[\\w-]+\\.static\\.?flickr\\.com/(?:\\d+/)+)(\\d+)|flic\\.kr/p/(["
+    "A-Za-z1-9]+))",
+    "(?:https?://)?(?:www\\.|secure\\.|m\\.)?flickr\\.com/photos/([^/?#]+)/"
+    "(?:album|set)s(?:/(\\d+))?",
+    "(?:https?://)?(?:www\\.|secure\\.|m\\.)?flickr\\.com/photos/([^/?#]+)/"
+    "galleries/(\\d+)",
+    "(?:https?://)?(?:www\\.|secure\\.|m\\.)?flickr\\.com/groups/([^/?#]+)",
+    "(?:https?://)?(?:www\\.|secure\\.|m\\.)?flickr\\.com/photos/([^/?#]+)/"
+    "?$",
+    "(?:https?://)?(?:www\\.|secure\\.|m\\.)?flickr\\.com/photos/([^/?#]+)/"
+    "favorites",
+    "(?:https?://)?(?:www\\.|secure\\.|m\\.)?flickr\\.com/search/?\\?([^#]+"
+    ")",
+    "(?:https?://)?(?:www\\.)?fori(?:io\\.com|\\.io)/works/(\\d+)",
+    "(?:https?://)?(?:www\\.)?fori(?:io\\.com|\\.io)/(?!works/)([^/?#]+)",
+    "(?:https?://)?(?:www\\.|sfw\\.)?(?:f[ux]|f?xfu)raffinity\\.net/gallery"
+    "/([^/?#]+)(?:$|/(?!folder/))",
+    "(?:https?://)?(?:www\\.|sfw\\.)?(?:f[ux]|f?xfu)raffinity\\.net/gallery"
+    "/([^/?#]+)/folder/(\\d+)(?:/([^/?#]+))?",
+    "(?:https?://)?(?:www\\.|sfw\\.)?(?:f[ux]|f?xfu)raffinity\\.net/scraps/"
+    "([^/?#]+)",
+    "(?:https?://)?(?:www\\.|sfw\\.)?(?:f[ux]|f?xfu)raffinity\\.net/favorit"
+    "es/([^/?#]+)(/\\d+/(?:next|prev))?",
+    "(?:https?://)?(?:www\\.|sfw\\.)?(?:f[ux]|f?xfu)raffinity\\.net/search("
+    "?:/([^/?#]+))?/?[?&]([^#]+)",
+    "(?:https?://)?(?:www\\.|sfw\\.)?(?:f[ux]|f?xfu)raffinity\\.net/(?:view"
+    "|full)/(\\d+)",
+    "(?:https?://)?(?:www\\.|sfw\\.)?(?:f[ux]|f?xfu)raffinity\\.net/user/(["
+    "^/?#]+)",
+    "(?:https?://)?(?:www\\.|sfw\\.)?(?:f[ux]|f?xfu)raffinity\\.net/watchli"
+    "st/by/([^/?#]+)",
+    "(?:https?://)?(?:www\\.|sfw\\.)?(?:f[ux]|f?xfu)raffinity\\.net(/msg/su"
+    "bmissions(?:/[^/?#]+)?)",
+    "(?:https?://)?(?:www\\.)?furry34\\.com/post/(\\d+)",
+    "(?:https?://)?(?:www\\.)?furry34\\.com/playlists/view/(\\d+)",
+    "(?:https?://)?(?:www\\.)?furry34\\.com/(?:([^/?#]+))?(?:/?\\?([^#]+))?"
+    "(?:$|#)",
+    "(?:https?://)?fuskator\\.com/(?:thumbs|expanded)/([^/?#]+)",
+    "(?:https?://)?fuskator\\.com(/(?:search|page)/.+)",
+    "(?:https?://)?(?:www\\.)?gelbooru\\.com/(?:index\\.php)?\\?page=post&s"
+    "=list&tags=([^&#]*)",
+    "(?:https?://)?(?:www\\.)?gelbooru\\.com/(?:index\\.php)?\\?page=pool&s"
+    "=show&id=(\\d+)",
+    "(?:https?://)?(?:www\\.)?gelbooru\\.com/(?:index\\.php)?\\?page=favori"
+    "tes&s=view&id=(\\d+)",
+    "(?:https?://)?(?:www\\.)?gelbooru\\.com/(?:index\\.php)?\\?(?=(?:[^#]+"
+    "&)?page=post(?:&|#|$))(?=(?:[^#]+&)?s=view(?:&|#|$))(?:[^#]+&)?id=(\\d"
+    "+)",
+    "(?:https?://)?(?:www\\.)?gelbooru\\.com/redirect\\.php\\?s=([^&#]+)",
+    "(?:gelbooru_v01:(https?://[^/?#]+)|(?:https?://)?(?:the-collection\\.b"
+    "ooru\\.org()|illusioncards\\.booru\\.org()|allgirl\\.booru\\.org()|dra"
+    "wfriends\\.booru\\.org()|vidyart2\\.booru\\.org()))/index\\.php\\?page"
+    "=post&s=list&tags=([^&#]+)",
+    "(?:gelbooru_v01:(https?://[^/?#]+)|(?:https?://)?(?:the-collection\\.b"
+    "ooru\\.org()|illusioncards\\.booru\\.org()|allgirl\\.booru\\.org()|dra"
+    "wfriends\\.booru\\.org()|vidyart2\\.booru\\.org()))/index\\.php\\?page"
+    "=favorites&s=view&id=(\\d+)",
+    "(?:gelbooru_v01:(https?://[^/?#]+)|(?:https?://)?(?:the-collection\\.b"
+    "ooru\\.org()|illusioncards\\.booru\\.org()|allgirl\\.booru\\.org()|dra"
+    "wfriends\\.booru\\.org()|vidyart2\\.booru\\.org()))/index\\.php\\?page"
+    "=post&s=view&id=(\\d+)",
+    "(?:gelbooru_v02:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?rule34"
+    "\\.xxx()|safebooru\\.org()|tbib\\.org()|hypnohub\\.net()|xbooru\\.com("
+    ")))/index\\.php\\?page=post&s=list&tags=([^&#]*)",
+    "(?:gelbooru_v02:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?rule34"
+    "\\.xxx()|safebooru\\.org()|tbib\\.org()|hypnohub\\.net()|xbooru\\.com("
+    ")))/index\\.php\\?page=pool&s=show&id=(\\d+)",
+    "(?:gelbooru_v02:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?rule34"
+    "\\.xxx()|safebooru\\.org()|tbib\\.org()|hypnohub\\.net()|xbooru\\.com("
+    ")))/index\\.php\\?page=favorites&s=view&id=(\\d+)",
+    "(?:gelbooru_v02:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?rule34"
+    "\\.xxx()|safebooru\\.org()|tbib\\.org()|hypnohub\\.net()|xbooru\\.com("
+    ")))/index\\.php\\?page=post&s=view&id=(\\d+)",
+    "(?:https?://)?(?:www\\.)?girlsreleased\\.com/set/(\\d+)",
+    "(?:https?://)?(?:www\\.)?girlsreleased\\.com/model/(\\d+(?:/.+)?)",
+    "(?:https?://)?(?:www\\.)?girlsreleased\\.com/site/([^/?#]+(?:/model/\\"
+    "d+/?.*)?)",
+    "(?:https?://)?(?:www\\.)?girlswithmuscle\\.com/(\\d+)",
+    "(?:https?://)?(?:www\\.)?girlswithmuscle\\.com/images/(.*)",
+    "(?:https?://)?(?:www\\.)?gofile\\.io/d/([^/?#]+)",
+    "(?:hatenablog:https?://([^/?#]+)|(?:https?://)?([\\w-]+\\.(?:hatenablo"
+    "g\\.(?:com|jp)|hatenadiary\\.com|hateblo\\.jp)))/entry/([^?#]+)(?:\\?("
+    "[^#]*))?(?:#.*)?$",
+    "(?:hatenablog:https?://([^/?#]+)|(?:https?://)?([\\w-]+\\.(?:hatenablo"
+    "g\\.(?:com|jp)|hatenadiary\\.com|hateblo\\.jp)))(/?)(?:\\?([^#]*))?(?:"
+    "#.*)?$",
+    "(?:hatenablog:https?://([^/?#]+)|(?:https?://)?([\\w-]+\\.(?:hatenablo"
+    "g\\.(?:com|jp)|hatenadiary\\.com|hateblo\\.jp)))(/archive(?:/\\d+(?:/"
+    "\\d+(?:/\\d+)?)?|/category/[^?#]+)?)(?:\\?([^#]*))?(?:#.*)?$",
+    "(?:hatenablog:https?://([^/?#]+)|(?:https?://)?([\\w-]+\\.(?:hatenablo"
+    "g\\.(?:com|jp)|hatenadiary\\.com|hateblo\\.jp)))(/search)(?:\\?([^#]*)"
+    ")?(?:#.*)?$",
+    "(?:https?://)?(?:www\\.)?hentai2read\\.com(/[^/?#]+/([^/?#]+))",
+    "(?:https?://)?(?:www\\.)?hentai2read\\.com(/[^/?#]+)/?$",
+    "(?:hentaicosplays:(https?://[^/?#]+)|(?:https?://)?(?:(?:\\w\\w\\.)?he"
+    "ntai-cosplays?(?:-xxx)?\\.com()|(?:\\w\\w\\.)?hentai-img(?:-xxx)?\\.co"
+    "m()|(?:\\w\\w\\.)?porn-images?(?:-xxx)?\\.com()))/(?:image|story)/([\\"
+    "w-]+)",
+    "(?:https?://)?(?:www\\.)?hentaihere\\.com/m/S(\\d+)/([^/?#]+)",
+    "(?:https?://)?(?:www\\.)?hentaihere\\.com(/m/S\\d+)/?$",
+    "((?:https?://)?(?:www\\.)?(?:1st)?hiper(?:dex|toon)\\d?\\.(?:com|net|i"
+    "nfo|top))(/mangas?/([^/?#]+)/([^/?#]+))",
+    "((?:https?://)?(?:www\\.)?(?:1st)?hiper(?:dex|toon)\\d?\\.(?:com|net|i"
+    "nfo|top))(/mangas?/([^/?#]+))/?$",
+    "((?:https?://)?(?:www\\.)?(?:1st)?hiper(?:dex|toon)\\d?\\.(?:com|net|i"
+    "nfo|top))(/manga-a(?:rtist|uthor)/(?:[^/?#]+))",
+    "(?:https?://)?(?:www\\.)?hotleak\\.vip/(?!(?:hot|creators|videos|photo"
+    "s)(?:$|/))([^/]+)/(photo|video)/(\\d+)",
+    "(?:https?://)?(?:www\\.)?hotleak\\.vip/(?!(?:hot|creators|videos|photo"
+    "s)(?:$|/))([^/?#]+)/?$",
+    "(?:https?://)?(?:www\\.)?hotleak\\.vip/(hot|creators|videos|photos)(?:"
+    "/?\\?([^#]+))?",
+    "(?:https?://)?(?:www\\.)?hotleak\\.vip/search(?:/?\\?([^#]+))",
+    "(?:https?://)?(?:www\\.)?idol(?:\\.sankaku)?complex\\.com(?:/[a-z]{2}("
+    "?:[-_][A-Z]{2})?)?(?:/posts)?/?\\?([^#]*)",
+    "(?:https?://)?(?:www\\.)?idol(?:\\.sankaku)?complex\\.com(?:/[a-z]{2}("
+    "?:[-_][A-Z]{2})?)?/pools?/(?:show/)?(\\w+)",
+    "(?:https?://)?(?:www\\.)?idol(?:\\.sankaku)?complex\\.com(?:/[a-z]{2}("
+    "?:[-_][A-Z]{2})?)?/posts?(?:/show)?/(\\w+)",
+    "(?:https?://)?(?:www\\.)?imagebam\\.com(/(?:gallery/|view/G)[a-zA-Z0-9"
+    "]+)",
+    "(?:https?://)?(?:\\w+\\.)?imagebam\\.com(/(?:image/|view/M|(?:[0-9a-f]"
+    "{2}/){3})[a-zA-Z0-9]+)",
+    "(?:https?://)?(?:www\\.)?imgchest\\.com/p/([A-Za-z0-9]{11})",
+    "(?:https?://)?(?:www\\.)?imgchest\\.com/u/([^/?#]+)",
+    "(?:https?://)?(?:www\\.|beta\\.)?imagefap\\.com/(?:gallery\\.php\\?gid"
+    "=|gallery/|pictures/)(\\d+)",
+    "(?:https?://)?(?:www\\.|beta\\.)?imagefap\\.com/photo/(\\d+)",
+    "(?:https?://)?(?:www\\.|beta\\.)?imagefap\\.com/(?:organizer/|(?:userg"
+    "allery\\.php\\?user(id)?=([^&#]+)&|profile/([^/?#]+)/galleries\\?)fold"
+    "erid=(?!0\\b))(\\d+|-1)",
+    "(?:https?://)?(?:www\\.|beta\\.)?imagefap\\.com/(?:profile(?:\\.php\\?"
+    "user=|/)([^/?#]+)(?:/galleries(?:\\?folderid=0)?)?|usergallery\\.php\\"
+    "?userid=(\\d+))(?:$|#)",
+    "(?:https?://)?(?:www\\.)?imagepond\\.net(/(?:i(?:mg|mage)?|video)/[^/?"
+    "#]+)",
+    "(?:https?://)?(?:www\\.)?imagepond\\.net/a(?:lbum)?/(.+)",
+    "(?:https?://)?(?:www\\.)?imagepond\\.net/(?:user/)?(.+)",
+    "(?:https?://)?(?:www\\.)?imageshack\\.com/i/([^/?#]+)",
+    "(?:https?://)?(?:www\\.)?imageshack\\.com/a/([^/?#]+)",
+    "(?:https?://)?(?:www\\.)?imageshack\\.com/user/([^/?#]+)",
+    "(?:https?://)?ibb\\.co/album/([^/?#]+)/?(?:\\?([^#]+))?",
+    "(?:https?://)?ibb\\.co/([^/?#]+)",
+    "(?:https?://)?([\\w-]+)\\.imgbb\\.com/?(?:\\?([^#]+))?",
+    "(?:https?://)?(?:www\\.)?imgbox\\.com/g/([A-Za-z0-9]{10})",
+    "(?:https?://)?(?:(?:www\\.|i\\.)?imgbox\\.com|images\\d+\\.imgbox\\.co"
+    "m/[0-9a-f]{2}/[0-9a-f]{2})/([A-Za-z0-9]{8})",
+    "(?:https?://)?(?:www\\.)?imgpile\\.com/p/(\\w+)",
+    "(?:https?://)?(?:www\\.)?imgpile\\.com/u/([^/?#]+)",
+    "(?:https?://)?(?:www\\.)?imgth\\.com/gallery/(\\d+)",
+    "(?:https?://)?(?:www\\.|[im]\\.)?imgur\\.(?:com|io)/(?!gallery|search)"
+    "(?:r/\\w+/)?(?:[^/?#]+-)?(\\w{7}|\\w{5})[sbtmlh]?",
+    "(?:https?://)?(?:www\\.|[im]\\.)?imgur\\.(?:com|io)/a/(?:[^/?#]+-)?(\\"
+    "w{7}|\\w{5})",
+    "(?:https?://)?(?:www\\.|[im]\\.)?imgur\\.(?:com|io)/(?:gallery|t/\\w+)"
+    "/(?:[^/?#]+-)?(\\w{7}|\\w{5})",
+    "(?:https?://)?(?:www\\.|[im]\\.)?imgur\\.(?:com|io)/user/(?!me(?:/|$|"
+    "\\?|#))([^/?#]+)(?:/posts|/submitted)?/?$",
+    "(?:https?://)?(?:www\\.|[im]\\.)?imgur\\.(?:com|io)/user/([^/?#]+)/fav"
+    "orites/?$",
+    "(?:https?://)?(?:www\\.|[im]\\.)?imgur\\.(?:com|io)/user/([^/?#]+)/fav"
+    "orites/folder/(\\d+)",
+    "(?:https?://)?(?:www\\.|[im]\\.)?imgur\\.(?:com|io)/user/me(?:/posts)?"
+    "(/hidden)?",
+    "(?:https?://)?(?:www\\.|[im]\\.)?imgur\\.(?:com|io)/r/([^/?#]+)/?$",
+    "(?:https?://)?(?:www\\.|[im]\\.)?imgur\\.(?:com|io)/t/([^/?#]+)$",
+    "(?:https?://)?(?:www\\.|[im]\\.)?imgur\\.(?:com|io)/search(?:/[^?#]+)?"
+    "/?\\?q=([^&#]+)",
+    "(?:IMHentai:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?imhentai\\."
+    "xxx()|(?:www\\.)?hentaiera\\.com()|(?:www\\.)?hentairox\\.com()|(?:www"
+    "\\.)?hentaifox\\.com()|(?:www\\.)?hentaienvy\\.com()|(?:www\\.)?hentai"
+    "zap\\.com()))/(?:gallery|view)/(\\d+)",
+    "(?:IMHentai:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?imhentai\\."
+    "xxx()|(?:www\\.)?hentaiera\\.com()|(?:www\\.)?hentairox\\.com()|(?:www"
+    "\\.)?hentaifox\\.com()|(?:www\\.)?hentaienvy\\.com()|(?:www\\.)?hentai"
+    "zap\\.com()))(/(?:artist|category|character|group|language|parody|tag)"
+    "/([^/?#]+))",
+    "(?:IMHentai:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?imhentai\\."
+    "xxx()|(?:www\\.)?hentaiera\\.com()|(?:www\\.)?hentairox\\.com()|(?:www"
+    "\\.)?hentaifox\\.com()|(?:www\\.)?hentaienvy\\.com()|(?:www\\.)?hentai"
+    "zap\\.com()))(/(?:advanced-)?search/?\\?[^#]+|/[^/?#]+/?)",
+    "(?:https?://)?(?:www\\.)?inkbunny\\.net/(?!s/)(gallery/|scraps/)?(\\w+"
+    ")(?:$|[/?#])",
+    "(?:https?://)?(?:www\\.)?inkbunny\\.net/(?:poolview_process\\.php\\?po"
+    "ol_id=(\\d+)|submissionsviewall\\.php\\?((?:[^#]+&)?mode=pool(?:&[^#]+"
+    ")?))",
+    "(?:https?://)?(?:www\\.)?inkbunny\\.net/(?:userfavorites_process\\.php"
+    "\\?favs_user_id=(\\d+)|submissionsviewall\\.php\\?((?:[^#]+&)?mode=use"
+    "rfavs(?:&[^#]+)?))",
+    "(?:https?://)?(?:www\\.)?inkbunny\\.net/submissionsviewall\\.php\\?((?"
+    ":[^#]+&)?mode=unreadsubs(?:&[^#]+)?)",
+    "(?:https?://)?(?:www\\.)?inkbunny\\.net/submissionsviewall\\.php\\?((?"
+    ":[^#]+&)?mode=search(?:&[^#]+)?)",
+    "(?:https?://)?(?:www\\.)?inkbunny\\.net/(?:watchlist_process\\.php\\?m"
+    "ode=watching&user_id=(\\d+)|usersviewall\\.php\\?((?:[^#]+&)?mode=watc"
+    "hing(?:&[^#]+)?))",
+    "(?:https?://)?(?:www\\.)?inkbunny\\.net/s/(\\d+)",
+    "(?:https?://)?(?:www\\.)?instagram\\.com/(?:share()(?:/(?:p|tv|reels?("
+    ")))?|(?:[^/?#]+/)?(?:p|tv|reels?()))/([^/?#]+)",
+    "(?:https?://)?(?:www\\.)?instagram\\.com/(?!(?:p|tv|reel|explore|stori"
+    "es)/)([^/?#]+)/?(?:$|[?#])",
+    "(?:https?://)?(?:www\\.)?instagram\\.com/(?!(?:p|tv|reel|explore|stori"
+    "es)/)([^/?#]+)/posts",
+    "(?:https?://)?(?:www\\.)?instagram\\.com/(?!(?:p|tv|reel|explore|stori"
+    "es)/)([^/?#]+)/reels",
+    "(?:https?://)?(?:www\\.)?instagram\\.com/(?!(?:p|tv|reel|explore|stori"
+    "es)/)([^/?#]+)/tagged",
+    "(?:https?://)?(?:www\\.)?instagram\\.com/(?!(?:p|tv|reel|explore|stori"
+    "es)/)([^/?#]+)/guide/[^/?#]+/(\\d+)",
+    "(?:https?://)?(?:www\\.)?instagram\\.com/(?!(?:p|tv|reel|explore|stori"
+    "es)/)([^/?#]+)/saved(?:/all-posts)?/?$",
+    "(?:https?://)?(?:www\\.)?instagram\\.com/(?!(?:p|tv|reel|explore|stori"
+    "es)/)([^/?#]+)/saved/([^/?#]+)/([^/?#]+)",
+    "(?:https?://)?(?:www\\.)?instagram\\.com/stories/me/?$()",
+    "(?:https?://)?(?:www\\.)?instagram\\.com/s(?:tories/(?:highlights/(\\d"
+    "+)|([^/?#]+)(?:/(\\d+))?)|/(aGlnaGxpZ2h0[^?#]+)(?:\\?story_media_id=("
+    "\\d+))?)",
+    "(?:https?://)?(?:www\\.)?instagram\\.com/(?!(?:p|tv|reel|explore|stori"
+    "es)/)([^/?#]+)/highlights",
+    "(?:https?://)?(?:www\\.)?instagram\\.com/(?!(?:p|tv|reel|explore|stori"
+    "es)/)([^/?#]+)/followers",
+    "(?:https?://)?(?:www\\.)?instagram\\.com/(?!(?:p|tv|reel|explore|stori"
+    "es)/)([^/?#]+)/following",
+    "(?:https?://)?(?:www\\.)?instagram\\.com/explore/tags/([^/?#]+)",
+    "(?:https?://)?(?:www\\.)?instagram\\.com/(?!(?:p|tv|reel|explore|stori"
+    "es)/)([^/?#]+)/info",
+    "(?:https?://)?(?:www\\.)?instagram\\.com/(?!(?:p|tv|reel|explore|stori"
+    "es)/)([^/?#]+)/avatar",
+    "(?:https?://)?issuu\\.com(/[^/?#]+/docs/[^/?#]+)",
+    "(?:https?://)?issuu\\.com/([^/?#]+)(?:/(\\d*))?$",
+    "(?:https?://)?itaku\\.ee/profile/([^/?#]+)/gallery(?:/(\\d+))?",
+    "(?:https?://)?itaku\\.ee/profile/([^/?#]+)/posts(?:/(\\d+))?",
+    "(?:https?://)?itaku\\.ee/profile/([^/?#]+)/stars(?:/(\\d+))?",
+    "(?:https?://)?itaku\\.ee/profile/([^/?#]+)/following",
+    "(?:https?://)?itaku\\.ee/profile/([^/?#]+)/followers",
+    "(?:https?://)?itaku\\.ee/profile/([^/?#]+)/bookmarks/(image|user)/(\\d"
+    "+)",
+    "(?:https?://)?itaku\\.ee/profile/([^/?#]+)/?(?:$|\\?|#)",
+    "(?:https?://)?itaku\\.ee/images/(\\d+)",
+    "(?:https?://)?itaku\\.ee/posts/(\\d+)",
+    "(?:https?://)?itaku\\.ee/home/images/?\\?([^#]+)",
+    "(?:https?://)?(\\w+)\\.itch\\.io/([\\w-]+)",
+    "(?:https?://)?(?:www\\.)?iwara\\.(tv|ai)/profile/([^/?#]+)/?$",
+    "(?:https?://)?(?:www\\.)?iwara\\.(tv|ai)/profile/([^/?#]+)/images(?:\\"
+    "?([^#]+))?",
+    "(?:https?://)?(?:www\\.)?iwara\\.(tv|ai)/profile/([^/?#]+)/videos(?:\\"
+    "?([^#]+))?",
+    "(?:https?://)?(?:www\\.)?iwara\\.(tv|ai)/profile/([^/?#]+)/playlists(?"
+    ":\\?([^#]+))?",
+    "(?:https?://)?(?:www\\.)?iwara\\.(tv|ai)/profile/([^/?#]+)/following",
+    "(?:https?://)?(?:www\\.)?iwara\\.(tv|ai)/profile/([^/?#]+)/followers",
+    "(?:https?://)?(?:www\\.)?iwara\\.(tv|ai)/image/([^/?#]+)",
+    "(?:https?://)?(?:www\\.)?iwara\\.(tv|ai)/video/([^/?#]+)",
+    "(?:https?://)?(?:www\\.)?iwara\\.(tv|ai)/playlist/([^/?#]+)",
+    "(?:https?://)?(?:www\\.)?iwara\\.(tv|ai)/favorites(?:/(image|video)s)?",
+    "(?:https?://)?(?:www\\.)?iwara\\.(tv|ai)/search\\?([^#]+)",
+    "(?:https?://)?(?:www\\.)?iwara\\.(tv|ai)/(image|video)s(?:\\?([^#]+))?",
+    "(?:https?://)?joyreactor\\.c(om|c)/post/(\\d+)",
+    "(?:https?://)?joyreactor\\.c(om|c)(/tag/([^/?#]+)(?:/[^/?#]+)?)",
+    "(?:https?://)?joyreactor\\.c(om|c)(/user/([^/?#]+)(?:/[^/?#]+)?)",
+    "(?:https?://)?joyreactor\\.c(om|c)(/search/([^/?#]+)(?:/[^/?#]+)?)",
+    "(?:jschan:(https?://[^/?#]+)|(?:https?://)?(?:94chan\\.org()))/([^/?#]"
+    "+)/thread/(\\d+)\\.html",
+    "(?:jschan:(https?://[^/?#]+)|(?:https?://)?(?:94chan\\.org()))/([^/?#]"
+    "+)(?:/index\\.html|/catalog\\.html|/\\d+\\.html|/?$)",
+    "(?:https?://)?kabe-uchiroom\\.com/mypage/?\\?id=(\\d+)",
+    "(?:https?://)?kaliscan\\.me(/manga/([\\w-]+)/chapter-([\\d.]+))",
+    "(?:https?://)?kaliscan\\.me(/manga/([\\w-]+))/?$",
+    "(?:https?://)?(?!www\\.|forums\\.)([\\w-]+)\\.keenspot\\.com(/.+)?",
+    "(?:https?://)?(?:www\\.|beta\\.)?(kemono|coomer)\\.(cr|s[tu]|party)/(["
+    "^/?#]+)/user/([^/?#]+)/?(?:\\?([^#]+))?(?:$|\\?|#)",
+    "(?:https?://)?(?:www\\.|beta\\.)?(kemono|coomer)\\.(cr|s[tu]|party)/po"
+    "sts()()(?:/?\\?([^#]+))?",
+    "(?:https?://)?(?:www\\.|beta\\.)?(kemono|coomer)\\.(cr|s[tu]|party)/(["
+    "^/?#]+)/user/([^/?#]+)/post/([^/?#]+)(/revisions?(?:/(\\d*))?)?",
+    "(?:https?://)?(?:www\\.|beta\\.)?(kemono|coomer)\\.(cr|s[tu]|party)/di"
+    "scord/server/(\\d+)[/#](?:channel/)?(\\d+)",
+    "(?:https?://)?(?:www\\.|beta\\.)?(kemono|coomer)\\.(cr|s[tu]|party)/di"
+    "scord/server/(\\d+)",
+    "(?:https?://)?(?:www\\.|beta\\.)?(kemono|coomer)\\.(cr|s[tu]|party)/(?"
+    ":account/)?favorites()()(?:/?\\?([^#]+))?",
+    "(?:https?://)?(?:www\\.|beta\\.)?(kemono|coomer)\\.(cr|s[tu]|party)/ar"
+    "tists(?:\\?([^#]+))?",
+    "(?:https?://)?downloads\\.khinsider\\.com/game-soundtracks/album/([^/?"
+    "#]+)",
+    "(?:https?://)?(?:www\\.)?komikcast\\d*\\.(?:l(?:i|a|ol)|com|cz|site|mo"
+    "?e)(/chapter/[^/?#]+/)",
+    "(?:https?://)?(?:www\\.)?komikcast\\d*\\.(?:l(?:i|a|ol)|com|cz|site|mo"
+    "?e)(/(?:komik/)?[^/?#]+/?)$",
+    "(?:https?://)?(?:(?:app\\.)?koofr\\.(?:net|eu)/links/([\\w-]+)|k00\\.f"
+    "r/(\\w+))",
+    "(?:https?://)?(?:www\\.)?leakgallery\\.com/(?!trending-medias|most-lik"
+    "ed|random/medias)([^/?#]+)(?:/(Photos|Videos|All))?(?:/(MostRecent|Mos"
+    "tViewed|MostLiked))?/?$",
+    "(?:https?://)?(?:www\\.)?leakgallery\\.com/trending-medias(?:/([\\w-]+"
+    "))?",
+    "(?:https?://)?(?:www\\.)?leakgallery\\.com/most-liked",
+    "(?:https?://)?(?:www\\.)?leakgallery\\.com/([^/?#]+)/(\\d+)",
+    "(?:https?://)?lensdump\\.com/a/(\\w+)(?:/?\\?([^#]+))?",
+    "(?:https?://)?lensdump\\.com/(?![ai]/)([^/?#]+)(?:/?\\?([^#]+))?",
+    "(?:https?://)?(?:(?:i\\d?\\.)?lensdump\\.com|\\w\\.l3n\\.co)/(?:i/)?("
+    "\\w+)",
+    "(?:https?://)?lexica\\.art/?\\?q=([^&#]+)",
+    "(?:https?://)?lightroom\\.adobe\\.com/shares/([0-9a-f]+)",
+    "(?:https?://)?(?:www\\.)?listal\\.com/viewimage/(\\d+)",
+    "(?:https?://)?(?:www\\.)?listal\\.com/([^/?#]+)/pictures",
+    "(?:https?://)?blog\\.livedoor\\.jp/(\\w+)/?(?:$|[?#])",
+    "(?:https?://)?blog\\.livedoor\\.jp/(\\w+)/archives/(\\d+)",
+    "(?:https?://)?[\\w-]+\\.lofter\\.com/post/([0-9a-f]+)_([0-9a-f]+)",
+    "(?:https?://)?(?:www\\.lofter\\.com/front/blog/home-page/([\\w-]+)|(["
+    "\\w-]+)\\.lofter\\.com)/?(?:$|\\?|#)",
+    "(?:https?://)?(?:www\\.|members\\.)?luscious\\.net/(?:albums|pictures/"
+    "c/[^/?#]+/album)/[^/?#]+_(\\d+)",
+    "(?:https?://)?(?:www\\.|members\\.)?luscious\\.net/albums/list/?(?:\\?"
+    "([^#]+))?",
+    "(?:lynxchan:(https?://[^/?#]+)|(?:https?://)?(?:bbw-chan\\.(?:link|nl)"
+    "()|kohlchan\\.net()|endchan\\.(?:org|net|gg)()))/([^/?#]+)/res/(\\d+)",
+    "(?:lynxchan:(https?://[^/?#]+)|(?:https?://)?(?:bbw-chan\\.(?:link|nl)"
+    "()|kohlchan\\.net()|endchan\\.(?:org|net|gg)()))/([^/?#]+)(?:/index|/c"
+    "atalog|/\\d+|/?$)",
+    "(?:https?://)?manga\\.madokami\\.al/Manga/(\\w/\\w{2}/\\w{4}/.+)",
+    "(?:https?://)?(?:www\\.)?mangadex\\.(?:org|cc)/(?:title|manga)/(?!foll"
+    "ows|feed$)([0-9a-f-]+)(?:/[^/?#]+)?\\?tab=art",
+    "(?:https?://)?(?:www\\.)?mangadex\\.(?:org|cc)/chapter/([0-9a-f-]+)",
+    "(?:https?://)?(?:www\\.)?mangadex\\.(?:org|cc)/(?:title|manga)/(?!foll"
+    "ows|feed$)([0-9a-f-]+)",
+    "(?:https?://)?(?:www\\.)?mangadex\\.(?:org|cc)/titles?/feed$()",
+    "(?:https?://)?(?:www\\.)?mangadex\\.(?:org|cc)/titles?/follows(?:\\?(["
+    "^#]+))?$",
+    "(?:https?://)?(?:www\\.)?mangadex\\.(?:org|cc)/list/([0-9a-f-]+)(?:/[^"
+    "/?#]*)?(?:\\?tab=(\\w+))?",
+    "(?:https?://)?(?:www\\.)?mangadex\\.(?:org|cc)/author/([0-9a-f-]+)",
+    "(?:https?://)?(?:www\\.)?mangafire\\.to/read/([\\w-]+\\.(\\w+))/([\\w-"
+    "]+)/((chapter|volume)-\\d+(?:\\D.*)?)",
+    "(?:https?://)?(?:www\\.)?mangafire\\.to/manga/([\\w-]+)\\.(\\w+)",
+    "(?:https?://)?(?:www\\.|m\\.)?(?:fanfox\\.net|mangafox\\.me)(/manga/[^"
+    "/?#]+/((?:v([^/?#]+)/)?c(\\d+)([^/?#]*)))",
+    "(?:https?://)?(?:www\\.|m\\.)?(?:fanfox\\.net|mangafox\\.me)(/manga/[^"
+    "/?#]+)/?$",
+    "(?:https?://)?(?:ww[\\dw]\\.)?mangafreak\\.me(/Read1_([^/?#]+)_((\\d+)"
+    "([a-z])?))",
+    "(?:https?://)?(?:ww[\\dw]\\.)?mangafreak\\.me(/Manga/([^/?#]+))",
+    "(?:https?://)?(?:www\\.|m\\.)?mangahere\\.c[co]/manga/([^/]+(?:/v0*(\\"
+    "d+))?/c([^/?#]+))",
+    "(?:https?://)?(?:www\\.|m\\.)?mangahere\\.c[co](/manga/[^/?#]+/?)(?:#."
+    "*)?$",
+    "(?:manganelo:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?nelomanga"
+    "\\.net()|(?:www\\.)?natomanga\\.com()|(?:www\\.)?manganato\\.gg()|(?:w"
+    "ww\\.)?mangakakalot\\.gg()))(/manga/[^/?#]+/chapter-[^/?#]+)",
+    "(?:manganelo:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?nelomanga"
+    "\\.net()|(?:www\\.)?natomanga\\.com()|(?:www\\.)?manganato\\.gg()|(?:w"
+    "ww\\.)?mangakakalot\\.gg()))(/manga/[^/?#]+)$",
+    "(?:manganelo:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?nelomanga"
+    "\\.net()|(?:www\\.)?natomanga\\.com()|(?:www\\.)?manganato\\.gg()|(?:w"
+    "ww\\.)?mangakakalot\\.gg()))/bookmark",
+    "(?:https?://)?(?:www\\.)?(?:(?:manga|comic|read)park\\.(?:com|net|org|"
+    "me|io|to)|parkmanga\\.(?:com|net|org)|mpark\\.to)/(?:title/[^/?#]+/|co"
+    "mic/\\d+/[^/?#]+/[^/?#]+-i)(\\d+)",
+    "(?:https?://)?(?:www\\.)?(?:(?:manga|comic|read)park\\.(?:com|net|org|"
+    "me|io|to)|parkmanga\\.(?:com|net|org)|mpark\\.to)/(?:title|comic)/(\\d"
+    "+)(?:[/-][^/?#]*)?/?$",
+    "(?:https?://)?(?:www\\.)?mangaread\\.org(/manga/[^/?#]+/[^/?#]+)",
+    "(?:https?://)?(?:www\\.)?mangaread\\.org(/manga/[^/?#]+)/?$",
+    "(?:https?://)?(?:www\\.)?mangareader\\.to/read/([\\w-]+-\\d+)/([^/?#]+"
+    ")/(chapter|volume)-(\\d+[^/?#]*)",
+    "(?:https?://)?(?:www\\.)?mangareader\\.to/([\\w-]+-\\d+)",
+    "(?:https?://)?mangataro\\.org(/read/([^/?#]+)/(?:[^/?#]*-)?(\\d+))",
+    "(?:https?://)?mangataro\\.org/manga/([^/?#]+)",
+    "(?:https?://)?(?:www\\.)?mangatown\\.com(/manga/[^/?#]+(?:/v0*(\\d+))?"
+    "/c(\\d+[^/?#]*))",
+    "(?:https?://)?(?:www\\.)?mangatown\\.com(/manga/[^/?#]+)",
+    "(?:https?://)?(?:www\\.)?mangoxo\\.com/album/(\\w+)",
+    "(?:https?://)?(?:www\\.)?mangoxo\\.com/(\\w+)/album",
+    "(?:misskey:(https?://[^/?#]+)|(?:https?://)?(?:misskey\\.io()|misskey"
+    "\\.design()|misskey\\.art()|lesbian\\.energy()|sushi\\.ski()))/@([^/?#"
+    "]+)/?$",
+    "(?:misskey:(https?://[^/?#]+)|(?:https?://)?(?:misskey\\.io()|misskey"
+    "\\.design()|misskey\\.art()|lesbian\\.energy()|sushi\\.ski()))/@([^/?#"
+    "]+)/notes",
+    "(?:misskey:(https?://[^/?#]+)|(?:https?://)?(?:misskey\\.io()|misskey"
+    "\\.design()|misskey\\.art()|lesbian\\.energy()|sushi\\.ski()))/@([^/?#"
+    "]+)/info",
+    "(?:misskey:(https?://[^/?#]+)|(?:https?://)?(?:misskey\\.io()|misskey"
+    "\\.design()|misskey\\.art()|lesbian\\.energy()|sushi\\.ski()))/@([^/?#"
+    "]+)/avatar",
+    "(?:misskey:(https?://[^/?#]+)|(?:https?://)?(?:misskey\\.io()|misskey"
+    "\\.design()|misskey\\.art()|lesbian\\.energy()|sushi\\.ski()))/@([^/?#"
+    "]+)/ba(?:nner|ckground)",
+    "(?:misskey:(https?://[^/?#]+)|(?:https?://)?(?:misskey\\.io()|misskey"
+    "\\.design()|misskey\\.art()|lesbian\\.energy()|sushi\\.ski()))/@([^/?#"
+    "]+)/following",
+    "(?:misskey:(https?://[^/?#]+)|(?:https?://)?(?:misskey\\.io()|misskey"
+    "\\.design()|misskey\\.art()|lesbian\\.energy()|sushi\\.ski()))/notes/("
+    "\\w+)",
+    "(?:misskey:(https?://[^/?#]+)|(?:https?://)?(?:misskey\\.io()|misskey"
+    "\\.design()|misskey\\.art()|lesbian\\.energy()|sushi\\.ski()))/(?:my|a"
+    "pi/i)/favorites",
+    "(?:https?://)?(?:www\\.)?m[1i]xdrop\\.(?:com|net|top|ag|bz)/[fe]/([^/?"
+    "#]+)",
+    "(?:https?://)?motherless\\.com/((?:g/[^/?#]+/|G[IV]?[A-Z0-9]+/)?(?!G)["
+    "A-Z0-9]+)",
+    "(?:https?://)?motherless\\.com/G([IVG])?([A-Z0-9]+)/?$",
+    "(?:https?://)?motherless\\.com/g([iv]?)/?([a-z0-9_]+)/?$",
+    "(?:https?://)?myhentaigallery\\.com/g(?:allery/(?:thumbnails|show))?/("
+    "\\d+)",
+    "(?:https?://)?myhentaigallery\\.com(/g/(artist|category|group|parody)/"
+    "(\\d+).*)",
+    "(?:myportfolio:(?:https?://)?([^/]+)|(?:https?://)?(?!cdn\\.)([\\w-]+"
+    "\\.myportfolio\\.com))(/[^/?#]+)?",
+    "(?:https?://)?blog\\.naver\\.com/(?:PostView\\.n(?:aver|hn)\\?blogId=("
+    "\\w+)&logNo=(\\d+)|(\\w+)/(\\d+)/?$)",
+    "(?:https?://)?blog\\.naver\\.com/(?:PostList\\.n(?:aver|hn)\\?(?:[^&#]"
+    "+&)*blogId=([^&#]+)|(\\w+)/?$)",
+    "(?:https?://)?chzzk\\.naver\\.com/(\\w+)/community/detail/(\\d+)",
+    "(?:https?://)?chzzk\\.naver\\.com/(\\w+)/community",
+    "(?:https?://)?comic\\.naver\\.com/(webtoon|challenge|bestChallenge)/de"
+    "tail(?:\\.nhn)?\\?([^#]+)",
+    "(?:https?://)?comic\\.naver\\.com/(webtoon|challenge|bestChallenge)/li"
+    "st(?:\\.nhn)?\\?([^#]+)",
+    "(?:https?://)?nekohouse\\.su/([^/?#]+)/user/([^/?#]+)/post/([^/?#]+)",
+    "(?:https?://)?nekohouse\\.su/([^/?#]+)/user/([^/?#]+)/?(?:\\?([^#]+))?"
+    "(?:$|\\?|#)",
+    "(?:https?://)?(?:(?:www\\.)?newgrounds\\.com/art/view/([^/?#]+)/[^/?#]"
+    "+|art\\.ngfiles\\.com/images/\\d+/\\d+_([^_]+)_([^.]+))",
+    "(?:https?://)?(?:www\\.)?newgrounds\\.com(/(?:portal/view|audio/listen"
+    ")/\\d+)",
+    "(?:https?://)?([\\w-]+)\\.newgrounds\\.com/art(?:(?:/page/|/?\\?page=)"
+    "(\\d+))?/?$",
+    "(?:https?://)?([\\w-]+)\\.newgrounds\\.com/audio(?:(?:/page/|/?\\?page"
+    "=)(\\d+))?/?$",
+    "(?:https?://)?([\\w-]+)\\.newgrounds\\.com/movies(?:(?:/page/|/?\\?pag"
+    "e=)(\\d+))?/?$",
+    "(?:https?://)?([\\w-]+)\\.newgrounds\\.com/games(?:(?:/page/|/?\\?page"
+    "=)(\\d+))?/?$",
+    "(?:https?://)?([\\w-]+)\\.newgrounds\\.com/?$",
+    "(?:https?://)?([\\w-]+)\\.newgrounds\\.com/favorites(?!/following)(?:/"
+    "(art|audio|movies)(?:(?:/page/|/?\\?page=)(\\d+))?)?",
+    "(?:https?://)?([\\w-]+)\\.newgrounds\\.com/favorites/(following)(?:(?:"
+    "/page/|/?\\?page=)(\\d+))?",
+    "(?:https?://)?(?:www\\.)?newgrounds\\.com/search/conduct/([^/?#]+)/?\\"
+    "?([^#]+)",
+    "(?:Nijie:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?nijie\\.info()"
+    "|(?:www\\.)?horne\\.red()))/members\\.php\\?id=(\\d+)",
+    "(?:Nijie:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?nijie\\.info()"
+    "|(?:www\\.)?horne\\.red()))/members_illust\\.php\\?id=(\\d+)",
+    "(?:Nijie:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?nijie\\.info()"
+    "|(?:www\\.)?horne\\.red()))/members_dojin\\.php\\?id=(\\d+)",
+    "(?:Nijie:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?nijie\\.info()"
+    "|(?:www\\.)?horne\\.red()))/user_like_illust_view\\.php\\?id=(\\d+)",
+    "(?:Nijie:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?nijie\\.info()"
+    "|(?:www\\.)?horne\\.red()))/history_nuita\\.php\\?id=(\\d+)",
+    "(?:Nijie:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?nijie\\.info()"
+    "|(?:www\\.)?horne\\.red()))/like_user_view\\.php",
+    "(?:Nijie:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?nijie\\.info()"
+    "|(?:www\\.)?horne\\.red()))/like_my\\.php",
+    "(?:Nijie:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?nijie\\.info()"
+    "|(?:www\\.)?horne\\.red()))/view(?:_popup)?\\.php\\?id=(\\d+)",
+    "(?:nitter:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?nitter\\.net("
+    ")|(?:www\\.)?nitter\\.space()|(?:www\\.)?nitter\\.tiekoetter\\.com()|("
+    "?:www\\.)?xcancel\\.com()|(?:www\\.)?lightbrd\\.com()))/(i(?:/user/|d:"
+    ")(\\d+)|[^/?#]+)(?:/tweets)?(?:$|\\?|#)",
+    "(?:nitter:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?nitter\\.net("
+    ")|(?:www\\.)?nitter\\.space()|(?:www\\.)?nitter\\.tiekoetter\\.com()|("
+    "?:www\\.)?xcancel\\.com()|(?:www\\.)?lightbrd\\.com()))/(i(?:/user/|d:"
+    ")(\\d+)|[^/?#]+)/with_replies",
+    "(?:nitter:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?nitter\\.net("
+    ")|(?:www\\.)?nitter\\.space()|(?:www\\.)?nitter\\.tiekoetter\\.com()|("
+    "?:www\\.)?xcancel\\.com()|(?:www\\.)?lightbrd\\.com()))/(i(?:/user/|d:"
+    ")(\\d+)|[^/?#]+)/media",
+    "(?:nitter:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?nitter\\.net("
+    ")|(?:www\\.)?nitter\\.space()|(?:www\\.)?nitter\\.tiekoetter\\.com()|("
+    "?:www\\.)?xcancel\\.com()|(?:www\\.)?lightbrd\\.com()))/(i(?:/user/|d:"
+    ")(\\d+)|[^/?#]+)/search",
+    "(?:nitter:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?nitter\\.net("
+    ")|(?:www\\.)?nitter\\.space()|(?:www\\.)?nitter\\.tiekoetter\\.com()|("
+    "?:www\\.)?xcancel\\.com()|(?:www\\.)?lightbrd\\.com()))/(i/web|[^/?#]+"
+    ")/status/(\\d+())",
+    "(?:https?://)?nozomi\\.la/post/(\\d+)",
+    "(?:https?://)?nozomi\\.la/(?:(index(?:-Popular)?)-(\\d+)\\.html)?(?:$|"
+    "#|\\?)",
+    "(?:https?://)?nozomi\\.la/tag/([^/?#]+)-(\\d+)\\.",
+    "(?:https?://)?nozomi\\.la/search\\.html\\?q=([^&#]+)",
+    "(?:https?://)?(?:www\\.)?nsfwalbum\\.com(/album/(\\d+))",
+    "(?:https?://)?(?:[a-z]{2}.)?nudostar\\.tv(/models/([^/?#]+)/?)$",
+    "(?:https?://)?(?:[a-z]{2}.)?nudostar\\.tv(/models/([^/?#]+)/(\\d+)/)",
+    "(?:https?://)?(?:www\\.)?ok\\.porn/albums/(\\d+)",
+    "(?:https?://)?(?:rule34|rule63|cosplay)\\.paheal\\.net/post/list/([^/?"
+    "#]+)",
+    "(?:https?://)?(?:rule34|rule63|cosplay)\\.paheal\\.net/post/view/(\\d+"
+    ")",
+    "(?:https?://)?(?:www\\.)?patreon\\.com/collection/(\\d+)",
+    "(?:https?://)?(?:www\\.)?patreon\\.com/(?!(?:home|create|login|signup|"
+    "search|posts|messages)(?:$|[/?#]))(?:profile/creators|(?:cw?/)?([^/?#]"
+    "+)(?:/posts)?)/?(?:\\?([^#]+))?",
+    "(?:https?://)?(?:www\\.)?patreon\\.com/home$",
+    "(?:https?://)?(?:www\\.)?patreon\\.com/posts/([^/?#]+)",
+    "(?:https?://)?(?:www\\.)?pexels\\.com/collections/((?:[^/?#]*-)?(\\w+)"
+    ")",
+    "(?:https?://)?(?:www\\.)?pexels\\.com/search/([^/?#]+)",
+    "(?:https?://)?(?:www\\.)?pexels\\.com/(@(?:(?:[^/?#]*-)?(\\d+)|[^/?#]+"
+    "))",
+    "(?:https?://)?(?:www\\.)?pexels\\.com/photo/((?:[^/?#]*-)?\\d+)",
+    "(?:philomena:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?derpibooru"
+    "\\.org()|(?:www\\.)?ponybooru\\.org()|furbooru\\.org()))/(?:images/)?("
+    "\\d+)",
+    "(?:philomena:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?derpibooru"
+    "\\.org()|(?:www\\.)?ponybooru\\.org()|furbooru\\.org()))/(?:search/?\\"
+    "?([^#]+)|tags/([^/?#]+))",
+    "(?:philomena:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?derpibooru"
+    "\\.org()|(?:www\\.)?ponybooru\\.org()|furbooru\\.org()))/galleries/(\\"
+    "d+)",
+    "(?:https?://)?(?:www\\.)?pholder\\.com(/r/([^/?#]+))(?:/?\\?([^#]+))?",
+    "(?:https?://)?(?:www\\.)?pholder\\.com(/u/[^/?#]+)(?:/?\\?([^#]+))?",
+    "(?:https?://)?(?:www\\.)?pholder\\.com/(.*)",
+    "(?:https?://)?(?:www\\.)?vogue\\.com/photovogue/photographers/(\\d+)",
+    "(?:https?://)?picarto\\.tv/([^/?#]+)/gallery",
+    "(?:https?://)?(?:www\\.)?picazor\\.com/[a-z]{2}/([^/?#]+)",
+    "(?:https?://)?(?:[\\w]+\\.)?pictoa\\.com(?:\\.de)?/albums/(?:[\\w-]+-)"
+    "?(\\d+)/(\\d+)",
+    "(?:https?://)?(?:[\\w]+\\.)?pictoa\\.com(?:\\.de)?/albums/(?:[\\w-]+-)"
+    "?(\\d+).html",
+    "(?:https?://)?(?:www\\.)?piczel\\.tv/gallery/([^/?#]+)/?$",
+    "(?:https?://)?(?:www\\.)?piczel\\.tv/gallery/(?!image/)[^/?#]+/(\\d+)",
+    "(?:https?://)?(?:www\\.)?piczel\\.tv/gallery/image/(\\d+)",
+    "(?:https?://)?www\\.pillowfort\\.social/posts/(\\d+)",
+    "(?:https?://)?www\\.pillowfort\\.social/(?!posts/)([^/?#]+(?:/tagged/["
+    "^/?#]+)?)",
+    "(?:https?://)?(?:\\w+\\.)?pinterest\\.[\\w.]+/(?!pin/)([^/?#]+)(?:/_sa"
+    "ved)?/?$",
+    "(?:https?://)?(?:\\w+\\.)?pinterest\\.[\\w.]+/(?!pin/)([^/?#]+)/pins/?"
+    "$",
+    "(?:https?://)?(?:\\w+\\.)?pinterest\\.[\\w.]+/(?!pin/)([^/?#]+)/_creat"
+    "ed/?$",
+    "(?:https?://)?(?:\\w+\\.)?pinterest\\.[\\w.]+/(?!pin/)([^/?#]+)/([^/?#"
+    "]+)/([^/?#]+)",
+    "(?:https?://)?(?:\\w+\\.)?pinterest\\.[\\w.]+/search/pins/?\\?q=([^&#]"
+    "+)",
+    "(?:https?://)?(?:\\w+\\.)?pinterest\\.[\\w.]+/pin/([^/?#]+)(?!.*#relat"
+    "ed$)",
+    "(?:https?://)?(?:\\w+\\.)?pinterest\\.[\\w.]+/(?!pin/)([^/?#]+)/([^/?#"
+    "]+)/?(?!.*#related$)",
+    "(?:https?://)?(?:\\w+\\.)?pinterest\\.[\\w.]+/pin/([^/?#]+).*#related$",
+    "(?:https?://)?(?:\\w+\\.)?pinterest\\.[\\w.]+/(?!pin/)([^/?#]+)/([^/?#"
+    "]+)/?#related$",
+    "(?:https?://)?pin\\.it/([^/?#]+)",
+    "(?:https?://)?pixeldrain\\.com/(?:u|api/file)/(\\w+)",
+    "(?:https?://)?pixeldrain\\.com/(?:l|api/list)/(\\w+)(?:#item=(\\d+))?",
+    "(?:https?://)?pixeldrain\\.com/(?:d|api/filesystem)/([^?]+)",
+    "(?:https?://)?(?:www\\.|touch\\.)?ph?ixiv\\.net/(?:(?:en/)?u(?:sers)?/"
+    "|member\\.php\\?id=|(?:mypage\\.php)?#id=)(\\d+)(?:$|[?#])",
+    "(?:https?://)?(?:www\\.|touch\\.)?ph?ixiv\\.net/(?:(?:en/)?users/(\\d+"
+    ")/(?:artworks|illustrations|manga)(?:/([^/?#]+))?/?(?:$|[?#])|member_i"
+    "llust\\.php\\?id=(\\d+)(?:&([^#]+))?)",
+    "(?:https?://)?(?:www\\.|touch\\.)?ph?ixiv\\.net/(?:en/)?users/(\\d+)/a"
+    "vatar",
+    "(?:https?://)?(?:www\\.|touch\\.)?ph?ixiv\\.net/(?:en/)?users/(\\d+)/b"
+    "ackground",
+    "(?:https?://)?pixiv\\.me/([^/?#]+)",
+    "(?:https?://)?(?:(?:www\\.|touch\\.)?ph?ixiv\\.net/(?:(?:en/)?artworks"
+    "/|member_illust\\.php\\?(?:[^&]+&)*illust_id=)(\\d+)|(?:i(?:\\d+\\.pix"
+    "iv|\\.pximg)\\.net/(?:(?:.*/)?img-[^/]+/img/\\d{4}(?:/\\d\\d){5}|img\\"
+    "d+/img/[^/]+)|img\\d*\\.pixiv\\.net/img/[^/]+|(?:www\\.)?pixiv\\.net/i"
+    ")/(\\d+))",
+    "(?:https?://)?(?:www\\.|touch\\.)?ph?ixiv\\.net/(?:en/)?artworks/unlis"
+    "ted/(\\w+)",
+    "(?:https?://)?(?:www\\.|touch\\.)?ph?ixiv\\.net/(?:(?:en/)?users/(\\d+"
+    ")/(bookmarks/artworks|following)(?:/([^/?#]+))?|bookmark\\.php)(?:\\?("
+    "[^#]*))?",
+    "(?:https?://)?(?:www\\.|touch\\.)?ph?ixiv\\.net/ranking\\.php(?:\\?([^"
+    "#]*))?",
+    "(?:https?://)?(?:www\\.|touch\\.)?ph?ixiv\\.net/(?:(?:en/)?tags/([^/?#"
+    "]+)(?:/[^/?#]+)?/?|search\\.php)(?:\\?([^#]+))?",
+    "(?:https?://)?(?:www\\.|touch\\.)?ph?ixiv\\.net/bookmark_new_illust\\."
+    "php",
+    "(?:https?://)?(?:www\\.)?pixivision\\.net/(?:en/)?a/(\\d+)",
+    "(?:https?://)?(?:www\\.|touch\\.)?ph?ixiv\\.net/user/(\\d+)/series/(\\"
+    "d+)",
+    "(?:https?://)?sketch\\.pixiv\\.net/@([^/?#]+)",
+    "(?:https?://)?(?:www\\.|touch\\.)?ph?ixiv\\.net/n(?:ovel/show\\.php\\?"
+    "id=|/)(\\d+)",
+    "(?:https?://)?(?:www\\.|touch\\.)?ph?ixiv\\.net/(?:en/)?users/(\\d+)/n"
+    "ovels",
+    "(?:https?://)?(?:www\\.|touch\\.)?ph?ixiv\\.net/novel/series/(\\d+)",
+    "(?:https?://)?(?:www\\.|touch\\.)?ph?ixiv\\.net/(?:en/)?users/(\\d+)/b"
+    "ookmarks/novels(?:/([^/?#]+))?(?:/?\\?([^#]+))?",
+    "(?:https?://)?(?!www\\.)([\\w-]+)\\.pixnet.net/album/photo/(\\d+)",
+    "(?:https?://)?(?!www\\.)([\\w-]+)\\.pixnet.net/album/set/(\\d+)",
+    "(?:https?://)?(?!www\\.)([\\w-]+)\\.pixnet.net/album/folder/(\\d+)",
+    "(?:https?://)?(?!www\\.)([\\w-]+)\\.pixnet.net()(?:/blog|/album(?:/lis"
+    "t)?)?/?(?:$|[?#])",
+    "(?:https?://)?(?:www\\.)?plurk\\.com/(?!p/)(\\w+)/?(?:$|[?#])",
+    "(?:https?://)?(?:www\\.)?plurk\\.com/p/(\\w+)",
+    "(?:https?://)?poipiku\\.com/(?:IllustListPcV\\.jsp\\?PG=(\\d+)&ID=)?("
+    "\\d+)/?(?:$|[?&#])",
+    "(?:https?://)?poipiku\\.com/(\\d+)/(\\d+)",
+    "(?:https?://)?(?:www\\.)?poringa\\.net/posts/imagenes/(\\d+)",
+    "(?:https?://)?(?:www\\.)?poringa\\.net/(\\w+)$",
+    "(?:https?://)?(?:www\\.)?poringa\\.net/buscar/\\?&?q=([^&#]+)",
+    "(?:https?://)?(?:[\\w-]+\\.)?pornhub\\.com/album/(\\d+)",
+    "(?:https?://)?(?:[\\w-]+\\.)?pornhub\\.com/gif/(\\d+)",
+    "(?:https?://)?(?:[\\w-]+\\.)?pornhub\\.com/((?:users|model|pornstar)/["
+    "^/?#]+)/?$",
+    "(?:https?://)?(?:[\\w-]+\\.)?pornhub\\.com/((?:users|model|pornstar)/["
+    "^/?#]+)/(photos(?:/[^/?#]+)?)",
+    "(?:https?://)?(?:[\\w-]+\\.)?pornhub\\.com/((?:users|model|pornstar)/["
+    "^/?#]+)/(gifs(?:/[^/?#]+)?)",
+    "(?:https?://)?(?:www\\.)?pornpics\\.com(?:/\\w\\w)?/galleries/((?:[^/?"
+    "#]+-)?(\\d+))",
+    "(?:https?://)?(?:www\\.)?pornpics\\.com(?:/\\w\\w)?/tags/([^/?#]+)",
+    "(?:https?://)?(?:www\\.)?pornpics\\.com(?:/\\w\\w)?/(?:\\?q=|pornstars"
+    "/|channels/)([^/&#]+)",
+    "(?:https?://)?(?:www\\.)?pornpics\\.com(?:/\\w\\w)?/(popular|recent|ra"
+    "ting|likes|views|comments)/?$",
+    "(?:https?://)?(?:www\\.)?pornpics\\.com(?:/\\w\\w)?/([^/?#]+)/?$",
+    "(?:https?://)?(?:www\\.)?pornstars\\.tube/albums/(\\d+)(?:/([\\w-]+))?",
+    "(?:postmill:(https?://[^/?#]+)|(?:https?://)?(?:(?:raddle\\.me|c32zjeg"
+    "hcp5tj3kb72pltz56piei66drc63vkhn5yixiyk4cmerrjtid\\.onion)()))/f/(\\w+"
+    ")/(\\d+)",
+    "(?:postmill:(https?://[^/?#]+)|(?:https?://)?(?:(?:raddle\\.me|c32zjeg"
+    "hcp5tj3kb72pltz56piei66drc63vkhn5yixiyk4cmerrjtid\\.onion)()))(/\\d+)$",
+    "(?:postmill:(https?://[^/?#]+)|(?:https?://)?(?:(?:raddle\\.me|c32zjeg"
+    "hcp5tj3kb72pltz56piei66drc63vkhn5yixiyk4cmerrjtid\\.onion)()))(/(?:fea"
+    "tured|subscribed|all)?)(/(?:hot|new|active|top|controversial|most_comm"
+    "ented))?(?:\\?([^#]+))?$",
+    "(?:postmill:(https?://[^/?#]+)|(?:https?://)?(?:(?:raddle\\.me|c32zjeg"
+    "hcp5tj3kb72pltz56piei66drc63vkhn5yixiyk4cmerrjtid\\.onion)()))(/f/\\w+"
+    ")(/(?:hot|new|active|top|controversial|most_commented))?(?:\\?([^#]+))"
+    "?$",
+    "(?:postmill:(https?://[^/?#]+)|(?:https?://)?(?:(?:raddle\\.me|c32zjeg"
+    "hcp5tj3kb72pltz56piei66drc63vkhn5yixiyk4cmerrjtid\\.onion)()))(/user/"
+    "\\w+/submissions)()(?:\\?([^#]+))?$",
+    "(?:postmill:(https?://[^/?#]+)|(?:https?://)?(?:(?:raddle\\.me|c32zjeg"
+    "hcp5tj3kb72pltz56piei66drc63vkhn5yixiyk4cmerrjtid\\.onion)()))(/tag/\\"
+    "w+)(/(?:hot|new|active|top|controversial|most_commented))?(?:\\?([^#]+"
+    "))?$",
+    "(?:postmill:(https?://[^/?#]+)|(?:https?://)?(?:(?:raddle\\.me|c32zjeg"
+    "hcp5tj3kb72pltz56piei66drc63vkhn5yixiyk4cmerrjtid\\.onion)()))(/search"
+    ")()\\?(q=[^#]+)$",
+    "(?:https?://)?rawkuma\\.(?:net|com)(/manga/[^/?#]+/chapter-\\d+(?:.\\d"
+    "+)?\\.(\\d+))",
+    "(?:https?://)?rawkuma\\.(?:net|com)/manga/([^/?#]+)",
+    "(?:reactor:(https?://[^/?#]+)|(?:https?://)?(?:(?:[^/.]+\\.)?reactor\\"
+    ".cc()|(?:www\\.)?(?:pornreactor\\.cc|fapreactor.com)()|thatpervert\\.c"
+    "om()))/tag/([^/?#]+)(?:/[^/?#]+)?",
+    "(?:reactor:(https?://[^/?#]+)|(?:https?://)?(?:(?:[^/.]+\\.)?reactor\\"
+    ".cc()|(?:www\\.)?(?:pornreactor\\.cc|fapreactor.com)()|thatpervert\\.c"
+    "om()))/search(?:/|\\?q=)([^/?#]+)",
+    "(?:reactor:(https?://[^/?#]+)|(?:https?://)?(?:(?:[^/.]+\\.)?reactor\\"
+    ".cc()|(?:www\\.)?(?:pornreactor\\.cc|fapreactor.com)()|thatpervert\\.c"
+    "om()))/user/([^/?#]+)",
+    "(?:reactor:(https?://[^/?#]+)|(?:https?://)?(?:(?:[^/.]+\\.)?reactor\\"
+    ".cc()|(?:www\\.)?(?:pornreactor\\.cc|fapreactor.com)()|thatpervert\\.c"
+    "om()))/post/(\\d+)",
+    "(?i)(?:https?://)?(?:www\\.)?readcomiconline\\.(?:li|to)(/Comic/[^/?#]"
+    "+/[^/?#]+\\?)([^#]+)",
+    "(?i)(?:https?://)?(?:www\\.)?readcomiconline\\.(?:li|to)(/Comic/[^/?#]"
+    "+/?)$",
+    "(?i)(?:https?://)?(?:www\\.)?readcomiconline\\.(?:li|to)(/(Artist|Genr"
+    "e|Publisher|Writer|)/([^/?#]+)(?:/[^/?#]+)?)",
+    "(?:https?://)?realbooru\\.com/index\\.php\\?page=post&s=list&tags=([^&"
+    "#]*)",
+    "(?:https?://)?realbooru\\.com/index\\.php\\?page=favorites&s=view&id=("
+    "\\d+)",
+    "(?:https?://)?realbooru\\.com/index\\.php\\?page=pool&s=show&id=(\\d+)",
+    "(?:https?://)?realbooru\\.com/index\\.php\\?page=post&s=view&id=(\\d+)",
+    "(?:https?://)?(?:www\\.)?(?:\\w+\\.)?reddit\\.com(/r/[^/?#]+(?:/([a-z]"
+    "+))?)/?(?:\\?([^#]*))?(?:$|#)",
+    "(?:https?://)?(?:www\\.)?(?:\\w+\\.)?reddit\\.com((?:/([a-z]+))?)/?(?:"
+    "\\?([^#]*))?(?:$|#)",
+    "(?:https?://)?(?:www\\.)?(?:\\w+\\.)?reddit\\.com/u(?:ser)?/([^/?#]+)("
+    "/[a-z]+)?/?(?:\\?([^#]*))?$",
+    "(?:https?://)?(?:(?:www\\.)?(?:\\w+\\.)?reddit\\.com/(?:(?:(?:r|u|user"
+    ")/[^/?#]+/)?comments|gallery)|redd\\.it)/([a-z0-9]+)",
+    "(?:https?://)?((?:i|preview)\\.redd\\.it|i\\.reddituploads\\.com)/([^/"
+    "?#]+)(\\?[^#]*)?",
+    "(?:https?://)?(?:www\\.)?(?:\\w+\\.)?reddit\\.com/(?:(r|u|user)/([^/?#"
+    "]+))/s/([a-zA-Z0-9]{10})",
+    "(?:https?://)?(?:\\w+\\.)?redgifs\\.com/users/([^/?#]+)/?(?:\\?([^#]+)"
+    ")?$",
+    "(?:https?://)?(?:www\\.)?redgifs\\.com/users/([^/?#]+)/collections/([^"
+    "/?#]+)",
+    "(?:https?://)?(?:www\\.)?redgifs\\.com/users/([^/?#]+)/collections/?$",
+    "(?:https?://)?(?:www\\.)?redgifs\\.com/niches/([^/?#]+)/?(?:\\?([^#]+)"
+    ")?$",
+    "(?:https?://)?(?:\\w+\\.)?redgifs\\.com/(?:gifs/([^/?#]+)|search(?:/gi"
+    "fs)?()|browse)(?:/?\\?([^#]+))?",
+    "(?:https?://)?(?:(?:\\w+\\.)?redgifs\\.com/(?:watch|ifr)|(?:\\w+\\.)?g"
+    "fycat\\.com(?:/gifs/detail|/\\w+)?|(?:www\\.)?gifdeliverynetwork\\.com"
+    "|i\\.redgifs\\.com/i)/([A-Za-z0-9]+)",
+    "(?:https?://)?rule34\\.us/index\\.php\\?r=posts/index&q=([^&#]*)",
+    "(?:https?://)?rule34\\.us/index\\.php\\?r=posts/view&id=(\\d+)",
+    "(?:https?://)?rule34vault\\.com/post/(\\d+)",
+    "(?:https?://)?rule34vault\\.com/playlists/view/(\\d+)",
+    "(?:https?://)?rule34vault\\.com/(?!p(?:ost|laylists)/)([^/?#]+)",
+    "(?:https?://)?(?:www\\.)?rule34\\.(xyz|world)/post/(\\d+)",
+    "(?:https?://)?(?:www\\.)?rule34\\.(xyz|world)/playlists/view/(\\d+)",
+    "(?:https?://)?(?:www\\.)?rule34\\.(xyz|world)/([^/?#]+)$",
+    "(?:https?://)?(?:www\\.)?s3nd\\.pics/post/([0-9a-f]+)",
+    "(?:https?://)?(?:www\\.)?s3nd\\.pics/user/(\\w+)",
+    "(?:https?://)?(?:www\\.)?s3nd\\.pics/search/?\\?([^#]+)",
+    "(?:https?://)?(?:(?:chan|www|beta|black|white)\\.sankakucomplex\\.com|"
+    "sankaku\\.app)(?:/[a-z]{2}(?:[-_][A-Z]{2})?)?(?:/posts)?/?\\?([^#]*)",
+    "(?:https?://)?(?:(?:chan|www|beta|black|white)\\.sankakucomplex\\.com|"
+    "sankaku\\.app)(?:/[a-z]{2}(?:[-_][A-Z]{2})?)?/(?:books|pools?/show)/("
+    "\\w+)",
+    "(?:https?://)?(?:(?:chan|www|beta|black|white)\\.sankakucomplex\\.com|"
+    "sankaku\\.app)(?:/[a-z]{2}(?:[-_][A-Z]{2})?)?/posts?(?:/show)?/(\\w+)",
+    "(?:https?://)?(?:(?:chan|www|beta|black|white)\\.sankakucomplex\\.com|"
+    "sankaku\\.app)(?:/[a-z]{2}(?:[-_][A-Z]{2})?)?/books/?\\?([^#]*)",
+    "(?:https?://)?(?:news|www)\\.sankakucomplex\\.com/(\\d\\d\\d\\d/\\d\\d"
+    "/\\d\\d/[^/?#]+)",
+    "(?:https?://)?(?:news|www)\\.sankakucomplex\\.com/((?:tag|category|aut"
+    "hor)/[^/?#]+)",
+    "(?:https?://)?(?:www\\.)?scatbooru\\.co\\.uk/\\?page=post&s=list&tags="
+    "([^&#]+)",
+    "(?:https?://)?(?:www\\.)?scatbooru\\.co\\.uk/\\?page=favorites&s=view&"
+    "id=(\\d+)",
+    "(?:https?://)?(?:www\\.)?scatbooru\\.co\\.uk/\\?page=post&s=view&id=("
+    "\\d+)",
+    "(?:https?://)?(?:www\\.)?scrolller\\.com(/r/[^/?#]+)(?:/?\\?([^#]+))?",
+    "(?:https?://)?(?:www\\.)?scrolller\\.com/reddit-user/([^/?#]+)(?:/?\\?"
+    "([^#]+))?",
+    "(?:https?://)?(?:www\\.)?scrolller\\.com/following",
+    "(?:https?://)?(?:www\\.)?scrolller\\.com/(?!r/|following$)([^/?#]+)",
+    "(?:https?://)?(?:www\\.|(?:sp\\.)?seiga\\.)?nicovideo\\.jp/user/illust"
+    "/(\\d+)(?:\\?(?:[^&]+&)*sort=([^&#]+))?",
+    "(?:https?://)?(?:(?:seiga\\.|www\\.)?nicovideo\\.jp/(?:seiga/im|image/"
+    "source/)|sp\\.seiga\\.nicovideo\\.jp/seiga/#!/im|lohas\\.nicoseiga\\.j"
+    "p/(?:thumb|(?:priv|o)/[^/]+/\\d+)/)(\\d+)",
+    "(?:https?://)?raw\\.senmanga\\.com(/[^/?#]+/[^/?#]+)",
+    "(?:https?://)?(?:www\\.)?sex\\.com(?:/[a-z]{2})?(/(?:\\w\\w/(?:pic|gif"
+    "|video)s|pin)/\\d+/?)(?!.*#related$)",
+    "(?:https?://)?(?:www\\.)?sex\\.com(?:/[a-z]{2})?(/pin/(\\d+)/?).*#rela"
+    "ted$",
+    "(?:https?://)?(?:www\\.)?sex\\.com(?:/[a-z]{2})?/user/([^/?#]+)/pins/",
+    "(?:https?://)?(?:www\\.)?sex\\.com(?:/[a-z]{2})?/user/([^/?#]+)/likes/",
+    "(?:https?://)?(?:www\\.)?sex\\.com(?:/[a-z]{2})?/user/([^/?#]+)/(?!(?:"
+    "following|pins|repins|likes)/)([^/?#]+)",
+    "(?:https?://)?(?:www\\.)?sex\\.com(?:/[a-z]{2})?/feed",
+    "(?:https?://)?(?:www\\.)?sex\\.com(?:/[a-z]{2})?/(?:(pic|gif|video)s(?"
+    ":\\?(search=[^#]+)$|/([^/?#]*))|search/(pic|gif|video)s)/?(?:\\?([^#]+"
+    "))?",
+    "(?:shimmie2:(https?://[^/?#]+)|(?:https?://)?(?:booru\\.cavemanon\\.xy"
+    "z()|rule34hentai\\.net()|vidya\\.pics()|noz\\.rip/booru()|co\\.llectio"
+    "n\\.pics()|soybooru\\.com()))/(?:index\\.php\\?q=/?)?post/list/([^/?#]"
+    "+)(?:/(\\d+))?",
+    "(?:shimmie2:(https?://[^/?#]+)|(?:https?://)?(?:booru\\.cavemanon\\.xy"
+    "z()|rule34hentai\\.net()|vidya\\.pics()|noz\\.rip/booru()|co\\.llectio"
+    "n\\.pics()|soybooru\\.com()))/(?:index\\.php\\?q=/?)?post/view/(\\d+)",
+    "(?:https?://)?(?:www\\.)?simply-hentai\\.com/series/([^/?#]+)(?:/tag-("
+    "[^/?#]+))?(?:/sort-([^/?#]+))?(?:/page-(\\d+))?(?:\\?([^#]+))?",
+    "(?:https?://)?(?:www\\.)?simply-hentai\\.com/2-mangas(?:/sort-([^/?#]+"
+    "))?(?:/page-(\\d+))?(?:\\?([^#]+))?",
+    "(?:https?://)?(?:www\\.)?simply-hentai\\.com/(parody|tag|character|col"
+    "lection|artist|translator)/([^/?#]+)(?:/tag-([^/?#]+))?(?:/sort-([^/?#"
+    "]+))?(?:/page-(\\d+))?(?:\\?([^#]+))?",
+    "(?:https?://)?(?:www\\.)?simply-hentai\\.com/language/([^/?#]+)(?:/sor"
+    "t-([^/?#]+))?(?:/page-(\\d+))?(?:\\?([^#]+))?",
+    "(?:https?://)?(?:www\\.)?simply-hentai\\.com/[^/?#]+/([^/?#]+)",
+    "(?:https?://)?(?:www\\.)?sizebooru\\.com/Details/(\\d+)",
+    "(?:https?://)?(?:www\\.)?sizebooru\\.com/Search/([^/?#]+)",
+    "(?:https?://)?(?:www\\.)?sizebooru\\.com/Galleries/List/(\\d+)",
+    "(?:https?://)?(?:www\\.)?sizebooru\\.com/Profile/Uploads/([^/?#]+)",
+    "(?:https?://)?(?:www\\.)?sizebooru\\.com/Profile/Favorites/([^/?#]+)",
+    "(?:https?://)?skeb\\.jp/@([^/?#]+)/works/(\\d+)",
+    "(?:https?://)?skeb\\.jp/@([^/?#]+)/works",
+    "(?:https?://)?skeb\\.jp/@([^/?#]+)/sent[ _-]?requests",
+    "(?:https?://)?skeb\\.jp/@([^/?#]+)/?$",
+    "(?:https?://)?skeb\\.jp/search\\?q=([^&#]+)",
+    "(?:https?://)?skeb\\.jp/@([^/?#]+)/following_creators",
+    "(?:https?://)?skeb\\.jp/following_users",
+    "(?:https?://)?([\\w-]+)\\.slickpic\\.com/albums/([^/?#]+)",
+    "(?:https?://)?([\\w-]+)\\.slickpic\\.com(?:/gallery)?/?(?:$|[?#])",
+    "(?:https?://)?(?:www\\.)?slideshare\\.net/(?:mobile/)?([^/?#]+)/([^/?#"
+    "]+)",
+    "smugmug:album:([^:]+)$",
+    "(?:smugmug:(?!album:)(?:https?://)?([^/]+)|(?:https?://)?([\\w-]+)\\.s"
+    "mugmug\\.com)(?:/[^/?#]+)+/i-([^/?#-]+)",
+    "(?:smugmug:(?!album:)(?:https?://)?([^/]+)|(?:https?://)?([\\w-]+)\\.s"
+    "mugmug\\.com)((?:/[^/?#a-fh-mo-z][^/?#]*)*)/?$",
+    "(?:https?://)?(?:www\\.)?soundgasm\\.net/u(?:ser)?/([^/?#]+)/([^/?#]+)",
+    "(?:https?://)?(?:www\\.)?soundgasm\\.net/u(?:ser)?/([^/?#]+)/?$",
+    "(?:https?://)?(?:www\\.)?speakerdeck\\.com/([^/?#]+)/([^/?#]+)",
+    "(?:https?://)?(?:www\\.)?steamgriddb\\.com/(grid|hero|logo|icon)/(\\d+"
+    ")",
+    "(?:https?://)?(?:www\\.)?steamgriddb\\.com/(game|collection)/(\\d+)/gr"
+    "ids(?:/(\\d+))?",
+    "(?:https?://)?(?:www\\.)?steamgriddb\\.com/(game|collection)/(\\d+)/he"
+    "roes(?:/(\\d+))?",
+    "(?:https?://)?(?:www\\.)?steamgriddb\\.com/(game|collection)/(\\d+)/lo"
+    "gos(?:/(\\d+))?",
+    "(?:https?://)?(?:www\\.)?steamgriddb\\.com/(game|collection)/(\\d+)/ic"
+    "ons(?:/(\\d+))?",
+    "(?:https?://)?(?:www\\.)?subscribestar\\.(com|adult)/(?!posts/)([^/?#]"
+    "+)(?:\\?([^#]+))?",
+    "(?:https?://)?(?:www\\.)?subscribestar\\.(com|adult)/posts/(\\d+)",
+    "(?:https?://)?(?:www\\.)?sxypix\\.com(/w/(\\w+))",
+    "(?:szurubooru:(https?://[^/?#]+)|(?:https?://)?(?:booru\\.bcbnsfw\\.sp"
+    "ace()|snootbooru\\.com()|(?:www\\.)?visuabusters\\.com/booru()))/posts"
+    "(?:/query=([^/?#]*))?",
+    "(?:szurubooru:(https?://[^/?#]+)|(?:https?://)?(?:booru\\.bcbnsfw\\.sp"
+    "ace()|snootbooru\\.com()|(?:www\\.)?visuabusters\\.com/booru()))/post/"
+    "(\\d+)",
+    "(?:https?://)?tapas\\.io/episode/(\\d+)",
+    "(?:https?://)?tapas\\.io/series/([^/?#]+)",
+    "(?:https?://)?tapas\\.io/(?!series|episode)([^/?#]+)",
+    "(?:https?://)?(?:tcb(?:-backup\\.bihar-mirchi|scans)|onepiecechapters)"
+    "\\.(?:com|me)(/chapters/\\d+/[^/?#]+)",
+    "(?:https?://)?(?:tcb(?:-backup\\.bihar-mirchi|scans)|onepiecechapters)"
+    "\\.(?:com|me)(/mangas/\\d+/[^/?#]+)",
+    "(?:https?://)(?:www\\.)??telegra\\.ph(/[^/?#]+)",
+    "(?:https?://)?tenor\\.com/(?:\\w\\w(?:-\\w\\w)?/)?view/(?:[^/?#]*-)?("
+    "\\d+)",
+    "(?:https?://)?tenor\\.com/(?:\\w\\w(?:-\\w\\w)?/)?search/([^/?#]+)",
+    "(?:https?://)?tenor\\.com/(?:\\w\\w(?:-\\w\\w)?/)?(?:users|official)/("
+    "[^/?#]+)",
+    "(?:https?://)?(?:www\\.)?thefap\\.net(/([^/?#]+)-(\\d+)/([^/?#]+)/i(\\"
+    "d+))",
+    "(?:https?://)?(?:www\\.)?thefap\\.net/([^/?#]+)-(\\d+)",
+    "(?:https?://)?(?:www\\.)?thehentaiworld\\.com/tag/([^/?#]+)",
+    "(?:https?://)?(?:www\\.)?thehentaiworld\\.com(/(?:video|(?:[\\w-]+-)?h"
+    "entai-image)s/([^/?#]+))",
+    "(?:https?://)?(?:www\\.)?tiktokv?\\.com/(?:@([\\w_.-]*)|share)/(?:phot"
+    "|vide)o/(\\d+)",
+    "(?:https?://)?(?:(?:v[mt]\\.)?tiktok\\.com|(?:www\\.)?tiktok\\.com/t)/"
+    "(?!@)([^/?#]+)",
+    "(?:https?://)?(?:www\\.)?tiktokv?\\.com/@([\\w_.-]+)/?(?:$|\\?|#)",
+    "(?:https?://)?(?:www\\.)?tiktokv?\\.com/@([\\w_.-]+)/avatar",
+    "(?:https?://)?(?:www\\.)?tiktokv?\\.com/@([\\w_.-]+)/posts",
+    "(?:https?://)?(?:www\\.)?tiktokv?\\.com/@([\\w_.-]+)/reposts",
+    "(?:https?://)?(?:www\\.)?tiktokv?\\.com/@([\\w_.-]+)/stories",
+    "(?:https?://)?(?:www\\.)?tiktokv?\\.com/@([\\w_.-]+)/like[sd]",
+    "(?:https?://)?(?:www\\.)?tiktokv?\\.com/@([\\w_.-]+)/saved",
+    "(?:https?://)?(?:www\\.)?tiktokv?\\.com/following",
+    "(?:https?://)?tmohentai\\.com/(?:contents|reader)/(\\w+)",
+    "(?:https?://)?(?:www\\.)?toyhou\\.se/([^/?#]+)/art",
+    "(?:https?://)?(?:(?:www\\.)?toyhou\\.se/~images|f\\d+\\.toyhou\\.se/fi"
+    "le/[^/?#]+/(?:image|watermark)s)/(\\d+)",
+    "(?:tumblr:(?:https?://)?([^/]+)|(?:https?://)?(?:(?:www\\.)?tumblr\\.c"
+    "om/(?:blog/(?:view/)?)?([\\w-]+)|([\\w-]+\\.tumblr\\.com)))(?:/page/\\"
+    "d+|/archive)?/?$",
+    "(?:tumblr:(?:https?://)?([^/]+)|(?:https?://)?(?:(?:www\\.)?tumblr\\.c"
+    "om/(?:blog/(?:view/)?)?([\\w-]+)|([\\w-]+\\.tumblr\\.com)))/(?:post/|i"
+    "mage/)?(\\d+)",
+    "(?:tumblr:(?:https?://)?([^/]+)|(?:https?://)?(?:(?:www\\.)?tumblr\\.c"
+    "om/(?:blog/(?:view/)?)?([\\w-]+)|([\\w-]+\\.tumblr\\.com)))(?:/archive"
+    ")?/tagged/([^/?#]+)",
+    "(?:tumblr:(?:https?://)?([^/]+)|(?:https?://)?(?:(?:www\\.)?tumblr\\.c"
+    "om/(?:blog/(?:view/)?)?([\\w-]+)|([\\w-]+\\.tumblr\\.com)))/day/(\\d\\"
+    "d\\d\\d/\\d\\d/\\d\\d)",
+    "(?:tumblr:(?:https?://)?([^/]+)|(?:https?://)?(?:(?:www\\.)?tumblr\\.c"
+    "om/(?:blog/(?:view/)?)?([\\w-]+)|([\\w-]+\\.tumblr\\.com)))/likes",
+    "(?:tumblr:(?:https?://)?([^/]+)|(?:https?://)?(?:(?:www\\.)?tumblr\\.c"
+    "om/(?:blog/(?:view/)?)?([\\w-]+)|([\\w-]+\\.tumblr\\.com)))/following",
+    "(?:tumblr:(?:https?://)?([^/]+)|(?:https?://)?(?:(?:www\\.)?tumblr\\.c"
+    "om/(?:blog/(?:view/)?)?([\\w-]+)|([\\w-]+\\.tumblr\\.com)))/followers",
+    "(?:https?://)?(?:www\\.)?tumblr\\.com/search/([^/?#]+)(?:/([^/?#]+)(?:"
+    "/([^/?#]+))?)?(?:/?\\?([^#]+))?",
+    "(?:https?://)?tumblrgallery\\.xyz(/tumblrblog/gallery/(\\d+)\\.html)",
+    "(?:https?://)?tumblrgallery\\.xyz(/post/(\\d+)\\.html)",
+    "(?:https?://)?tumblrgallery\\.xyz(/s\\.php\\?q=([^&#]+))",
+    "(?:https?://)?(?:www\\.)?tungsten\\.run/post/(\\w+)",
+    "(?:https?://)?(?:www\\.)?tungsten\\.run/model/(\\w+)(?:/?\\?model_vers"
+    "ion=(\\w+))?",
+    "(?:https?://)?(?:www\\.)?tungsten\\.run/user/([^/?#]+)(?:/posts)?/?(?:"
+    "\\?([^#]+))?",
+    "(?:https?://)?(?:(?:www\\.)?turbo(?:vid)?\\.cr|saint\\d*\\.(?:su|pk|cr"
+    "|to))/a/([^/?#]+)",
+    "(?:https?://)?(?:(?:www\\.)?turbo(?:vid)?\\.cr|saint\\d*\\.(?:su|pk|cr"
+    "|to))/(?:embe)?[dv]/([^/?#]+)",
+    "(?:https?://)?(?:www\\.)?twibooru\\.org/(\\d+)",
+    "(?:https?://)?(?:www\\.)?twibooru\\.org/(?:search/?\\?([^#]+)|tags/([^"
+    "/?#]+))",
+    "(?:https?://)?(?:www\\.)?twibooru\\.org/galleries/(\\d+)",
+    "(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v)"
+    ")?x)\\.com/home(?:/fo(?:llowing|r[-_ ]?you()))?/?$",
+    "(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v)"
+    ")?x)\\.com/(?:notifications|i/timeline())",
+    "(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v)"
+    ")?x)\\.com/search/?\\?(?:[^&#]+&)*q=([^&#]+)",
+    "(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v)"
+    ")?x)\\.com/hashtag/([^/?#]+)",
+    "(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v)"
+    ")?x)\\.com/(?:([^/?#]+)/?(?:$|\\?|#)|i(?:/user/|ntent/user\\?user_id=)"
+    "(\\d+))",
+    "(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v)"
+    ")?x)\\.com/([^/?#]+)/timeline(?!\\w)",
+    "(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v)"
+    ")?x)\\.com/([^/?#]+)/tweets(?!\\w)",
+    "(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v)"
+    ")?x)\\.com/([^/?#]+)/with_replies(?!\\w)",
+    "(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v)"
+    ")?x)\\.com/([^/?#]+)/highlights(?!\\w)",
+    "(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v)"
+    ")?x)\\.com/([^/?#]+)/media(?!\\w)",
+    "(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v)"
+    ")?x)\\.com/([^/?#]+)/likes(?!\\w)",
+    "(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v)"
+    ")?x)\\.com/i/bookmarks()",
+    "(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v)"
+    ")?x)\\.com/i/lists/(\\d+)/?$",
+    "(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v)"
+    ")?x)\\.com/i/lists/(\\d+)/members",
+    "(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v)"
+    ")?x)\\.com/([^/?#]+)/following(?!\\w)",
+    "(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v)"
+    ")?x)\\.com/([^/?#]+)/followers(?!\\w)",
+    "(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v)"
+    ")?x)\\.com/i/communities/(\\d+)",
+    "(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v)"
+    ")?x)\\.com/([^/?#]+)/communities/?$",
+    "(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v)"
+    ")?x)\\.com/i/events/(\\d+)",
+    "(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v)"
+    ")?x)\\.com/([^/?#]+|i/web)/status/(\\d+)/?(?:$|\\?|#|photo/|video/)",
+    "(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v)"
+    ")?x)\\.com/(?:[^/?#]+|i/web)/status/(\\d+)/quotes",
+    "(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v)"
+    ")?x)\\.com/([^/?#]+)/info",
+    "(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v)"
+    ")?x)\\.com/([^/?#]+)/photo",
+    "(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v)"
+    ")?x)\\.com/([^/?#]+)/header_photo",
+    "https?://pbs\\.twimg\\.com/media/([\\w-]+)(?:\\?format=|\\.)(\\w+)",
+    "(?:https?://)?(?:\\w+\\.)?urlgalleries\\.com/([^/?#]+)/(\\d+)(/[^/?#]+"
+    ")?",
+    "(?:https?://)?unsplash\\.com/photos/([^/?#]+)",
+    "(?:https?://)?unsplash\\.com/@(\\w+)/?$",
+    "(?:https?://)?unsplash\\.com/@(\\w+)/likes",
+    "(?:https?://)?unsplash\\.com/collections/([^/?#]+)(?:/([^/?#]+))?",
+    "(?:https?://)?unsplash\\.com/s/photos/([^/?#]+)(?:\\?([^#]+))?",
+    "(?:https?://)?uploadir\\.com/(?:user/)?u(?:ploads)?/([^/?#]+)",
+    "(?:urlshortener:(https?://[^/?#]+)|(?:https?://)?(?:bit\\.ly()|t\\.co("
+    ")))(/[^/?#]+)",
+    "(?:https?://)?(?:www\\.)?vanilla-rock\\.com(/(?!category/|tag/)[^/?#]+"
+    ")/?$",
+    "(?:https?://)?(?:www\\.)?vanilla-rock\\.com(/(?:tag|category)/[^?#]+)",
+    "(?:vichan:(https?://[^/?#]+)|(?:https?://)?(?:8kun\\.top()|smuglo(?:\\"
+    ".li|li\\.net)()|boards\\.guro\\.cx()))/([^/?#]+)/res/(\\d+)",
+    "(?:vichan:(https?://[^/?#]+)|(?:https?://)?(?:8kun\\.top()|smuglo(?:\\"
+    ".li|li\\.net)()|boards\\.guro\\.cx()))/([^/?#]+)(?:/index|/catalog|/\\"
+    "d+|/?$)",
+    "(?:https?://)?(?:www\\.)?vipergirls\\.to/threads/(\\d+)(?:-[^/?#]+)?(/"
+    "page\\d+)?(?:$|#|\\?(?!p=))",
+    "(?:https?://)?(?:www\\.)?vipergirls\\.to/threads/(\\d+)(?:-[^/?#]+)?\\"
+    "?p=\\d+[^#]*#post(\\d+)",
+    "(?:https://)?(?:www\\.|m\\.)?vk\\.com/(?:(?:albums|photos|id)(-?\\d+)|"
+    "(?!(?:album|tag|wall)-?\\d+_?)([^/?#]+))",
+    "(?:https://)?(?:www\\.|m\\.)?vk\\.com/album(-?\\d+)_(\\d+)$",
+    "(?:https://)?(?:www\\.|m\\.)?vk\\.com/tag(-?\\d+)$",
+    "(?:https://)?(?:www\\.|m\\.)?vk\\.com/wall(-?\\d+)_(\\d+)",
+    "(?:https?://)?(?:www\\.)?vsco\\.co/([^/?#]+)/?$",
+    "(?:https?://)?(?:www\\.)?vsco\\.co/([^/?#]+)/(?:gallery|images)",
+    "(?:https?://)?(?:www\\.)?vsco\\.co/([^/?#]+)/collection",
+    "(?:https?://)?(?:www\\.)?vsco\\.co/spaces/([^/?#]+)",
+    "(?:https?://)?(?:www\\.)?vsco\\.co/([^/?#]+)/spaces",
+    "(?:https?://)?(?:www\\.)?vsco\\.co/([^/?#]+)/avatar",
+    "(?:https?://)?(?:www\\.)?vsco\\.co/([^/?#]+)/media/([0-9a-fA-F]+)",
+    "(?:https?://)?(?:www\\.)?vsco\\.co/([^/?#]+)/video/([^/?#]+)",
+    "(?:https?://)?wallhaven\\.cc/search(?:/?\\?([^#]+))?",
+    "(?:https?://)?wallhaven\\.cc/user/([^/?#]+)/favorites/(\\d+)",
+    "(?:https?://)?wallhaven\\.cc/user/([^/?#]+)/?$",
+    "(?:https?://)?wallhaven\\.cc/user/([^/?#]+)/favorites/?$",
+    "(?:https?://)?wallhaven\\.cc/user/([^/?#]+)/uploads",
+    "(?:https?://)?(?:wallhaven\\.cc/w/|whvn\\.cc/|w\\.wallhaven\\.cc/[a-z]"
+    "+/\\w\\w/wallhaven-)(\\w+)",
+    "(?:https?://)?(?:www\\.)?wallpapercave\\.com/",
+    "(?:https?://)?(?:www\\.)?warosu\\.org/([^/]+)/thread/(\\d+)",
+    "(?:https://)?(?:www\\.)?weasyl.com/(?:~[\\w~-]+/submissions|submission"
+    "|view)/(\\d+)",
+    "(?:https://)?(?:www\\.)?weasyl.com/(?:~|submissions/)([\\w~-]+)/?$",
+    "(?:https://)?(?:www\\.)?weasyl.com/submissions/([\\w~-]+)\\?folderid=("
+    "\\d+)",
+    "(?:https://)?(?:www\\.)?weasyl.com/journal/(\\d+)",
+    "(?:https://)?(?:www\\.)?weasyl.com/journals/([\\w~-]+)",
+    "(?:https://)?(?:www\\.)?weasyl.com/favorites(?:\\?userid=(\\d+)|/([^/?"
+    "#]+))",
+    "(?:https?://)?(?:s\\d+\\.)?webmshare\\.com/(?:play/|download-webm/)?("
+    "\\w{3,})",
+    "(?:https?://)?(?:www\\.)?webtoons\\.com/(([^/?#]+)/([^/?#]+)/([^/?#]+)"
+    "/[^/?#]+)/viewer\\?([^#'\\\"]+)",
+    "(?:https?://)?(?:www\\.)?webtoons\\.com/(([^/?#]+)/([^/?#]+)/([^/?#]+)"
+    ")/list\\?([^#]+)",
+    "(?:https?://)?(?:www\\.)?webtoons\\.com/p/community/([^/?#]+)/u/([^/?#"
+    "]+)",
+    "(?:https?://)?(?:www\\.)?weebcentral\\.com(/chapters/(\\w+))",
+    "(?:https?://)?(?:www\\.)?weebcentral\\.com/series/(\\w+)",
+    "(?:https?://)?weebdex\\.org/chapter/(\\w+)",
+    "(?:https?://)?weebdex\\.org/title/(\\w+)(?:/[^/?#]+/?\\?([^#]+))?",
+    "(?:https?://)?(?:www\\.|m\\.)?weibo\\.c(?:om|n)/(?:(u|n|p(?:rofile)?)/"
+    ")?([^/?#]+)(?:/home)?(?:$|#)",
+    "(?:https?://)?(?:www\\.|m\\.)?weibo\\.c(?:om|n)/(?:(u|n|p(?:rofile)?)/"
+    ")?([^/?#]+)(?:/home)?\\?tabtype=home",
+    "(?:https?://)?(?:www\\.|m\\.)?weibo\\.c(?:om|n)/(?:(u|n|p(?:rofile)?)/"
+    ")?([^/?#]+)(?:/home)?\\?tabtype=feed",
+    "(?:https?://)?(?:www\\.|m\\.)?weibo\\.c(?:om|n)/(?:(u|n|p(?:rofile)?)/"
+    ")?([^/?#]+)(?:/home)?\\?tabtype=video",
+    "(?:https?://)?(?:www\\.|m\\.)?weibo\\.c(?:om|n)/(?:(u|n|p(?:rofile)?)/"
+    ")?([^/?#]+)(?:/home)?\\?tabtype=newVideo",
+    "(?:https?://)?(?:www\\.|m\\.)?weibo\\.c(?:om|n)/(?:(u|n|p(?:rofile)?)/"
+    ")?([^/?#]+)(?:/home)?\\?tabtype=article",
+    "(?:https?://)?(?:www\\.|m\\.)?weibo\\.c(?:om|n)/(?:(u|n|p(?:rofile)?)/"
+    ")?([^/?#]+)(?:/home)?\\?tabtype=album(?:[:_-]([^&#]+))?",
+    "(?:https?://)?(?:www\\.|m\\.)?weibo\\.c(?:om|n)/(detail|status|\\d+)/("
+    "\\w+)",
+    "(?:https?://)?(?:www\\.)?whyp\\.it/tracks/(\\d+)(?:/[^/?#]+)?/?(?:\\?("
+    "[^#]+))?",
+    "(?:https?://)?(?:www\\.)?whyp\\.it/users/(\\d+)(?:/[^/?#]+)?/?(?:\\?(["
+    "^#]+))?",
+    "(?:https?://)?(?:www\\.)?whyp\\.it/collections/(\\d+)(?:/[^/?#]+)?/?(?"
+    ":\\?([^#]+))?",
+    "(?:https?://)?(?:www\\.)?wikiart\\.org/([a-z]+)/(?!\\w+-by-)([\\w-]+)/"
+    "?$",
+    "(?:https?://)?(?:www\\.)?wikiart\\.org/([a-z]+)/(?!(?:paintings|artist"
+    "s)-by-)([\\w-]+)/([\\w-]+)",
+    "(?:https?://)?(?:www\\.)?wikiart\\.org/([a-z]+)/paintings-by-([\\w-]+)"
+    "/([\\w-]+)",
+    "(?:https?://)?(?:www\\.)?wikiart\\.org/([a-z]+)/artists-by-([\\w-]+)/("
+    "[\\w-]+)",
+    "(?:https?://)(?:(?:www\\.)?wikifeetx?|men\\.wikifeet)\\.com/([^/?#]+)",
+    "(?:wikimedia:(https?://[^/?#]+)|(?:https?://)?(?:[a-z]{2,}\\.wik(?:i(?"
+    ":pedia|quote|books|source|news|versity|data|voyage)|tionary)\\.org()|s"
+    "pecies\\.wikimedia\\.org()|commons\\.wikimedia\\.org()|(?:www\\.)?medi"
+    "awiki\\.org()|[\\w-]+\\.fandom\\.com()|\\w+\\.wiki\\.gg()|(?:www\\.)?m"
+    "ariowiki\\.com()|(?:bulbapedia|archives)\\.bulbagarden\\.net()|(?:www"
+    "\\.)?pidgi\\.net()|azurlane\\.koumakan\\.jp()|(?:www\\.)?mgewiki\\.moe"
+    "()))/(?!static/)([^?#]+)",
+    "(?:wikimedia:(https?://[^/?#]+)|(?:https?://)?(?:[a-z]{2,}\\.wik(?:i(?"
+    ":pedia|quote|books|source|news|versity|data|voyage)|tionary)\\.org()|s"
+    "pecies\\.wikimedia\\.org()|commons\\.wikimedia\\.org()|(?:www\\.)?medi"
+    "awiki\\.org()|[\\w-]+\\.fandom\\.com()|\\w+\\.wiki\\.gg()|(?:www\\.)?m"
+    "ariowiki\\.com()|(?:bulbapedia|archives)\\.bulbagarden\\.net()|(?:www"
+    "\\.)?pidgi\\.net()|azurlane\\.koumakan\\.jp()|(?:www\\.)?mgewiki\\.moe"
+    "()))/?$",
+    "(?:https?://)?(?:www\\.)?xasiat\\.com((?:/fr|/ja)?/albums/(\\d+)/[^/?#"
+    "]+)",
+    "(?:https?://)?(?:www\\.)?xasiat\\.com((?:/fr|/ja)?/albums/tags/[^/?#]+"
+    ")",
+    "(?:https?://)?(?:www\\.)?xasiat\\.com((?:/fr|/ja)?/albums/categories/["
+    "^/?#]+)",
+    "(?:https?://)?(?:www\\.)?xasiat\\.com((?:/fr|/ja)?/albums/models/[^/?#"
+    "]+)",
+    "(?:xenforo:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?simpcity\\.("
+    "?:cr|su)()|(?:www\\.)?nudostar\\.com/forum()|(?:www\\.)?allthefallen\\"
+    ".moe/forum()|(?:www\\.)?celebforum\\.to()|(?:www\\.)?titsintops\\.com/"
+    "phpBB2()|forums\\.socialmediagirls\\.com()|(?:www\\.)?blacktowhite\\.n"
+    "et()))(/(?:index\\.php\\?)?threads/[^/?#]+/(?:page-\\d+)?#?post-|/post"
+    "s/)(\\d+)",
+    "(?:xenforo:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?simpcity\\.("
+    "?:cr|su)()|(?:www\\.)?nudostar\\.com/forum()|(?:www\\.)?allthefallen\\"
+    ".moe/forum()|(?:www\\.)?celebforum\\.to()|(?:www\\.)?titsintops\\.com/"
+    "phpBB2()|forums\\.socialmediagirls\\.com()|(?:www\\.)?blacktowhite\\.n"
+    "et()))(/(?:index\\.php\\?)?threads/(?:[^/?#]+\\.)?\\d+)(?:/page-(\\d+)"
+    ")?",
+    "(?:xenforo:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?simpcity\\.("
+    "?:cr|su)()|(?:www\\.)?nudostar\\.com/forum()|(?:www\\.)?allthefallen\\"
+    ".moe/forum()|(?:www\\.)?celebforum\\.to()|(?:www\\.)?titsintops\\.com/"
+    "phpBB2()|forums\\.socialmediagirls\\.com()|(?:www\\.)?blacktowhite\\.n"
+    "et()))(/(?:index\\.php\\?)?forums/(?:[^/?#]+\\.)?[^/?#]+)(?:/page-(\\d"
+    "+))?",
+    "(?:xenforo:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?simpcity\\.("
+    "?:cr|su)()|(?:www\\.)?nudostar\\.com/forum()|(?:www\\.)?allthefallen\\"
+    ".moe/forum()|(?:www\\.)?celebforum\\.to()|(?:www\\.)?titsintops\\.com/"
+    "phpBB2()|forums\\.socialmediagirls\\.com()|(?:www\\.)?blacktowhite\\.n"
+    "et()))(/(?:index\\.php\\?)?)me(?:dia/users/([^/?#]+)(?:/page-(\\d+))?|"
+    "mbers/([^/?#]+)/#xfmgMedia)",
+    "(?:xenforo:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?simpcity\\.("
+    "?:cr|su)()|(?:www\\.)?nudostar\\.com/forum()|(?:www\\.)?allthefallen\\"
+    ".moe/forum()|(?:www\\.)?celebforum\\.to()|(?:www\\.)?titsintops\\.com/"
+    "phpBB2()|forums\\.socialmediagirls\\.com()|(?:www\\.)?blacktowhite\\.n"
+    "et()))(/(?:index\\.php\\?)?media/albums/([^/?#]+))(?:/page-(\\d+))?",
+    "(?:xenforo:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?simpcity\\.("
+    "?:cr|su)()|(?:www\\.)?nudostar\\.com/forum()|(?:www\\.)?allthefallen\\"
+    ".moe/forum()|(?:www\\.)?celebforum\\.to()|(?:www\\.)?titsintops\\.com/"
+    "phpBB2()|forums\\.socialmediagirls\\.com()|(?:www\\.)?blacktowhite\\.n"
+    "et()))(/(?:index\\.php\\?)?media/categories/([^/?#]+))(?:/page-(\\d+))"
+    "?",
+    "(?:xenforo:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?simpcity\\.("
+    "?:cr|su)()|(?:www\\.)?nudostar\\.com/forum()|(?:www\\.)?allthefallen\\"
+    ".moe/forum()|(?:www\\.)?celebforum\\.to()|(?:www\\.)?titsintops\\.com/"
+    "phpBB2()|forums\\.socialmediagirls\\.com()|(?:www\\.)?blacktowhite\\.n"
+    "et()))(/(?:index\\.php\\?)?media/((?:[^/?#]+\\.)\\d+))",
+    "(?:xenforo:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?simpcity\\.("
+    "?:cr|su)()|(?:www\\.)?nudostar\\.com/forum()|(?:www\\.)?allthefallen\\"
+    ".moe/forum()|(?:www\\.)?celebforum\\.to()|(?:www\\.)?titsintops\\.com/"
+    "phpBB2()|forums\\.socialmediagirls\\.com()|(?:www\\.)?blacktowhite\\.n"
+    "et()))(/(?:index\\.php\\?)?members/[^/?#]+)(?:/page-(\\d+))?",
+    "(?:https?://)?xfolio\\.jp(?:/[^/?#]+)?/portfolio/([^/?#]+)/works/(\\d+"
+    ")",
+    "(?:https?://)?xfolio\\.jp(?:/[^/?#]+)?/portfolio/([^/?#]+)(?:/works)?/"
+    "?(?:$|\\?|#)",
+    "(?:https?://)?xfolio\\.jp(?:/[^/?#]+)?/portfolio/([^/?#]+)/series/(\\d"
+    "+)",
+    "(?:https?://)?((?:[\\w-]+\\.)?xhamster(?:\\d?\\.(?:com|one|desi)|\\.po"
+    "rncache\\.net))(/photos/gallery/[^/?#]+)",
+    "(?:https?://)?((?:[\\w-]+\\.)?xhamster(?:\\d?\\.(?:com|one|desi)|\\.po"
+    "rncache\\.net))/users/([^/?#]+)(?:/photos)?/?(?:$|[?#])",
+    "(?:https?://)?(?:www\\.)?xvideos\\.com/(?:profiles|(?:amateur-|model-)"
+    "?channels)/([^/?#]+)/photos/(\\d+)",
+    "(?:https?://)?(?:www\\.)?xvideos\\.com/(?:profiles|(?:amateur-|model-)"
+    "?channels)/([^/?#]+)/?(?:#.*)?$",
+    "(?:https?://)?(?:www\\.)?yiffverse\\.com/post/(\\d+)",
+    "(?:https?://)?(?:www\\.)?yiffverse\\.com/playlist/(\\d+)",
+    "(?:https?://)?(?:www\\.)?yiffverse\\.com/(?:tag/([^/?#]+))?(?:/?\\?([^"
+    "#]+))?(?:$|#)",
+    "(?:https?://)?(?:www\\.)?yourlesbians\\.com(/album/([^/?#]+)/?)",
+    "(?:https?://)?(?:www\\.)?zerochan\\.net/(?!\\d+$)([^/?#]+)/?(?:\\?([^#"
+    "]+))?",
+    "(?:https?://)?(?:www\\.)?zerochan\\.net/(\\d+)",
+    "(?:moebooru:(https?://[^/?#]+)|(?:https?://)?(?:yande\\.re()|konachan"
+    "\\.(?:com|net)()|(?:www\\.)?sakugabooru\\.com()|lolibooru\\.moe()))/po"
+    "st\\?(?:[^&#]*&)*tags=([^&#]*)",
+    "(?:moebooru:(https?://[^/?#]+)|(?:https?://)?(?:yande\\.re()|konachan"
+    "\\.(?:com|net)()|(?:www\\.)?sakugabooru\\.com()|lolibooru\\.moe()))/po"
+    "ol/show/(\\d+)",
+    "(?:moebooru:(https?://[^/?#]+)|(?:https?://)?(?:yande\\.re()|konachan"
+    "\\.(?:com|net)()|(?:www\\.)?sakugabooru\\.com()|lolibooru\\.moe()))/po"
+    "st/show/(\\d+)",
+    "(?:moebooru:(https?://[^/?#]+)|(?:https?://)?(?:yande\\.re()|konachan"
+    "\\.(?:com|net)()|(?:www\\.)?sakugabooru\\.com()|lolibooru\\.moe()))/po"
+    "st/popular_(by_(?:day|week|month)|recent)(?:\\?([^#]*))?",
+    "(?:foolfuuka:(https?://[^/?#]+)|(?:https?://)?(?:(?:archive\\.)?4plebs"
+    "\\.org()|archived\\.moe()|(?:www\\.)?archiveofsins\\.com()|arch\\.b4k"
+    "\\.(?:dev|co)()|desuarchive\\.org()|boards\\.fireden\\.net()|archive\\"
+    ".palanq\\.win()|(?:rbt\\.asia|(?:archive\\.)?rebeccablacktech\\.com)()"
+    "|thebarchive\\.com()))/([^/?#]+)/thread/(\\d+)",
+    "(?:foolfuuka:(https?://[^/?#]+)|(?:https?://)?(?:(?:archive\\.)?4plebs"
+    "\\.org()|archived\\.moe()|(?:www\\.)?archiveofsins\\.com()|arch\\.b4k"
+    "\\.(?:dev|co)()|desuarchive\\.org()|boards\\.fireden\\.net()|archive\\"
+    ".palanq\\.win()|(?:rbt\\.asia|(?:archive\\.)?rebeccablacktech\\.com)()"
+    "|thebarchive\\.com()))/([^/?#]+)(?:/(?:page/)?(\\d*))?$",
+    "(?:foolfuuka:(https?://[^/?#]+)|(?:https?://)?(?:(?:archive\\.)?4plebs"
+    "\\.org()|archived\\.moe()|(?:www\\.)?archiveofsins\\.com()|arch\\.b4k"
+    "\\.(?:dev|co)()|desuarchive\\.org()|boards\\.fireden\\.net()|archive\\"
+    ".palanq\\.win()|(?:rbt\\.asia|(?:archive\\.)?rebeccablacktech\\.com)()"
+    "|thebarchive\\.com()))/([^/?#]+)/search((?:/[^/?#]+/[^/?#]+)+)",
+    "(?:foolfuuka:(https?://[^/?#]+)|(?:https?://)?(?:(?:archive\\.)?4plebs"
+    "\\.org()|archived\\.moe()|(?:www\\.)?archiveofsins\\.com()|arch\\.b4k"
+    "\\.(?:dev|co)()|desuarchive\\.org()|boards\\.fireden\\.net()|archive\\"
+    ".palanq\\.win()|(?:rbt\\.asia|(?:archive\\.)?rebeccablacktech\\.com)()"
+    "|thebarchive\\.com()))/([^/?#]+)/gallery(?:/(\\d+))?",
+    "(?:foolslide:(https?://[^/?#]+)|(?:https?://)?(?:))(/read/[^/?#]+/[a-z"
+    "-]+/\\d+/\\d+(?:/\\d+)?)",
+    "(?:foolslide:(https?://[^/?#]+)|(?:https?://)?(?:))(/series/[^/?#]+)",
+    "(?:mastodon:(https?://[^/?#]+)|(?:https?://)?(?:mastodon\\.social()|pa"
+    "woo\\.net()|baraag\\.net()))(?:/web)?/(?:@|users/)([^/?#]+)(?:/media)?"
+    "/?$",
+    "(?:mastodon:(https?://[^/?#]+)|(?:https?://)?(?:mastodon\\.social()|pa"
+    "woo\\.net()|baraag\\.net()))(?:/web)?/bookmarks",
+    "(?:mastodon:(https?://[^/?#]+)|(?:https?://)?(?:mastodon\\.social()|pa"
+    "woo\\.net()|baraag\\.net()))(?:/web)?/favourites",
+    "(?:mastodon:(https?://[^/?#]+)|(?:https?://)?(?:mastodon\\.social()|pa"
+    "woo\\.net()|baraag\\.net()))(?:/web)?/lists/(\\w+)",
+    "(?:mastodon:(https?://[^/?#]+)|(?:https?://)?(?:mastodon\\.social()|pa"
+    "woo\\.net()|baraag\\.net()))(?:/web)?/tags/(\\w+)",
+    "(?:mastodon:(https?://[^/?#]+)|(?:https?://)?(?:mastodon\\.social()|pa"
+    "woo\\.net()|baraag\\.net()))(?:/web)?/(?:@|users/)([^/?#]+)/following",
+    "(?:mastodon:(https?://[^/?#]+)|(?:https?://)?(?:mastodon\\.social()|pa"
+    "woo\\.net()|baraag\\.net()))(?:/web)?/(?:@[^/?#]+|(?:users/[^/?#]+/)?("
+    "?:statuses|notice|objects()))/(?!following)([^/?#]+)",
+    "(?:shopify:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?chelseacrew"
+    "\\.com()|(?:www\\.)?fashionnova\\.com()|(?:[a-z]+\\.)?loungeunderwear"
+    "\\.com()|michaels\\.com\\.au()|modcloth\\.com()|(?:www\\.)?ohpolly\\.c"
+    "om()|(?:www\\.)?omgmiamiswimwear\\.com()|pinupgirlclothing\\.com()|(?:"
+    "www\\.)?raidlondon\\.com()|(?:www\\.)?unique\\-vintage\\.com()|(?:www"
+    "\\.)?windsorstore\\.com()))(?:/[a-z]{2}(?:-[^/?#]+)?)?(/collections/["
+    "\\w-]+)/?(?:$|[?#])",
+    "(?:shopify:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?chelseacrew"
+    "\\.com()|(?:www\\.)?fashionnova\\.com()|(?:[a-z]+\\.)?loungeunderwear"
+    "\\.com()|michaels\\.com\\.au()|modcloth\\.com()|(?:www\\.)?ohpolly\\.c"
+    "om()|(?:www\\.)?omgmiamiswimwear\\.com()|pinupgirlclothing\\.com()|(?:"
+    "www\\.)?raidlondon\\.com()|(?:www\\.)?unique\\-vintage\\.com()|(?:www"
+    "\\.)?windsorstore\\.com()))(?:/[a-z]{2}(?:-[^/?#]+)?)?((?:/collections"
+    "/[\\w-]+)?/products/[\\w-]+)",
+    "(?:lolisafe:(https?://[^/?#]+)|(?:https?://)?(?:))/a/([^/?#]+)",
+    "(?:https?://)?(?:www\\.)?((?:imx\\.to|img\\.yt)/(?:i/|img-)(\\w+)(\\.h"
+    "tml)?)",
+    "(?:https?://)?(?:www\\.)?(imx\\.to/g/([^/?#]+))",
+    "(?:https?://)?((?:www\\.)?acidimg\\.cc/img-([a-z0-9]+)\\.html)",
+    "(?:https?://)?((?:www|img\\d+)\\.imagevenue\\.com/([A-Z0-9]{8,10}|view"
+    "/.*|img\\.php\\?.*))",
+    "(?:https?://)?((?:www\\.|phun\\.)?image(?:twist|haha)\\.com/([a-z0-9]{"
+    "12}))",
+    "(?:https?://)?((?:www\\.|phun\\.)?image(?:twist|haha)\\.com/(p/[^/?#]+"
+    "/(\\d+)|\\?[^#]*\\bfld_id=\\d+[^#]*&page=\\d+))",
+    "(?:https?://)?((?:www\\.)?imgadult\\.com/img-([0-9a-f]+)\\.html)",
+    "(?:https?://)?((?:www\\.)?imgspice\\.com/([^/?#]+))",
+    "(?:https?://)?(?:www\\.)?pixhost\\.(?:to|org)(/show/\\d+/(\\d+)_[^/?#]"
+    "+)",
+    "(?:https?://)?(?:www\\.)?pixhost\\.(?:to|org)(/gallery/([^/?#]+))",
+    "(?:https?://)?(?:www\\.)?(?:postim(?:ages|g)|pixxxels)\\.(?:cc|org)(/("
+    "?!gallery/)(?:image/)?([^/?#]+)/?)",
+    "(?:https?://)?(?:www\\.)?(?:postim(?:ages|g)|pixxxels)\\.(?:cc|org)(/g"
+    "allery/([^/?#]+))",
+    "(?:https?://)?((?:www\\.)?turboimagehost\\.com/p/(\\d+)/[^/?#]+\\.html"
+    ")",
+    "(?:https?://)?((?:www\\.)?turboimagehost\\.com/album/(\\d+)/([^/?#]*))",
+    "(?:https?://)?(vipr\\.im/(\\w+))",
+    "(?:https?://)?((?:www\\.)?imgclick\\.net/([^/?#]+))",
+    "(?:https?://)?(?:www\\.|img\\d+\\.)?fappic\\.com/(?:i/\\d+/())?(\\w{10"
+    ",})(?:/|\\.)\\w+",
+    "(?:https?://)?((?:www\\.)?picstate\\.com/view/full/([^/?#]+))",
+    "(?:https?://)?(?:www\\.)?(img(drive|taxi|wallet)\\.(?:com|net)/img-(\\"
+    "w+)\\.html)",
+    "(?:https?://)?(?:www\\.)?silverpic\\.(?:net|com)(/([a-z0-9]{10,})/[\\S"
+    "]+\\.html)",
+    "(?:https?://)?(?:www\\.)?imgpv\\.com(/([a-z0-9]{10,})/[\\S]+\\.html)",
+    "(?i)https?://(?P<domain>[^/?#]+)/(?P<path>[^?#]+\\.(?:jpe?g|jpe|png|gi"
+    "f|bmp|svg|web[mp]|avif|heic|psd|mp4|m4v|mov|mkv|og[gmv]|wav|mp3|opus|z"
+    "ip|rar|7z|pdf|swf))(?:\\?(?P<query>[^#]*))?(?:#(?P<fragment>.*))?$",
+    "r(?:ecursive)?:",
+    "oauth:flickr$",
+    "oauth:smugmug$",
+    "oauth:tumblr$",
+    "oauth:deviantart$",
+    "oauth:reddit$",
+    "oauth:mastodon:(?:https?://)?([^/?#]+)",
+    "oauth:pixiv$",
+    "(?i)noo?p$",
+    "ytdl:(.*)",
+    "(?i)(?P<generic>g(?:eneric)?:)(?P<scheme>https?://)?(?P<domain>[-\\w\\"
+    ".]+)(?P<path>/[^?#]*)?(?:\\?(?P<query>[^#]*))?(?:\\#(?P<fragment>.*))?",
+)
+
+BASECATEGORIES = (
+    "",
+    "2chen",
+    "Danbooru",
+    "E621",
+    "IMHentai",
+    "Nijie",
+    "blogger",
+    "booru",
+    "chevereto",
+    "foolfuuka",
+    "foolslide",
+    "gelbooru_v01",
+    "gelbooru_v02",
+    "hentaicosplays",
+    "jschan",
+    "lolisafe",
+    "lynxchan",
+    "manganelo",
+    "mastodon",
+    "misskey",
+    "moebooru",
+    "nitter",
+    "philomena",
+    "postmill",
+    "reactor",
+    "shimmie2",
+    "shopify",
+    "szurubooru",
+    "urlshortener",
+    "vichan",
+    "wikimedia",
+    "xenforo",
+)
+
+CONFIG = (
+    ("bunkr", "tlds"),
+    ("generic", "enabled"),
+    ("ytdl", "enabled"),
+)
+
+INDEX = {
+    "1sthiperdex": (305, 306, 307),
+    "1sthipertoon": (305, 306, 307),
+    "2ch": (0, 1),
+    "2chan": (2,),
+    "2chen": (3, 4),
+    "35photo": (5, 6, 7, 8),
+    "4archive": (15, 16),
+    "4chanarchives": (17, 18),
+    "4channel": (13, 14),
+    "4plebs": (871, 872, 873, 874),
+    "500px": (19, 20, 21, 22),
+    "8chan": (23, 24),
+    "8kun": (786, 787),
+    "8muses": (25,),
+    "94chan": (402, 403),
+    "ac": (110, 111),
+    "acidimg": (889,),
+    "adultdvdempire": (26,),
+    "adultempire": (26,),
+    "agn": (27, 28),
+    "ahottie": (29, 30, 31),
+    "aibooru": (154, 155, 156, 157, 158, 159, 160, 161, 162),
+    "allgirl": (283, 284, 285),
+    "allporncomic": (32, 33, 34),
+    "allthefallen": (
+        154, 155, 156, 157, 158, 159, 160, 161, 162, 846, 847, 848,
+        849, 850, 851, 852, 853
+    ),
+    "anthro": (207,),
+    "ao3": (35, 36, 37, 38, 39, 40, 41, 42, 43),
+    "app": (110, 111),
+    "arca": (44, 45, 46),
+    "arch": (871, 872, 873, 874),
+    "architizer": (47, 48),
+    "archive": (871, 872, 873, 874),
+    "archived": (871, 872, 873, 874),
+    "archiveofourown": (35, 36, 37, 38, 39, 40, 41, 42, 43),
+    "archiveofsins": (871, 872, 873, 874),
+    "are": (49,),
+    "artstation": (50, 51, 52, 53, 54, 55, 56, 57, 58, 59),
+    "artstn": (58,),
+    "aryion": (60, 61, 62, 63, 64, 65),
+    "asia": (871, 872, 873, 874),
+    "audiochan": (66, 67, 68, 69),
+    "ax": (110, 111),
+    "azurlane": (840, 841),
+    "baraag": (877, 878, 879, 880, 881, 882, 883),
+    "bbc": (70, 71),
+    "bbw-chan": (436, 437),
+    "bcbnsfw": (704, 705),
+    "behance": (72, 73, 74),
+    "behoimi": (9, 10, 11, 12),
+    "bellazon": (75, 76, 77),
+    "bihar-mirchi": (709, 710),
+    "bilibili": (79, 80),
+    "bit": (783,),
+    "black": (110, 111),
+    "blacktowhite": (846, 847, 848, 849, 850, 851, 852, 853),
+    "blogger": (81, 82, 83, 84),
+    "blogspot": (81, 82, 83, 84),
+    "boards": (13, 14, 786, 787),
+    "boosty": (101, 102, 103, 104, 105, 106),
+    "booth": (107, 108, 109),
+    "borvar": (154, 155, 156, 157, 158, 159, 160, 161, 162),
+    "bsky": (85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100),
+    "bskye": (85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100),
+    "bskyx": (85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100),
+    "bsyy": (85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100),
+    "bsyye": (85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100),
+    "bsyyx": (85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100),
+    "bulbagarden": (840, 841),
+    "bunkr": (110, 111),
+    "c32zjeghcp5tj3kb72pltz56piei66drc63vkhn5yixiyk4cmerrjtid": (
+        602, 603, 604, 605, 606, 607, 608
+    ),
+    "cat": (110, 111),
+    "catbox": (112, 113),
+    "cavemanon": (668, 669),
+    "cbsky": (85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100),
+    "cbskye": (
+        85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100
+    ),
+    "cbskyx": (
+        85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100
+    ),
+    "cbsyy": (85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100),
+    "cbsyye": (
+        85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100
+    ),
+    "cbsyyx": (
+        85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100
+    ),
+    "celebforum": (846, 847, 848, 849, 850, 851, 852, 853),
+    "cfake": (114, 115, 116, 117),
+    "chelseacrew": (884, 885),
+    "chevereto": (118, 119, 120, 121),
+    "church": (118, 119, 120, 121),
+    "chzzk": (486, 487),
+    "ci": (110, 111),
+    "ci-en": (122, 123, 124, 125),
+    "civitai": (
+        126, 127, 128, 129, 130, 131, 132, 133, 134, 135, 136, 137,
+        138, 139, 140, 141, 142, 143
+    ),
+    "com": (305, 306, 307, 416, 417, 857, 858),
+    "comedywildlifephoto": (144,),
+    "comic": (488, 489),
+    "comick": (145, 146, 147),
+    "comicpark": (457, 458),
+    "comics": (25,),
+    "comicvine": (148,),
+    "coomer": (408, 409, 410, 411, 412, 413, 414),
+    "cosplay": (523, 524),
+    "cr": (110, 111, 118, 119, 120, 121, 746, 747),
+    "cyberdrop": (149, 150),
+    "cyberfile": (151, 152, 153),
+    "cz": (416, 417),
+    "danbooru": (154, 155, 156, 157, 158, 159, 160, 161, 162),
+    "dandadan": (163, 164),
+    "danke": (165, 166),
+    "derpibooru": (533, 534, 535),
+    "desi": (857, 858),
+    "desktopography": (167, 168, 169),
+    "desuarchive": (871, 872, 873, 874),
+    "deviantart": (
+        170, 171, 172, 173, 174, 175, 176, 177, 178, 179, 180, 181,
+        182, 183, 184, 185, 186, 187, 913
+    ),
+    "discord": (188, 189, 190, 191, 192, 193, 194),
+    "dlsite": (122, 123, 124, 125),
+    "donmai": (154, 155, 156, 157, 158, 159, 160, 161, 162),
+    "download": (154, 155, 156, 157, 158, 159, 160, 161, 162),
+    "downloads": (415,),
+    "drawfriends": (283, 284, 285),
+    "dynasty-scans": (195, 196, 197, 198, 199),
+    "e621": (200, 201, 202, 203, 204, 205, 206, 207),
+    "e6ai": (200, 201, 202, 203, 204, 205, 206),
+    "e926": (200, 201, 202, 203, 204, 205, 206),
+    "endchan": (436, 437),
+    "eporner": (208,),
+    "erome": (209, 210, 211),
+    "everia": (212, 213, 214, 215, 216),
+    "facebook": (217, 218, 219, 220, 221, 222, 223, 224),
+    "fanbox": (225, 226, 227, 228, 229),
+    "fandom": (840, 841),
+    "fanfox": (448, 449),
+    "fansly": (231, 232, 233, 234, 235, 236),
+    "fantia": (237, 238, 239),
+    "fapachi": (243, 244),
+    "fapello": (240, 241, 242),
+    "fappic": (903,),
+    "fashionnova": (884, 885),
+    "fav": (183,),
+    "fi": (110, 111),
+    "fikfap": (245, 246, 247),
+    "filester": (248, 249),
+    "fireden": (871, 872, 873, 874),
+    "fish": (118, 119, 120, 121),
+    "fishing": (118, 119, 120, 121),
+    "fitnakedgirls": (250, 251, 252, 253, 254),
+    "fixupx": (
+        751, 752, 753, 754, 755, 756, 757, 758, 759, 760, 761, 762,
+        763, 764, 765, 766, 767, 768, 769, 770, 771, 772, 773, 774
+    ),
+    "fixvx": (
+        751, 752, 753, 754, 755, 756, 757, 758, 759, 760, 761, 762,
+        763, 764, 765, 766, 767, 768, 769, 770, 771, 772, 773, 774
+    ),
+    "flic": (255,),
+    "flickr": (255, 256, 257, 258, 259, 260, 261, 910),
+    "foolfuuka": (871, 872, 873, 874),
+    "fori": (262, 263),
+    "foriio": (262, 263),
+    "furaffinity": (264, 265, 266, 267, 268, 269, 270, 271, 272),
+    "furbooru": (533, 534, 535),
+    "furry34": (273, 274, 275),
+    "fuskator": (276, 277),
+    "fxbsky": (
+        85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100
+    ),
+    "fxbskye": (
+        85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100
+    ),
+    "fxbskyx": (
+        85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100
+    ),
+    "fxbsyy": (
+        85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100
+    ),
+    "fxbsyye": (
+        85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100
+    ),
+    "fxbsyyx": (
+        85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100
+    ),
+    "fxdeviantart": (
+        170, 171, 172, 173, 174, 176, 177, 178, 179, 183, 184, 186, 187
+    ),
+    "fxfuraffinity": (264, 265, 266, 267, 268, 269, 270, 271, 272),
+    "fxraffinity": (264, 265, 266, 267, 268, 269, 270, 271, 272),
+    "fxtwitter": (
+        751, 752, 753, 754, 755, 756, 757, 758, 759, 760, 761, 762,
+        763, 764, 765, 766, 767, 768, 769, 770, 771, 772, 773, 774
+    ),
+    "g": (919,),
+    "gelbooru": (278, 279, 280, 281, 282),
+    "gelbooru_v01": (283, 284, 285),
+    "gelbooru_v02": (286, 287, 288, 289),
+    "general": (154, 155, 156, 157, 158, 159, 160, 161, 162),
+    "generic": (919,),
+    "gfycat": (633,),
+    "gifdeliverynetwork": (633,),
+    "girlsreleased": (290, 291, 292),
+    "girlswithmuscle": (293, 294),
+    "gofile": (295,),
+    "hateblo": (296, 297, 298, 299),
+    "hatenablog": (296, 297, 298, 299),
+    "hatenadiary": (296, 297, 298, 299),
+    "hentai-cosplay": (302,),
+    "hentai-cosplay-xxx": (302,),
+    "hentai-cosplays": (302,),
+    "hentai-cosplays-xxx": (302,),
+    "hentai-img": (302,),
+    "hentai-img-xxx": (302,),
+    "hentai2read": (300, 301),
+    "hentaicosplays": (302,),
+    "hentaienvy": (347, 348, 349),
+    "hentaiera": (347, 348, 349),
+    "hentaifox": (347, 348, 349),
+    "hentaihere": (303, 304),
+    "hentairox": (347, 348, 349),
+    "hentaizap": (347, 348, 349),
+    "hijiribe": (154, 155, 156, 157, 158, 159, 160, 161, 162),
+    "hiperdex": (305, 306, 307),
+    "hipertoon": (305, 306, 307),
+    "horne": (502, 503, 504, 505, 506, 507, 508, 509),
+    "hotleak": (308, 309, 310, 311),
+    "hypnohub": (286, 287, 288, 289),
+    "ibb": (329, 330),
+    "idolcomplex": (312, 313, 314),
+    "illusioncards": (283, 284, 285),
+    "imagebam": (315, 316),
+    "imagefap": (319, 320, 321, 322),
+    "imagehaha": (891, 892),
+    "imagepond": (323, 324, 325),
+    "imageshack": (326, 327, 328),
+    "imagetwist": (891, 892),
+    "imagevenue": (890,),
+    "img": (887,),
+    "imgadult": (893,),
+    "imgbb": (331,),
+    "imgbox": (332, 333),
+    "imgchest": (317, 318),
+    "imgclick": (902,),
+    "imgdrive": (905,),
+    "imglike": (118, 119, 120, 121),
+    "imgpile": (334, 335),
+    "imgpv": (907,),
+    "imgspice": (894,),
+    "imgtaxi": (905,),
+    "imgth": (336,),
+    "imgur": (337, 338, 339, 340, 341, 342, 343, 344, 345, 346),
+    "imgwallet": (905,),
+    "imhentai": (347, 348, 349),
+    "imx": (887, 888),
+    "info": (305, 306, 307),
+    "inkbunny": (350, 351, 352, 353, 354, 355, 356),
+    "instagram": (
+        357, 358, 359, 360, 361, 362, 363, 364, 365, 366, 367, 368,
+        369, 370, 371, 372
+    ),
+    "is": (110, 111),
+    "issuu": (373, 374),
+    "itaku": (375, 376, 377, 378, 379, 380, 381, 382, 383, 384),
+    "itch": (385,),
+    "iwara": (386, 387, 388, 389, 390, 391, 392, 393, 394, 395, 396, 397),
+    "joyreactor": (398, 399, 400, 401),
+    "jpeg": (118, 119, 120, 121),
+    "jpg": (118, 119, 120, 121),
+    "jschan": (402, 403),
+    "k00": (418,),
+    "kabe-uchiroom": (404,),
+    "kaliscan": (405, 406),
+    "keenspot": (407,),
+    "kemono": (408, 409, 410, 411, 412, 413, 414),
+    "kohlchan": (436, 437),
+    "konachan": (867, 868, 869, 870),
+    "koofr": (418,),
+    "l3n": (425,),
+    "la": (110, 111, 416, 417),
+    "leakgallery": (419, 420, 421, 422),
+    "lensdump": (423, 424, 425),
+    "lesbian": (469, 470, 471, 472, 473, 474, 475, 476),
+    "lexica": (426,),
+    "li": (416, 417),
+    "life": (0, 1),
+    "lightbrd": (510, 511, 512, 513, 514),
+    "lightroom": (427,),
+    "listal": (428, 429),
+    "litter": (113,),
+    "livedoor": (430, 431),
+    "llection": (668, 669),
+    "lofter": (432, 433),
+    "lol": (416, 417),
+    "lolibooru": (867, 868, 869, 870),
+    "loungeunderwear": (884, 885),
+    "luscious": (434, 435),
+    "lynxchan": (436, 437),
+    "m1xdrop": (477,),
+    "madokami": (438,),
+    "main": (85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100),
+    "mangadex": (439, 440, 441, 442, 443, 444, 445),
+    "mangafire": (446, 447),
+    "mangafox": (448, 449),
+    "mangafreak": (450, 451),
+    "mangahere": (452, 453),
+    "mangakakalot": (454, 455, 456),
+    "manganato": (454, 455, 456),
+    "manganelo": (454, 455, 456),
+    "mangapark": (457, 458),
+    "mangaread": (459, 460),
+    "mangareader": (461, 462),
+    "mangataro": (463, 464),
+    "mangatown": (465, 466),
+    "mangoxo": (467, 468),
+    "mariowiki": (840, 841),
+    "mastodon": (877, 878, 879, 880, 881, 882, 883, 915),
+    "me": (416, 417),
+    "media": (110, 111),
+    "mediawiki": (840, 841),
+    "mgewiki": (840, 841),
+    "michaels": (884, 885),
+    "misskey": (469, 470, 471, 472, 473, 474, 475, 476),
+    "mixdrop": (477,),
+    "mobile": (
+        751, 752, 753, 754, 755, 756, 757, 758, 759, 760, 761, 762,
+        763, 764, 765, 766, 767, 768, 769, 770, 771, 772, 773, 774
+    ),
+    "modcloth": (884, 885),
+    "moe": (416, 417),
+    "moebooru": (867, 868, 869, 870),
+    "motherless": (478, 479, 480),
+    "mpark": (457, 458),
+    "myhentaigallery": (481, 482),
+    "myportfolio": (483,),
+    "natomanga": (454, 455, 456),
+    "naver": (484, 485),
+    "nekohouse": (490, 491),
+    "nelomanga": (454, 455, 456),
+    "net": (305, 306, 307),
+    "newgrounds": (492, 493, 494, 495, 496, 497, 498, 499, 500, 501),
+    "ngfiles": (492,),
+    "nicoseiga": (659,),
+    "nicovideo": (658, 659),
+    "nijie": (502, 503, 504, 505, 506, 507, 508, 509),
+    "nitter": (510, 511, 512, 513, 514),
+    "noop": (917,),
+    "nop": (917,),
+    "noz": (668, 669),
+    "nozomi": (515, 516, 517, 518),
+    "nsfwalbum": (519,),
+    "nudostar": (846, 847, 848, 849, 850, 851, 852, 853),
+    "oauth": (916,),
+    "ohpolly": (884, 885),
+    "omgmiamiswimwear": (884, 885),
+    "one": (857, 858),
+    "onepiecechapters": (709, 710),
+    "org": (110, 111),
+    "parkmanga": (457, 458),
+    "patreon": (525, 526, 527, 528),
+    "pawoo": (877, 878, 879, 880, 881, 882, 883),
+    "pet": (118, 119, 120, 121),
+    "pexels": (529, 530, 531, 532),
+    "ph": (110, 111),
+    "philomena": (533, 534, 535),
+    "phixiv": (
+        562, 563, 564, 565, 567, 568, 569, 570, 571, 572, 574, 576,
+        577, 578, 579
+    ),
+    "pholder": (536, 537, 538),
+    "picarto": (540,),
+    "picazor": (541,),
+    "picstate": (904,),
+    "pictoa": (542, 543),
+    "piczel": (544, 545, 546),
+    "pidgi": (840, 841),
+    "pillowfort": (547, 548),
+    "pin": (558,),
+    "pinterest": (549, 550, 551, 552, 553, 554, 555, 556, 557),
+    "pinupgirlclothing": (884, 885),
+    "pixeldrain": (559, 560, 561),
+    "pixhost": (895, 896),
+    "pixiv": (
+        230, 562, 563, 564, 565, 566, 567, 568, 569, 570, 571, 572,
+        574, 576, 577, 578, 579
+    ),
+    "pixivision": (573,),
+    "pixxxels": (897, 898),
+    "pk": (110, 111, 746, 747),
+    "plurk": (584, 585),
+    "poipiku": (586, 587),
+    "ponybooru": (533, 534, 535),
+    "poringa": (588, 589, 590),
+    "porn": (522,),
+    "porn-image": (302,),
+    "porn-image-xxx": (302,),
+    "porn-images": (302,),
+    "porn-images-xxx": (302,),
+    "porncache": (857, 858),
+    "pornhub": (591, 592, 593, 594, 595),
+    "pornpics": (596, 597, 598, 599, 600),
+    "pornstars": (601,),
+    "postimages": (897, 898),
+    "postimg": (897, 898),
+    "postmill": (602, 603, 604, 605, 606, 607, 608),
+    "preview": (626,),
+    "ps": (110, 111),
+    "putme": (118, 119, 120, 121),
+    "putmega": (118, 119, 120, 121),
+    "pximg": (567,),
+    "r": (909,),
+    "raddle": (602, 603, 604, 605, 606, 607, 608),
+    "raidlondon": (884, 885),
+    "rawkuma": (609, 610),
+    "readcomiconline": (615, 616, 617),
+    "readpark": (457, 458),
+    "realbooru": (618, 619, 620, 621),
+    "rebeccablacktech": (871, 872, 873, 874),
+    "recursive": (909,),
+    "red": (110, 111),
+    "redd": (625, 626),
+    "reddit": (622, 623, 624, 625, 627, 914),
+    "reddituploads": (626,),
+    "redgifs": (628, 629, 630, 631, 632, 633),
+    "ru": (110, 111),
+    "rule34": (286, 287, 288, 289, 523, 524, 634, 635, 639, 640, 641),
+    "rule34hentai": (668, 669),
+    "rule34vault": (636, 637, 638),
+    "rule63": (523, 524),
+    "s3nd": (642, 643, 644),
+    "safebooru": (
+        154, 155, 156, 157, 158, 159, 160, 161, 162, 286, 287, 288, 289
+    ),
+    "sakugabooru": (867, 868, 869, 870),
+    "sankaku": (645, 646, 647, 648),
+    "sankakucomplex": (312, 313, 314, 645, 646, 647, 648, 649, 650),
+    "scatbooru": (651, 652, 653),
+    "schan": (3, 4),
+    "scrolller": (654, 655, 656, 657),
+    "secure": (255, 256, 257, 258, 259, 260, 261),
+    "senmanga": (660,),
+    "sex": (661, 662, 663, 664, 665, 666, 667),
+    "shimmie2": (668, 669),
+    "shopify": (884, 885),
+    "si": (110, 111),
+    "silverpic": (906,),
+    "simpcity": (846, 847, 848, 849, 850, 851, 852, 853),
+    "simply-hentai": (670, 671, 672, 673, 674),
+    "site": (110, 111, 416, 417),
+    "sizebooru": (675, 676, 677, 678, 679),
+    "sk": (110, 111),
+    "skeb": (680, 681, 682, 683, 684, 685, 686),
+    "sketch": (575,),
+    "slickpic": (687, 688),
+    "slideshare": (689,),
+    "smuglo": (786, 787),
+    "smugloli": (786, 787),
+    "smugmug": (690, 691, 692, 911),
+    "snootbooru": (704, 705),
+    "socialmediagirls": (846, 847, 848, 849, 850, 851, 852, 853),
+    "sonohara": (154, 155, 156, 157, 158, 159, 160, 161, 162),
+    "soundgasm": (693, 694),
+    "soybooru": (668, 669),
+    "speakerdeck": (695,),
+    "sta": (175,),
+    "static": (255,),
+    "staticflickr": (255,),
+    "steamgriddb": (696, 697, 698, 699, 700),
+    "sturdychan": (3, 4),
+    "su": (110, 111, 118, 119, 120, 121, 746, 747),
+    "subscribestar": (701, 702),
+    "sushi": (469, 470, 471, 472, 473, 474, 475, 476),
+    "sxypix": (703,),
+    "szurubooru": (704, 705),
+    "t": (783,),
+    "tapas": (706, 707, 708),
+    "tbib": (286, 287, 288, 289),
+    "tcbscans": (709, 710),
+    "telegra": (711,),
+    "tenor": (712, 713, 714),
+    "the-collection": (283, 284, 285),
+    "thebarchive": (871, 872, 873, 874),
+    "thefap": (715, 716),
+    "thehentaiworld": (717, 718),
+    "tiekoetter": (510, 511, 512, 513, 514),
+    "tiktok": (719, 720, 721, 722, 723, 724, 725, 726, 727, 728),
+    "tiktokv": (719, 721, 722, 723, 724, 725, 726, 727, 728),
+    "titsintops": (846, 847, 848, 849, 850, 851, 852, 853),
+    "tmohentai": (729,),
+    "to": (110, 111, 746, 747),
+    "top": (305, 306, 307),
+    "touch": (
+        562, 563, 564, 565, 567, 568, 569, 570, 571, 572, 574, 576,
+        577, 578, 579
+    ),
+    "toyhou": (730, 731),
+    "tumblr": (732, 733, 734, 735, 736, 737, 738, 739, 912),
+    "tumblrgallery": (740, 741, 742),
+    "tungsten": (743, 744, 745),
+    "turbo": (746, 747),
+    "turboimagehost": (899, 900),
+    "turbovid": (746, 747),
+    "twibooru": (748, 749, 750),
+    "twimg": (775,),
+    "twitter": (
+        751, 752, 753, 754, 755, 756, 757, 758, 759, 760, 761, 762,
+        763, 764, 765, 766, 767, 768, 769, 770, 771, 772, 773, 774
+    ),
+    "unique-vintage": (884, 885),
+    "unsplash": (777, 778, 779, 780, 781),
+    "uploadir": (782,),
+    "urlgalleries": (776,),
+    "urlshortener": (783,),
+    "vanilla-rock": (784, 785),
+    "vichan": (786, 787),
+    "vidya": (668, 669),
+    "vidyart2": (283, 284, 285),
+    "vipergirls": (788, 789),
+    "vipr": (901,),
+    "visuabusters": (704, 705),
+    "vk": (790, 791, 792, 793),
+    "vogue": (539,),
+    "vsco": (794, 795, 796, 797, 798, 799, 800, 801),
+    "vxbsky": (
+        85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100
+    ),
+    "vxbskye": (
+        85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100
+    ),
+    "vxbskyx": (
+        85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100
+    ),
+    "vxbsyy": (
+        85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100
+    ),
+    "vxbsyye": (
+        85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100
+    ),
+    "vxbsyyx": (
+        85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100
+    ),
+    "vxtwitter": (
+        751, 752, 753, 754, 755, 756, 757, 758, 759, 760, 761, 762,
+        763, 764, 765, 766, 767, 768, 769, 770, 771, 772, 773, 774
+    ),
+    "wallhaven": (802, 803, 804, 805, 806, 807),
+    "wallpapercave": (808,),
+    "warosu": (809,),
+    "webmshare": (816,),
+    "webtoons": (817, 818, 819),
+    "weebcentral": (820, 821),
+    "weebdex": (822, 823),
+    "weibo": (824, 825, 826, 827, 828, 829, 830, 831),
+    "whvn": (807,),
+    "whyp": (832, 833, 834),
+    "wiki": (840, 841),
+    "wikiart": (835, 836, 837, 838),
+    "wikibooks": (840, 841),
+    "wikidata": (840, 841),
+    "wikifeet": (839,),
+    "wikifeetx": (839,),
+    "wikimedia": (840, 841),
+    "wikinews": (840, 841),
+    "wikipedia": (840, 841),
+    "wikiquote": (840, 841),
+    "wikisource": (840, 841),
+    "wikiversity": (840, 841),
+    "wikivoyage": (840, 841),
+    "wiktionary": (840, 841),
+    "windsorstore": (884, 885),
+    "ws": (110, 111),
+    "www": (305, 306, 307, 416, 417),
+    "x": (
+        751, 752, 753, 754, 755, 756, 757, 758, 759, 760, 761, 762,
+        763, 764, 765, 766, 767, 768, 769, 770, 771, 772, 773, 774
+    ),
+    "xasiat": (842, 843, 844, 845),
+    "xbooru": (286, 287, 288, 289),
+    "xcancel": (510, 511, 512, 513, 514),
+    "xenforo": (846, 847, 848, 849, 850, 851, 852, 853),
+    "xfolio": (854, 855, 856),
+    "xfuraffinity": (264, 265, 266, 267, 268, 269, 270, 271, 272),
+    "xhamster": (857, 858),
+    "xvideos": (859, 860),
+    "yande": (867, 868, 869, 870),
+    "yiffverse": (861, 862, 863),
+    "yourlesbians": (864,),
+    "ytdl": (918,),
+    "zerochan": (865, 866),
+}
+
+OTHER = (
+    78,
+    520,
+    521,
+    580,
+    581,
+    582,
+    583,
+    611,
+    612,
+    613,
+    614,
+    810,
+    811,
+    812,
+    813,
+    814,
+    815,
+    875,
+    876,
+    886,
+    908,
+)
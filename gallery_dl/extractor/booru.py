@@ -10,6 +10,7 @@
 
 from .common import BaseExtractor, Message
 from .. import text
+import itertools
 import operator
 
 
@@ -34,31 +35,47 @@ class BooruExtractor(BaseExtractor):
             else:
                 self._file_url = operator.itemgetter(url_key)
 
-        for post in self.posts():
-            try:
-                url = self._file_url(post)
-                if url[0] == "/":
-                    url = self.root + url
-            except Exception as exc:
-                self.log.debug("%s: %s", exc.__class__.__name__, exc)
-                self.log.warning("Unable to fetch download URL for post %s "
-                                 "(md5: %s)", post.get("id"), post.get("md5"))
-                continue
-
-            if fetch_html:
-                html = self._html(post)
-                if tags:
-                    self._tags(post, html)
-                if notes:
-                    self._notes(post, html)
-
-            if "extension" not in post:
-                text.nameext_from_url(url, post)
-            post.update(data)
-            self._prepare(post)
-
-            yield Message.Directory, "", post
-            yield Message.Url, url, post
+        if (prefetch := self.archive_prefetch) is None:
+            batch_size = 1
+        else:
+            # check each page of posts against the download archive
+            # before fetching their HTML pages
+            batch_size = self.per_page
+
+        posts = iter(self.posts())
+        while batch := tuple(itertools.islice(posts, batch_size)):
+            files = []
+            for post in batch:
+                try:
+                    url = self._file_url(post)
+                    if url[0] == "/":
+                        url = self.root + url
+                except Exception as exc:
+                    self.log.debug("%s: %s", exc.__class__.__name__, exc)
+                    self.log.warning(
+                        "Unable to fetch download URL for post %s "
+                        "(md5: %s)", post.get("id"), post.get("md5"))
+                    continue
+
+                if "extension" not in post:
+                    text.nameext_from_url(url, post)
+                post.update(data)
+                self._prepare(post)
+                files.append((url, post))
+
+            if prefetch is not None and files:
+                prefetch([post for _, post in files])
+
+            for url, post in files:
+                if fetch_html:
+                    html = self._html(post)
+                    if tags:
+                        self._tags(post, html)
+                    if notes:
+                        self._notes(post, html)
+
+                yield Message.Directory, "", post
+                yield Message.Url, url, post
 
     def skip_files(self, num):
         pages = num // self.per_page
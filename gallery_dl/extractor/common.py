@@ -23,7 +23,8 @@ import threading
 from xml.etree import ElementTree
 from requests.adapters import HTTPAdapter
 from .message import Message
-from .. import config, output, text, util, dt, cache, exception
+from .. import config, output, text, util, dt, cache, httpcache, ratelimit
+from .. import exception
 urllib3 = requests.packages.urllib3
 
 
@@ -53,10 +54,12 @@ class Extractor():
     request_interval = 0.0
     request_interval_min = 0.0
     request_interval_429 = 60.0
-    request_timestamp = 0.0
+    request_ratelimit_headers = True
+    prefetch = 0
+    prefetch_copy = True
     exc = exception
     finalize = skip_files = skip_posts = skip_children = skip_date = \
-        import_blacklist = None
+        import_blacklist = archive_prefetch = None
 
     def __init__(self, match):
         self.log = logging.getLogger(self.category)
@@ -91,6 +94,9 @@ class Extractor():
 
     def __iter__(self):
         self.initialize()
+        if prefetch := self.config("prefetch", self.prefetch):
+            return self._items_prefetch(
+                16 if prefetch is True else prefetch)
         return self.items()
 
     def initialize(self):
@@ -111,6 +117,70 @@ class Extractor():
         return
         yield
 
+    def _items_prefetch(self, size):
+        """Run 'items()' in a separate thread
+
+        Yield up to 'size' messages ahead of their consumer
+        """
+        messages = queue.Queue(size)
+        stop = threading.Event()
+        thread = threading.Thread(
+            target=self._items_prefetch_thread,
+            args=(messages, stop, config.inherit()),
+            daemon=True,
+        )
+
+        thread.start()
+        try:
+            while True:
+                msg = messages.get()
+                if msg is None:
+                    thread.join()
+                    # raise an abort the producer stopped for
+                    flags = util.FLAGS
+                    for flag in ("POST", "FILE", "CHILD"):
+                        if getattr(flags, flag):
+                            flags.process(flag)
+                    return
+                if isinstance(msg, BaseException):
+                    thread.join()
+                    raise msg
+                yield msg
+        finally:
+            # stop producer thread when the consumer goes away early
+            stop.set()
+
+    def _items_prefetch_thread(self, messages, stop, init=util.noop):
+        init()
+        flags = util.FLAGS.current()
+
+        def put(item):
+            while True:
+                try:
+                    return messages.put(item, True, 1.0)
+                except queue.Full:
+                    if stop.is_set():
+                        raise
+
+        try:
+            copy = self.prefetch_copy
+            for msg, url, kwdict in self.items():
+                if stop.is_set():
+                    return
+                if flags.POST or flags.FILE or flags.CHILD:
+                    # do not fetch further pages after an abort
+                    break
+                # extractors are allowed to modify 'kwdict' after yielding
+                put((msg, url, kwdict.copy() if copy else kwdict))
+            put(None)
+        except queue.Full:
+            pass
+        except BaseException as exc:
+            try:
+                put(exc)
+            except queue.Full:
+                pass
+
     def config(self, key, default=None):
         return config.interpolate(self._cfgpath, key, default)
 
@@ -169,14 +239,43 @@ class Extractor():
                 else:
                     kwargs["headers"] = {"Content-Type": "application/json"}
 
-        response = challenge = None
+        response = challenge = entry = None
         tries = 1
 
-        if self._interval_request is not None and interval:
-            seconds = (self._interval_request() -
-                       (time.time() - Extractor.request_timestamp))
-            if seconds > 0.0:
+        if (hcache := self._http_cache) is not None and method == "GET" and \
+                not kwargs.get("data") and not kwargs.get("stream") and \
+                not kwargs.get("auth") and not kwargs.get("cookies") and \
+                session.auth is None:
+            hheaders = session.headers.copy()
+            if headers := kwargs.get("headers"):
+                hheaders.update(headers)
+            hkey = hcache.key(
+                url, kwargs.get("params"), hheaders, session.cookies)
+
+            try:
+                if (entry := hcache.lookup(hkey, hheaders)) is not None:
+                    if entry.fresh(self._http_cache_ttl):
+                        response = hcache.load(hkey, entry)
+                        if encoding:
+                            response.encoding = encoding
+                        return response
+                    kwargs["headers"] = entry.conditional(headers)
+            except hcache.Error as exc:
+                self.log.warning("Unable to use HTTP cache (%s: %s)",
+                                 exc.__class__.__name__, exc)
+                hcache = entry = None
+        else:
+            hcache = None
+
+        if interval:
+            limit = self._ratelimit
+            burst = self._ratelimit_burst
+            delay = 0.0 if self._interval_request is None else \
+                self._interval_request()
+            if seconds := limit.acquire(delay, burst):
                 self.sleep(seconds, "request")
+        else:
+            delay = None
 
         while True:
             try:
@@ -202,6 +301,26 @@ class Extractor():
                 code = response.status_code
                 if self._write_pages:
                     self._dump_response(response)
+                if self._ratelimit_headers and \
+                        (seconds := self._ratelimit.update(response)):
+                    self.wait(seconds=seconds, reason="rate limit")
+                if self._ratelimit_adaptive:
+                    if code == 429 or code == 503:
+                        self._ratelimit.failure()
+                    elif code < 400:
+                        self._ratelimit.success()
+                if hcache is not None:
+                    try:
+                        if code == 304 and entry is not None:
+                            code = 200
+                            hcache.revalidate(hkey, entry, response)
+                        elif code == 200:
+                            hcache.store(hkey, response, hheaders,
+                                         self._http_cache_ttl)
+                    except hcache.Error as exc:
+                        self.log.warning(
+                            "Unable to update HTTP cache (%s: %s)",
+                            exc.__class__.__name__, exc)
                 if (
                     code < 400 or
                     code in expected or
@@ -223,6 +342,9 @@ class Extractor():
                 challenge = util.detect_challenge(response)
                 if challenge is not None:
                     self.log.warning(challenge)
+                    if self._ratelimit_adaptive and code != 429 and \
+                            code != 503:
+                        self._ratelimit.failure()
 
                 if code == 429 and self._handle_429(response):
                     continue
@@ -232,8 +354,8 @@ class Extractor():
                     break
 
             finally:
-                if interval:
-                    Extractor.request_timestamp = time.time()
+                if delay is not None:
+                    limit.release(delay, burst)
 
             self.log.debug("%s (%s/%s)", msg, tries, retries+1)
             if tries > retries:
@@ -248,6 +370,11 @@ class Extractor():
                 s = self._interval_429(tries)
                 if seconds < s:
                     seconds = s
+                if self._ratelimit_headers:
+                    s = ratelimit.retry_after(response)
+                    if seconds < s:
+                        seconds = s
+                self._ratelimit.block(seconds)
                 self.wait(seconds=seconds, reason="429 Too Many Requests")
             else:
                 self.sleep(seconds, "retry")
@@ -477,6 +604,15 @@ class Extractor():
         self._verify = self.config("verify", True)
         self._proxies = util.build_proxy_map(self.config("proxy"), self.log)
 
+        if http_cache := self.config("http-cache"):
+            max_size = self.config("http-cache-size", "256M")
+            if isinstance(max_size, str):
+                max_size = text.parse_bytes(max_size)
+            self._http_cache = httpcache.connect(http_cache, max_size)
+            self._http_cache_ttl = self.config("http-cache-ttl", 0)
+        else:
+            self._http_cache = None
+
         if self._retries < 0:
             self._retries = float("inf")
         if not self._retry_codes:
@@ -485,6 +621,16 @@ class Extractor():
         self._interval_request = util.build_duration_func(
             self.config("sleep-request", self.request_interval),
             self.request_interval_min)
+        if self.config("sleep-request-adaptive", False):
+            self._ratelimit = ratelimit.adaptive(self.category)
+            self._ratelimit_adaptive = True
+        else:
+            self._ratelimit = ratelimit.get(self.category)
+            self._ratelimit_adaptive = False
+        self._ratelimit_burst = self.config("sleep-request-burst", 1)
+        # extractors handling these headers themselves would wait twice
+        self._ratelimit_headers = self.request_ratelimit_headers and \
+            self.config("ratelimit-headers", False)
 
         _interval_retry = self.config("sleep-retries")
         if _interval_retry is None:
@@ -648,8 +794,21 @@ class Extractor():
         else:
             ssl_ctx = None
 
-        adapter = _build_requests_adapter(
-            ssl_options, ssl_ciphers, ssl_ctx, source_address)
+        pool = (self.config("pool-hosts", 10),
+                self.config("pool-size", 10),
+                self.config("pool-idle-timeout"))
+
+        adapter = None
+        if http2 := self.config("http2"):
+            try:
+                adapter = _build_http2_adapter(
+                    http2 == "only", ssl_options, ssl_ciphers, ssl_ctx,
+                    source_address, pool)
+            except ImportError as exc:
+                self.log.error("%s: %s", exc.__class__.__name__, exc)
+        if adapter is None:
+            adapter = _build_requests_adapter(
+                ssl_options, ssl_ciphers, ssl_ctx, source_address, pool)
         session.mount("https://", adapter)
         session.mount("http://", adapter)
 
@@ -1049,36 +1208,9 @@ class Dispatch():
 
 class AsynchronousMixin():
     """Run info extraction in a separate thread"""
-
-    def __iter__(self):
-        self.initialize()
-
-        messages = queue.Queue(5)
-        thread = threading.Thread(
-            target=self.async_items,
-            args=(messages,),
-            daemon=True,
-        )
-
-        thread.start()
-        while True:
-            msg = messages.get()
-            if msg is None:
-                thread.join()
-                return
-            if isinstance(msg, Exception):
-                thread.join()
-                raise msg
-            yield msg
-            messages.task_done()
-
-    def async_items(self, messages):
-        try:
-            for msg in self.items():
-                messages.put(msg)
-        except Exception as exc:
-            messages.put(exc)
-        messages.put(None)
+    prefetch = 5
+    # these never modify a 'kwdict' after yielding it
+    prefetch_copy = False
 
 
 class BaseExtractor(Extractor):
@@ -1127,26 +1259,68 @@ class BaseExtractor(Extractor):
 
 class RequestsAdapter(HTTPAdapter):
 
-    def __init__(self, ssl_context=None, source_address=None):
+    def __init__(self, ssl_context=None, source_address=None,
+                 pool_hosts=10, pool_size=10, idle_timeout=None):
         self.ssl_context = ssl_context
         self.source_address = source_address
-        HTTPAdapter.__init__(self)
+        self.idle_timeout = idle_timeout
+        HTTPAdapter.__init__(self, pool_hosts, pool_size)
 
     def init_poolmanager(self, *args, **kwargs):
         kwargs["ssl_context"] = self.ssl_context
         kwargs["source_address"] = self.source_address
-        return HTTPAdapter.init_poolmanager(self, *args, **kwargs)
+        HTTPAdapter.init_poolmanager(self, *args, **kwargs)
+        if self.idle_timeout:
+            _idle_pool_classes(self.poolmanager, self.idle_timeout)
 
     def proxy_manager_for(self, *args, **kwargs):
         kwargs["ssl_context"] = self.ssl_context
         kwargs["source_address"] = self.source_address
-        return HTTPAdapter.proxy_manager_for(self, *args, **kwargs)
-
-
-def _build_requests_adapter(
-        ssl_options, ssl_ciphers, ssl_ctx, source_address):
-
-    key = (ssl_options, ssl_ciphers, ssl_ctx, source_address)
+        manager = HTTPAdapter.proxy_manager_for(self, *args, **kwargs)
+        if self.idle_timeout:
+            _idle_pool_classes(manager, self.idle_timeout)
+        return manager
+
+
+def _idle_pool_classes(manager, idle_timeout):
+    """Let 'manager' create pools that expire idle connections"""
+    # 'pool_classes_by_scheme' is shared with all other managers
+    classes = manager.pool_classes_by_scheme = \
+        manager.pool_classes_by_scheme.copy()
+    for scheme, cls in classes.items():
+        if cls in (urllib3.HTTPConnectionPool, urllib3.HTTPSConnectionPool):
+            classes[scheme] = type(
+                "Idle" + cls.__name__, (IdleConnectionPoolMixin, cls),
+                {"idle_timeout": idle_timeout})
+
+
+class IdleConnectionPoolMixin():
+    """Close pooled connections unused for more than 'idle_timeout' seconds
+
+    Only connections currently in a pool's queue get closed this way,
+    so connections in use by other threads are never affected.
+    """
+    idle_timeout = None
+
+    def _get_conn(self, timeout=None):
+        conn = super()._get_conn(timeout)
+        idle_since = getattr(conn, "idle_since", None)
+        if idle_since is not None and \
+                time.monotonic() - idle_since > self.idle_timeout:
+            # drop connections the server likely closed by now
+            conn.close()
+        return conn
+
+    def _put_conn(self, conn):
+        if conn is not None:
+            conn.idle_since = time.monotonic()
+        return super()._put_conn(conn)
+
+
+def _build_requests_adapter(ssl_options, ssl_ciphers, ssl_ctx,
+                            source_address, pool=(10, 10, None)):
+
+    key = (ssl_options, ssl_ciphers, ssl_ctx, source_address, pool)
     try:
         return CACHE_ADAPTERS[key]
     except KeyError:
@@ -1172,7 +1346,23 @@ def _build_requests_adapter(
         ssl_context = None
 
     adapter = CACHE_ADAPTERS[key] = RequestsAdapter(
-        ssl_context, source_address)
+        ssl_context, source_address, *pool)
+    return adapter
+
+
+def _build_http2_adapter(only, ssl_options, ssl_ciphers, ssl_ctx,
+                         source_address, pool):
+
+    key = ("http2", only, ssl_options, ssl_ciphers, ssl_ctx,
+           source_address, pool)
+    try:
+        return CACHE_ADAPTERS[key]
+    except KeyError:
+        pass
+
+    from ..http2 import Http2Adapter
+    adapter = CACHE_ADAPTERS[key] = Http2Adapter(
+        only, ssl_options, ssl_ciphers, ssl_ctx, source_address, *pool)
     return adapter
 
 
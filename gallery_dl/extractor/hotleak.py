@@ -20,6 +20,7 @@ class HotleakExtractor(Extractor):
     filename_fmt = "{creator}_{id}.{extension}"
     archive_fmt = "{type}_{creator}_{id}"
     root = "https://hotleak.vip"
+    request_ratelimit_headers = False
 
     def items(self):
         for post in self.posts():
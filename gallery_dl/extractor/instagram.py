@@ -108,7 +108,7 @@ class InstagramExtractor(Extractor):
                 files.reverse()
 
             for file in files:
-                file = {**post, **file}
+                file = util.OverlayDict(post, file)
 
                 if url := file.get("audio_url"):
                     if audio:
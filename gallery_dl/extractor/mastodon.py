@@ -18,6 +18,7 @@ class MastodonExtractor(BaseExtractor):
     directory_fmt = ("mastodon", "{instance}", "{account[username]}")
     filename_fmt = "{category}_{id}_{media[id]}.{extension}"
     archive_fmt = "{media[id]}"
+    request_ratelimit_headers = False
 
     def __init__(self, match):
         BaseExtractor.__init__(self, match)
@@ -22,6 +22,7 @@ class RedditExtractor(Extractor):
     archive_fmt = "{filename}"
     cookies_domain = ".reddit.com"
     request_interval = 0.6
+    request_ratelimit_headers = False
 
     def items(self):
         self.api = RedditAPI(self)
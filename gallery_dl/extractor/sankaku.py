@@ -24,6 +24,7 @@ class SankakuExtractor(BooruExtractor):
     category = "sankaku"
     root = "https://sankaku.app"
     filename_fmt = "{category}_{id}_{md5}.{extension}"
+    request_ratelimit_headers = False
     _warning = True
 
     TAG_TYPES = {
@@ -35,9 +35,9 @@ def parse(format_string, default=NONE, fmt=format):
             import logging
             logging.getLogger("formatter").error(
                 "Invalid formatter type '%s'", kind[1:])
-            cls = StringFormatter
+            cls = _FORMATTERS["S"]
     else:
-        cls = StringFormatter
+        cls = _FORMATTERS["S"]
 
     try:
         formatter = _CACHE[key] = cls(format_string, default, fmt)
@@ -51,6 +51,35 @@ def parse(format_string, default=NONE, fmt=format):
     return formatter
 
 
+def parse_fields(format_string):
+    """Return key and accessor functions of each field in 'format_string'
+
+    Return None if its result might depend on anything else.
+    """
+    if format_string and format_string[0] == "\f":
+        kind, _, format_string = format_string.partition(" ")
+        if kind != "\fS" and kind != "\fC":
+            return None
+
+    fields = {}
+    for _, field_name, format_spec, _ in \
+            _string.formatter_parser(format_string):
+        if not field_name:
+            continue
+        if "{" in format_spec:
+            return None
+        for field_name in field_name.split("|"):
+            if field_name in fields:
+                continue
+            key, funcs = parse_field_name(field_name)
+            if key in _GLOBALS:
+                if key != "_lit" and key != "_nul":
+                    return None
+            else:
+                fields[field_name] = (key, funcs)
+    return list(fields.values())
+
+
 class StringFormatter():
     """Custom, extended version of string.Formatter
 
@@ -208,6 +237,113 @@ class StringFormatter():
             return lambda obj: fmt(conversion(obj))
 
 
+class CompiledStringFormatter(StringFormatter):
+    """StringFormatter generating a single Python function
+
+    Field access, conversions, and standard format specifiers get inlined
+    into one f-string expression instead of calling a chain of closures
+    and joining their results.
+    """
+
+    def __init__(self, format_string, default=NONE, fmt=format):
+        self.default = default
+        self.format = fmt
+        self.format_map = self._compile(format_string)
+
+    def _compile(self, format_string):
+        fmt = self.format
+        env = {"default": self.default, "fmt": fmt}
+        body = []
+        parts = []
+
+        for literal_text, field_name, format_spec, conv in \
+                _string.formatter_parser(format_string):
+            if literal_text:
+                parts.append(literal_text)
+            if not field_name:
+                continue
+
+            num = len(body)
+            var = f"v{num}"
+            spec = None
+
+            if "|" in field_name:
+                env[f"f{num}"] = self._field_access(
+                    field_name, format_spec, conv)
+                body.append(f"{var} = f{num}(kwdict)")
+                parts.append((var, spec, False))
+                continue
+
+            key, funcs = parse_field_name(field_name)
+            if key in _GLOBALS:
+                env[f"g{num}"] = _GLOBALS[key]
+                expr = f"g{num}()"
+            elif funcs:
+                expr = f"kwdict[{key!r}]"
+            else:
+                expr = None
+                body.append(f"{var} = kwdict[{key!r}] "
+                            f"if {key!r} in kwdict else default")
+
+            if expr is not None:
+                for idx, func in enumerate(funcs):
+                    env[f"a{num}_{idx}"] = func
+                    expr = f"a{num}_{idx}({expr})"
+                body.append(f"try:\n"
+                            f"        {var} = {expr}\n"
+                            f"    except Exception:\n"
+                            f"        {var} = default")
+
+            if conv:
+                env[f"c{num}"] = _CONVERSIONS[conv]
+                var = f"c{num}({var})"
+
+            if not format_spec:
+                # 'fmt' does not get applied to converted values
+                parts.append((var, spec, not conv))
+                continue
+
+            if format_spec[0] not in _FORMAT_SPECIFIERS and \
+                    _INLINE_SPEC(format_spec):
+                spec = format_spec
+            else:
+                env[f"s{num}"] = _build_format_func(format_spec, fmt)
+                var = f"s{num}({var})"
+            parts.append((var, spec, False))
+
+        if not body:
+            return lambda _: format_string
+
+        if len(parts) == 1:
+            var, spec, apply_fmt = parts[0]
+            if spec is not None:
+                result = f"f'{{{var}:{spec}}}'"
+            elif apply_fmt:
+                result = f"fmt({var})"
+            else:
+                result = var
+        else:
+            result = []
+            for part in parts:
+                if isinstance(part, str):
+                    result.append("f" + repr(
+                        part.replace("{", "{{").replace("}", "}}")))
+                    continue
+                var, spec, apply_fmt = part
+                if apply_fmt and fmt is not format and \
+                        fmt is not util.identity:
+                    var = f"fmt({var})"
+                if spec is not None:
+                    var = f"{var}:{spec}"
+                result.append(f"f'{{{var}}}'")
+            result = " ".join(result)
+        body.append(f"return {result}")
+
+        source = "def format_map(kwdict):\n    " + "\n    ".join(body)
+        exec(compile(source, "<format string>", "exec"), env)
+        return env["format_map"]
+
+
 class ExpressionFormatter():
     """Generate text by evaluating a Python expression"""
 
@@ -585,11 +721,13 @@ _literal = Literal()
 _CACHE = {}
 _ENCODING = sys.getfilesystemencoding()
 _SEPARATOR = "/"
+_INLINE_SPEC = text.re_compile(r"[^{}'\"\\\n]*").fullmatch
 _FORMATTERS = {
     "E" : ExpressionFormatter,
     "F" : FStringFormatter,
     "J" : JinjaFormatter,
     "M" : ModuleFormatter,
+    "C" : CompiledStringFormatter,
     "S" : StringFormatter,
     "T" : TemplateFormatter,
     "TF": TemplateFStringFormatter,
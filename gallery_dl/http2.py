@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2026 Mike Fährmann
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 2 as
+# published by the Free Software Foundation.
+
+"""HTTP/2 transport adapter for requests sessions"""
+
+import ssl
+import threading
+import http.client
+import httpx
+import requests
+from requests import exceptions as rexc
+from requests.adapters import BaseAdapter
+from requests.cookies import extract_cookies_to_jar
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers, select_proxy
+
+# connection-specific headers not allowed in HTTP/2 requests
+HOP_HEADERS = {
+    "connection",
+    "keep-alive",
+    "proxy-connection",
+    "transfer-encoding",
+    "upgrade",
+}
+
+
+class Http2Adapter(BaseAdapter):
+    """Send requests with httpx, using HTTP/2 when a server supports it
+
+    Redirects, cookies, and authentication
+    are still handled by the requests Session this adapter is mounted on.
+    Concurrent requests to the same host
+    get multiplexed over a single connection.
+    """
+
+    def __init__(self, only=False, ssl_options=0, ssl_ciphers=None,
+                 ssl_ctx=None, source_address=None,
+                 pool_hosts=10, pool_size=10, idle_timeout=None):
+        BaseAdapter.__init__(self)
+        self.http1 = not only
+        self.ssl_options = ssl_options
+        self.ssl_ciphers = ssl_ciphers
+        self.ssl_ctx = ssl_ctx
+        self.local_address = source_address[0] if source_address else None
+        self.limits = httpx.Limits(
+            max_keepalive_connections=pool_hosts * pool_size,
+            keepalive_expiry=idle_timeout or 5.0,
+        )
+        self.transports = {}
+        self.lock = threading.Lock()
+        self.transport(None, True, None)
+
+    def send(self, request, stream=False, timeout=None, verify=True,
+             cert=None, proxies=None):
+        transport = self.transport(
+            select_proxy(request.url, proxies) if proxies else None,
+            verify, cert)
+
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+        else:
+            connect = read = timeout
+
+        body = request.body
+        if isinstance(body, str):
+            body = body.encode()
+
+        try:
+            hrequest = httpx.Request(
+                request.method, request.url,
+                headers=[
+                    (key, value)
+                    for key, value in request.headers.items()
+                    if key.lower() not in HOP_HEADERS
+                ],
+                content=body,
+                extensions={"timeout": {
+                    "connect": connect,
+                    "read"   : read,
+                    "write"  : read,
+                    "pool"   : connect,
+                }},
+            )
+            hresponse = transport.handle_request(hrequest)
+        except httpx.ConnectTimeout as exc:
+            raise rexc.ConnectTimeout(exc, request=request)
+        except httpx.TimeoutException as exc:
+            raise rexc.ReadTimeout(exc, request=request)
+        except httpx.ProxyError as exc:
+            raise rexc.ProxyError(exc, request=request)
+        except httpx.TransportError as exc:
+            raise rexc.ConnectionError(exc, request=request)
+
+        response = requests.Response()
+        response.status_code = hresponse.status_code
+        response.headers = CaseInsensitiveDict(hresponse.headers.items())
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.raw = Http2Response(hresponse)
+        response.reason = hresponse.reason_phrase
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        extract_cookies_to_jar(response.cookies, request, response.raw)
+        return response
+
+    def close(self):
+        with self.lock:
+            transports = tuple(self.transports.values())
+            self.transports.clear()
+        for transport in transports:
+            transport.close()
+
+    def transport(self, proxy, verify, cert):
+        """Return a transport for 'proxy', 'verify', and 'cert'"""
+        key = (proxy, verify, cert)
+        try:
+            return self.transports[key]
+        except KeyError:
+            pass
+
+        with self.lock:
+            if (transport := self.transports.get(key)) is None:
+                transport = self.transports[key] = httpx.HTTPTransport(
+                    verify=self.ssl_context(verify, cert),
+                    http1=self.http1,
+                    http2=True,
+                    limits=self.limits,
+                    proxy=proxy,
+                    local_address=self.local_address,
+                    trust_env=False,
+                )
+        return transport
+
+    def ssl_context(self, verify, cert):
+        """Build an SSL context for 'verify' and 'cert'"""
+        if self.ssl_ctx is None:
+            ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+            if verify:
+                ctx.load_verify_locations(
+                    verify if isinstance(verify, str) else
+                    requests.certs.where())
+        else:
+            ctx = self.ssl_ctx(ssl.PROTOCOL_TLS_CLIENT)
+
+        if verify:
+            ctx.check_hostname = True
+            ctx.verify_mode = ssl.CERT_REQUIRED
+        else:
+            ctx.check_hostname = False
+            ctx.verify_mode = ssl.CERT_NONE
+
+        if self.ssl_options:
+            ctx.options |= self.ssl_options
+        if self.ssl_ciphers:
+            ctx.set_ciphers(self.ssl_ciphers)
+        if cert:
+            if isinstance(cert, str):
+                ctx.load_cert_chain(cert)
+            else:
+                ctx.load_cert_chain(*cert)
+        return ctx
+
+
+class Http2Response():
+    """urllib3.HTTPResponse replacement for httpx responses"""
+    chunked = True
+
+    def __init__(self, response):
+        self.response = response
+        self.status = response.status_code
+        self.version = 20 if response.http_version == "HTTP/2" else 11
+
+        # cookie handling expects an 'http.client' message object
+        self.msg = msg = http.client.HTTPMessage()
+        for key, value in response.headers.multi_items():
+            msg[key] = value
+        self._original_response = self
+
+    def info(self):
+        return self.msg
+
+    def stream(self, chunk_size=None, decode_content=True):
+        try:
+            if decode_content:
+                yield from self.response.iter_bytes(chunk_size)
+            else:
+                yield from self.response.iter_raw(chunk_size)
+        except httpx.DecodingError as exc:
+            raise rexc.ContentDecodingError(exc)
+        except httpx.TimeoutException as exc:
+            raise rexc.ConnectionError(exc)
+        except httpx.TransportError as exc:
+            raise rexc.ChunkedEncodingError(exc)
+
+    def read(self, amt=None, decode_content=True):
+        """Return all remaining content"""
+        return b"".join(self.stream(None, decode_content))
+
+    def close(self):
+        self.response.close()
+
+    release_conn = close
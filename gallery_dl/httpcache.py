@@ -0,0 +1,272 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2026 Mike Fährmann
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 2 as
+# published by the Free Software Foundation.
+
+"""On-disk cache for HTTP responses"""
+
+import os
+import time
+import hashlib
+import logging
+import threading
+import requests
+from . import cache, util
+
+log = logging.getLogger("httpcache")
+_instances = {}
+
+# response headers not describing the stored, decoded content
+IGNORE_HEADERS = {
+    "content-encoding",
+    "content-length",
+    "transfer-encoding",
+    "connection",
+    "keep-alive",
+    "set-cookie",
+}
+
+
+def connect(path, max_size=0):
+    """Return the HttpCache for 'path'
+
+    Return None if it cannot be opened.
+    """
+    if path is True:
+        path = cache.sibling("http-cache.sqlite3")
+    else:
+        path = util.expand_path(path)
+
+    try:
+        return _instances[path]
+    except KeyError:
+        pass
+
+    try:
+        instance = HttpCache(path, max_size)
+    except Exception as exc:
+        log.warning("Unable to open HTTP cache at '%s' (%s: %s)",
+                    path, exc.__class__.__name__, exc)
+        instance = None
+    else:
+        log.debug("Using HTTP cache at '%s'", path)
+
+    _instances[path] = instance
+    return instance
+
+
+class HttpCache():
+    """SQLite3 database of GET responses and their validators
+
+    Entries are evicted in least-recently-used order
+    once their combined size exceeds 'max_size' bytes.
+    """
+
+    def __init__(self, path, max_size=0):
+        import sqlite3
+        try:
+            con = sqlite3.connect(path, timeout=60, check_same_thread=False)
+        except sqlite3.OperationalError:
+            os.makedirs(os.path.dirname(path))
+            con = sqlite3.connect(path, timeout=60, check_same_thread=False)
+        con.isolation_level = None
+
+        self.Error = sqlite3.Error
+        self.connection = con
+        self.max_size = max_size
+        self.lock = threading.Lock()
+
+        con.execute("CREATE TABLE IF NOT EXISTS responses ("
+                    "key TEXT PRIMARY KEY, url TEXT, headers TEXT, "
+                    "vary TEXT, content BLOB, size INTEGER, "
+                    "stored REAL, accessed REAL)")
+        con.execute("CREATE INDEX IF NOT EXISTS responses_accessed "
+                    "ON responses (accessed)")
+        self.size = con.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def close(self):
+        self.connection.close()
+
+    def key(self, url, params=None, headers=None, cookies=None):
+        """Return the cache key for a GET request
+
+        Requests sending cookies or an 'Authorization' header
+        get a separate key for each set of credentials.
+        """
+        request = requests.models.PreparedRequest()
+        request.prepare_url(url, params)
+        request.prepare_headers(None)
+        key = request.url
+
+        credentials = []
+        if headers and (auth := headers.get("Authorization")):
+            credentials.append(auth)
+        if cookies and (cookie := requests.cookies.get_cookie_header(
+                cookies, request)):
+            credentials.append(cookie)
+        if credentials:
+            digest = hashlib.sha256("\n".join(credentials).encode())
+            key = f"{key} {digest.hexdigest()}"
+        return key
+
+    def lookup(self, key, headers):
+        """Return the CacheEntry for 'key' matching request 'headers'"""
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT url, headers, vary, content, stored "
+                "FROM responses WHERE key=?", (key,)).fetchone()
+        if row is None:
+            return None
+
+        entry = CacheEntry(*row)
+        if entry.vary:
+            headers = requests.structures.CaseInsensitiveDict(headers)
+            for name, value in entry.vary.items():
+                if headers.get(name) != value:
+                    return None
+        return entry
+
+    def load(self, key, entry):
+        """Return 'entry' as response and mark it as recently used"""
+        with self.lock:
+            self.connection.execute(
+                "UPDATE responses SET accessed=? WHERE key=?",
+                (time.time(), key))
+
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.url = entry.url
+        response.headers = requests.structures.CaseInsensitiveDict(
+            entry.headers)
+        response.encoding = requests.utils.get_encoding_from_headers(
+            response.headers)
+        response.request = requests.Request(
+            "GET", key.partition(" ")[0]).prepare()
+        response._content = entry.content
+        return response
+
+    def revalidate(self, key, entry, response):
+        """Turn a '304 Not Modified' response into its cached version"""
+        headers = requests.structures.CaseInsensitiveDict(entry.headers)
+        for name, value in response.headers.items():
+            if name.lower() not in IGNORE_HEADERS:
+                headers[name] = value
+
+        response.status_code = 200
+        response.reason = "OK"
+        response.headers = headers
+        response.encoding = requests.utils.get_encoding_from_headers(headers)
+        response._content = entry.content
+
+        now = time.time()
+        with self.lock:
+            self.connection.execute(
+                "UPDATE responses SET headers=?, stored=?, accessed=? "
+                "WHERE key=?", (util.json_dumps(dict(headers)), now, now, key))
+        return response
+
+    def store(self, key, response, headers, ttl=0):
+        """Add 'response' to the cache
+
+        Only responses that can be revalidated
+        or that stay fresh for 'ttl' seconds get stored.
+        Responses setting cookies or looking like a bot challenge
+        do not, since replaying them would skip both.
+        """
+        rheaders = response.headers
+        if "no-store" in rheaders.get("cache-control", "") or \
+                not (ttl or "etag" in rheaders or "last-modified" in rheaders):
+            return
+        if "set-cookie" in rheaders or \
+                util.detect_challenge(response) is not None:
+            return
+
+        vary = None
+        if value := rheaders.get("vary"):
+            if "*" in value:
+                return
+            headers = requests.structures.CaseInsensitiveDict(headers)
+            vary = {}
+            for name in value.split(","):
+                if name := name.strip():
+                    vary[name] = headers.get(name)
+
+        content = response.content
+        size = len(content)
+        if self.max_size and size > self.max_size:
+            return
+
+        now = time.time()
+        with self.lock:
+            con = self.connection
+            if row := con.execute(
+                    "SELECT size FROM responses WHERE key=?",
+                    (key,)).fetchone():
+                self.size -= row[0]
+
+            con.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?,?,?,?,?,?,?,?)", (
+                    key,
+                    response.url,
+                    util.json_dumps({
+                        name: value
+                        for name, value in rheaders.items()
+                        if name.lower() not in IGNORE_HEADERS
+                    }),
+                    util.json_dumps(vary) if vary else None,
+                    content,
+                    size,
+                    now,
+                    now,
+                ))
+            self.size += size
+
+            if self.max_size and self.size > self.max_size:
+                self._evict()
+
+    def _evict(self):
+        """Delete least recently used entries until below 'max_size'"""
+        size = self.size
+        keys = []
+        for key, entry_size in self.connection.execute(
+                "SELECT key, size FROM responses ORDER BY accessed"):
+            if size <= self.max_size:
+                break
+            keys.append((key,))
+            size -= entry_size
+
+        self.connection.executemany(
+            "DELETE FROM responses WHERE key=?", keys)
+        self.size = size
+        log.debug("Evicted %s entries", len(keys))
+
+
+class CacheEntry():
+    __slots__ = ("url", "headers", "vary", "content", "stored")
+
+    def __init__(self, url, headers, vary, content, stored):
+        self.url = url
+        self.headers = util.json_loads(headers)
+        self.vary = util.json_loads(vary) if vary else None
+        self.content = content
+        self.stored = stored
+
+    def fresh(self, ttl):
+        """Return True if this entry can be used without revalidation"""
+        return ttl and time.time() - self.stored < ttl
+
+    def conditional(self, headers=None):
+        """Return 'headers' extended by conditional request headers"""
+        headers = headers.copy() if headers else {}
+        for name, value in self.headers.items():
+            name = name.lower()
+            if name == "etag":
+                headers["If-None-Match"] = value
+            elif name == "last-modified":
+                headers["If-Modified-Since"] = value
+        return headers
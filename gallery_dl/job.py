@@ -6,9 +6,12 @@
 # it under the terms of the GNU General Public License version 2 as
 # published by the Free Software Foundation.
 
+import os
 import sys
+import copy
 import errno
 import logging
+import threading
 import functools
 import collections
 
@@ -326,6 +329,11 @@ class Job():
         init = extr.config("init", False)
         if init and init != "lazy":
             self.initialize()
+        elif extr.archive_prefetch is not None and \
+                extr.config("prefetch", extr.prefetch):
+            # 'archive_prefetch' gets called from the 'prefetch' thread
+            # and must not set up PathFormat and archive there
+            self.initialize()
 
     def _collect_urls(self, source):
         if not source:
@@ -414,9 +422,64 @@ class DownloadJob(Job):
         self.visited = set() if parent is None else parent.visited
         self._extractor_filter = None
         self._skipcnt = 0
+        self._pool = None
+        self._pending = ()
+        self._pp_pool = None
+        self._pp_pending = ()
+        self._pp_lanes = None
+        self._pp_background = False
+        self._defer = None
+        self._deferred = ()
+
+        if self.extractor.config("archive"):
+            self.extractor.archive_prefetch = self.archive_prefetch
 
     def handle_url(self, url, kwdict):
         """Download the resource specified in 'url'"""
+        if not self._handle_url_prepare(kwdict):
+            return
+
+        if self.sleep is not None:
+            self.extractor.sleep(self.sleep(), "download")
+
+        # download from URL
+        failed = self._download_fallback(
+            url, kwdict, self.pathfmt, self.download)
+        self._handle_url_finish(url, kwdict, failed)
+
+    def handle_url_concurrent(self, url, kwdict):
+        """Download 'url' in a worker thread of the download pool"""
+        pending = self._pending
+        if pending and ("prepare" in self.hooks or
+                        "prepare-after" in self.hooks):
+            # 'prepare' callbacks may depend on state
+            # set by the previous file's 'file' or 'after' callbacks
+            self._download_drain()
+
+        # extractors are allowed to reuse and modify 'kwdict' objects
+        kwdict = kwdict.copy()
+        if not self._handle_url_prepare(kwdict):
+            return
+
+        if self.sleep is not None:
+            self.extractor.sleep(self.sleep(), "download")
+
+        if self._pool is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self._pool = ThreadPoolExecutor(
+                self._workers, "download", config.inherit())
+            self._local = threading.local()
+
+        pathfmt = copy.copy(self.pathfmt)
+        pending.append((url, pathfmt, self._pool.submit(
+            self._download_fallback, url, kwdict, pathfmt,
+            functools.partial(self._download_worker, pathfmt=pathfmt))))
+
+        while len(pending) >= self._workers_max:
+            self._download_complete()
+
+    def _handle_url_prepare(self, kwdict):
+        """Prepare download; return False if it should be skipped"""
         hooks = self.hooks
         pathfmt = self.pathfmt
         archive = self.archive
@@ -428,10 +491,11 @@ class DownloadJob(Job):
             for callback in hooks["prepare"]:
                 callback(pathfmt)
 
-        if archive is not None and archive.check(kwdict):
+        if archive is not None and (archive.check(kwdict) or (
+                self._pending and self._archive_pending(kwdict))):
             pathfmt.fix_extension()
             self.handle_skip()
-            return
+            return False
 
         if pathfmt.extension and not self.metadata_http:
             pathfmt.build_path()
@@ -440,7 +504,7 @@ class DownloadJob(Job):
                 if archive is not None and self._archive_write_skip:
                     archive.add(kwdict)
                 self.handle_skip()
-                return
+                return False
 
         if "prepare-after" in hooks:
             for callback in hooks["prepare-after"]:
@@ -450,26 +514,32 @@ class DownloadJob(Job):
                 if archive is not None and self._archive_write_skip:
                     archive.add(kwdict)
                 self.handle_skip()
-                return
+                return False
 
-        if self.sleep is not None:
-            self.extractor.sleep(self.sleep(), "download")
+        return True
+
+    def _archive_pending(self, kwdict):
+        """Return True if 'kwdict' is in the download archive
+        after finishing a pending download with the same archive key"""
+        cache_key = self.archive._cache_key
+        if (key := kwdict.get(cache_key)) is None:
+            return False
+        for _, pathfmt, _ in self._pending:
+            if pathfmt.kwdict.get(cache_key) == key:
+                break
+        else:
+            return False
 
-        # download from URL
-        failed = False
-        try:
-            if not self.download(url):
-                # use fallback URLs if available/enabled
-                fallback = kwdict.get("_fallback", ()) if self.fallback else ()
-                for num, url in enumerate(fallback, 1):
-                    util.remove_file(pathfmt.temppath)
-                    self.log.info("Trying fallback URL #%d", num)
-                    if self.download(url):
-                        break
-                else:
-                    failed = True
-        except exception.StopDownload:
-            failed = True
+        self._download_drain()
+        if self._deferred:
+            self._defer_complete()
+        return self.archive.check(kwdict)
+
+    def _handle_url_finish(self, url, kwdict, failed):
+        """Run postprocessors and finalize a completed download"""
+        hooks = self.hooks
+        pathfmt = self.pathfmt
+        archive = self.archive
 
         if failed:
             self.status |= 4
@@ -493,6 +563,7 @@ class DownloadJob(Job):
         # process download flag
         if FLAGS.DOWNLOAD is not None:
             FLAGS.DOWNLOAD = None
+            self._defer = None
             self.status |= 4
             self.log.error("Failed to download %s", pathfmt.filename or url)
             if "error" in hooks:
@@ -504,19 +575,171 @@ class DownloadJob(Job):
         pathfmt.finalize()
         self.out.success(pathfmt.path)
         self._skipcnt = 0
-        if archive is not None and self._archive_write_file:
-            archive.add(kwdict)
-        if "after" in hooks:
-            for callback in hooks["after"]:
-                callback(pathfmt)
-        if archive is not None and self._archive_write_after:
+
+        if (future := self._defer) is not None:
+            # a 'file' callback is still processing this file
+            self._defer = None
+            self._defer_append(future, pathfmt, kwdict, -1)
+        elif self._deferred:
+            # finish files in download order
+            self._defer_complete(64)
+            if self._deferred:
+                self._defer_append(None, pathfmt, kwdict, -1)
+            elif entry := self._handle_url_after(pathfmt, kwdict, -1):
+                self._defer_append(*entry)
+        elif entry := self._handle_url_after(pathfmt, kwdict, -1):
+            self._defer_append(*entry)
+
+    def _handle_url_after(self, pathfmt, kwdict, index):
+        """Write archive entries and run 'after' callbacks from 'index' on
+
+        Return a (future, pathfmt, kwdict, index) tuple
+        when a callback deferred the remaining ones.
+        """
+        archive = self.archive
+        if index < 0:
+            # with background 'after' callbacks, write 'file' entries
+            # only after they succeeded
+            if archive is not None and self._archive_write_file and \
+                    not self._pp_background:
+                archive.add(kwdict)
+            index = 0
+
+        if "after" in self.hooks:
+            callbacks = self.hooks["after"]
+            while index < len(callbacks):
+                callbacks[index](pathfmt)
+                index += 1
+                if (future := self._defer) is not None:
+                    self._defer = None
+                    return future, pathfmt, kwdict, index
+
+        if archive is not None and (self._archive_write_after or (
+                self._archive_write_file and self._pp_background)):
             archive.add(kwdict)
 
+    def defer(self, future):
+        """Delay finishing the current file until 'future' is done
+
+        Its archive entries and all following 'after' callbacks
+        only get processed if 'future' returns a true value.
+        """
+        self._defer = future
+
+    def _defer_append(self, future, pathfmt, kwdict, index, left=False):
+        if not self._deferred:
+            self._deferred = collections.deque()
+
+        # 'pathfmt' and 'kwdict' get reused for the next file
+        pathfmt = copy.copy(pathfmt)
+        pathfmt.kwdict = kwdict = kwdict.copy()
+
+        entry = (future, pathfmt, kwdict, index)
+        if left:
+            self._deferred.appendleft(entry)
+        else:
+            self._deferred.append(entry)
+
+    def _defer_complete(self, limit=0):
+        """Finish deferred files until at most 'limit' remain
+
+        Files whose futures are already done always get finished.
+        """
+        # '_defer_append()' might replace an empty 'self._deferred'
+        while deferred := self._deferred:
+            future, pathfmt, kwdict, index = deferred[0]
+            if future is not None and not future.done() and \
+                    len(deferred) <= limit:
+                return
+            deferred.popleft()
+
+            if future is not None:
+                try:
+                    result = future.result()
+                except exception.ControlException:
+                    raise
+                except Exception as exc:
+                    self.status |= 1
+                    self.log.error("Postprocessor error: %s: %s",
+                                   exc.__class__.__name__, exc)
+                    self.log.traceback(exc)
+                    result = False
+                if not result:
+                    continue
+
+            if entry := self._handle_url_after(pathfmt, kwdict, index):
+                self._defer_append(*entry, left=True)
+
+    def _download_fallback(self, url, kwdict, pathfmt, download):
+        """Download 'url' or its fallback URLs; return True on failure"""
+        try:
+            if download(url):
+                return False
+
+            # use fallback URLs if available/enabled
+            fallback = kwdict.get("_fallback", ()) if self.fallback else ()
+            for num, url in enumerate(fallback, 1):
+                util.remove_file(pathfmt.temppath)
+                self.log.info("Trying fallback URL #%d", num)
+                if download(url):
+                    return False
+        except exception.StopDownload:
+            pass
+        return True
+
+    def _download_worker(self, url, pathfmt):
+        """Download 'url' using this thread's downloader instances"""
+        try:
+            downloaders = self._local.downloaders
+        except AttributeError:
+            downloaders = self._local.downloaders = {}
+        return self._download(url, pathfmt, functools.partial(
+            self.get_downloader, downloaders=downloaders))
+
+    def _download_complete(self):
+        """Finish the oldest pending download in the download pool"""
+        url, pathfmt, future = self._pending.popleft()
+        pathfmt_orig = self.pathfmt
+        self.pathfmt = pathfmt
+        try:
+            self._handle_url_finish(url, pathfmt.kwdict, future.result())
+        finally:
+            self.pathfmt = pathfmt_orig
+
+    def _download_drain(self):
+        """Finish all pending downloads in submission order"""
+        while self._pending:
+            self._download_complete()
+
+    def _download_cancel(self):
+        """Cancel all pending downloads that have not started yet
+
+        Skip 'file' and 'after' callbacks for all of them.
+        """
+        for _, _, future in self._pending:
+            future.cancel()
+        self._pending.clear()
+
+    def dispatch(self, messages):
+        try:
+            return Job.dispatch(self, messages)
+        except exception.StopExtraction:
+            raise
+        except BaseException:
+            # stop promptly on errors and interruptions
+            if self._pending:
+                self._download_cancel()
+            raise
+
     def handle_directory(self, kwdict):
         """Set and create the target directory for downloads"""
         if self.pathfmt is None:
             self.initialize(kwdict)
         else:
+            if self._pending:
+                self._download_drain()
+            if self._deferred:
+                self._defer_complete()
             if "post-after" in self.hooks:
                 for callback in self.hooks["post-after"]:
                     callback(self.pathfmt)
@@ -532,6 +755,11 @@ class DownloadJob(Job):
             return
         self.visited.add(url)
 
+        if self._pending:
+            self._download_drain()
+        if self._deferred:
+            self._defer_complete()
+
         if "child" in self.hooks:
             pathfmt = self.pathfmt
             pathfmt.kwdict = kwdict
@@ -617,7 +845,52 @@ class DownloadJob(Job):
             for callback in self.hooks["child-after"]:
                 callback(pathfmt)
 
+    def archive_prefetch(self, kwdicts):
+        """Look up download archive entries for 'kwdicts' in bulk"""
+        if self.pathfmt is None:
+            # only reached without 'prefetch', i.e. on the main thread
+            self.initialize()
+        if (archive := self.archive) is None:
+            return
+
+        extension_map = self.pathfmt.extension_map
+        entries = []
+        for kwdict in kwdicts:
+            kwdict = kwdict.copy()
+            self.update_kwdict(kwdict)
+            if ext := kwdict.get("extension"):
+                kwdict["extension"] = extension_map(ext, ext)
+            entries.append(kwdict)
+        archive.check_many(entries)
+
     def handle_finalize(self):
+        if self._pool is not None:
+            try:
+                self._download_drain()
+            except exception.ControlException:
+                self._pending.clear()
+            except Exception as exc:
+                self.status |= 4
+                self.log.error("%s: %s", exc.__class__.__name__, exc)
+                self.log.traceback(exc)
+                self._pending.clear()
+            self._pool.shutdown()
+            self._pool = None
+
+        if self._deferred:
+            try:
+                self._defer_complete()
+            except exception.ControlException:
+                self._deferred.clear()
+
+        if self._pp_pool is not None:
+            try:
+                self._postprocess_drain()
+            except exception.ControlException:
+                self._pp_pending.clear()
+            self._pp_pool.shutdown()
+            self._pp_pool = None
+
         if self.archive is not None:
             if not self.status:
                 self.archive.finalize()
@@ -661,9 +934,12 @@ class DownloadJob(Job):
 
     def download(self, url):
         """Download 'url'"""
-        if downloader := self.get_downloader(url[:url.find(":")]):
+        return self._download(url, self.pathfmt, self.get_downloader)
+
+    def _download(self, url, pathfmt, get_downloader):
+        if downloader := get_downloader(url[:url.find(":")]):
             try:
-                return downloader.download(url, self.pathfmt)
+                return downloader.download(url, pathfmt)
             except OSError as exc:
                 if exc.errno == errno.ENOSPC:
                     raise
@@ -672,24 +948,30 @@ class DownloadJob(Job):
         self._write_unsupported(url)
         return False
 
-    def get_downloader(self, scheme):
+    def get_downloader(self, scheme, downloaders=None):
         """Return a downloader suitable for 'scheme'"""
+        if downloaders is None:
+            downloaders = self.downloaders
         try:
-            return self.downloaders[scheme]
+            return downloaders[scheme]
         except KeyError:
             pass
 
         cls = downloader.find(scheme)
         if cls and config.get(("downloader", cls.scheme), "enabled", True):
             instance = cls(self)
+            if downloaders is not self.downloaders:
+                # progress output from concurrent downloads
+                # would overwrite each other
+                instance.out = output.NullOutput()
         else:
             instance = None
             self.log.error("'%s:' URLs are not supported/enabled", scheme)
 
         if cls and cls.scheme == "http":
-            self.downloaders["http"] = self.downloaders["https"] = instance
+            downloaders["http"] = downloaders["https"] = instance
         else:
-            self.downloaders[scheme] = instance
+            downloaders[scheme] = instance
         return instance
 
     def initialize(self, kwdict=None):
@@ -707,6 +989,12 @@ class DownloadJob(Job):
         if not cfg("download", True):
             # monkey-patch method to do nothing and always return True
             self.download = pathfmt.fix_extension
+        elif (workers := cfg("download-workers", 1)) > 1 and \
+                self.__class__.handle_url is DownloadJob.handle_url:
+            self._workers = workers
+            self._workers_max = workers * 2
+            self._pending = collections.deque()
+            self.handle_url = self.handle_url_concurrent
 
         if archive_path := cfg("archive"):
             archive_table = cfg("archive-table")
@@ -727,6 +1015,10 @@ class DownloadJob(Job):
                     cfg("archive-mode"),
                     cfg("archive-pragma"),
                     pathfmt,
+                    None,
+                    cfg("archive-bloom"),
+                    (cfg("archive-batch-size", 100),
+                     cfg("archive-batch-interval", 10.0)),
                 )
             except Exception as exc:
                 extr.log.warning(
@@ -771,6 +1063,7 @@ class DownloadJob(Job):
             pathfmt.exists = lambda x=None: False
             if self.archive is not None:
                 self.archive.check = pathfmt.exists
+            extr.archive_prefetch = None
 
         if not cfg("postprocess", True):
             return
@@ -843,21 +1136,126 @@ class DownloadJob(Job):
 
             if pp_list:
                 extr.log.debug("Active postprocessor modules: %s", pp_list)
+                if self._pp_lanes:
+                    self._init_background(cfg("postprocessor-workers"))
                 if "init" in self.hooks:
                     for callback in self.hooks["init"]:
                         callback(pathfmt)
 
     def register_hooks(self, hooks, options=None):
-        expr = options.get("filter") if options else None
+        if options:
+            if expr := options.get("filter"):
+                condition = util.compile_filter(expr)
+                hooks = {
+                    hook: functools.partial(
+                        _call_hook_condition, callback, condition)
+                    for hook, callback in hooks.items()
+                }
+            if limit := options.get("background"):
+                hooks = self._register_background(hooks, options, limit)
+
+        for hook, callback in hooks.items():
+            self.hooks[hook].append(callback)
+
+    def _register_background(self, hooks, options, limit):
+        """Move 'after' callbacks of a postprocessor to a worker thread"""
+        if self._pp_lanes is None:
+            self._pp_pending = collections.deque()
+            self._pp_lanes = {}
+
+        # one lane per postprocessor, even across register_hooks() calls
+        key = id(options)
+        if (lane := self._pp_lanes.get(key)) is None:
+            if limit is True or limit < 1:
+                limit = 1
+            lane = self._pp_lanes[key] = _BackgroundLane(options, limit)
+
+        result = {}
+        for hook, callback in hooks.items():
+            if hook == "after":
+                result[hook] = functools.partial(
+                    _call_hook_background, callback, lane)
+            else:
+                # other callbacks may depend on state
+                # set by this postprocessor's pending 'after' callbacks
+                result[hook] = functools.partial(
+                    self._postprocess_wait, lane, callback)
+        return result
+
+    def _init_background(self, workers):
+        """Group 'after' callbacks of background postprocessors"""
+        callbacks = self.hooks.get("after")
+        if not callbacks:
+            return
 
-        if expr:
-            condition = util.compile_filter(expr)
-            for hook, callback in hooks.items():
-                self.hooks[hook].append(functools.partial(
-                    _call_hook_condition, callback, condition))
-        else:
-            for hook, callback in hooks.items():
-                self.hooks[hook].append(callback)
+        hooks = []
+        background = []
+        for callback in callbacks:
+            if getattr(callback, "func", None) is _call_hook_background:
+                if not background:
+                    hooks.append(functools.partial(
+                        self._postprocess_submit, background))
+                background.append(callback)
+            else:
+                hooks.append(callback)
+
+        if background:
+            self.hooks["after"] = hooks
+            self._pp_background = True
+            self._pp_workers = workers or os.cpu_count() or 1
+            self._pp_workers_max = self._pp_workers * 2
+
+    def _postprocess_submit(self, callbacks, pathfmt):
+        """Run background 'after' callbacks for 'pathfmt' in order
+
+        Defer all following 'after' callbacks and archive entries
+        until they are done.
+        """
+        if self._pp_pool is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self._pp_pool = ThreadPoolExecutor(
+                self._pp_workers, "postprocessor", config.inherit())
+
+        # extractors are allowed to reuse and modify 'kwdict' objects
+        pathfmt = copy.copy(pathfmt)
+        pathfmt.kwdict = pathfmt.kwdict.copy()
+
+        lanes = [callback.args[1] for callback in callbacks]
+        future = self._pp_pool.submit(_call_hooks_background, [
+            (callback.args[0], lane, lane.ticket())
+            for callback, lane in zip(callbacks, lanes)
+        ], pathfmt)
+        for lane in lanes:
+            lane.futures.add(future)
+        self.defer(future)
+
+        pending = self._pp_pending
+        pending.append((future, lanes))
+        while len(pending) >= self._pp_workers_max:
+            self._postprocess_complete()
+
+    def _postprocess_complete(self):
+        """Wait for the oldest background callbacks to finish
+
+        Their results and errors get processed by '_defer_complete()'.
+        """
+        future, lanes = self._pp_pending.popleft()
+        for lane in lanes:
+            lane.futures.discard(future)
+
+        from concurrent.futures import wait
+        wait((future,))
+
+    def _postprocess_drain(self):
+        """Wait for all background callbacks to finish"""
+        while self._pp_pending:
+            self._postprocess_complete()
+
+    def _postprocess_wait(self, lane, callback, pathfmt):
+        """Run 'callback' after all of 'lane's pending work is done"""
+        while lane.futures:
+            self._postprocess_complete()
+        callback(pathfmt)
 
     def _build_extractor_filter(self):
         clist = self.extractor.config("whitelist")
@@ -879,6 +1277,73 @@ def _call_hook_condition(callback, condition, pathfmt):
         callback(pathfmt)
 
 
+def _call_hook_background(callback, lane, pathfmt):
+    lane.call(callback, pathfmt)
+
+
+def _call_hooks_background(entries, pathfmt):
+    entries = iter(entries)
+    try:
+        for callback, lane, ticket in entries:
+            lane.call(callback, pathfmt, ticket)
+    except BaseException:
+        # let later files pass through the remaining lanes
+        for _, lane, ticket in entries:
+            lane.skip(ticket)
+        raise
+    return True
+
+
+class _BackgroundLane():
+    """Concurrency limit and pending work of a background postprocessor
+
+    With a limit of 1, callbacks run in the order they were submitted in.
+    """
+    __slots__ = ("options", "semaphore", "condition",
+                 "tickets", "turn", "futures")
+
+    def __init__(self, options, limit):
+        # keep 'options' alive so its id() stays unique
+        self.options = options
+        self.futures = set()
+        self.tickets = self.turn = 0
+        if limit > 1:
+            self.semaphore = threading.BoundedSemaphore(limit)
+            self.condition = None
+        else:
+            self.semaphore = None
+            self.condition = threading.Condition()
+
+    def ticket(self):
+        if self.condition is None:
+            return None
+        ticket = self.tickets
+        self.tickets += 1
+        return ticket
+
+    def call(self, callback, pathfmt, ticket=None):
+        if ticket is None:
+            if self.semaphore is None:
+                return callback(pathfmt)
+            with self.semaphore:
+                return callback(pathfmt)
+
+        with self.condition:
+            self.condition.wait_for(lambda: self.turn == ticket)
+        try:
+            callback(pathfmt)
+        finally:
+            self.skip(ticket)
+
+    def skip(self, ticket):
+        if ticket is None:
+            return
+        with self.condition:
+            self.condition.wait_for(lambda: self.turn == ticket)
+            self.turn += 1
+            self.condition.notify_all()
+
+
 class SimulationJob(DownloadJob):
     """Simulate the extraction process without downloading anything"""
 
@@ -286,6 +286,12 @@ def build_parser():
         dest="extractor_sources", metavar="PATH", action="append",
         help="Load external extractors from PATH",
     )
+    general.add_argument(
+        "--serve",
+        dest="serve", metavar="ADDRESS",
+        help=("Run as server and accept jobs over HTTP on ADDRESS "
+              "('HOST:PORT' or the path of a UNIX socket)"),
+    )
     general.add_argument(
         "--compat",
         dest="category-map", nargs=0, action=ConfigConstAction, const="compat",
@@ -342,6 +348,11 @@ def build_parser():
         help=("Download URLs found in FILE. "
               "Delete them after they were downloaded successfully."),
     )
+    input.add_argument(
+        "--jobs",
+        dest="jobs", metavar="N", type=int,
+        help="Process up to N input URLs at the same time",
+    )
     input.add_argument(
         "--no-input",
         dest="input", nargs=0, action=ConfigConstAction, const=False,
@@ -10,10 +10,12 @@
 
 import os
 import shutil
+import threading
 import functools
 from . import util, formatter, exception
 
 WINDOWS = util.WINDOWS
+NONE = util.NONE
 EXTENSION_MAP = {
     "jpeg": "jpg",
     "jpe" : "jpg",
@@ -32,6 +34,8 @@ class PathFormat():
             kwdefault = util.NONE
 
         self.filename_conditions = self.directory_conditions = None
+        self._directory_fields = {}
+        self._directory_cache = {}
 
         filename_fmt = config("filename")
         try:
@@ -55,24 +59,25 @@ class PathFormat():
             if directory_fmt is None:
                 directory_fmt = extractor.directory_fmt
             elif isinstance(directory_fmt, dict):
-                self.directory_conditions = [
-                    (util.compile_filter(expr), [
-                        formatter.parse(fmt, kwdefault).format_map
-                        for fmt in fmts
-                    ])
-                    for expr, fmts in directory_fmt.items() if expr
-                ]
+                self.directory_conditions = conditions = []
+                for expr, fmts in directory_fmt.items():
+                    if expr:
+                        formatters = self._directory_formatters(
+                            fmts, kwdefault)
+                        conditions.append(
+                            (util.compile_filter(expr), formatters))
                 directory_fmt = directory_fmt.get("", extractor.directory_fmt)
 
-            self.directory_formatters = [
-                formatter.parse(dirfmt, kwdefault).format_map
-                for dirfmt in directory_fmt
-            ]
+            self.directory_formatters = self._directory_formatters(
+                directory_fmt, kwdefault)
         except Exception as exc:
             raise exception.DirectoryFormatError(exc)
 
         self.kwdict = {}
         self.delete = False
+        # shared with copies of this object in download worker threads
+        self.directories = {}
+        self.directories_lock = threading.Lock()
         self.prefix = ""
         self.filename = ""
         self.extension = ""
@@ -120,6 +125,12 @@ class PathFormat():
         if WINDOWS:
             self.extended = config("path-extended", True)
 
+        if config("skip-index"):
+            self.lexists = self._index_lexists
+        else:
+            self.lexists = os.path.lexists
+        self.index = self.index_directory = None
+
         self.basedirectory_conditions = None
         basedir = extractor._parentdir
         if not basedir:
@@ -138,6 +149,23 @@ class PathFormat():
                 basedir = self._prepare_basedirectory(basedir)
         self.basedirectory = basedir
 
+    def _directory_formatters(self, fmts, kwdefault):
+        """Parse directory format strings and register their fields"""
+        formatters = [
+            formatter.parse(fmt, kwdefault).format_map
+            for fmt in fmts
+        ]
+
+        # results only get cached when all fields are known
+        fields = []
+        for fmt in fmts:
+            if (flds := formatter.parse_fields(fmt)) is None:
+                return formatters
+            fields.extend(flds)
+        self._directory_fields[id(formatters)] = fields
+
+        return formatters
+
     def _prepare_basedirectory(self, basedir):
         basedir = util.expand_path(basedir)
         if os.altsep and os.altsep in basedir:
@@ -157,17 +185,47 @@ class PathFormat():
             if "r" in mode:
                 # '.part' file no longer exists
                 return util.NullContext()
+            with self.directories_lock:
+                self.directories.pop(self.realdirectory, None)
             os.makedirs(self.realdirectory)
+            self._add_directory(self.realdirectory)
             return open(self.temppath, mode)
 
+    def makedirs(self, directory=None, force=False):
+        """Create 'directory' and all its missing parent directories
+
+        Skip directories already created or known to exist,
+        unless 'force' is enabled, e.g. after a FileNotFoundError
+        caused by removing such a directory.
+        """
+        if directory is None:
+            directory = self.realdirectory
+        directories = self.directories
+        with self.directories_lock:
+            if force:
+                directories.pop(directory, None)
+            elif directory in directories:
+                # mark as most recently used
+                directories[directory] = directories.pop(directory)
+                return
+        try:
+            os.makedirs(directory, exist_ok=True)
+        except FileNotFoundError:
+            # parent directory got removed while creating 'directory'
+            os.makedirs(directory, exist_ok=True)
+        self._add_directory(directory)
+
+    def _add_directory(self, directory):
+        directories = self.directories
+        with self.directories_lock:
+            directories[directory] = None
+            if len(directories) > 256:
+                del directories[next(iter(directories))]
+
     def exists(self):
         """Return True if the file exists on disk"""
-        if self.extension:
-            try:
-                os.lstat(self.realpath)  # raises OSError if file doesn't exist
-                return self.check_file()
-            except OSError:
-                pass
+        if self.extension and self.lexists(self.realpath):
+            return self.check_file()
         return False
 
     def check_file(self):
@@ -175,18 +233,40 @@ class PathFormat():
 
     def _enum_file(self):
         num = 1
-        try:
-            while True:
-                prefix = format(num) + "."
-                self.kwdict["extension"] = prefix + self.extension
-                self.build_path()
-                os.lstat(self.realpath)  # raises OSError if file doesn't exist
-                num += 1
-        except OSError:
-            pass
+        while True:
+            prefix = format(num) + "."
+            self.kwdict["extension"] = prefix + self.extension
+            self.build_path()
+            if not self.lexists(self.realpath):
+                break
+            num += 1
         self.prefix = prefix
         return False
 
+    def _index_lexists(self, path):
+        """Look up 'path' in a snapshot of its directory's file names"""
+        directory, _, name = path.rpartition(os.sep)
+        if directory != self.index_directory:
+            self._index_load(directory)
+        if (index := self.index) is None:
+            return os.path.lexists(path)
+        return name in index
+
+    def _index_load(self, directory):
+        self.index_directory = directory
+        try:
+            with os.scandir(directory) as it:
+                self.index = {entry.name for entry in it}
+        except FileNotFoundError:
+            self.index = set()
+        except OSError:
+            self.index = None
+
+    def _index_add(self, path):
+        directory, _, name = path.rpartition(os.sep)
+        if directory == self.index_directory and self.index is not None:
+            self.index.add(name)
+
     def set_directory(self, kwdict):
         """Build directory path and create it if necessary"""
         self.kwdict = kwdict
@@ -286,6 +366,29 @@ class PathFormat():
                 formatters = [formatter.parse(fmt).format_map
                               for fmt in segments]
 
+            if (fields := self._directory_fields.get(id(formatters))) \
+                    is not None:
+                values = [id(formatters)]
+                for key, funcs in fields:
+                    try:
+                        obj = kwdict[key]
+                        for func in funcs:
+                            obj = func(obj)
+                        values.append(obj)
+                        values.append(obj.__class__)
+                    except Exception:
+                        values.append(NONE)
+                        values.append(None)
+                values = tuple(values)
+                try:
+                    return self._directory_cache[values]
+                except KeyError:
+                    pass
+                except TypeError:
+                    values = None  # unhashable field value
+            else:
+                values = None
+
             segments = []
             strip = self.strip
             for fmt in formatters:
@@ -303,10 +406,16 @@ class PathFormat():
                             segment = segment.rstrip(strip)
                         if segment:
                             segments.append(self.clean_segment(segment))
-            return segments
         except Exception as exc:
             raise exception.DirectoryFormatError(exc)
 
+        if values is not None:
+            cache = self._directory_cache
+            if len(cache) >= 256:
+                cache.clear()
+            cache[values] = segments
+        return segments
+
     def build_path(self):
         """Combine directory and filename to full paths"""
         self.filename = filename = self.build_filename(self.kwdict)
@@ -380,13 +489,22 @@ class PathFormat():
     def set_mtime(self, path=None):
         if (mtime := (self.kwdict.get("_mtime_meta") or
                       self.kwdict.get("_mtime_http"))):
-            util.set_mtime(self.realpath if path is None else path, mtime)
+            if path is None:
+                if self.kwdict.get("_hardlink"):
+                    # shares its mtime with another file
+                    return
+                path = self.realpath
+            util.set_mtime(path, mtime)
 
     def finalize(self):
         """Move tempfile to its target location"""
         if self.delete:
             self.delete = False
-            os.unlink(self.temppath)
+            try:
+                os.unlink(self.temppath)
+            except FileNotFoundError:
+                # written directly into a post processor's output
+                pass
             return
 
         if self.temppath != self.realpath:
@@ -415,6 +533,8 @@ class PathFormat():
                     os.unlink(self.temppath)
                 break
 
+        if self.index is not None:
+            self._index_add(self.realpath)
         self.set_mtime()
 
 
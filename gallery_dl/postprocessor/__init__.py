@@ -12,6 +12,7 @@ modules = {
     "actions",
     "classify",
     "compare",
+    "dedup",
     "directory",
     "exec",
     "hash",
@@ -0,0 +1,273 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2026 Mike Fährmann
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 2 as
+# published by the Free Software Foundation.
+
+"""Replace files with identical content by hard links or reflinks"""
+
+from .common import PostProcessor
+from .hash import HashTee
+from .. import cache, text, util, exception
+import hashlib
+import errno
+import os
+
+
+class DedupPP(PostProcessor):
+
+    def __init__(self, job, options):
+        PostProcessor.__init__(self, job)
+
+        self.algorithm = options.get("hash") or "sha256"
+        self.chunk_size = options.get("chunk-size", 32768)
+        self.names = (("", self.algorithm),)
+        self.count = self.saved = 0
+
+        mode = options.get("mode")
+        if mode == "reflink":
+            if util.WINDOWS:
+                self.log.warning("'reflink' mode is not supported on Windows")
+                return
+            self._link_file = _reflink
+        else:
+            if mode and mode != "hardlink":
+                self.log.warning("Unsupported mode '%s'", mode)
+            self._link_file = os.link
+
+        prefix = options.get("prefix") or 0
+        if isinstance(prefix, str):
+            prefix = text.parse_bytes(prefix)
+        self.prefix = prefix
+
+        path = options.get("database")
+        path = cache.sibling("dedup.sqlite3") if path is None else \
+            util.expand_path(path)
+        try:
+            self.database = DedupDatabase(path)
+        except Exception as exc:
+            self.log.warning("Failed to open database at '%s' (%s: %s)",
+                             path, exc.__class__.__name__, exc)
+            return
+        self.log.debug("Using database '%s'", path)
+
+        hooks = {"file": self.run}
+        if options.get("stream", True):
+            hooks["prepare-after"] = self.prepare
+        job.register_hooks(hooks, options)
+        job.register_hooks({"finalize": self.finalize})
+
+    def prepare(self, pathfmt):
+        DedupTee(self, pathfmt).attach(pathfmt.kwdict)
+
+    def run(self, pathfmt):
+        # extractors are allowed to reuse 'kwdict' objects
+        pathfmt.kwdict.pop("_hardlink", None)
+
+        path = pathfmt.temppath
+        try:
+            size = os.stat(path).st_size
+        except OSError:
+            return
+
+        tee = HashTee.find(pathfmt.kwdict, self)
+        if tee is not None and tee.match is not None:
+            # stopped download of a known file
+            return self._saved(pathfmt, size, tee.match)
+
+        if tee is not None and tee.complete(pathfmt):
+            digest = tee.hashes[0][1].hexdigest()
+            prefix = tee.prefix_digest
+        else:
+            digest, prefix = self._hash_file(path)
+
+        if (original := self.database.find(digest, size)) and \
+                original != pathfmt.realpath and \
+                self._usable(original, size):
+            try:
+                if not os.path.samefile(original, path):
+                    self._link(original, path)
+            except OSError as exc:
+                self.log.warning("Unable to link '%s' to '%s' (%s: %s)",
+                                 pathfmt.filename, original,
+                                 exc.__class__.__name__, exc)
+            else:
+                return self._saved(pathfmt, size, original)
+
+        self.database.add(digest, size, prefix, pathfmt.realpath)
+
+    def finalize(self, pathfmt):
+        if self.count:
+            self.log.info("Saved %sB by linking %s duplicate file%s",
+                          util.format_value(self.saved), self.count,
+                          "" if self.count == 1 else "s")
+        self.database.close()
+
+    def check_prefix(self, tee):
+        """Stop the download of a file whose prefix is already known"""
+        if not (result := self.database.find_prefix(
+                tee.prefix_digest, tee.total)):
+            return
+
+        original = result[0]
+        if not self._usable(original, tee.total):
+            return
+
+        try:
+            self._link(original, tee.pathfmt.temppath)
+        except OSError as exc:
+            self.log.debug("Unable to link '%s' (%s: %s)",
+                           original, exc.__class__.__name__, exc)
+            return
+
+        tee.match = original
+        raise exception.DownloadComplete()
+
+    def _saved(self, pathfmt, size, original):
+        self.count += 1
+        self.saved += size
+        self.log.debug("Linked duplicate of '%s'", original)
+        if self._link_file is os.link:
+            # setting its mtime would change that of 'original' as well
+            pathfmt.kwdict["_hardlink"] = original
+
+    def _usable(self, path, size):
+        """Return True if 'path' is an existing file of 'size' bytes"""
+        try:
+            return os.stat(path).st_size == size
+        except OSError:
+            return False
+
+    def _link(self, src, dst):
+        """Replace 'dst' with a link to 'src'"""
+        temp = dst + ".dedup"
+        util.remove_file(temp)
+        self._link_file(src, temp)
+        try:
+            os.replace(temp, dst)
+        except OSError:
+            util.remove_file(temp)
+            raise
+
+    def _hash_file(self, path):
+        """Return full and prefix hash digests of 'path'"""
+        digest = hashlib.new(self.algorithm)
+        prefix = None
+
+        with open(path, "rb") as fp:
+            if self.prefix:
+                data = fp.read(self.prefix)
+                digest.update(data)
+                if len(data) == self.prefix:
+                    prefix = f"{self.prefix}:{digest.hexdigest()}"
+
+            size = self.chunk_size
+            while data := fp.read(size):
+                digest.update(data)
+
+        return digest.hexdigest(), prefix
+
+
+class DedupTee(HashTee):
+    """HashTee additionally hashing the first 'prefix' bytes of a file"""
+    __slots__ = ("pathfmt", "total", "prefix_hash", "prefix_remaining",
+                 "prefix_digest", "match", "check")
+
+    def __init__(self, pp, pathfmt):
+        HashTee.__init__(self, pp, pp.names, pp.chunk_size)
+        self.pathfmt = pathfmt
+        self.prefix_digest = self.match = None
+
+    def start(self, fp, offset=0, size=None):
+        prefix = self.owner.prefix
+        self.total = size
+        self.prefix_hash = hashlib.new(self.owner.algorithm) \
+            if prefix else None
+        self.prefix_remaining = prefix
+        self.prefix_digest = self.match = None
+
+        # no early stop for data already present
+        self.check = False
+        update = HashTee.start(self, fp, offset, size)
+        self.check = size and size > prefix
+        return update
+
+    def update(self, data):
+        HashTee.update(self, data)
+
+        if self.prefix_hash is not None:
+            if len(data) < self.prefix_remaining:
+                self.prefix_hash.update(data)
+                self.prefix_remaining -= len(data)
+                return
+
+            self.prefix_hash.update(data[:self.prefix_remaining])
+            self.prefix_digest = \
+                f"{self.owner.prefix}:{self.prefix_hash.hexdigest()}"
+            self.prefix_hash = None
+            if self.check:
+                self.owner.check_prefix(self)
+
+
+class DedupDatabase():
+    """SQLite3 database mapping content hashes to file paths"""
+
+    def __init__(self, path):
+        import sqlite3
+        try:
+            con = sqlite3.connect(path, timeout=60, check_same_thread=False)
+        except sqlite3.OperationalError:
+            os.makedirs(os.path.dirname(path))
+            con = sqlite3.connect(path, timeout=60, check_same_thread=False)
+        con.isolation_level = None
+
+        self.connection = con
+        con.execute("CREATE TABLE IF NOT EXISTS files ("
+                    "hash TEXT, size INTEGER, prefix TEXT, path TEXT, "
+                    "PRIMARY KEY (hash, size))")
+        con.execute("CREATE INDEX IF NOT EXISTS files_prefix "
+                    "ON files (prefix, size)")
+
+    def close(self):
+        self.connection.close()
+
+    def find(self, digest, size):
+        """Return the path of a file with hash 'digest' and 'size'"""
+        if row := self.connection.execute(
+                "SELECT path FROM files WHERE hash=? AND size=?",
+                (digest, size)).fetchone():
+            return row[0]
+        return None
+
+    def find_prefix(self, prefix, size):
+        """Return path and hash of a file with 'prefix' digest and 'size'"""
+        return self.connection.execute(
+            "SELECT path, hash FROM files WHERE prefix=? AND size=?",
+            (prefix, size)).fetchone()
+
+    def add(self, digest, size, prefix, path):
+        self.connection.execute(
+            "INSERT OR REPLACE INTO files VALUES (?,?,?,?)",
+            (digest, size, prefix, path))
+
+
+def _reflink(src, dst):
+    """Create a copy-on-write clone of 'src' at 'dst'"""
+    try:
+        import fcntl
+    except ImportError:
+        raise OSError(errno.EOPNOTSUPP, "Reflinks are not supported")
+    FICLONE = 0x40049409
+
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        try:
+            fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+        except OSError:
+            fdst.close()
+            os.unlink(dst)
+            raise
+
+
+__postprocessor__ = DedupPP
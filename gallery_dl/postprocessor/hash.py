@@ -10,6 +10,7 @@
 
 from .common import PostProcessor
 import hashlib
+import os
 
 
 class HashPP(PostProcessor):
@@ -38,22 +39,35 @@ class HashPP(PostProcessor):
             events = ("file",)
         elif isinstance(events, str):
             events = events.split(",")
-        job.register_hooks({event: self.run for event in events}, options)
+        hooks = {event: self.run for event in events}
 
-    def run(self, pathfmt):
-        hashes = [
-            (key, hashlib.new(name))
-            for key, name in self.hashes
-        ]
+        if options.get("stream", True) and (
+                "file" in hooks or "after" in hooks):
+            # compute hashes while files get downloaded
+            hooks["prepare-after"] = self.prepare
+        job.register_hooks(hooks, options)
 
-        size = self.chunk_size
-        with self._open(pathfmt) as fp:
-            while True:
-                data = fp.read(size)
-                if not data:
-                    break
-                for _, h in hashes:
-                    h.update(data)
+    def prepare(self, pathfmt):
+        HashTee(self, self.hashes, self.chunk_size).attach(pathfmt.kwdict)
+
+    def run(self, pathfmt):
+        tee = HashTee.find(pathfmt.kwdict, self)
+        if tee is not None and tee.complete(pathfmt):
+            hashes = tee.hashes
+        else:
+            hashes = [
+                (key, hashlib.new(name))
+                for key, name in self.hashes
+            ]
+
+            size = self.chunk_size
+            with self._open(pathfmt) as fp:
+                while True:
+                    data = fp.read(size)
+                    if not data:
+                        break
+                    for _, h in hashes:
+                        h.update(data)
 
         for key, h in hashes:
             pathfmt.kwdict[key] = h.hexdigest()
@@ -68,4 +82,77 @@ class HashPP(PostProcessor):
             return open(pathfmt.realpath, "rb")
 
 
+class HashTee():
+    """Update hash digests with all data written to a file
+
+    Downloaders call 'start()' for each tee in a file's '_http_tee' list
+    before writing to it and pass all written data to the returned
+    function.
+    """
+    __slots__ = ("owner", "names", "chunk_size", "hashes", "size")
+
+    def __init__(self, owner, names, chunk_size=32768):
+        self.owner = owner
+        self.names = names
+        self.chunk_size = chunk_size
+        self.hashes = None
+        self.size = 0
+
+    def attach(self, kwdict):
+        """Add this tee to 'kwdict', replacing one of the same owner"""
+        tees = [tee for tee in kwdict.get("_http_tee") or ()
+                if tee.owner is not self.owner]
+        tees.append(self)
+        kwdict["_http_tee"] = tees
+
+    @staticmethod
+    def find(kwdict, owner):
+        """Return the tee of 'owner' in 'kwdict'"""
+        for tee in kwdict.get("_http_tee") or ():
+            if tee.owner is owner:
+                return tee
+        return None
+
+    def start(self, fp, offset=0, size=None):
+        """Start hashing data written to 'fp' at 'offset'
+
+        Data already present in front of 'offset' gets read from 'fp'.
+        """
+        self.hashes = [
+            (key, hashlib.new(name))
+            for key, name in self.names
+        ]
+        self.size = 0
+
+        if offset:
+            fp.seek(0)
+            remaining = offset
+            while remaining > 0:
+                data = fp.read(min(self.chunk_size, remaining))
+                if not data:
+                    break
+                remaining -= len(data)
+                self.update(data)
+            fp.seek(offset)
+
+        return self.update
+
+    def update(self, data):
+        for _, h in self.hashes:
+            h.update(data)
+        self.size += len(data)
+
+    def complete(self, pathfmt):
+        """Return True if all of the file's content got hashed"""
+        if self.hashes is None:
+            return False
+        try:
+            return os.stat(pathfmt.temppath).st_size == self.size
+        except OSError:
+            try:
+                return os.stat(pathfmt.realpath).st_size == self.size
+            except OSError:
+                return False
+
+
 __postprocessor__ = HashPP
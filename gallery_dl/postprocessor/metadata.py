@@ -10,6 +10,7 @@
 
 from .common import PostProcessor
 from .. import util, formatter
+import threading
 import json
 import sys
 import os
@@ -24,6 +25,7 @@ class MetadataPP(PostProcessor):
         cfmt = options.get("content-format") or options.get("format")
         omode = "w"
         filename = None
+        sink = False
 
         if mode == "tags":
             self.write = self._write_tags
@@ -59,6 +61,13 @@ class MetadataPP(PostProcessor):
             self._json_encode = self._make_encoder(options).encode
             omode = "a"
             filename = "data.jsonl"
+            sink = options.get("buffer", False)
+        elif mode == "sqlite":
+            self.write = self._write_sqlite
+            self._json_encode = self._make_encoder(options).encode
+            self._open_sink = self._open_sqlite
+            filename = "metadata.sqlite3"
+            sink = True
         else:
             self.write = self._write_json
             self._json_encode = self._make_encoder(options, 4).encode
@@ -103,6 +112,14 @@ class MetadataPP(PostProcessor):
         else:
             self.extension = options.get("extension", ext)
 
+        if sink and self.run == self._run_default:
+            # keep one output file open and write to it in batches
+            # until it changes or the job ends
+            self.run = self._run_sink
+            self._sink = self._sink_path = None
+            self._sink_lock = threading.Lock()
+            job.register_hooks({"finalize": self._close_sink})
+
         events = options.get("event")
         if events is None:
             events = ("file",)
@@ -131,11 +148,7 @@ class MetadataPP(PostProcessor):
         if archive and archive.check(pathfmt.kwdict):
             return
 
-        if util.WINDOWS and pathfmt.extended:
-            directory = pathfmt._extended_path(self._directory(pathfmt))
-        else:
-            directory = self._directory(pathfmt)
-        path = directory + self._filename(pathfmt)
+        directory, path = self._path(pathfmt)
 
         if self.meta_path is not None:
             pathfmt.kwdict[self.meta_path] = path
@@ -157,6 +170,59 @@ class MetadataPP(PostProcessor):
         if self.mtime:
             pathfmt.set_mtime(path)
 
+    _run_default = run
+
+    def _run_sink(self, pathfmt):
+        archive = self.archive
+        if archive and archive.check(pathfmt.kwdict):
+            return
+
+        directory, path = self._path(pathfmt)
+
+        if self.meta_path is not None:
+            pathfmt.kwdict[self.meta_path] = path
+
+        # 'background' postprocessors may run this in several threads
+        with self._sink_lock:
+            if path != self._sink_path:
+                if self.skip and os.path.exists(path):
+                    return
+                self._close_sink_impl()
+                pathfmt.makedirs(directory)
+                try:
+                    self._sink = self._open_sink(path)
+                except FileNotFoundError:
+                    # 'directory' got removed after it was created
+                    pathfmt.makedirs(directory, True)
+                    self._sink = self._open_sink(path)
+                self._sink_path = path
+
+            self.write(self._sink, pathfmt.kwdict, pathfmt)
+
+        if archive:
+            archive.add(pathfmt.kwdict)
+
+    def _open_sink(self, path):
+        return open(path, self.omode,
+                    encoding=self.encoding,
+                    newline=self.newline,
+                    buffering=65536)
+
+    def _open_sqlite(self, path):
+        if not os.path.isdir(os.path.dirname(path)):
+            # sqlite3 reports this only as generic OperationalError
+            raise FileNotFoundError(path)
+        return MetadataDatabase(path)
+
+    def _close_sink(self, _=None):
+        with self._sink_lock:
+            self._close_sink_impl()
+
+    def _close_sink_impl(self):
+        if self._sink is not None:
+            self._sink.close()
+            self._sink = self._sink_path = None
+
     def _run_stdout(self, pathfmt):
         self.write(sys.stdout, pathfmt.kwdict)
 
@@ -182,6 +248,14 @@ class MetadataPP(PostProcessor):
             except Exception:
                 pass
 
+    def _path(self, pathfmt):
+        """Return directory and full path of a metadata file"""
+        if util.WINDOWS and pathfmt.extended:
+            directory = pathfmt._extended_path(self._directory(pathfmt))
+        else:
+            directory = self._directory(pathfmt)
+        return directory, directory + self._filename(pathfmt)
+
     def _base(self, pathfmt):
         return pathfmt.realdirectory
 
@@ -246,11 +320,16 @@ class MetadataPP(PostProcessor):
 
         fp.write("\n".join(tags) + "\n")
 
-    def _write_json(self, fp, kwdict):
+    def _write_json(self, fp, kwdict, _=None):
         if self.filter:
             kwdict = self.filter(kwdict)
         fp.write(self._json_encode(kwdict) + "\n")
 
+    def _write_sqlite(self, database, kwdict, pathfmt):
+        if self.filter:
+            kwdict = self.filter(kwdict)
+        database.add(pathfmt.realpath, self._json_encode(kwdict))
+
     def _make_filter(self, options):
         if include := options.get("include"):
             if isinstance(include, str):
@@ -283,6 +362,75 @@ class MetadataPP(PostProcessor):
         )
 
 
+class MetadataDatabase():
+    """SQLite3 database mapping file paths to their metadata
+
+    Paths are stored relative to the database's directory.
+    It can be used from multiple threads.
+    """
+
+    def __init__(self, path, batch_size=100):
+        import sqlite3
+        self.directory = os.path.dirname(os.path.abspath(path))
+        self.connection = con = sqlite3.connect(
+            path, timeout=60, check_same_thread=False)
+        self.lock = threading.RLock()
+        self.batch_size = batch_size
+        self.rows = []
+
+        con.execute("CREATE TABLE IF NOT EXISTS metadata ("
+                    "path TEXT PRIMARY KEY, data TEXT)")
+
+    def close(self):
+        with self.lock:
+            self.commit()
+            self.connection.close()
+
+    def key(self, path):
+        """Return the database key for the file at 'path'"""
+        try:
+            path = os.path.relpath(path, self.directory)
+        except ValueError:
+            # different drives on Windows
+            pass
+        return path.replace(os.sep, "/")
+
+    def add(self, path, data):
+        """Queue JSON 'data' for the file at 'path' to be written"""
+        key = self.key(path)
+        with self.lock:
+            self.rows.append((key, data))
+            if len(self.rows) >= self.batch_size:
+                self.commit()
+
+    def commit(self):
+        """Write all queued entries"""
+        with self.lock:
+            if self.rows:
+                with self.connection:
+                    self.connection.executemany(
+                        "INSERT OR REPLACE INTO metadata VALUES (?,?)",
+                        self.rows)
+                self.rows.clear()
+
+    def get(self, path):
+        """Return the metadata of the file at 'path' or None"""
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT data FROM metadata WHERE path=?",
+                (self.key(os.path.abspath(path)),)).fetchone()
+        return util.json_loads(row[0]) if row else None
+
+    def __iter__(self):
+        """Yield (path, metadata) tuples of all stored files"""
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT path, data FROM metadata").fetchall()
+        for path, data in rows:
+            yield (os.path.join(self.directory, path),
+                   util.json_loads(data))
+
+
 def _traverse(obj, key):
     name, _, key = key.partition("[")
     obj = obj[name]
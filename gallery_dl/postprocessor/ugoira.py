@@ -10,10 +10,12 @@
 
 from .common import PostProcessor
 from .. import util, output
+import collections
 import subprocess
 import tempfile
 import zipfile
 import shutil
+import copy
 import os
 
 try:
@@ -42,6 +44,7 @@ class UgoiraPP(PostProcessor):
         self.mkvm_metadata = options.get("mkvmerge-metadata", True)
         self.skip = options.get("skip", True)
         self.uniform = self._convert_zip = self._convert_files = False
+        self.pipe = False
 
         ffmpeg = options.get("ffmpeg-location")
         self.ffmpeg = util.expand_path(ffmpeg) if ffmpeg else "ffmpeg"
@@ -64,6 +67,12 @@ class UgoiraPP(PostProcessor):
         elif mode == "image2":
             self._process = self._process_image2
             self._finalize = None
+        elif mode == "pipe":
+            self._process = self._process_pipe
+            self._finalize = None
+            self.pipe = True
+            if not self.twopass:
+                self._tempdir = util.NullContext
         elif mode == "archive":
             if ext is None:
                 ext = "zip"
@@ -108,6 +117,15 @@ class UgoiraPP(PostProcessor):
             "after"  : self.convert_from_files,
         }, options)
 
+        processes = options.get("processes", 1)
+        if processes > 1 and self._convert_impl == self.convert_to_animation:
+            self.processes = processes
+            self.pool = None
+            self.pending = collections.deque()
+            self._convert_impl = self.convert_to_animation_pool
+            self._defer = job.defer
+            job.register_hooks({"finalize": self.finalize})
+
     def prepare(self, pathfmt):
         self._convert_zip = self._convert_files = False
         if "_ugoira_frame_data" not in pathfmt.kwdict:
@@ -142,7 +160,7 @@ class UgoiraPP(PostProcessor):
         self._zip_ext = ext = pathfmt.extension
 
         with self._tempdir() as tempdir:
-            if tempdir:
+            if tempdir and not self.pipe:
                 try:
                     with zipfile.ZipFile(pathfmt.temppath) as zfile:
                         zfile.extractall(tempdir)
@@ -170,14 +188,14 @@ class UgoiraPP(PostProcessor):
             return
         self._zip_source = False
 
-        with tempfile.TemporaryDirectory() as tempdir:
+        with self._tempdir() as tempdir:
             for frame in self._files:
 
                 # update frame filename extension
                 frame["file"] = name = \
                     f"{frame['file'].partition('.')[0]}.{frame['ext']}"
 
-                if tempdir:
+                if tempdir and not self.pipe:
                     # move frame into tempdir
                     try:
                         self._copy_file(frame["path"], tempdir + "/" + name)
@@ -190,10 +208,9 @@ class UgoiraPP(PostProcessor):
             self._frames = self._files
             if self.convert(pathfmt, tempdir):
                 self.log.info(pathfmt.filename)
-                if self.delete:
-                    self.log.debug("Deleting frames")
-                    for frame in self._files:
-                        util.remove_file(frame["path"])
+                if self.delete and self._convert_impl != \
+                        self.convert_to_animation_pool:
+                    self._delete_frames(self._files)
 
     def convert(self, pathfmt, tempdir):
         pathfmt.set_extension(self.extension)
@@ -204,44 +221,153 @@ class UgoiraPP(PostProcessor):
         return self._convert_impl(pathfmt, tempdir)
 
     def convert_to_animation(self, pathfmt, tempdir):
-        # process frames and collect command-line arguments
-        args = self._process(pathfmt, tempdir)
-        if self.args_pp:
-            args += self.args_pp
-        if self.args:
-            args += self.args
-
-        # ensure target directory exists
-        os.makedirs(pathfmt.realdirectory, exist_ok=True)
+        self._zip_path = pathfmt.temppath
 
         # invoke ffmpeg
         try:
-            if self.twopass:
-                if "-f" not in self.args:
-                    args += ("-f", self.extension)
-                args += ("-passlogfile", tempdir + "/ffmpeg2pass", "-pass")
-                self._exec(args + ["1", "-y", os.devnull])
-                self._exec(args + ["2", pathfmt.realpath])
-            else:
-                args.append(pathfmt.realpath)
-                self._exec(args)
-            if self._finalize:
-                self._finalize(pathfmt, tempdir)
-        except OSError as exc:
-            output.stderr_write("\n")
-            self.log.error("Unable to invoke FFmpeg (%s: %s)",
-                           exc.__class__.__name__, exc)
-            self.log.traceback(exc)
+            for args, frames in self._commands(pathfmt, tempdir):
+                self._exec(args, frames)
+        except Exception as exc:
+            self._convert_error(exc)
             pathfmt.realpath = pathfmt.temppath
+        else:
+            if self.mtime:
+                pathfmt.set_mtime()
+            return True
+
+    def convert_to_animation_pool(self, pathfmt, tempdir):
+        """Run conversion processes in a worker thread"""
+        if tempdir:
+            # take over 'tempdir' from its context manager
+            path = tempdir + ".ugoira"
+            os.rename(tempdir, path)
+            os.mkdir(tempdir)
+            tempdir = path
+
+        if self._zip_source:
+            # keep frames available after the job moved or deleted the file
+            self._zip_path = path = pathfmt.temppath + ".ugoira"
+            util.remove_file(path)
+            try:
+                os.link(pathfmt.temppath, path)
+            except OSError:
+                shutil.copyfile(pathfmt.temppath, path)
+            restore = pathfmt.temppath if self.delete else None
+            cleanup = (tempdir, path, restore)
+        else:
+            cleanup = (tempdir, None, None)
+
+        try:
+            commands = self._commands(pathfmt, tempdir)
         except Exception as exc:
-            output.stderr_write("\n")
-            self.log.error("%s: %s", exc.__class__.__name__, exc)
-            self.log.traceback(exc)
+            self._convert_cleanup(*cleanup)
+            self._convert_error(exc)
             pathfmt.realpath = pathfmt.temppath
+            return None
+        except BaseException:
+            self._convert_cleanup(*cleanup)
+            raise
+
+        if self.pool is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self.pool = ThreadPoolExecutor(self.processes, "ugoira")
+
+        pending = self.pending
+        while pending and pending[0].done():
+            pending.popleft()
+        while len(pending) >= self.processes * 2:
+            pending.popleft().result()
+
+        # extractors are allowed to reuse and modify 'kwdict' objects
+        pathfmt = copy.copy(pathfmt)
+        pathfmt.kwdict = pathfmt.kwdict.copy()
+
+        future = self.pool.submit(
+            self._convert_worker, pathfmt, commands, cleanup,
+            None if self._zip_source or not self.delete else self._files)
+        pending.append(future)
+
+        # hold back archive entries and later postprocessors
+        # until the output file exists
+        self._defer(future)
+        return True
+
+    def finalize(self, _):
+        """Wait for all pending conversions to finish"""
+        if self.pool is not None:
+            while self.pending:
+                self.pending.popleft().result()
+            self.pool.shutdown()
+            self.pool = None
+
+    def _convert_worker(self, pathfmt, commands, cleanup, frames):
+        tempdir, source, restore = cleanup
+        try:
+            for args, input in commands:
+                self._exec(args, input)
+        except Exception as exc:
+            self._convert_error(exc)
+            if restore:
+                # put the downloaded ZIP archive back in place
+                os.replace(source, restore)
+            return False
         else:
             if self.mtime:
                 pathfmt.set_mtime()
+            if frames:
+                self._delete_frames(frames)
             return True
+        finally:
+            self._convert_cleanup(tempdir, source)
+
+    def _convert_cleanup(self, tempdir, source, _=None):
+        if source:
+            util.remove_file(source)
+        if tempdir:
+            shutil.rmtree(tempdir, ignore_errors=True)
+
+    def _convert_error(self, exc):
+        output.stderr_write("\n")
+        if isinstance(exc, OSError):
+            self.log.error("Unable to invoke FFmpeg (%s: %s)",
+                           exc.__class__.__name__, exc)
+        else:
+            self.log.error("%s: %s", exc.__class__.__name__, exc)
+        self.log.traceback(exc)
+
+    def _commands(self, pathfmt, tempdir):
+        """Return a list of (arguments, frame input) tuples to run"""
+        # process frames and collect command-line arguments
+        args = self._process(pathfmt, tempdir)
+        if self.args_pp:
+            args += self.args_pp
+        if self.args:
+            args += self.args
+        frames = self._input if self.pipe else None
+
+        # ensure target directory exists;
+        # ffmpeg failing to write into a removed one
+        # cannot be caught and retried as FileNotFoundError
+        pathfmt.makedirs(force=True)
+
+        if self.twopass:
+            if "-f" not in self.args:
+                args += ("-f", self.extension)
+            args += ("-passlogfile", tempdir + "/ffmpeg2pass", "-pass")
+            commands = [(args + ["1", "-y", os.devnull], frames),
+                        (args + ["2", pathfmt.realpath], frames)]
+        else:
+            args.append(pathfmt.realpath)
+            commands = [(args, frames)]
+
+        if self._finalize:
+            commands.append((self._finalize(pathfmt, tempdir), None))
+        return commands
+
+    def _delete_frames(self, frames):
+        self.log.debug("Deleting frames")
+        for frame in frames:
+            util.remove_file(frame["path"])
 
     def convert_to_archive(self, pathfmt, tempdir):
         frames = self._frames
@@ -297,10 +423,27 @@ class UgoiraPP(PostProcessor):
     _convert_impl = convert_to_animation
     _tempdir = tempfile.TemporaryDirectory
 
-    def _exec(self, args):
+    def _exec(self, args, frames=None):
         self.log.debug(args)
         out = None if self.output else subprocess.DEVNULL
-        if retcode := util.Popen(args, stdout=out, stderr=out).wait():
+        if frames is None:
+            retcode = util.Popen(args, stdout=out, stderr=out).wait()
+        else:
+            process = util.Popen(
+                args, stdin=subprocess.PIPE, stdout=out, stderr=out)
+            try:
+                with process.stdin as fp:
+                    self._write_frames(fp, frames)
+            except BrokenPipeError:
+                # ffmpeg exited early; its exit status tells why
+                pass
+            except BaseException:
+                process.kill()
+                process.wait()
+                raise
+            retcode = process.wait()
+
+        if retcode:
             output.stderr_write("\n")
             self.log.error("Non-zero exit status when running %s (%s)",
                            args, retcode)
@@ -354,6 +497,41 @@ class UgoiraPP(PostProcessor):
                    f"{frame['file'].rpartition('.')[2]}"),
         ]
 
+    def _process_pipe(self, pathfmt, tempdir):
+        frames = self._frames
+
+        # emulate non-uniform delays by repeating frames
+        delay = max(self._delay_gcd(frames), 10)
+        self._input = (
+            self._zip_path if self._zip_source else None,
+            [(frame["file"] if self._zip_source else frame["path"],
+              max(round(frame["delay"] / delay), 1))
+             for frame in frames],
+        )
+
+        return [
+            self.ffmpeg,
+            "-f", "image2pipe",
+            "-framerate", f"1000/{delay}",
+            "-i", "-",
+        ]
+
+    def _write_frames(self, fp, frames):
+        """Write frame data to 'fp' in display order"""
+        path, frames = frames
+        if path:
+            with zipfile.ZipFile(path) as zfile:
+                for name, count in frames:
+                    data = zfile.read(name)
+                    for _ in range(count):
+                        fp.write(data)
+        else:
+            for path, count in frames:
+                with open(path, "rb") as frame:
+                    data = frame.read()
+                for _ in range(count):
+                    fp.write(data)
+
     def _process_mkvmerge(self, pathfmt, tempdir):
         self._realpath = pathfmt.realpath
         pathfmt.realpath = f"{tempdir}/temp.{self.extension}"
@@ -385,7 +563,7 @@ class UgoiraPP(PostProcessor):
         args += ("=", pathfmt.realpath)
 
         pathfmt.realpath = self._realpath
-        self._exec(args)
+        return args
 
     def _write_ffmpeg_concat(self, tempdir, duration=True):
         content = ["ffconcat version 1.0"]
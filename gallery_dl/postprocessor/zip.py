@@ -10,6 +10,7 @@
 
 from .common import PostProcessor
 from .. import util
+import threading
 import zipfile
 import os
 
@@ -40,10 +41,22 @@ class ZipPP(PostProcessor):
         self.args = (self.path + ext, "a",
                      self.COMPRESSION_ALGORITHMS[algorithm], True)
 
-        job.register_hooks({
-            "file": (self.write_safe if options.get("mode") == "safe" else
-                     self.write_fast),
-        }, options)
+        mode = options.get("mode")
+        if mode == "safe":
+            hooks = {"file": self.write_safe}
+            self.batch = options.get("batch-size", 1)
+        elif mode == "stream":
+            hooks = {"file": self.write_safe}
+            self.batch = options.get("batch-size", 1)
+            if self.delete:
+                hooks["prepare-after"] = self.prepare
+        else:
+            hooks = {"file": self.write_fast}
+            self.batch = 0
+        self.count = 0
+        self.lock = threading.Lock()
+
+        job.register_hooks(hooks, options)
         job.hooks["finalize"].append(self.finalize)
 
     def open(self):
@@ -70,8 +83,54 @@ class ZipPP(PostProcessor):
         self.write(pathfmt, self.zfile)
 
     def write_safe(self, pathfmt):
-        with self.open() as zfile:
-            self.write(pathfmt, zfile)
+        with self.lock:
+            if self.zfile is None:
+                self.zfile = self.open()
+            self.write(pathfmt, self.zfile)
+
+            # update the archive's central directory every 'batch' files
+            self.count += 1
+            if self.batch and self.count >= self.batch:
+                self.count = 0
+                self.zfile.close()
+                self.zfile = None
+
+    def prepare(self, pathfmt):
+        pathfmt.kwdict["_http_sink"] = self.sink
+
+    def sink(self, pathfmt, size=None):
+        """Return a file object writing directly into the archive
+
+        Return None when the archive is currently in use
+        or already contains a file with the same name.
+        """
+        if not self.lock.acquire(False):
+            return None
+        try:
+            if self.zfile is None:
+                self.zfile = self.open()
+            zfile = self.zfile
+            if pathfmt.filename in zfile.NameToInfo:
+                self.lock.release()
+                return None
+            return ZipSink(self, pathfmt.filename, zfile.open(
+                pathfmt.filename, "w",
+                force_zip64=not size or size > zipfile.ZIP64_LIMIT))
+        except BaseException:
+            self.lock.release()
+            raise
+
+    def discard(self, name):
+        """Drop the last written member 'name' from the current archive
+
+        Its data gets overwritten by the next member
+        or cut off when closing the archive.
+        """
+        zfile = self.zfile
+        info = zfile.NameToInfo.pop(name)
+        zfile.filelist.remove(info)
+        zfile.start_dir = info.header_offset
+        zfile.fp.seek(info.header_offset)
 
     def write_extra(self, pathfmt, zfile, files):
         for path in map(util.expand_path, files):
@@ -100,4 +159,38 @@ class ZipPP(PostProcessor):
                 util.remove_file(self.zfile.filename)
 
 
+class ZipSink():
+    """Write-only file object for a single ZIP archive member"""
+    __slots__ = ("zpp", "name", "fp", "size")
+
+    def __init__(self, zpp, name, fp):
+        self.zpp = zpp
+        self.name = name
+        self.fp = fp
+        self.size = 0
+
+    def write(self, data):
+        self.size += len(data)
+        return self.fp.write(data)
+
+    def tell(self):
+        return self.size
+
+    def close(self):
+        try:
+            self.fp.close()
+        finally:
+            self.zpp.lock.release()
+
+    def abort(self):
+        """Discard this member and everything written to it"""
+        # 'ZipFile.open(…, "w")' provides no way to cancel a write;
+        # finish this member and remove it from the archive's index
+        try:
+            self.fp.close()
+            self.zpp.discard(self.name)
+        finally:
+            self.zpp.lock.release()
+
+
 __postprocessor__ = ZipPP
@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2026 Mike Fährmann
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 2 as
+# published by the Free Software Foundation.
+
+"""Shared request rate limits"""
+
+import time
+import pickle
+import logging
+import threading
+from . import cache, dt
+
+log = logging.getLogger("ratelimit")
+_limits = {}
+
+# adaptive rate control
+ADAPT_INITIAL = 1.0    # interval after the first failure
+ADAPT_BACKOFF = 2.0    # interval multiplier after a failure
+ADAPT_INCREASE = 0.1   # requests per second added after ADAPT_WINDOW ...
+ADAPT_WINDOW = 20      # ... consecutive successful requests
+ADAPT_MIN = 0.05       # shortest interval before removing it entirely
+ADAPT_MAX = 300.0      # longest interval
+ADAPT_MAXAGE = 30 * 86400
+
+
+def get(key):
+    """Return the RateLimit for 'key'"""
+    try:
+        return _limits[key]
+    except KeyError:
+        return _limits.setdefault(key, RateLimit())
+
+
+def adaptive(key):
+    """Return the RateLimit for 'key' with adaptive rate control enabled
+
+    Its interval gets initialized with the value stored in the cache
+    database by a previous run.
+    """
+    limit = get(key)
+    if limit.adaptive:
+        return limit
+
+    with limit.lock:
+        if not limit.adaptive:
+            limit.adaptive = key
+            if interval := _load(key):
+                log.debug("%s: Using interval of %.2f seconds",
+                          key, interval)
+                limit.interval = interval
+    return limit
+
+
+def stats():
+    """Return request and wait time statistics for all rate limits"""
+    return {
+        key: {
+            "requests": limit.requests,
+            "waits"   : limit.waits,
+            "waited"  : round(limit.waited, 3),
+            "interval": round(limit.interval, 3),
+        }
+        for key, limit in tuple(_limits.items())
+    }
+
+
+def retry_after(response):
+    """Return the number of seconds in a 'Retry-After' header or 0.0"""
+    if not (value := response.headers.get("retry-after")):
+        return 0.0
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    if (date := dt.parse(value, "%a, %d %b %Y %H:%M:%S GMT")) is dt.NONE:
+        return 0.0
+    return dt.to_ts(date) - time.time()
+
+
+class RateLimit():
+    """Token bucket shared by all requests for one key
+
+    Tokens get refilled once per 'interval' seconds
+    and the bucket holds up to 'burst' tokens.
+    This is implemented as a 'theoretical arrival time' (tat),
+    the earliest time the next request could start without any burst.
+    """
+    __slots__ = ("lock", "tat", "requests", "waits", "waited",
+                 "adaptive", "interval", "successes", "backoff")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.tat = self.waited = self.interval = self.backoff = 0.0
+        self.requests = self.waits = self.successes = 0
+        self.adaptive = None
+
+    def acquire(self, interval=0.0, burst=1):
+        """Reserve a token and return the seconds to wait for it"""
+        with self.lock:
+            if interval < self.interval:
+                interval = self.interval
+            now = time.monotonic()
+            tat = self.tat if self.tat > now else now
+            self.tat = tat + interval
+            self.requests += 1
+
+            seconds = tat - now
+            if burst > 1:
+                seconds -= (burst - 1) * interval
+            if seconds <= 0.0:
+                return 0.0
+            self.waits += 1
+            self.waited += seconds
+        return seconds
+
+    def release(self, interval=0.0, burst=1):
+        """Count 'interval' from the end of a finished request"""
+        with self.lock:
+            if interval < self.interval:
+                interval = self.interval
+            until = time.monotonic() + interval
+            if burst > 1:
+                until -= (burst - 1) * interval
+            if until > self.tat:
+                self.tat = until
+
+    def block(self, seconds):
+        """Delay all further requests by at least 'seconds'"""
+        until = time.monotonic() + seconds
+        with self.lock:
+            if until > self.tat:
+                self.tat = until
+
+    def update(self, response):
+        """Block requests until the reset time of an exhausted rate limit
+
+        Return the number of seconds to wait.
+        """
+        headers = response.headers
+        if (remaining := headers.get("x-ratelimit-remaining")) is None:
+            return 0.0
+        try:
+            if float(remaining) > 0.0:
+                return 0.0
+            reset = float(headers["x-ratelimit-reset"])
+        except (KeyError, ValueError):
+            return 0.0
+
+        if reset > 1e12:
+            # timestamp in milliseconds
+            seconds = reset / 1000.0 - time.time()
+        elif reset > 1e9:
+            # timestamp in seconds
+            seconds = reset - time.time()
+        else:
+            seconds = reset
+
+        if seconds <= 0.0:
+            return 0.0
+        self.block(seconds)
+        return seconds
+
+    def success(self):
+        """Shorten the adaptive interval after enough successful requests"""
+        with self.lock:
+            if not self.interval:
+                return
+            self.successes += 1
+            if self.successes < ADAPT_WINDOW:
+                return
+            self.successes = 0
+
+            interval = 1.0 / (1.0 / self.interval + ADAPT_INCREASE)
+            self.interval = interval = \
+                interval if interval >= ADAPT_MIN else 0.0
+        _store(self.adaptive, interval)
+
+    def failure(self):
+        """Lengthen the adaptive interval after a rate-limited request"""
+        with self.lock:
+            self.successes = 0
+
+            # ignore failures of requests sent before the last backoff
+            now = time.monotonic()
+            if now - self.backoff < self.interval:
+                return
+            self.backoff = now
+
+            interval = self.interval * ADAPT_BACKOFF \
+                if self.interval else ADAPT_INITIAL
+            self.interval = interval = \
+                interval if interval <= ADAPT_MAX else ADAPT_MAX
+        log.debug("%s: Increasing interval to %.2f seconds",
+                  self.adaptive, interval)
+        _store(self.adaptive, interval)
+
+
+def _key(key):
+    return f"gallery_dl.ratelimit-{key}"
+
+
+def _load(key):
+    """Return the interval for 'key' stored in the cache database"""
+    if (db := cache.database()) is None:
+        return 0.0
+    try:
+        row = db.execute(
+            "SELECT value FROM data WHERE key=? AND expires > ? LIMIT 1",
+            (_key(key), int(time.time()))).fetchone()
+        return pickle.loads(row[0]) if row else 0.0
+    except Exception as exc:
+        log.debug("%s: Failed to load interval (%s: %s)",
+                  key, exc.__class__.__name__, exc)
+        return 0.0
+
+
+def _store(key, interval):
+    """Store the interval for 'key' in the cache database"""
+    if (db := cache.database()) is None:
+        return
+    try:
+        with db:
+            db.execute(
+                "INSERT OR REPLACE INTO data VALUES (?,?,?)",
+                (_key(key), pickle.dumps(interval),
+                 int(time.time()) + ADAPT_MAXAGE))
+    except Exception as exc:
+        log.debug("%s: Failed to store interval (%s: %s)",
+                  key, exc.__class__.__name__, exc)
@@ -0,0 +1,380 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2026 Mike Fährmann
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 2 as
+# published by the Free Software Foundation.
+
+"""Run jobs submitted over HTTP or a UNIX socket"""
+
+import io
+import os
+import hmac
+import json
+import stat
+import queue
+import secrets
+import logging
+import itertools
+import threading
+import collections
+import socketserver
+from http import server as http
+from . import config, extractor, job, exception, ratelimit, util, version
+
+log = logging.getLogger("server")
+
+JOBTYPES = {
+    "download": job.DownloadJob,
+    "simulate": job.SimulationJob,
+    "data"    : job.DataJob,
+}
+
+# options a submitted job is allowed to set
+# (no paths, format strings, filters, post processors, or cookies)
+OPTIONS = {
+    "chapter-range",
+    "chapter-unique",
+    "image-range",
+    "image-unique",
+    "include",
+    "videos",
+    "skip",
+    "retries",
+    "timeout",
+    "sleep",
+    "sleep-request",
+    "sleep-extractor",
+    "rate",
+    "part",
+    "mtime",
+}
+
+
+class Server():
+    """Queue and run jobs while keeping state between them
+
+    Jobs run one after another in a single worker thread,
+    with their options applied to this thread's configuration only.
+    Extractors with the same category, options, and 'cookies' setting
+    share their 'requests' session, i.e. cookies and connection pools.
+    """
+
+    def __init__(self, jobtype=None, history=1000, options=None):
+        self.jobtype = jobtype or job.DownloadJob
+        self.history = history
+        self.options = OPTIONS.union(options) if options else OPTIONS
+        self.jobs = collections.OrderedDict()
+        self.sessions = {}
+        self.queue = queue.Queue()
+        self.lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self._worker, name="server-worker", daemon=True)
+        self._thread.start()
+
+    def stop(self, wait=False):
+        if self._thread is not None:
+            self.queue.put(None)
+            if wait:
+                self._thread.join()
+            self._thread = None
+
+    def submit(self, data):
+        """Add a new job described by 'data' to the queue"""
+        urls = data.get("urls") or data.get("url")
+        if isinstance(urls, str):
+            urls = (urls,)
+        if not urls or not isinstance(urls, (list, tuple)) or \
+                not all(isinstance(url, str) for url in urls):
+            raise ValueError("'urls' must be a string or list of strings")
+
+        jobtype = data.get("type")
+        if jobtype is None:
+            jobtype = self.jobtype
+        elif jobtype in JOBTYPES:
+            jobtype = JOBTYPES[jobtype]
+        else:
+            raise ValueError(f"Invalid job type '{jobtype}'")
+
+        options = []
+        if (opts := data.get("options")) is not None:
+            if not isinstance(opts, dict):
+                raise ValueError("'options' must be an object")
+            for key, value in opts.items():
+                path = key.split(".")
+                if path[0] not in ("extractor", "downloader") or \
+                        path[-1] not in self.options:
+                    raise ValueError(f"Option '{key}' is not allowed")
+                options.append((path[:-1], path[-1], value))
+
+        entry = {
+            "id"     : next(self._ids),
+            "status" : "queued",
+            "urls"   : list(urls),
+            "results": [],
+            "exit"   : None,
+        }
+        entry_event = threading.Event()
+
+        with self.lock:
+            self.jobs[entry["id"]] = (entry, entry_event)
+            while len(self.jobs) > self.history:
+                _, (old, _) = next(iter(self.jobs.items()))
+                if old["status"] != "finished":
+                    break
+                self.jobs.popitem(last=False)
+
+        self.queue.put((entry, entry_event, jobtype, options))
+        return entry, entry_event
+
+    def status(self, job_id=None):
+        """Return the status of one or all jobs"""
+        with self.lock:
+            if job_id is None:
+                return [entry for entry, _ in self.jobs.values()]
+            if job_id in self.jobs:
+                return self.jobs[job_id][0]
+        return None
+
+    def _worker(self):
+        while (item := self.queue.get()) is not None:
+            entry, event, jobtype, options = item
+            entry["status"] = "running"
+            try:
+                with config.local(options):
+                    entry["exit"] = self.run(
+                        entry, jobtype, options)
+            except Exception as exc:
+                log.error("%s: %s", exc.__class__.__name__, exc)
+                log.debug("", exc_info=exc)
+                entry["exit"] = 1
+            finally:
+                entry["status"] = "finished"
+                event.set()
+
+    def run(self, entry, jobtype, options):
+        """Run 'jobtype' for all URLs of 'entry'"""
+        retval = 0
+        results = entry["results"]
+        options = util.json_dumps(options) if options else None
+
+        for url in entry["urls"]:
+            result = {"url": url}
+
+            while True:
+                try:
+                    log.debug("Starting %s for '%s'", jobtype.__name__, url)
+
+                    if (extr := extractor.find(url)) is None:
+                        raise exception.NoExtractorError()
+                    key = (extr.category, options,
+                           util.json_dumps(extr.config("cookies")))
+                    if (session := self.sessions.get(key)) is not None:
+                        extr.session = session
+                        extr.cookies = session.cookies
+                        # reload cookies from their source, which also
+                        # sets 'cookies_file' for 'cookies-update'
+                        if extr.cookies_domain is not None:
+                            extr._init_cookies()
+
+                    if jobtype is job.DataJob:
+                        djob = jobtype(extr, file=io.StringIO())
+                        status = djob.run()
+                        result["data"] = djob.data
+                    else:
+                        status = jobtype(extr).run()
+
+                    if session is None and extr.session is not None:
+                        self.sessions[key] = extr.session
+
+                except exception.RestartExtraction:
+                    log.debug("Restarting '%s'", url)
+                    continue
+                except exception.ControlException:
+                    status = 0
+                except exception.NoExtractorError:
+                    log.error("Unsupported URL '%s'", url)
+                    status = 64
+                break
+
+            result["status"] = status
+            results.append(result)
+            retval |= status
+
+        return retval
+
+
+class RequestHandler(http.BaseHTTPRequestHandler):
+    """HTTP interface
+
+    POST /jobs        submit a job
+    GET  /jobs        list all jobs
+    GET  /jobs/ID     show job status
+    GET  /ratelimits  show request and wait time statistics
+
+    All requests need an 'Authorization: Bearer TOKEN' header.
+    """
+    server_version = f"gallery-dl/{version.__version__}"
+
+    def do_GET(self):
+        if not self.authorize():
+            return
+        path = self.path.rstrip("/")
+        if path == "/jobs":
+            return self.send_json(200, self.server.gdl.status())
+
+        if path == "/ratelimits":
+            return self.send_json(200, ratelimit.stats())
+
+        if path.startswith("/jobs/"):
+            try:
+                job_id = int(path[6:])
+            except ValueError:
+                job_id = 0
+            if (entry := self.server.gdl.status(job_id)) is not None:
+                return self.send_json(200, entry)
+
+        self.send_json(404, {"error": "Not Found"})
+
+    def do_POST(self):
+        if not self.authorize():
+            return
+        if self.path.rstrip("/") != "/jobs":
+            return self.send_json(404, {"error": "Not Found"})
+
+        ctype = self.headers.get("Content-Type") or ""
+        if ctype.partition(";")[0].strip().lower() != "application/json":
+            return self.send_json(415, {
+                "error": "Content-Type must be 'application/json'"})
+
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            data = json.loads(self.rfile.read(length))
+            if not isinstance(data, dict):
+                raise ValueError("Expected a JSON object")
+            entry, event = self.server.gdl.submit(data)
+        except Exception as exc:
+            return self.send_json(400, {
+                "error": f"{exc.__class__.__name__}: {exc}"})
+
+        if data.get("wait"):
+            event.wait()
+            self.send_json(200, entry)
+        else:
+            self.send_json(202, entry)
+
+    def authorize(self):
+        """Check this request's token and send an error response if invalid
+
+        Browsers do not send an 'Authorization' header
+        with cross-origin requests without a CORS preflight,
+        which this server never allows.
+        """
+        auth = self.headers.get("Authorization") or ""
+        scheme, _, token = auth.partition(" ")
+        if scheme.lower() == "bearer" and hmac.compare_digest(
+                token.strip().encode(), self.server.token.encode()):
+            return True
+        self.send_json(401, {"error": "Unauthorized"})
+        return False
+
+    def send_json(self, code, data):
+        body = util.json_dumps(data).encode()
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        log.debug(format, *args)
+
+
+class HTTPServer(http.ThreadingHTTPServer):
+    daemon_threads = True
+
+
+if hasattr(socketserver, "UnixStreamServer"):
+    class UnixServer(socketserver.ThreadingMixIn,
+                     socketserver.UnixStreamServer):
+        daemon_threads = True
+
+        def get_request(self):
+            request, _ = self.socket.accept()
+            # BaseHTTPRequestHandler expects a (host, port) tuple
+            return request, ("unix", 0)
+else:
+    UnixServer = None
+
+
+def build_server(address):
+    """Return an HTTP server listening on 'address'
+
+    'address' is either a 'HOST:PORT' pair, a port number,
+    or the path of a UNIX socket.
+    """
+    host, _, port = address.rpartition(":")
+    if port.isdecimal() and "/" not in address:
+        return HTTPServer((host or "127.0.0.1", int(port)), RequestHandler)
+
+    if UnixServer is None:
+        raise ValueError("UNIX sockets are not supported on this platform")
+    path = util.expand_path(address)
+    try:
+        mode = os.stat(path).st_mode
+    except FileNotFoundError:
+        pass
+    else:
+        # remove the leftover socket of a previous run, but nothing else
+        if not stat.S_ISSOCK(mode):
+            raise ValueError(f"'{path}' exists and is not a socket")
+        os.unlink(path)
+    return UnixServer(path, RequestHandler)
+
+
+def serve(address, jobtype=None):
+    """Accept and run jobs until interrupted"""
+    try:
+        srv = build_server(address)
+    except Exception as exc:
+        log.error("Unable to listen on '%s' (%s: %s)",
+                  address, exc.__class__.__name__, exc)
+        return 1
+
+    srv.gdl = gdl = Server(
+        jobtype,
+        config.get(("server",), "history", 1000),
+        config.get(("server",), "options"),
+    )
+    if not (token := config.get(("server",), "token")):
+        token = secrets.token_urlsafe(24)
+        log.info("Token: %s", token)
+    srv.token = token
+    gdl.start()
+
+    try:
+        import signal
+        signal.signal(signal.SIGTERM, _sigterm)
+    except Exception:
+        pass
+
+    log.info("Listening on %s", address)
+    try:
+        srv.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        srv.server_close()
+        gdl.stop()
+        if UnixServer is not None and isinstance(srv, UnixServer):
+            util.remove_file(srv.server_address)
+    return 0
+
+
+def _sigterm(signum, frame):
+    raise KeyboardInterrupt()
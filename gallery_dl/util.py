@@ -16,6 +16,7 @@ import random
 import getpass
 import hashlib
 import binascii
+import threading
 import functools
 import itertools
 import subprocess
@@ -577,6 +578,108 @@ class NullContext():
         pass
 
 
+class OverlayDict(dict):
+    """dict with read-only access to the entries of a shared 'base' dict
+
+    New or changed entries get stored in the OverlayDict itself,
+    leaving 'base' unmodified. Removing an entry
+    turns the OverlayDict into a regular, independent copy.
+    """
+    __slots__ = ("base",)
+
+    def __init__(self, base, *args, **kwargs):
+        dict.__init__(self, *args, **kwargs)
+        if dict.__len__(self):
+            self.base = base
+        else:
+            # empty dicts get serialized as '{}' by the C json encoder
+            dict.update(self, base)
+            self.base = {}
+
+    def __missing__(self, key):
+        return self.base[key]
+
+    def __contains__(self, key):
+        return dict.__contains__(self, key) or key in self.base
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def __eq__(self, other):
+        return dict(self.items()) == other
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+    def __delitem__(self, key):
+        self._detach()
+        dict.__delitem__(self, key)
+
+    def __reduce__(self):
+        return (dict, (dict(self.items()),))
+
+    __hash__ = None
+
+    def get(self, key, default=None):
+        if dict.__contains__(self, key):
+            return dict.__getitem__(self, key)
+        return self.base.get(key, default)
+
+    def setdefault(self, key, default=None):
+        if key in self:
+            return self[key]
+        self[key] = default
+        return default
+
+    def pop(self, key, *default):
+        if key in self:
+            self._detach()
+        return dict.pop(self, key, *default)
+
+    def popitem(self):
+        self._detach()
+        return dict.popitem(self)
+
+    def clear(self):
+        dict.clear(self)
+        self.base = {}
+
+    def copy(self):
+        return OverlayDict(self.base, dict.items(self))
+
+    def keys(self):
+        if not self.base:
+            return dict.keys(self)
+        keys = dict.fromkeys(self.base)
+        keys.update(dict.fromkeys(dict.keys(self)))
+        return keys.keys()
+
+    def values(self):
+        return [self[key] for key in self.keys()]
+
+    def items(self):
+        if not self.base:
+            return dict.items(self)
+        items = self.base.copy()
+        items.update(dict.items(self))
+        return items.items()
+
+    def _detach(self):
+        """Copy all entries of 'base' into this dict"""
+        if base := self.base:
+            own = dict(dict.items(self))
+            dict.clear(self)
+            dict.update(self, base)
+            dict.update(self, own)
+            self.base = {}
+
+
 class NullResponse():
     __slots__ = ("url", "reason")
 
@@ -703,6 +806,40 @@ class Flags():
         raise exception.StopExtraction()
 
 
+class LocalFlags():
+    """Access the Flags object of the current thread
+
+    Threads running a job with its own Flags select them with 'use()',
+    all others share a common, process-wide Flags object.
+    """
+    __slots__ = ("_local", "_default")
+
+    def __init__(self):
+        object.__setattr__(self, "_local", threading.local())
+        object.__setattr__(self, "_default", Flags())
+
+    def __getattr__(self, name):
+        return getattr(self.current(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self.current(), name, value)
+
+    def current(self):
+        """Return the Flags object of the current thread"""
+        return getattr(self._local, "flags", self._default)
+
+    def get(self):
+        """Return the Flags object selected for the current thread or None"""
+        return getattr(self._local, "flags", None)
+
+    def use(self, flags):
+        """Use 'flags' for the current thread, or the common ones if None"""
+        if flags is None:
+            self._local.__dict__.pop("flags", None)
+        else:
+            self._local.flags = flags
+
+
 # v137.0 release of Firefox on 2025-04-01 has ordinal 739342
 # 735506 == 739342 - 137 * 28
 # v135.0 release of Chrome  on 2025-04-01 has ordinal 739342
@@ -719,7 +856,7 @@ re = text.re
 re_compile = text.re_compile
 
 NONE = CustomNone()
-FLAGS = Flags()
+FLAGS = LocalFlags()
 WINDOWS = (os.name == "nt")
 SENTINEL = object()
 EXECUTABLE = getattr(sys, "frozen", False)
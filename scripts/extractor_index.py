@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Copyright 2026 Mike Fährmann
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 2 as
+# published by the Free Software Foundation.
+
+"""Generate an index mapping URL domains to extractor classes
+
+Besides the domain index, the generated module contains the pattern
+of each extractor class, which allows extractor.find() to only import
+the module of a matching extractor.
+"""
+
+import os
+import re
+import sys
+import json
+import textwrap
+import collections
+
+import util
+from gallery_dl import extractor
+from gallery_dl.extractor import common
+
+try:
+    import re._parser as sre_parse
+    import re._constants as sre
+except ImportError:
+    import sre_parse
+    import sre_constants as sre
+
+
+# placeholders for non-literal pattern parts
+ANY = "\1"   # may match anything, including '/'
+HOST = "\0"  # does not match '/'
+
+MAX_EXPANSIONS = 5000
+
+# config options changing extractor patterns at import time
+CONFIG = (
+    ("bunkr", "tlds"),
+    ("generic", "enabled"),
+    ("ytdl", "enabled"),
+)
+
+# only used as index key when there is no other choice
+GENERIC_LABELS = {
+    "www", "m", "com", "net", "org", "co", "http", "https"}
+
+REPEAT = (sre.MAX_REPEAT, sre.MIN_REPEAT,
+          getattr(sre, "POSSESSIVE_REPEAT", None))
+
+
+class Unindexable(Exception):
+    """Pattern cannot be reduced to a set of domains"""
+
+
+def expand(items, strings):
+    """Expand parsed regex 'items' into literal prefixes of URLs
+
+    Stops expanding a string once it contains the host of a URL.
+    """
+    done = []
+    for op, av in items:
+        done.extend(s for s in strings if host_complete(s))
+        strings = [s for s in strings if not host_complete(s)]
+        if not strings:
+            break
+
+        if op is sre.LITERAL:
+            char = chr(av).lower()
+            strings = [s + char for s in strings]
+
+        elif op is sre.IN and 0 < len(chars := in_literals(av)) <= 8:
+            strings = [s + char for s in strings for char in chars]
+
+        elif op is sre.BRANCH:
+            result = []
+            for branch in av[1]:
+                result.extend(expand(branch, strings))
+            strings = result
+
+        elif op is sre.SUBPATTERN:
+            strings = expand(av[-1], strings)
+
+        elif op is getattr(sre, "ATOMIC_GROUP", None):
+            strings = expand(av, strings)
+
+        elif op in REPEAT:
+            min, max, item = av
+            if max == 1:
+                result = expand(item, strings)
+                if not min:
+                    result.extend(strings)
+                strings = result
+            else:
+                char = HOST if excludes_slash(item) else ANY
+                strings = [s + char for s in strings]
+
+        elif op is sre.AT:
+            if av in (sre.AT_END, sre.AT_END_STRING):
+                # nothing can follow; terminate the host
+                strings = [s + "/" for s in strings]
+
+        elif op in (sre.ASSERT, sre.ASSERT_NOT):
+            pass
+
+        else:
+            char = HOST if excludes_slash(((op, av),)) else ANY
+            strings = [s + char for s in strings]
+
+        if len(strings) > MAX_EXPANSIONS:
+            raise Unindexable("too many alternatives")
+    return strings + done
+
+
+def excludes_slash(items):
+    """Return True if no part of 'items' can match a '/'"""
+    for op, av in items:
+        if op is sre.LITERAL:
+            if av == 47:
+                return False
+        elif op is sre.NOT_LITERAL:
+            if av != 47:
+                return False
+        elif op is sre.IN:
+            if in_matches(av, 47):
+                return False
+        elif op in REPEAT:
+            if not excludes_slash(av[2]):
+                return False
+        elif op is sre.SUBPATTERN:
+            if not excludes_slash(av[-1]):
+                return False
+        elif op is sre.BRANCH:
+            if not all(excludes_slash(branch) for branch in av[1]):
+                return False
+        elif op not in (sre.AT, sre.ASSERT, sre.ASSERT_NOT):
+            return False
+    return True
+
+
+def in_literals(items):
+    """Return all characters matched by class 'items'"""
+    chars = set()
+    for op, av in items:
+        if op is sre.LITERAL:
+            chars.add(chr(av).lower())
+        elif op is sre.RANGE and av[1] - av[0] < 8:
+            chars.update(chr(c).lower() for c in range(av[0], av[1]+1))
+        else:
+            return ()
+    return chars
+
+
+def in_matches(items, code):
+    """Return True if character class 'items' matches 'code'"""
+    negate = False
+    for op, av in items:
+        if op is sre.NEGATE:
+            negate = True
+        elif op is sre.LITERAL:
+            if av == code:
+                return not negate
+        elif op is sre.RANGE:
+            if av[0] <= code <= av[1]:
+                return not negate
+        elif op is sre.CATEGORY:
+            if av in (sre.CATEGORY_NOT_DIGIT, sre.CATEGORY_NOT_SPACE,
+                      sre.CATEGORY_NOT_WORD):
+                return not negate
+    return negate
+
+
+def host_complete(string):
+    """Return True if 'string' contains a URL's entire host"""
+    if "https://".startswith(string) or "http://".startswith(string):
+        return False
+    return extractor._index_match(string).end() < len(string)
+
+
+def pattern_source(pattern):
+    """Return a regex string equivalent to 'pattern'"""
+    if isinstance(pattern, str):
+        return pattern
+    if pattern.flags != re.compile(pattern.pattern).flags:
+        raise ValueError(f"unsupported flags in pattern {pattern!r}")
+    return pattern.pattern
+
+
+def pattern_keys(pattern):
+    """Return index keys for all URLs matched by 'pattern'
+
+    Each key is a literal label that is part of every host
+    matched by one of the pattern's alternatives.
+    """
+    if isinstance(pattern, str):
+        source, flags = pattern, 0
+    else:
+        source, flags = pattern.pattern, pattern.flags
+    strings = expand(sre_parse.parse(source, flags), [""])
+
+    keys = set()
+    for string in strings:
+        if not host_complete(string):
+            # prefix matches allow arbitrary continuations
+            string += ANY
+        host, sep, _ = extractor._index_match(string)[1].partition(ANY)
+
+        labels = extractor._index_labels(host)
+        if sep:
+            # label directly in front of ANY is incomplete
+            labels.pop()
+        labels = [label for label in labels if label and HOST not in label]
+        if not labels:
+            raise Unindexable(f"no literal labels in {string!r}")
+
+        keys.add(max(labels, key=lambda label: (
+            label not in GENERIC_LABELS, len(label))))
+    return keys
+
+
+def build_index():
+    modules = []
+    classes = []
+    patterns = []
+    basecategories = set()
+    index = collections.defaultdict(list)
+    other = []
+
+    extractor._cache.clear()
+    for module in extractor._modules_internal():
+        mod = len(modules)
+        modules.append(module.__name__.rpartition(".")[2])
+
+        for cls in extractor.add_module(module):
+            pos = len(classes)
+            classes.append((mod, cls.__name__))
+            patterns.append(pattern_source(cls.pattern))
+            if issubclass(cls, common.BaseExtractor):
+                basecategories.add(cls.basecategory)
+
+            try:
+                keys = pattern_keys(cls.pattern)
+            except Unindexable as exc:
+                if os.environ.get("GDL_INDEX_DEBUG"):
+                    print(cls.__name__, exc, file=sys.stderr)
+                other.append(pos)
+            else:
+                for key in keys:
+                    index[key].append(pos)
+
+    return {
+        "MODULES"       : tuple(modules),
+        "CLASSES"       : tuple(classes),
+        "PATTERNS"      : tuple(patterns),
+        "BASECATEGORIES": tuple(sorted(basecategories)),
+        "CONFIG"        : CONFIG,
+        "INDEX"         : {key: tuple(index[key]) for key in sorted(index)},
+        "OTHER"         : tuple(other),
+    }
+
+
+def generate_output(data):
+    NL = "\n"
+    GENERATOR = "/".join(os.path.normpath(__file__).split(os.sep)[-2:])
+    lines = [
+        "# -*- coding: utf-8 -*-\n",
+        "\n",
+        f"# auto-generated by {GENERATOR}\n",
+        "# Do not edit manually\n",
+    ]
+
+    for name, value in data.items():
+        lines.append(f"\n{name} = ")
+        if isinstance(value, dict):
+            lines.append("{\n")
+            for key, positions in value.items():
+                line = f'    "{key}": {positions!r},\n'
+                if len(line) > 80:
+                    items = textwrap.wrap(
+                        repr(positions)[1:-1], 71,
+                        initial_indent="        ",
+                        subsequent_indent="        ")
+                    line = f'    "{key}": (\n{NL.join(items)}\n    ),\n'
+                lines.append(line)
+            lines.append("}\n")
+        else:
+            lines.append("(\n")
+            lines.extend(f"    {literal(v)},\n" for v in value)
+            lines.append(")\n")
+
+    return "".join(lines)
+
+
+def literal(value):
+    """Return Python source code for 'value'"""
+    if isinstance(value, str):
+        # split long strings into implicitly concatenated chunks
+        chunks = []
+        chunk = ""
+        for char in value:
+            char = json.dumps(char, ensure_ascii=False)[1:-1]
+            if len(chunk) + len(char) > 70:
+                chunks.append(chunk)
+                chunk = ""
+            chunk += char
+        chunks.append(chunk)
+        return "\n    ".join(f'"{chunk}"' for chunk in chunks)
+    if isinstance(value, tuple):
+        return f"({', '.join(literal(v) for v in value)})"
+    return repr(value)
+
+
+def main(path=None):
+    data = build_index()
+
+    if path is None:
+        path = util.path("gallery_dl", "extractor", "_index.py")
+    with util.lazy(path) as fp:
+        fp.write(generate_output(data))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1] if len(sys.argv) > 1 else None)
@@ -17,6 +17,7 @@ hiddenimports.extend(
     if not file.startswith("__")
 )
 
+hiddenimports.append(extractor.__name__ + "._index")
 hiddenimports.append("yt_dlp")
 
 mypyc = "81d243bd2c585b0f4821__mypyc"
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Copyright 2026 Mike Fährmann
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 2 as
+# published by the Free Software Foundation.
+
+"""Measure import time of finding an extractor for a single URL
+
+Fails when more than '--max-modules' extractor modules get imported,
+when import time exceeds '--max-ms', or when it is more than
+'--tolerance' percent slower than the results of a '--compare' file.
+"""
+
+import os
+import sys
+import json
+import argparse
+import tempfile
+import subprocess
+
+import util
+
+URLS = (
+    "https://www.pixiv.net/artworks/966412",
+    "https://x.com/supernaturepics/status/604341487988576256",
+    "https://danbooru.donmai.us/posts/294929",
+    "https://imgur.com/21yMxCS",
+)
+
+CODE = """\
+from gallery_dl import extractor
+if extractor.find({!r}) is None:
+    raise SystemExit("no extractor found")
+"""
+
+IGNORE = {
+    "gallery_dl.extractor.common",
+    "gallery_dl.extractor.message",
+    "gallery_dl.extractor._index",
+}
+
+
+def measure(url, env):
+    """Return import time in µs and extractor modules imported for 'url'"""
+    proc = subprocess.run(
+        (sys.executable, "-X", "importtime", "-c", CODE.format(url)),
+        cwd=util.ROOTDIR, env=env,
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+        encoding="utf-8",
+    )
+    if proc.returncode:
+        raise SystemExit(f"{url}: {proc.stderr.splitlines()[-1]}")
+
+    total = 0
+    modules = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[12:].split("|")
+        if name.startswith(" gallery_dl"):
+            # top-level 'gallery_dl' import, including its dependencies
+            total += int(cumulative)
+        name = name.strip()
+        if name.startswith("gallery_dl.extractor.") and name not in IGNORE:
+            modules.append(name)
+    return total, modules
+
+
+def parse_args(args=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "-n", "--runs", type=int, default=5, metavar="N",
+        help="number of measurements per URL (default: %(default)s)")
+    parser.add_argument(
+        "--max-ms", type=float, metavar="MS",
+        help="maximum import time in ms")
+    parser.add_argument(
+        "--max-modules", type=int, default=1, metavar="N",
+        help="maximum number of imported extractor modules "
+             "(default: %(default)s)")
+    parser.add_argument(
+        "--save", metavar="FILE",
+        help="write results to FILE")
+    parser.add_argument(
+        "--compare", metavar="FILE",
+        help="compare results to those stored in FILE")
+    parser.add_argument(
+        "--tolerance", type=float, default=20.0, metavar="PERCENT",
+        help="allowed slowdown compared to '--compare' results "
+             "(default: %(default)s)")
+    parser.add_argument(
+        "urls", nargs="*", metavar="URL",
+        help="URLs to test (default: a few well-known sites)")
+    return parser.parse_args(args)
+
+
+def main():
+    args = parse_args()
+    failed = False
+    results = {}
+
+    if args.compare:
+        with open(args.compare) as fp:
+            baseline = json.load(fp)
+    else:
+        baseline = {}
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        # use a separate bytecode cache to exclude compilation time
+        env = os.environ.copy()
+        env["PYTHONPYCACHEPREFIX"] = tmpdir
+        env.pop("PYTHONDONTWRITEBYTECODE", None)
+
+        for url in args.urls or URLS:
+            measure(url, env)
+            times = []
+            for _ in range(args.runs):
+                time, modules = measure(url, env)
+                times.append(time)
+
+            ms = results[url] = min(times) / 1000
+            print(f"{ms:7.1f}ms {len(modules):3} module(s)  {url}")
+
+            if len(modules) > args.max_modules:
+                print(f"    {', '.join(modules)}", file=sys.stderr)
+                failed = True
+            if args.max_ms and ms > args.max_ms:
+                print(f"    slower than {args.max_ms}ms", file=sys.stderr)
+                failed = True
+            if (base := baseline.get(url)) and \
+                    ms > base * (1.0 + args.tolerance / 100.0):
+                print(f"    slower than {base:.1f}ms "
+                      f"+ {args.tolerance}%", file=sys.stderr)
+                failed = True
+
+    if args.save:
+        with open(args.save, "w") as fp:
+            json.dump(results, fp, indent=4)
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -110,6 +110,9 @@ def build_setuptools():
             "video": [
                 "yt-dlp",
             ],
+            "http2": [
+                "httpx[http2]",
+            ],
             "extra": [
                 "requests[socks]",
                 "yt-dlp[default]",
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Copyright 2026 Mike Fährmann
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 2 as
+# published by the Free Software Foundation.
+
+"""Compare StringFormatter and CompiledStringFormatter performance"""
+
+import os
+import sys
+import timeit
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from gallery_dl import formatter, dt  # noqa E402
+
+KWDICT = {
+    "category"   : "booru",
+    "subcategory": "post",
+    "id"         : 1234567,
+    "num"        : 3,
+    "title"      : "Lorem ipsum dolor sit amet, consectetur adipiscing elit",
+    "artist"     : {"name": "Foo Bar", "id": 987},
+    "tags"       : ["foo", "bar", "baz", "qux"],
+    "date"       : dt.datetime(2010, 1, 1),
+    "filename"   : "abcdef0123456789",
+    "extension"  : "jpg",
+}
+
+FORMATS = (
+    "{category}",
+    "{filename}.{extension}",
+    "{category}_{id}_{filename}.{extension}",
+    "{id}_{num:>03}_{title[:32]}.{extension}",
+    "{artist[name]} - {title!l:?/ /}{date:%Y-%m-%d}.{extension}",
+    "{category}/{artist[name]|artist[id]}/{tags:J, /}/{id}.{extension}",
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "-n", "--number", type=int, default=100000,
+        help="number of format_map calls per format string")
+    parser.add_argument(
+        "-r", "--repeat", type=int, default=5,
+        help="number of measurements; the fastest one gets reported")
+    parser.add_argument(
+        "formats", nargs="*", metavar="FORMAT",
+        help="format strings to measure")
+    args = parser.parse_args()
+
+    total_std = total_cmp = 0.0
+    for fmt in args.formats or FORMATS:
+        fstd = formatter.StringFormatter(fmt).format_map
+        fcmp = formatter.CompiledStringFormatter(fmt).format_map
+        if fstd(KWDICT) != fcmp(KWDICT):
+            raise SystemExit(f"Result mismatch for '{fmt}'")
+
+        std = measure(fstd, args)
+        cmp = measure(fcmp, args)
+        total_std += std
+        total_cmp += cmp
+        print(f"{std * 1e9 / args.number:8.1f} ns "
+              f"{cmp * 1e9 / args.number:8.1f} ns "
+              f"{std / cmp:5.2f}x  {fmt}")
+
+    print(f"{'':->24}\n"
+          f"{total_std / total_cmp:22.2f}x  total")
+
+
+def measure(format_map, args):
+    """Return the lowest time of 'args.number' calls to 'format_map'"""
+    kwdict = KWDICT.copy()
+    return min(timeit.repeat(
+        lambda: format_map(kwdict), number=args.number, repeat=args.repeat))
+
+
+if __name__ == "__main__":
+    main()
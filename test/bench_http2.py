@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Copyright 2026 Mike Fährmann
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 2 as
+# published by the Free Software Foundation.
+
+"""Compare HTTP/1.1 and HTTP/2 transports fetching many small files"""
+
+import os
+import sys
+import time
+import argparse
+import threading
+import http.server
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from gallery_dl import extractor, config  # noqa E402
+from test.test_http2 import Http2Server  # noqa E402
+
+CONTENT = b"\xff" * 2048
+
+
+def http1_server(args):
+    class Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        connections = 0
+
+        def setup(self):
+            Handler.connections += 1
+            time.sleep(args.handshake)
+            http.server.BaseHTTPRequestHandler.setup(self)
+
+        def do_GET(self):
+            time.sleep(args.latency)
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(CONTENT)))
+            self.end_headers()
+            self.wfile.write(CONTENT)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address
+    return f"http://{host}:{port}", lambda: Handler.connections
+
+
+def http2_server(args):
+    class Server(Http2Server):
+
+        def handle(self, sock):
+            time.sleep(args.handshake)
+            Http2Server.handle(self, sock)
+
+        def respond(self, sock, conn, lock, stream_id, headers, body):
+            threading.Timer(args.latency, self.send, (
+                sock, conn, lock, stream_id, 200, (), CONTENT,
+            )).start()
+
+    server = Server()
+    return server.address, lambda: server.connections
+
+
+def measure(address, args):
+    """Return the time to fetch 'args.number' files from 'address'"""
+    extr = extractor.find(f"generic:{address}/")
+    extr.initialize()
+
+    def fetch(num):
+        return len(extr.request(f"{address}/{num}.jpg").content)
+
+    start = time.monotonic()
+    with ThreadPoolExecutor(args.workers) as pool:
+        size = sum(pool.map(fetch, range(args.number)))
+    elapsed = time.monotonic() - start
+
+    if size != args.number * len(CONTENT):
+        raise SystemExit("Incomplete responses")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "-n", "--number", type=int, default=200,
+        help="number of files to fetch")
+    parser.add_argument(
+        "-w", "--workers", type=int, default=16,
+        help="number of concurrent requests")
+    parser.add_argument(
+        "-l", "--latency", type=float, default=0.02,
+        help="seconds the server takes to answer a request")
+    parser.add_argument(
+        "-s", "--handshake", type=float, default=0.1,
+        help="seconds the server takes to accept a new connection")
+    args = parser.parse_args()
+
+    config.set(("extractor",), "pool-size", args.workers)
+
+    address, connections = http1_server(args)
+    time1 = measure(address, args)
+    print(f"HTTP/1.1: {time1:6.2f} s  {connections():3} connections")
+
+    config.set(("extractor",), "http2", "only")
+    address, connections = http2_server(args)
+    time2 = measure(address, args)
+    print(f"HTTP/2  : {time2:6.2f} s  {connections():3} connections")
+
+    print(f"speedup : {time1 / time2:6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Copyright 2026 Mike Fährmann
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 2 as
+# published by the Free Software Foundation.
+
+"""Compare memory usage of per-file dict copies and OverlayDict objects"""
+
+import os
+import sys
+import argparse
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from gallery_dl import util  # noqa E402
+
+
+def generate_post(num, fields):
+    post = {
+        "category"   : "booru",
+        "subcategory": "post",
+        "id"         : num,
+        "title"      : f"Post Title #{num}",
+        "tags"       : ["foo", "bar", "baz"],
+        "user"       : {"id": num % 1000, "name": f"user{num % 1000}"},
+    }
+    for idx in range(fields - len(post)):
+        post[f"field{idx}"] = idx
+    return post
+
+
+def generate_file(num):
+    return {
+        "num"      : num,
+        "url"      : f"https://example.org/{num}.jpg",
+        "filename" : str(num),
+        "extension": "jpg",
+    }
+
+
+def build_copy(posts, files):
+    return [
+        {**post, **generate_file(num)}
+        for post in posts
+        for num in range(files)
+    ]
+
+
+def build_overlay(posts, files):
+    return [
+        util.OverlayDict(post, generate_file(num))
+        for post in posts
+        for num in range(files)
+    ]
+
+
+def measure(func, posts, files):
+    """Return the number of bytes allocated by 'func' and its result"""
+    tracemalloc.start()
+    result = func(posts, files)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "-p", "--posts", type=int, default=10000,
+        help="number of posts")
+    parser.add_argument(
+        "-f", "--files", type=int, default=4,
+        help="number of files per post")
+    parser.add_argument(
+        "-k", "--keys", type=int, default=30,
+        help="number of post-level metadata fields")
+    args = parser.parse_args()
+
+    posts = [generate_post(num, args.keys) for num in range(args.posts)]
+    size_copy, result_copy = measure(build_copy, posts, args.files)
+    size_overlay, result_overlay = measure(build_overlay, posts, args.files)
+
+    for a, b in zip(result_copy, result_overlay):
+        if util.json_dumps(a) != util.json_dumps(b):
+            raise SystemExit("Result mismatch")
+
+    total = args.posts * args.files
+    print(f"{total} files, {args.keys} post fields, "
+          f"{len(result_copy[0]) - args.keys} file fields\n"
+          f"dict copy  : {size_copy / 1048576:8.2f} MiB "
+          f"({size_copy // total} B/file)\n"
+          f"OverlayDict: {size_overlay / 1048576:8.2f} MiB "
+          f"({size_overlay // total} B/file)\n"
+          f"reduction  : {100 - size_overlay * 100 / size_copy:8.1f} %")
+
+
+if __name__ == "__main__":
+    main()
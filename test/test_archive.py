@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Copyright 2026 Mike Fährmann
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 2 as
+# published by the Free Software Foundation.
+
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from gallery_dl import archive  # noqa E402
+
+
+class TestDownloadArchive(unittest.TestCase):
+    cls = archive.DownloadArchive
+
+    def setUp(self):
+        self.archive = archive.connect(":memory:", "test_", "{id}")
+        self.archive.__class__ = self.cls
+        if self.cls is archive.DownloadArchiveMemory:
+            self.archive.keys = set()
+
+    def tearDown(self):
+        self.archive.close()
+
+    def test_check(self):
+        self.assertFalse(self.archive.check({"id": 1}))
+        self.archive.add({"id": 1})
+        self.assertTrue(self.archive.check({"id": 1}))
+        self.assertFalse(self.archive.check({"id": 2}))
+
+    def test_check_many(self):
+        for i in range(0, 1200, 3):
+            self.archive.add({"id": i})
+
+        kwdicts = [{"id": i} for i in range(1200)]
+        results = self.archive.check_many(kwdicts)
+
+        self.assertEqual(results, [i % 3 == 0 for i in range(1200)])
+        self.assertEqual(kwdicts[5]["_archive_key"], "test_5")
+
+    def test_check_many_cached(self):
+        self.archive.add({"id": 1})
+        self.archive.check_many([{"id": 1}, {"id": 2}])
+
+        with patch.object(self.archive, "cursor") as cursor:
+            self.assertTrue(self.archive.check({"id": 1}))
+            self.assertFalse(self.archive.check({"id": 2}))
+        cursor.execute.assert_not_called()
+
+        # results are only used once
+        self.assertFalse(self.archive.check({"id": 3}))
+        self.assertFalse(self.archive._prefetched)
+
+    def test_check_many_add(self):
+        self.archive.check_many([{"id": 1}, {"id": 1}])
+        self.archive.add({"id": 1})
+        self.assertTrue(self.archive.check({"id": 1}))
+
+    def test_check_many_add_concurrent(self):
+        select_many = self.archive._select_many
+
+        def select_add(keys):
+            found = select_many(keys)
+            # 'add()' from another thread before results get stored
+            self.archive.add({"id": 1})
+            return found
+
+        with patch.object(self.archive, "_select_many", select_add):
+            self.archive.check_many([{"id": 1}, {"id": 2}])
+
+        self.assertTrue(self.archive.check({"id": 1}))
+        self.assertFalse(self.archive.check({"id": 2}))
+
+    def test_check_many_bounded(self):
+        self.archive._prefetched.maxsize = 5
+        self.archive.add({"id": 1})
+
+        self.archive.check_many([{"id": i} for i in range(4)])
+        self.archive.check_many([{"id": i} for i in range(10, 14)])
+        self.assertEqual(len(self.archive._prefetched), 5)
+
+        # oldest results are gone, but still looked up
+        self.assertIsNone(self.archive._prefetched.pop(self.archive.keygen(
+            {"id": 1})))
+        self.assertTrue(self.archive.check({"id": 1}))
+
+        # results of the current window are always kept
+        self.archive.check_many([{"id": i} for i in range(20, 28)])
+        self.assertEqual(len(self.archive._prefetched), 8)
+
+
+class TestDownloadArchiveMemory(TestDownloadArchive):
+    cls = archive.DownloadArchiveMemory
+
+
+class TestDownloadArchiveBatch(TestDownloadArchive):
+    cls = archive.DownloadArchiveBatch
+
+    def setUp(self):
+        self.archive = archive.connect(
+            ":memory:", "test_", "{id}", mode="batch", batch=(3, 60.0))
+
+    def _stored(self):
+        cursor = self.archive.connection.cursor()
+        cursor.execute("SELECT entry FROM archive ORDER BY entry")
+        return [row[0] for row in cursor]
+
+    def test_batch_size(self):
+        self.assertIsInstance(self.archive, archive.DownloadArchiveBatch)
+
+        self.archive.add({"id": 1})
+        self.archive.add({"id": 2})
+        self.assertEqual(self._stored(), [])
+        self.assertTrue(self.archive.check({"id": 2}))
+
+        self.archive.add({"id": 3})
+        self.assertEqual(self._stored(), ["test_1", "test_2", "test_3"])
+        self.assertFalse(self.archive.keys)
+
+    def test_batch_interval(self):
+        self.archive._batch_interval = 0.0
+        self.archive.add({"id": 1})
+        self.assertEqual(self._stored(), ["test_1"])
+
+    def test_batch_close(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "archive.sqlite3")
+            db = archive.connect(path, "test_", "{id}", mode="batch")
+            db.add({"id": 1})
+            db.close()
+
+            db = archive.connect(path, "test_", "{id}")
+            self.assertTrue(db.check({"id": 1}))
+            db.close()
+
+
+class TestDownloadArchiveBloom(unittest.TestCase):
+
+    def setUp(self):
+        db = archive.connect(":memory:", "test_", "{id}")
+        for i in range(0, 100, 2):
+            db.add({"id": i})
+        self.archive = archive.DownloadArchiveBloom(db)
+
+    def tearDown(self):
+        self.archive.close()
+
+    def test_bloom_filter(self):
+        bloom = archive.BloomFilter(1000, 0.01)
+        for i in range(1000):
+            bloom.add(str(i))
+
+        self.assertTrue(all(str(i) in bloom for i in range(1000)))
+        false = sum(str(i) in bloom for i in range(1000, 11000))
+        self.assertLess(false, 300)
+        self.assertLess(bloom.error_rate(), 0.02)
+
+    def test_check(self):
+        self.assertEqual(self.archive.bloom.count, 50)
+        self.assertTrue(self.archive.check({"id": 2}))
+
+        with patch.object(self.archive.archive, "check") as check:
+            self.assertFalse(self.archive.check({"id": "foo"}))
+        check.assert_not_called()
+
+        self.archive.add({"id": "foo"})
+        self.assertTrue(self.archive.check({"id": "foo"}))
+
+    def test_check_many(self):
+        results = self.archive.check_many([{"id": i} for i in range(100)])
+        self.assertEqual(results, [i % 2 == 0 for i in range(100)])
+
+    def test_connect(self):
+        db = archive.connect(":memory:", "", "{id}", bloom=True)
+        self.assertIsInstance(db, archive.DownloadArchiveBloom)
+        db.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
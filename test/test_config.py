@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-# Copyright 2015-2025 Mike Fährmann
+# Copyright 2015-2026 Mike Fährmann
 #
 # This program is free software; you can redistribute it and/or modify
 # it under the terms of the GNU General Public License version 2 as
@@ -10,6 +10,7 @@
 import os
 import sys
 import unittest
+import threading
 
 import tempfile
 
@@ -181,6 +182,63 @@ class TestConfig(unittest.TestCase):
         self.assertEqual(config.get(("b",)    , "c"), "text")
         self.assertEqual(config.get(("e", "f"), "g"), None)
 
+    def test_local(self):
+        options = (
+            (("b",)    , "c", [1, 2, 3]),
+            (("e", "f"), "g", 234),
+        )
+        results = {}
+
+        def thread(init=util.noop):
+            init()
+            results["c"] = config.get(("b",), "c")
+            results["g"] = config.get(("e", "f"), "g")
+
+        with config.local(options):
+            self.assertEqual(config.get(("b",)    , "c"), [1, 2, 3])
+            self.assertEqual(config.get(("b", "b"), "a"), 3)
+            self.assertEqual(config.get(("e", "f"), "g"), 234)
+            self.assertEqual(config.interpolate(("e", "f"), "g"), 234)
+
+            # other threads still use the global config
+            t = threading.Thread(target=thread)
+            t.start()
+            t.join()
+            self.assertEqual(results, {"c": "text", "g": None})
+
+            # unless they inherit the current thread's config
+            t = threading.Thread(target=thread, args=(config.inherit(),))
+            t.start()
+            t.join()
+            self.assertEqual(results, {"c": [1, 2, 3], "g": 234})
+
+            # global config stays unchanged
+            self.assertEqual(config._config["b"]["c"], "text")
+            self.assertNotIn("e", config._config)
+
+        self.assertEqual(config.get(("b",)    , "c"), "text")
+        self.assertEqual(config.get(("e", "f"), "g"), None)
+        self.assertIs(config.inherit(), util.noop)
+
+    def test_inherit_flags(self):
+        flags = util.Flags()
+        results = []
+
+        def thread(init=util.noop):
+            init()
+            results.append(util.FLAGS.current())
+
+        util.FLAGS.use(flags)
+        try:
+            t = threading.Thread(target=thread, args=(config.inherit(),))
+            t.start()
+            t.join()
+        finally:
+            util.FLAGS.use(None)
+
+        self.assertIs(results[0], flags)
+        self.assertIs(config.inherit(), util.noop)
+
     def test_load(self):
         with tempfile.TemporaryDirectory() as base:
             path1 = os.path.join(base, "cfg1")
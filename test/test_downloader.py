@@ -16,6 +16,7 @@ import re
 import logging
 import os.path
 import binascii
+import time
 import tempfile
 import threading
 import http.server
@@ -242,7 +243,8 @@ class TestHTTPDownloader(TestDownloaderBase):
         port = 0  # select random not-in-use port
 
         try:
-            server = http.server.HTTPServer((host, port), HttpRequestHandler)
+            server = http.server.ThreadingHTTPServer(
+                (host, port), HttpRequestHandler)
         except OSError as exc:
             raise unittest.SkipTest(
                 f"cannot spawn local HTTP server ({exc})")
@@ -259,6 +261,7 @@ class TestHTTPDownloader(TestDownloaderBase):
 
     def tearDown(self):
         self.downloader.minsize = self.downloader.maxsize = None
+        self.downloader.segments = 0
 
     def test_http_download(self):
         self._run_test("jpg", None, DATA["jpg"], "jpg", "jpg")
@@ -280,6 +283,102 @@ class TestHTTPDownloader(TestDownloaderBase):
         self._run_test("png", None, DATA["png"], "gif", "png")
         self._run_test("gif", None, DATA["gif"], "jpg", "gif")
 
+    def test_http_segments(self):
+        self.downloader.segments = 4
+        self.downloader.segments_min = 1000
+
+        with patch.object(self.downloader, "_download_segment",
+                          wraps=self.downloader._download_segment) as seg:
+            self._run_test("~BIG", None, DATA["~BIG"], "bin", "bin")
+        self.assertEqual(seg.call_count, 4)
+        self.assertEqual(
+            [call.args[4:6] for call in seg.call_args_list],
+            [(0, 25600), (25600, 51200), (51200, 76800), (76800, 102400)])
+
+        # files below 'segments-min' use a single connection
+        with patch.object(self.downloader, "_download_segment") as seg:
+            self._run_test("jpg", None, DATA["jpg"], "jpg", "jpg")
+        seg.assert_not_called()
+
+    def test_http_segments_interrupt(self):
+        self.downloader.segments = 4
+        self.downloader.segments_min = 1000
+        finished = []
+
+        def segment(url, headers, fd, index, start, end,
+                    done, errors, stop, **kwargs):
+            stop.wait()
+            time.sleep(0.01)
+            finished.append(index)
+
+        pathfmt = self._prepare_destination(extension="bin")
+        with patch.object(self.downloader, "_download_segment", segment), \
+                patch.object(self.downloader.out, "start",
+                             side_effect=KeyboardInterrupt), \
+                self.assertRaises(KeyboardInterrupt):
+            self.downloader.download(f"{self.address}/~BIG", pathfmt)
+
+        # all segment threads ended before the file got closed
+        self.assertEqual(sorted(finished), [0, 1, 2, 3])
+
+    def test_http_tee(self):
+        from gallery_dl.postprocessor.hash import HashTee
+        import hashlib
+
+        for input in (None, DATA["jpg"][:123]):
+            pathfmt = self._prepare_destination(input, extension="jpg")
+            tee = HashTee(self, (("md5", "md5"),))
+            tee.attach(pathfmt.kwdict)
+            # resume from 'input' as existing file content
+            with patch.object(self.downloader, "part", False):
+                self.assertTrue(self.downloader.download(
+                    f"{self.address}/jpg", pathfmt))
+
+            self.assertTrue(tee.complete(pathfmt))
+            self.assertEqual(tee.hashes[0][1].hexdigest(),
+                             hashlib.md5(DATA["jpg"]).hexdigest())
+
+    def test_http_sink(self):
+        from gallery_dl.postprocessor.zip import ZipSink
+        import zipfile
+
+        zpath = os.path.join(self.dir.name, "sink.zip")
+        lock = threading.Lock()
+
+        with zipfile.ZipFile(zpath, "w") as zfile:
+            zpp = Mock(lock=lock, zfile=zfile)
+
+            def sink(pathfmt, size):
+                if not lock.acquire(False):
+                    return None
+                return ZipSink(zpp, pathfmt.filename,
+                               zfile.open(pathfmt.filename, "w"))
+
+            # file gets written into the archive
+            pathfmt = self._prepare_destination(extension="jpg")
+            pathfmt.kwdict["_http_sink"] = sink
+            self.assertTrue(self.downloader.download(
+                f"{self.address}/jpg", pathfmt))
+            name = pathfmt.filename
+            self.assertTrue(pathfmt.delete)
+            self.assertFalse(os.path.exists(pathfmt.realpath))
+            self.assertFalse(lock.locked())
+            pathfmt.finalize()
+
+            # archive in use; fall back to a regular file
+            pathfmt = self._prepare_destination(extension="png")
+            pathfmt.kwdict["_http_sink"] = sink
+            with lock:
+                self.assertTrue(self.downloader.download(
+                    f"{self.address}/png", pathfmt))
+            pathfmt.finalize()
+            with open(pathfmt.realpath, "rb") as fp:
+                self.assertEqual(fp.read(), DATA["png"])
+
+        with zipfile.ZipFile(zpath) as zfile:
+            self.assertEqual(zfile.namelist(), [name])
+            self.assertEqual(zfile.read(name), DATA["jpg"])
+
     def test_http_filesize_min(self):
         url = f"{self.address}/gif"
         pathfmt = self._prepare_destination(None, extension=None)
@@ -335,20 +434,23 @@ class HttpRequestHandler(http.server.BaseHTTPRequestHandler):
             self.wfile.write(self.path.encode())
             return
 
-        headers = {"Content-Length": len(output)}
+        headers = {"Accept-Ranges": "bytes"}
 
         if "Range" in self.headers:
             status = 206
 
-            match = re.match(r"bytes=(\d+)-", self.headers["Range"])
+            match = re.match(r"bytes=(\d+)-(\d*)", self.headers["Range"])
             start = int(match[1])
+            end = int(match[2]) + 1 if match[2] else len(output)
 
             headers["Content-Range"] = \
-                f"bytes {start}-{len(output) - 1}/{len(output)}"
-            output = output[start:]
+                f"bytes {start}-{end - 1}/{len(output)}"
+            output = output[start:end]
         else:
             status = 200
 
+        headers["Content-Length"] = len(output)
+
         self.send_response(status)
         for key, value in headers.items():
             self.send_header(key, value)
@@ -424,6 +526,8 @@ for ext, content in SAMPLES:
 for idx, (_, content) in enumerate(SAMPLES):
     DATA[f"S{idx:>02}"] = content
 
+DATA["~BIG"] = bytes(range(256)) * 400
+
 
 # reverse mime types mapping
 MIME_TYPES = {
@@ -14,9 +14,13 @@ from unittest.mock import patch
 
 import time
 import string
+import requests
+import urllib3
+import threading
+import http.server
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from gallery_dl import extractor, util, dt, config, cache  # noqa E402
+from gallery_dl import extractor, util, dt, config, cache, ratelimit  # noqa E402
 from gallery_dl.extractor import mastodon  # noqa E402
 from gallery_dl.extractor.common import Extractor, Message  # noqa E402
 from gallery_dl.extractor.directlink import DirectlinkExtractor  # noqa E402
@@ -65,6 +69,7 @@ class TestExtractorModule(unittest.TestCase):
         extractor._cache.clear()
         extractor._module_iter = extractor._modules_internal()
         extractor._list_classes = _list_classes
+        extractor._index_data = None
 
     def test_find(self):
         for uri in self.VALID_URIS:
@@ -95,6 +100,73 @@ class TestExtractorModule(unittest.TestCase):
         self.assertEqual(classes[0], FakeExtractor)
         self.assertIsInstance(extractor.find(uri), FakeExtractor)
 
+    def test_index(self):
+        from gallery_dl.extractor import _index
+
+        classes = extractor.extractors()
+        self.assertEqual(
+            tuple(extractor.modules), _index.MODULES,
+            "outdated index; run scripts/extractor_index.py")
+        self.assertEqual(
+            sorted(name for _, name in _index.CLASSES),
+            sorted(cls.__name__ for cls in classes),
+            "outdated index; run scripts/extractor_index.py")
+
+        patterns = {
+            name: pattern
+            for (_, name), pattern in zip(_index.CLASSES, _index.PATTERNS)
+        }
+        for cls in classes:
+            self.assertEqual(
+                patterns[cls.__name__], cls.pattern.pattern,
+                "outdated index; run scripts/extractor_index.py")
+
+        for cls in classes:
+            url = cls.example
+            expected = None
+            for cand in _list_classes():
+                if cand.pattern.match(url):
+                    expected = cand
+                    break
+
+            extractor._index_data = None
+            result = None
+            for cand in extractor._index_classes(url):
+                if cand.pattern.match(url):
+                    result = cand
+                    break
+
+            self.assertIs(result, expected, url)
+        self.assertIs(extractor._index_data, _index)
+
+    def test_index_disabled(self):
+        modules = extractor.modules
+        extractor.modules = ["pixiv"]
+        try:
+            self.assertIsNone(extractor._index_load())
+            self.assertIs(extractor._index_data, False)
+        finally:
+            extractor.modules = modules
+
+        extractor._index_data = None
+        extractor._module_iter = iter(())
+        self.assertIsNone(extractor._index_load())
+
+        extractor._index_data = None
+        extractor._module_iter = extractor._modules_internal()
+        config.set(("extractor", "generic"), "enabled", True)
+        try:
+            self.assertIsNone(extractor._index_load())
+        finally:
+            config.clear()
+
+        extractor._index_data = None
+        self.assertTrue(extractor._index_load())
+
+        extractor.add(FakeExtractor)
+        self.assertIs(extractor._index_data, False)
+        self.assertIsInstance(extractor.find("fake:foo"), FakeExtractor)
+
     def test_from_url(self):
         for uri in self.VALID_URIS:
             cls = extractor.find(uri).__class__
@@ -416,5 +488,130 @@ class TextExtractorOAuth(unittest.TestCase):
             self.assertEqual(len(m.mock_calls), 1)
 
 
+class TestExtractorRatelimitHeaders(unittest.TestCase):
+
+    def tearDown(self):
+        config.clear()
+        ratelimit._limits.pop("fake", None)
+        ratelimit._limits.pop("reddit", None)
+
+    def _request(self, extr):
+        response = requests.Response()
+        response.status_code = 200
+        response.url = "https://example.org/"
+        response.headers.update({
+            "x-ratelimit-remaining": "0.0",
+            "x-ratelimit-used"     : "100",
+            "x-ratelimit-reset"    : "300",
+        })
+
+        extr.initialize()
+        with patch.object(extr.session, "request",
+                          return_value=response), \
+                patch.object(extr, "wait") as wait:
+            self.assertIs(extr.request(response.url), response)
+        return wait.mock_calls
+
+    def test_default(self):
+        self.assertEqual(self._request(FakeExtractor.from_url("fake:")), [])
+
+    def test_enabled(self):
+        config.set(("extractor",), "ratelimit-headers", True)
+        calls = self._request(FakeExtractor.from_url("fake:"))
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(calls[0].kwargs["reason"], "rate limit")
+
+    def test_reddit(self):
+        # reddit's API code waits for 'x-ratelimit-reset' on its own
+        config.set(("extractor",), "ratelimit-headers", True)
+        extr = extractor.find("https://www.reddit.com/r/python/")
+        self.assertEqual(extr.category, "reddit")
+        self.assertEqual(self._request(extr), [])
+
+
+class TestExtractorConnectionPool(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        try:
+            server = http.server.ThreadingHTTPServer(
+                ("127.0.0.1", 0), HttpRequestHandler)
+        except OSError as exc:
+            raise unittest.SkipTest(
+                f"cannot spawn local HTTP server ({exc})")
+
+        host, port = server.server_address
+        cls.address = f"http://{host}:{port}"
+        cls.server = server
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        HttpRequestHandler.clients = []
+
+    def tearDown(self):
+        config.clear()
+
+    def _extractor(self):
+        extr = extractor.find(f"generic:{self.address}/")
+        extr.initialize()
+        return extr
+
+    def test_shared(self):
+        config.set(("extractor",), "pool-size", 23)
+        extr1 = self._extractor()
+        extr2 = self._extractor()
+
+        self.assertIsNot(extr1.session, extr2.session)
+        adapter = extr1.session.get_adapter(self.address)
+        self.assertIs(extr2.session.get_adapter(self.address), adapter)
+        self.assertEqual(adapter._pool_maxsize, 23)
+
+        # both extractors use the same connection
+        extr1.request(self.address + "/1")
+        extr2.request(self.address + "/2")
+        extr1.request(self.address + "/3")
+        clients = HttpRequestHandler.clients
+        self.assertEqual(len(clients), 3)
+        self.assertEqual(len(set(clients)), 1)
+
+    def test_idle_timeout(self):
+        config.set(("extractor",), "pool-idle-timeout", 0.05)
+        extr = self._extractor()
+
+        extr.request(self.address + "/1")
+        extr.request(self.address + "/2")
+        time.sleep(0.1)
+        extr.request(self.address + "/3")
+
+        clients = HttpRequestHandler.clients
+        self.assertEqual(clients[0], clients[1])
+        self.assertNotEqual(clients[1], clients[2])
+
+        # default pool classes stay untouched
+        self.assertIs(
+            urllib3.poolmanager.pool_classes_by_scheme["http"],
+            urllib3.HTTPConnectionPool)
+
+
+class HttpRequestHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    clients = []
+
+    def do_GET(self):
+        self.clients.append(self.client_address)
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"OK")
+
+    def log_message(self, format, *args):
+        pass
+
+
 if __name__ == "__main__":
     unittest.main()
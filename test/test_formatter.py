@@ -538,6 +538,18 @@ class TestFormatter(unittest.TestCase):
         with self.assertRaises(OSError):
             formatter.parse("\fT /")
 
+    def test_compiled(self):
+        fmt = formatter.parse("\fC {a!l}-{d[a]:?</>/}{i:>03}.{missing|l[0]}")
+        self.assertIsInstance(fmt, formatter.CompiledStringFormatter)
+        self.assertEqual(fmt.format_map(self.kwdict),
+                         "hello world-<foo>002.a")
+
+        self._run_test("\fC {i}", "2")
+        self._run_test("\fC {i}", 2, fmt=util.identity)
+        self._run_test("\fC {i} {i!s}", "2 2", fmt=util.identity)
+        self._run_test("\fC {missing}{{}}", "None{}")
+        self._run_test("\fC '\"\\\n", "'\"\\\n")
+
     def test_expression(self):
         self._run_test("\fE a", self.kwdict["a"])
         self._run_test(
@@ -713,5 +725,17 @@ def noarg():
         self.assertEqual(output, result, format_string)
 
 
+class TestCompiledFormatter(TestFormatter):
+
+    def setUp(self):
+        formatter._CACHE.clear()
+        formatter._FORMATTERS["S"] = formatter.CompiledStringFormatter
+
+    def tearDown(self):
+        formatter._CACHE.clear()
+        formatter._FORMATTERS["S"] = formatter.StringFormatter
+        config.clear()
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Copyright 2026 Mike Fährmann
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 2 as
+# published by the Free Software Foundation.
+
+import os
+import sys
+import unittest
+
+import time
+import socket
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from gallery_dl import extractor, config  # noqa E402
+from gallery_dl.extractor.common import CACHE_ADAPTERS  # noqa E402
+
+try:
+    import h2.config
+    import h2.events
+    import h2.connection
+    from gallery_dl import http2
+except ImportError:
+    h2 = http2 = None
+
+CONTENT = bytes(range(256)) * 200
+
+
+class TestHttp2(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        if http2 is None:
+            raise unittest.SkipTest("no 'httpx' or 'h2' module")
+        try:
+            cls.server = Http2Server()
+        except OSError as exc:
+            raise unittest.SkipTest(
+                f"cannot spawn local HTTP/2 server ({exc})")
+        cls.address = cls.server.address
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.close()
+
+    def setUp(self):
+        config.set(("extractor",), "http2", "only")
+        self.server.connections = 0
+        self.server.requests = []
+
+    def tearDown(self):
+        config.clear()
+        # use a separate connection pool for each test
+        for key, adapter in tuple(CACHE_ADAPTERS.items()):
+            if key[0] == "http2":
+                del CACHE_ADAPTERS[key]
+                adapter.close()
+
+    def _extractor(self):
+        extr = extractor.find(f"generic:{self.address}/")
+        extr.initialize()
+        return extr
+
+    def test_request(self):
+        extr = self._extractor()
+        self.assertIsInstance(
+            extr.session.get_adapter(self.address), http2.Http2Adapter)
+
+        response = extr.request(self.address + "/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.text, "OK")
+        self.assertEqual(response.headers["Content-Type"], "text/plain")
+        self.assertEqual(response.raw.version, 20)
+
+        method, path, headers = self.server.requests[0]
+        self.assertEqual(method, "GET")
+        self.assertEqual(path, "/")
+        self.assertNotIn("connection", headers)
+        self.assertEqual(headers["user-agent"],
+                         extr.session.headers["User-Agent"])
+
+    def test_post(self):
+        extr = self._extractor()
+        response = extr.request(
+            self.address + "/echo", method="POST", json={"a": 1})
+        self.assertEqual(response.json(), {"a": 1})
+
+    def test_cookies(self):
+        extr = self._extractor()
+        extr.request(self.address + "/cookies")
+        self.assertEqual(extr.cookies.get("a"), "1")
+        self.assertEqual(extr.cookies.get("b"), "2")
+
+        extr.request(self.address + "/")
+        cookies = self.server.requests[-1][2]["cookie"]
+        self.assertEqual(sorted(cookies.split("; ")), ["a=1", "b=2"])
+
+    def test_redirect(self):
+        extr = self._extractor()
+        response = extr.request(self.address + "/redirect")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.url, self.address + "/")
+        self.assertEqual(len(response.history), 1)
+
+    def test_error(self):
+        extr = self._extractor()
+
+        response = extr.request(self.address + "/404", fatal=False)
+        self.assertEqual(response.status_code, 404)
+
+        with self.assertRaises(extr.exc.HttpError):
+            extr.request(self.address + "/404", retries=0)
+
+    def test_stream(self):
+        extr = self._extractor()
+        response = extr.request(self.address + "/file", stream=True)
+        self.assertEqual(
+            b"".join(response.iter_content(1000)), CONTENT)
+
+    def test_multiplex(self):
+        extr = self._extractor()
+        results = []
+
+        def request():
+            results.append(extr.request(self.address + "/slow").text)
+
+        threads = [threading.Thread(target=request) for _ in range(8)]
+        extr.request(self.address + "/")
+
+        start = time.monotonic()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.monotonic() - start
+
+        self.assertEqual(results, ["OK"] * 8)
+        self.assertEqual(self.server.connections, 1)
+        self.assertEqual(len(self.server.requests), 9)
+        # each '/slow' response takes 0.2 seconds
+        self.assertLess(elapsed, 1.0)
+
+
+class Http2Server():
+    """Minimal cleartext HTTP/2 server"""
+
+    def __init__(self):
+        self.socket = socket.create_server(("127.0.0.1", 0))
+        host, port = self.socket.getsockname()
+        self.address = f"http://{host}:{port}"
+        self.connections = 0
+        self.requests = []
+        threading.Thread(target=self.serve, daemon=True).start()
+
+    def close(self):
+        self.socket.close()
+
+    def serve(self):
+        while True:
+            try:
+                sock, _ = self.socket.accept()
+            except OSError:
+                return
+            self.connections += 1
+            threading.Thread(
+                target=self.handle, args=(sock,), daemon=True).start()
+
+    def handle(self, sock):
+        conn = h2.connection.H2Connection(h2.config.H2Configuration(
+            client_side=False, header_encoding="utf-8"))
+        conn.initiate_connection()
+        lock = threading.Lock()
+        sock.sendall(conn.data_to_send())
+        streams = {}
+
+        try:
+            while data := sock.recv(65536):
+                with lock:
+                    for event in conn.receive_data(data):
+                        if isinstance(event, h2.events.RequestReceived):
+                            streams[event.stream_id] = (
+                                dict(event.headers), [])
+                        elif isinstance(event, h2.events.DataReceived):
+                            streams[event.stream_id][1].append(event.data)
+                            conn.acknowledge_received_data(
+                                event.flow_controlled_length,
+                                event.stream_id)
+                        elif isinstance(event, h2.events.StreamEnded):
+                            headers, body = streams.pop(event.stream_id)
+                            self.respond(sock, conn, lock, event.stream_id,
+                                         headers, b"".join(body))
+                    sock.sendall(conn.data_to_send())
+        except OSError:
+            pass
+        finally:
+            sock.close()
+
+    def respond(self, sock, conn, lock, stream_id, headers, body):
+        method = headers[":method"]
+        path = headers[":path"]
+        self.requests.append((method, path, headers))
+
+        status = 200
+        rheaders = [("content-type", "text/plain")]
+        content = b"OK"
+
+        if path == "/cookies":
+            rheaders.append(("set-cookie", "a=1; Path=/"))
+            rheaders.append(("set-cookie", "b=2; Path=/"))
+        elif path == "/redirect":
+            status = 302
+            rheaders.append(("location", "/"))
+            content = b""
+        elif path == "/echo":
+            content = body
+        elif path == "/file":
+            rheaders[0] = ("content-type", "application/octet-stream")
+            content = CONTENT
+        elif path == "/slow":
+            return threading.Timer(0.2, self.send, (
+                sock, conn, lock, stream_id, status, rheaders, content,
+            )).start()
+        elif path != "/":
+            status = 404
+            content = b"Not Found"
+
+        self.send(sock, conn, None, stream_id, status, rheaders, content)
+
+    def send(self, sock, conn, lock, stream_id, status, headers, content):
+        if lock is not None:
+            with lock:
+                return self.send(
+                    sock, conn, None, stream_id, status, headers, content)
+
+        conn.send_headers(stream_id, [
+            (":status", str(status)),
+            ("content-length", str(len(content))),
+            *headers,
+        ])
+        size = conn.max_outbound_frame_size
+        for offset in range(0, len(content), size):
+            conn.send_data(stream_id, content[offset:offset+size])
+        conn.end_stream(stream_id)
+        sock.sendall(conn.data_to_send())
+
+
+if __name__ == "__main__":
+    unittest.main()
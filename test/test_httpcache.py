@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Copyright 2026 Mike Fährmann
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 2 as
+# published by the Free Software Foundation.
+
+import os
+import sys
+import sqlite3
+import unittest
+from unittest.mock import patch
+
+import threading
+import http.server
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from gallery_dl import extractor, httpcache, config  # noqa E402
+
+
+class TestHttpCache(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        try:
+            server = http.server.ThreadingHTTPServer(
+                ("127.0.0.1", 0), HttpRequestHandler)
+        except OSError as exc:
+            raise unittest.SkipTest(
+                f"cannot spawn local HTTP server ({exc})")
+
+        host, port = server.server_address
+        cls.address = f"http://{host}:{port}"
+        cls.server = server
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        config.set(("extractor",), "http-cache", ":memory:")
+        HttpRequestHandler.requests = []
+
+    def tearDown(self):
+        for instance in httpcache._instances.values():
+            instance.close()
+        httpcache._instances.clear()
+        config.clear()
+
+    def _extractor(self):
+        extr = extractor.find(f"generic:{self.address}/")
+        extr.initialize()
+        return extr
+
+    def test_revalidate(self):
+        extr = self._extractor()
+        url = f"{self.address}/etag"
+
+        response = extr.request(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.text, "etag content")
+
+        response = extr.request(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.text, "etag content")
+        self.assertEqual(response.headers["ETag"], '"123"')
+
+        self.assertEqual(HttpRequestHandler.requests, [
+            ("/etag", None, None),
+            ("/etag", '"123"', None),
+        ])
+
+    def test_last_modified(self):
+        extr = self._extractor()
+        url = f"{self.address}/lastmod"
+
+        self.assertEqual(extr.request_json(url), {"lastmod": True})
+        self.assertEqual(extr.request_json(url), {"lastmod": True})
+
+        self.assertEqual(HttpRequestHandler.requests, [
+            ("/lastmod", None, None),
+            ("/lastmod", None, "Sat, 01 Jan 2000 00:00:00 GMT"),
+        ])
+
+    def test_ttl(self):
+        config.set(("extractor",), "http-cache-ttl", 3600)
+        extr = self._extractor()
+        url = f"{self.address}/etag"
+
+        extr.request(url)
+        with patch.object(extr.session, "request") as request:
+            response = extr.request(url)
+        request.assert_not_called()
+
+        self.assertEqual(response.text, "etag content")
+        self.assertEqual(len(HttpRequestHandler.requests), 1)
+
+    def test_params(self):
+        extr = self._extractor()
+        url = f"{self.address}/etag"
+
+        extr.request(url, params={"a": 1})
+        extr.request(url, params={"a": 2})
+        extr.request(url + "?a=1")
+
+        self.assertEqual(HttpRequestHandler.requests, [
+            ("/etag?a=1", None, None),
+            ("/etag?a=2", None, None),
+            ("/etag?a=1", '"123"', None),
+        ])
+
+    def test_credentials(self):
+        extr = self._extractor()
+        url = f"{self.address}/etag"
+
+        extr.request(url)
+        extr.cookies.set("session", "abc", domain="127.0.0.1")
+        extr.request(url)
+        extr.request(url, headers={"Authorization": "Bearer 123"})
+        extr.cookies.clear()
+        extr.request(url)
+
+        # logged-in and anonymous responses are cached separately
+        self.assertEqual(HttpRequestHandler.requests, [
+            ("/etag", None, None),
+            ("/etag", None, None),
+            ("/etag", None, None),
+            ("/etag", '"123"', None),
+        ])
+
+    def test_credentials_key(self):
+        hcache = httpcache.connect(":memory:")
+        url = f"{self.address}/etag"
+        cookies = requests.cookies.RequestsCookieJar()
+        cookies.set("session", "abc", domain="example.org")
+
+        self.assertEqual(hcache.key(url, None, {}, cookies), url)
+        self.assertNotEqual(
+            hcache.key(url, None, {"Authorization": "Basic a"}), url)
+        self.assertNotEqual(
+            hcache.key(url, None, {"Authorization": "Basic a"}),
+            hcache.key(url, None, {"Authorization": "Basic b"}))
+
+        cookies.set("session", "abc", domain="127.0.0.1")
+        key = hcache.key(url, None, {}, cookies)
+        self.assertTrue(key.startswith(url + " "))
+
+    def test_no_validators(self):
+        extr = self._extractor()
+        url = f"{self.address}/plain"
+
+        extr.request(url)
+        extr.request(url)
+
+        self.assertEqual(HttpRequestHandler.requests, [
+            ("/plain", None, None),
+            ("/plain", None, None),
+        ])
+
+    def test_post(self):
+        extr = self._extractor()
+        url = f"{self.address}/etag"
+
+        extr.request(url)
+        extr.request(url, method="POST", data=b"foo")
+        self.assertEqual(HttpRequestHandler.requests[1], ("/etag", None, None))
+
+    def test_evict(self):
+        hcache = httpcache.connect(":memory:")
+        hcache.max_size = 30
+        extr = self._extractor()
+
+        for path in ("/etag?1", "/etag?2", "/etag?3"):
+            extr.request(self.address + path)
+            self.assertLessEqual(hcache.size, 30)
+
+        keys = [row[0] for row in hcache.connection.execute(
+            "SELECT key FROM responses ORDER BY key")]
+        self.assertEqual(keys, [
+            f"{self.address}/etag?2",
+            f"{self.address}/etag?3",
+        ])
+
+    def test_vary(self):
+        hcache = httpcache.connect(":memory:")
+        extr = self._extractor()
+        url = f"{self.address}/vary"
+
+        extr.request(url, headers={"X-Test": "a"})
+        self.assertIsNotNone(hcache.lookup(url, {"X-Test": "a"}))
+        self.assertIsNone(hcache.lookup(url, {"X-Test": "b"}))
+
+    def test_set_cookie(self):
+        hcache = httpcache.connect(":memory:")
+        extr = self._extractor()
+        url = f"{self.address}/cookie"
+
+        extr.request(url)
+        extr.request(url)
+
+        self.assertIsNone(hcache.lookup(url, {}))
+        self.assertEqual(HttpRequestHandler.requests, [
+            ("/cookie", None, None),
+            ("/cookie", None, None),
+        ])
+
+    def test_error(self):
+        hcache = httpcache.connect(":memory:")
+        extr = self._extractor()
+        url = f"{self.address}/etag"
+        error = sqlite3.OperationalError("database is locked")
+
+        with patch.object(hcache, "lookup", side_effect=error), \
+                self.assertLogs(extr.log, "WARNING"):
+            response = extr.request(url)
+        self.assertEqual(response.text, "etag content")
+
+        with patch.object(hcache, "store", side_effect=error), \
+                self.assertLogs(extr.log, "WARNING"):
+            response = extr.request(url)
+        self.assertEqual(response.text, "etag content")
+
+        extr.request(url)
+        revalidate = hcache.revalidate
+
+        def revalidate_error(*args):
+            with patch.object(hcache, "connection") as connection:
+                connection.execute.side_effect = error
+                return revalidate(*args)
+
+        with patch.object(hcache, "revalidate", revalidate_error), \
+                self.assertLogs(extr.log, "WARNING"):
+            response = extr.request(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.text, "etag content")
+
+
+class HttpRequestHandler(http.server.BaseHTTPRequestHandler):
+    requests = []
+
+    def do_GET(self):
+        path, _, _ = self.path.partition("?")
+        inm = self.headers.get("If-None-Match")
+        ims = self.headers.get("If-Modified-Since")
+        self.requests.append((self.path, inm, ims))
+
+        headers = {}
+        if path == "/etag":
+            body = b"etag content"
+            headers["ETag"] = '"123"'
+            status = 304 if inm == '"123"' else 200
+        elif path == "/lastmod":
+            body = b'{"lastmod": true}'
+            headers["Last-Modified"] = "Sat, 01 Jan 2000 00:00:00 GMT"
+            status = 304 if ims == headers["Last-Modified"] else 200
+        elif path == "/cookie":
+            body = b"cookie"
+            headers["ETag"] = '"cookie"'
+            headers["Set-Cookie"] = "session=abc"
+            status = 200
+        elif path == "/vary":
+            body = b"vary"
+            headers["ETag"] = '"vary"'
+            headers["Vary"] = "X-Test"
+            status = 200
+        else:
+            body = b"plain"
+            status = 200
+
+        if status == 304:
+            body = b""
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.requests.append((self.path, None, None))
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+if __name__ == "__main__":
+    unittest.main()
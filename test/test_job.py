@@ -13,9 +13,16 @@ import unittest
 from unittest.mock import patch
 
 import io
+import time
+import queue
+import sqlite3
+import tempfile
+import threading
+from concurrent import futures
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from gallery_dl import job, config, text  # noqa E402
+from gallery_dl import job, config, text, util, exception  # noqa E402
+from gallery_dl import JobScheduler  # noqa E402
 from gallery_dl.extractor.common import Extractor, Message  # noqa E402
 
 
@@ -91,6 +98,242 @@ class TestDownloadJob(TestJob):
         self.assertFalse(tjob.archive)
         self.assertFalse(tjob.hooks)
 
+    def test_opt_init_prefetch(self):
+        config.set((), "prefetch", 2)
+        config.set((), "archive", ":memory:")
+
+        extr = TestExtractorNoop.from_url("test:noop")
+        tjob = self.jobclass(extr)
+        tjob._init()
+
+        # set up on the main thread, not by 'archive_prefetch()'
+        self.assertTrue(tjob.pathfmt)
+        self.assertTrue(tjob.archive)
+
+    def test_opt_download_workers(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            config.set((), "base-directory", tempdir)
+            config.set((), "download-workers", 3)
+            config.set(("output",), "mode", "null")
+            config.set((), "postprocessors", [{
+                "name"   : "metadata",
+                "mode"   : "print",
+                "event"  : "after",
+                "format" : "{num}",
+            }])
+
+            extr = TestExtractorText.from_url("test:text")
+            output = self._capture_stdout(extr)
+
+            self.assertEqual(output, "\n".join(map(str, range(10))) + "\n")
+            for num in range(10):
+                path = os.path.join(tempdir, "test_category", f"{num}.txt")
+                with open(path) as fp:
+                    self.assertEqual(fp.read(), f"content {num}")
+
+    def test_opt_download_workers_interrupt(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            config.set((), "base-directory", tempdir)
+            config.set((), "download-workers", 2)
+            config.set(("output",), "mode", "null")
+
+            extr = TestExtractorText.from_url("test:text")
+            tjob = self.jobclass(extr)
+            tjob._init()
+            tjob.initialize()
+
+            started = []
+            event = threading.Event()
+
+            def download(url, pathfmt):
+                started.append(url)
+                event.wait(5)
+                return False
+
+            def messages():
+                for num, msg in enumerate(extr):
+                    if num > 3:
+                        raise KeyboardInterrupt()
+                    yield msg
+
+            tjob._download_worker = download
+            tjob.hooks = {"file": [lambda _: files.append(1)]}
+            files = []
+
+            with self.assertRaises(KeyboardInterrupt):
+                tjob.dispatch(messages())
+            self.assertFalse(tjob._pending)
+            event.set()
+            tjob.handle_finalize()
+
+            # the third file never started
+            self.assertEqual(sorted(started),
+                             ["text:content 0", "text:content 1"])
+            self.assertEqual(files, [])
+
+    def test_opt_download_workers_archive(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            config.set((), "base-directory", tempdir)
+            config.set((), "download-workers", 3)
+            config.set((), "archive", ":memory:")
+            config.set((), "archive-format", "{num}")
+            config.set(("output",), "mode", "null")
+
+            class Extr(TestExtractorText):
+                filename_fmt = "{index}.{extension}"
+
+                def items(self):
+                    yield Message.Directory, "", {"extension": "txt"}
+                    for index, num in enumerate((1, 2, 1, 3, 2)):
+                        yield Message.Url, f"text:{num}", {
+                            "num": num, "index": index, "extension": "txt"}
+
+            urls = []
+            extr = Extr.from_url("test:text")
+            tjob = self.jobclass(extr)
+            worker = tjob._download_worker
+            tjob._download_worker = lambda url, pathfmt: (
+                urls.append(url) or worker(url, pathfmt))
+            tjob.run()
+
+            # files with the same archive key get downloaded only once
+            self.assertEqual(sorted(urls), ["text:1", "text:2", "text:3"])
+
+    def test_opt_postprocessor_background(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            config.set((), "base-directory", tempdir)
+            config.set((), "postprocessor-workers", 4)
+            config.set(("output",), "mode", "null")
+            config.set((), "postprocessors", [
+                {
+                    "name"      : "metadata",
+                    "event"     : "after",
+                    "background": True,
+                },
+                {
+                    "name"      : "metadata/print@after",
+                    "format"    : "{num}",
+                    "background": True,
+                },
+            ])
+
+            extr = TestExtractorText.from_url("test:text")
+            tjob = self.jobclass(extr)
+            output = self._capture_stdout(tjob)
+
+            self.assertEqual(tjob.status, 0)
+            self.assertIsNone(tjob._pp_pool)
+            self.assertEqual(output, "\n".join(map(str, range(10))) + "\n")
+            for num in range(10):
+                path = os.path.join(
+                    tempdir, "test_category", f"{num}.txt.json")
+                with open(path) as fp:
+                    self.assertIn(f'"num": {num}', fp.read())
+
+    def test_opt_postprocessor_background_sqlite(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            config.set((), "base-directory", tempdir)
+            config.set(("output",), "mode", "null")
+            config.set((), "postprocessors", [{
+                "name"      : "metadata",
+                "mode"      : "sqlite",
+                "event"     : "after",
+                "include"   : ["num"],
+                "background": 2,
+            }])
+
+            extr = TestExtractorText.from_url("test:text")
+            tjob = self.jobclass(extr)
+            self._capture_stdout(tjob)
+            self.assertEqual(tjob.status, 0)
+
+            from gallery_dl.postprocessor.metadata import MetadataDatabase
+            db = MetadataDatabase(os.path.join(
+                tempdir, "test_category", "metadata.sqlite3"))
+            try:
+                self.assertEqual(
+                    sorted(data["num"] for _, data in db), list(range(10)))
+            finally:
+                db.close()
+
+    def test_opt_postprocessor_background_error(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            config.set((), "base-directory", tempdir)
+            config.set(("output",), "mode", "null")
+            module = os.path.join(tempdir, "bgcheck.py")
+            with open(module, "w") as fp:
+                fp.write("def check(kwdict):\n"
+                         "    if kwdict['num'] == 4:\n"
+                         "        raise ValueError('num 4')\n")
+            config.set((), "archive", tempdir + "/archive.sqlite3")
+            config.set((), "archive-format", "{num}")
+            config.set((), "archive-prefix", "")
+
+            config.set((), "postprocessors", [
+                {
+                    "name"      : "python@after",
+                    "function"  : module + ":check",
+                    "background": True,
+                },
+                {
+                    "name"      : "metadata/print@after",
+                    "format"    : "{num}",
+                    "background": 2,
+                },
+            ])
+
+            extr = TestExtractorText.from_url("test:text")
+            tjob = self.jobclass(extr)
+            with self.assertLogs("download", "ERROR") as log_info:
+                output = self._capture_stdout(tjob)
+
+            self.assertEqual(tjob.status, 1)
+            self.assertEqual(sorted(output.split()),
+                             [str(n) for n in range(10) if n != 4])
+            self.assertIn("ValueError: num 4", log_info.output[0])
+
+            # a file with failed background callbacks is not archived
+            db = sqlite3.connect(tempdir + "/archive.sqlite3")
+            self.assertEqual(sorted(
+                int(entry) for entry, in db.execute(
+                    "SELECT entry FROM archive")),
+                [n for n in range(10) if n != 4])
+            db.close()
+
+    def test_defer(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            config.set((), "base-directory", tempdir)
+            config.set((), "archive", tempdir + "/archive.sqlite3")
+            config.set((), "archive-format", "{num}")
+            config.set(("output",), "mode", "null")
+
+            extr = TestExtractorText.from_url("test:text")
+            tjob = self.jobclass(extr)
+            tjob.initialize()
+
+            def file(pathfmt):
+                num = pathfmt.kwdict["num"]
+                if num in (2, 5):
+                    future = futures.Future()
+                    tjob.defer(future)
+                    threading.Timer(
+                        0.05, future.set_result, (num != 5,)).start()
+
+            def after(pathfmt):
+                nums.append(pathfmt.kwdict["num"])
+
+            nums = []
+            tjob.hooks = {"file": [file], "after": [after]}
+            tjob.run()
+
+            # files after a deferred one keep their order,
+            # a failed one gets neither 'after' callbacks nor archive entry
+            self.assertEqual(nums, [0, 1, 2, 3, 4, 6, 7, 8, 9])
+            db = sqlite3.connect(tempdir + "/archive.sqlite3")
+            self.assertEqual(db.execute(
+                "SELECT COUNT(*) FROM archive").fetchone()[0], 9)
+            db.close()
+
     def test_parent_metadata_extractor(self):
         config.set((), "parent-metadata", True)
 
@@ -462,6 +705,63 @@ class TestDataJob(TestJob):
         tjob = self.jobclass(extr)
         tjob._init()
 
+    def test_opt_prefetch(self):
+        config.set((), "prefetch", 2)
+
+        extr = TestExtractorText.from_url("test:text")
+        tjob = self.jobclass(extr, file=None)
+        tjob.run()
+        self.assertEqual(
+            [kwdict["num"] for kwdict in tjob.data_meta], list(range(10)))
+
+        extr = TestExtractorException.from_url("test:exception")
+        tjob = self.jobclass(extr, file=None)
+        tjob.run()
+        self.assertIsInstance(tjob.exception, ZeroDivisionError)
+
+    def test_opt_prefetch_abort(self):
+        config.set((), "prefetch", 2)
+
+        extr = TestExtractorEndless.from_url("test:endless")
+        produced = []
+        items = extr.items
+
+        def count():
+            for msg in items():
+                produced.append(msg)
+                yield msg
+        extr.items = count
+
+        messages = iter(extr)
+        next(messages)
+        util.FLAGS.FILE = "abort"
+        try:
+            with self.assertRaises(exception.AbortExtraction):
+                for _ in range(100):
+                    next(messages)
+        finally:
+            util.FLAGS.FILE = None
+
+        # no further results after the abort
+        num = len(produced)
+        time.sleep(0.05)
+        self.assertEqual(len(produced), num)
+        self.assertLess(num, 10)
+
+    def test_opt_prefetch_copy(self):
+        config.set((), "prefetch", 2)
+        data = {}
+
+        class Extr(TestExtractorNoop):
+            def items(self):
+                yield Message.Directory, "", data
+
+        for copy in (True, False):
+            Extr.prefetch_copy = copy
+            msg = next(iter(Extr.from_url("test:noop")))
+            self.assertEqual(msg[2], data)
+            self.assertEqual(msg[2] is data, not copy)
+
     def test_opt_follow(self):
         config.set((), "follow", "{user[bio]!R}")
 
@@ -510,6 +810,54 @@ class TestDataJob(TestJob):
         self.assertEqual(len(tjob.data_urls), 81)
 
 
+class TestJobScheduler(unittest.TestCase):
+
+    def tearDown(self):
+        config.clear()
+
+    def test_interrupt(self):
+        finalized = []
+
+        class Job(job.UrlJob):
+            def handle_finalize(self):
+                finalized.append(self.extractor.category)
+
+        class Scheduler(JobScheduler):
+            def _find(self, state):
+                extr = TestExtractorEndless.from_url("test:endless")
+                extr.category = state[1]
+                return extr
+
+        class Results(queue.Queue):
+            def get(self):
+                time.sleep(0.1)
+                raise KeyboardInterrupt()
+
+        class InputManager():
+            def entries(self):
+                return ((i, f"test{i}", None) for i in range(5))
+
+            def report(self, index, url):
+                pass
+
+        scheduler = Scheduler(Job, InputManager(), 3)
+        scheduler.results = Results()
+
+        with patch("sys.stdout", io.StringIO()), \
+                self.assertRaises(KeyboardInterrupt):
+            scheduler.run()
+
+        # all started jobs ran 'handle_finalize' before run() returned
+        self.assertEqual(sorted(finalized), ["test0", "test1", "test2"])
+        self.assertFalse(scheduler.threads)
+        self.assertIsNone(util.FLAGS.FILE)
+
+        results = scheduler.results.queue
+        self.assertEqual(len(results), 3)
+        for _, _, result in results:
+            self.assertIsInstance(result, exception.TerminateExtraction)
+
+
 class TestExtractor(Extractor):
     category = "test_category"
     subcategory = "test_subcategory"
@@ -583,6 +931,30 @@ class TestExtractorException(Extractor):
         return 1/0
 
 
+class TestExtractorText(Extractor):
+    category = "test_category"
+    subcategory = "test_subcategory_text"
+    filename_fmt = "{num}.{extension}"
+    pattern = r"test:text$"
+
+    def items(self):
+        data = {"extension": "txt"}
+        yield Message.Directory, "", data
+        for data["num"] in range(10):
+            yield Message.Url, f"text:content {data['num']}", data
+
+
+class TestExtractorEndless(Extractor):
+    category = "test_category"
+    subcategory = "test_subcategory_endless"
+    pattern = r"test:endless$"
+
+    def items(self):
+        while True:
+            time.sleep(0.01)
+            yield Message.Url, "https://example.org/", {}
+
+
 class TestExtractorNoop(Extractor):
     category = "test_category_alt"
     subcategory = "test_subcategory"
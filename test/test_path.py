@@ -12,6 +12,8 @@ import sys
 import unittest
 from unittest.mock import patch
 
+import tempfile
+
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from gallery_dl import path, extractor, config  # noqa E402
 
@@ -94,6 +96,112 @@ class TestPathObject(TestPath):
         self.assertEqual(pfmt.generate_path(
             ["foo", "bar", "{id:A+1}"]), "foo/bar/124")
 
+    def test_directory_cache(self):
+        config.set((), "directory", ["{category}", "{user[name]}", "{id}"])
+        pfmt = self._pfmt()
+        kwdict = {"category": "test", "user": {"name": "Foo"}, "id": 1}
+
+        segments = pfmt.build_directory(kwdict)
+        self.assertEqual(segments, ["test", "Foo", "1"])
+        self.assertEqual(len(pfmt._directory_cache), 1)
+
+        # same field values
+        kwdict = {"category": "test", "user": {"name": "Foo"}, "id": 1,
+                  "other": "value"}
+        self.assertIs(pfmt.build_directory(kwdict), segments)
+
+        # different field values
+        kwdict["user"]["name"] = "Bar"
+        self.assertEqual(pfmt.build_directory(kwdict), ["test", "Bar", "1"])
+        kwdict["id"] = True
+        self.assertEqual(pfmt.build_directory(kwdict),
+                         ["test", "Bar", "True"])
+        del kwdict["user"]
+        self.assertEqual(pfmt.build_directory(kwdict),
+                         ["test", "None", "True"])
+        self.assertEqual(len(pfmt._directory_cache), 4)
+
+        # unhashable field value
+        kwdict["id"] = [1, 2]
+        self.assertEqual(pfmt.build_directory(kwdict),
+                         ["test", "None", "[1, 2]"])
+        self.assertEqual(len(pfmt._directory_cache), 4)
+
+        # fields with unknown dependencies
+        for fmt in ("{_now:%Y}", "\fE str(id)"):
+            config.set((), "directory", ["{category}", fmt])
+            pfmt = self._pfmt()
+            pfmt.build_directory(kwdict)
+            self.assertEqual(pfmt._directory_cache, {}, fmt)
+
+    def test_skip_index(self):
+        config.set((), "skip-index", True)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config.set((), "base-directory", tmpdir)
+            pfmt = self._pfmt(kwdict=True)
+            directory = pfmt.realdirectory
+            os.makedirs(directory)
+            for name in ("file.ext", "file.1.ext"):
+                with open(directory + name, "w"):
+                    pass
+
+            pfmt.set_filename(KWDICT.copy())
+            pfmt.build_path()
+            with patch("os.lstat") as lstat:
+                self.assertTrue(pfmt.exists())
+                pfmt.check_file = pfmt._enum_file
+                self.assertFalse(pfmt.exists())
+            lstat.assert_not_called()
+            self.assertEqual(pfmt.filename, "file.2.ext")
+            self.assertEqual(pfmt.index, {"file.ext", "file.1.ext"})
+
+            # finalized files get added
+            pfmt.temppath = directory + "temp"
+            with open(pfmt.temppath, "w"):
+                pass
+            pfmt.finalize()
+            self.assertEqual(
+                pfmt.index, {"file.ext", "file.1.ext", "file.2.ext"})
+
+            # missing directory
+            pfmt.set_directory({**KWDICT, "category": "missing"})
+            pfmt.set_filename(KWDICT.copy())
+            pfmt.build_path()
+            self.assertFalse(pfmt.exists())
+            self.assertEqual(pfmt.index, set())
+
+    def test_makedirs(self):
+        pfmt = self._pfmt()
+        with patch("os.makedirs") as makedirs:
+            for _ in range(3):
+                pfmt.makedirs("foo/bar/")
+                pfmt.makedirs("foo/baz/")
+        self.assertEqual(makedirs.call_count, 2)
+        self.assertEqual(list(pfmt.directories), ["foo/bar/", "foo/baz/"])
+
+        with patch("os.makedirs") as makedirs:
+            for num in range(300):
+                pfmt.makedirs(f"{num}/")
+        self.assertEqual(makedirs.call_count, 300)
+        self.assertEqual(len(pfmt.directories), 256)
+        self.assertNotIn("foo/bar/", pfmt.directories)
+        self.assertIn("299/", pfmt.directories)
+
+    def test_makedirs_force(self):
+        pfmt = self._pfmt()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            directory = os.path.join(tmpdir, "foo", "bar")
+            pfmt.makedirs(directory)
+            os.rmdir(directory)
+
+            # cached, but no longer existing
+            pfmt.makedirs(directory)
+            self.assertFalse(os.path.isdir(directory))
+
+            pfmt.makedirs(directory, True)
+            self.assertTrue(os.path.isdir(directory))
+            self.assertIn(directory, pfmt.directories)
+
     @patch("os.sep", "/")
     @patch("gallery_dl.path.WINDOWS", False)
     def test_generate_path_unix(self):
@@ -39,6 +39,10 @@ class FakeJob():
         self.get_logger = logging.getLogger
         self.hooks = collections.defaultdict(list)
         self.status = 0
+        self.deferred = None
+
+    def defer(self, future):
+        self.deferred = future
 
     def register_hooks(self, hooks, options=None):
         for hook, callback in hooks.items():
@@ -211,6 +215,132 @@ class ClassifyTest(BasePostprocessorTest):
         self.assertEqual(self.pathfmt.realpath, f"{path}/file.foo")
 
 
+class DedupTest(BasePostprocessorTest):
+
+    def _create(self, options=None, data=None):
+        if options is None:
+            options = {}
+        options["database"] = os.path.join(self.dir.name, "dedup.sqlite3")
+        util.remove_file(options["database"])
+        return BasePostprocessorTest._create(self, options, data)
+
+    def _file(self, name, content):
+        kwdict = {"category": "test", "filename": name, "extension": "ext"}
+        self.pathfmt.set_filename(kwdict)
+        self.pathfmt.build_path()
+        # remove links created by previous tests
+        util.remove_file(self.pathfmt.realpath)
+        if content is not None:
+            with self.pathfmt.open("wb") as fp:
+                fp.write(content)
+        return self.pathfmt.realpath
+
+    def test_link(self):
+        pp = self._create()
+
+        path1 = self._file("file1", b"Foo Bar\n")
+        self._trigger(("file",))
+        path2 = self._file("file2", b"Foo Bar\n")
+        self._trigger(("file",))
+        path3 = self._file("file3", b"Foo Baz\n")
+        self._trigger(("file",))
+
+        self.assertTrue(os.path.samefile(path1, path2))
+        self.assertFalse(os.path.samefile(path1, path3))
+        self.assertEqual(pp.count, 1)
+        self.assertEqual(pp.saved, 8)
+
+        with self.assertLogs(pp.log, "INFO") as log_info:
+            self._trigger(("finalize",))
+        self.assertEqual(log_info.output[0], (
+            "INFO:postprocessor.dedup:"
+            "Saved 8B by linking 1 duplicate file"))
+
+    def test_link_mtime(self):
+        self._create()
+
+        path1 = self._file("file1", b"Foo Bar\n")
+        self._trigger(("file",))
+        self.pathfmt.finalize()
+        mtime = os.stat(path1).st_mtime
+
+        path2 = self._file("file2", b"Foo Bar\n")
+        self.pathfmt.kwdict["_mtime_http"] = 123456789
+        self._trigger(("file",))
+        self.pathfmt.finalize()
+
+        self.assertTrue(os.path.samefile(path1, path2))
+        self.assertEqual(os.stat(path1).st_mtime, mtime)
+
+        # explicit paths get updated
+        self.pathfmt.set_mtime(path1)
+        self.assertEqual(os.stat(path1).st_mtime, 123456789)
+
+    def test_reflink_unsupported(self):
+        from gallery_dl.postprocessor import dedup
+        # no 'fcntl' module on Windows
+        with patch.dict(sys.modules, {"fcntl": None}), \
+                self.assertRaises(OSError):
+            dedup._reflink(__file__, os.path.join(self.dir.name, "foo"))
+
+    def test_link_missing(self):
+        pp = self._create()
+
+        path1 = self._file("file1", b"Foo Bar\n")
+        self._trigger(("file",))
+        os.unlink(path1)
+
+        # the new file replaces the missing one
+        path2 = self._file("file2", b"Foo Bar\n")
+        self._trigger(("file",))
+        path3 = self._file("file3", b"Foo Bar\n")
+        self._trigger(("file",))
+
+        self.assertTrue(os.path.samefile(path2, path3))
+        self.assertEqual(pp.count, 1)
+
+    def test_stream(self):
+        pp = self._create({"prefix": 4})
+        path1 = self._file("file1", b"Foo Bar\n")
+        self._trigger(("file",))
+
+        path2 = self._file("file2", None)
+        self._trigger(("prepare-after",))
+        tee, = self.pathfmt.kwdict["_http_tee"]
+
+        with self.pathfmt.open("w+b") as fp:
+            update = tee.start(fp, 0, 8)
+            update(b"Fo")
+            fp.write(b"Fo")
+            with self.assertRaises(exception.DownloadComplete):
+                update(b"o Bar\n")
+
+        self.assertTrue(os.path.samefile(path1, path2))
+        self._trigger(("file",))
+        self.assertEqual(pp.count, 1)
+
+    def test_stream_prefix_mismatch(self):
+        pp = self._create({"prefix": 4})
+        path1 = self._file("file1", b"Foo Bar\n")
+        self._trigger(("file",))
+
+        path2 = self._file("file2", None)
+        self._trigger(("prepare-after",))
+        tee, = self.pathfmt.kwdict["_http_tee"]
+
+        with self.pathfmt.open("w+b") as fp:
+            update = tee.start(fp, 0, 8)
+            for data in (b"Fob ", b"Bar\n"):
+                update(data)
+                fp.write(data)
+
+        self._trigger(("file",))
+        self.assertFalse(os.path.samefile(path1, path2))
+        self.assertEqual(pp.count, 0)
+        self.assertEqual(pp.database.find(
+            tee.hashes[0][1].hexdigest(), 8), path2)
+
+
 class DirectoryTest(BasePostprocessorTest):
 
     def test_default(self):
@@ -574,6 +704,63 @@ class HashTest(BasePostprocessorTest):
             "3e1095b50736c4fd1e2deea152e3c8ecd5993462a747208e4d842659935a1c62",
             kwdict["sha512"], "sha512")
 
+    def test_stream(self):
+        self._create({})
+        self._trigger(("prepare-after",))
+
+        tee, = self.pathfmt.kwdict["_http_tee"]
+        with self.pathfmt.open("w+b") as fp:
+            update = tee.start(fp)
+            for data in (b"Foo ", b"Bar\n"):
+                update(data)
+                fp.write(data)
+
+        with patch("builtins.open") as mock:
+            self._trigger(("file",))
+        mock.assert_not_called()
+
+        kwdict = self.pathfmt.kwdict
+        self.assertEqual(
+            "35c9c9c7c90ad764bae9e2623f522c24", kwdict["md5"], "md5")
+        self.assertEqual(
+            "14d3d804494ef4e57d72de63e4cfee761240471a", kwdict["sha1"], "sha1")
+
+    def test_stream_resume(self):
+        self._create({"chunk-size": 3})
+        self._trigger(("prepare-after",))
+
+        with self.pathfmt.open("wb") as fp:
+            fp.write(b"Foo B")
+
+        tee, = self.pathfmt.kwdict["_http_tee"]
+        with self.pathfmt.open("r+b") as fp:
+            fp.seek(5)
+            tee.start(fp, 5)(b"ar\n")
+            fp.write(b"ar\n")
+
+        self._trigger(("file",))
+        self.assertEqual(
+            "35c9c9c7c90ad764bae9e2623f522c24", self.pathfmt.kwdict["md5"])
+
+    def test_stream_incomplete(self):
+        self._create({})
+        self._trigger(("prepare-after",))
+
+        # file not (entirely) written through the tee
+        tee, = self.pathfmt.kwdict["_http_tee"]
+        with self.pathfmt.open("w+b") as fp:
+            tee.start(fp)(b"Foo ")
+            fp.write(b"Foo Bar\n")
+
+        self._trigger(("file",))
+        self.assertEqual(
+            "35c9c9c7c90ad764bae9e2623f522c24", self.pathfmt.kwdict["md5"])
+
+    def test_stream_disabled(self):
+        self._create({"stream": False})
+        self._trigger(("prepare-after",))
+        self.assertNotIn("_http_tee", self.pathfmt.kwdict)
+
 
 class MetadataTest(BasePostprocessorTest):
 
@@ -648,6 +835,86 @@ class MetadataTest(BasePostprocessorTest):
 "public" : "hello \\u30ef\\u30fc\\u30eb\\u30c9"}
 """)
 
+    def test_metadata_jsonl(self):
+        pp = self._create({"mode": "jsonl", "include": ["id"]})
+        self.assertEqual(pp.run, pp._run_default)
+
+        path = os.path.join(self.pathfmt.realdirectory, "data.jsonl")
+        util.remove_file(path)
+
+        for num in range(3):
+            self.pathfmt.kwdict["id"] = num
+            self._trigger()
+            # each record gets written immediately
+            with open(path) as fp:
+                self.assertEqual(len(fp.readlines()), num + 1)
+
+        with open(path) as fp:
+            self.assertEqual(fp.read(), '{"id": 0}\n{"id": 1}\n{"id": 2}\n')
+
+    def test_metadata_jsonl_buffer(self):
+        pp = self._create({"mode": "jsonl", "include": ["id"],
+                           "buffer": True})
+        self.assertEqual(pp.run, pp._run_sink)
+
+        path = os.path.join(self.pathfmt.realdirectory, "data.jsonl")
+        util.remove_file(path)
+
+        for num in range(3):
+            self.pathfmt.kwdict["id"] = num
+            self._trigger()
+        self.assertEqual(pp._sink_path, path)
+
+        self._trigger(("finalize",))
+        self.assertIsNone(pp._sink)
+        with open(path) as fp:
+            self.assertEqual(fp.read(), '{"id": 0}\n{"id": 1}\n{"id": 2}\n')
+
+    def test_metadata_jsonl_buffer_removed(self):
+        self._create({"mode": "jsonl", "include": ["id"],
+                      "buffer": True, "directory": "sub"})
+        self.pathfmt.kwdict["id"] = 1
+        directory = os.path.join(self.pathfmt.realdirectory, "sub")
+        path = os.path.join(directory, "data.jsonl")
+
+        self._trigger()
+        self._trigger(("finalize",))
+        os.unlink(path)
+        os.rmdir(directory)
+
+        # directory is still cached as existing
+        self._trigger()
+        self._trigger(("finalize",))
+        with open(path) as fp:
+            self.assertEqual(fp.read(), '{"id": 1}\n')
+
+    def test_metadata_sqlite(self):
+        self._create({"mode": "sqlite", "exclude": ["category"]})
+
+        path = os.path.join(self.pathfmt.realdirectory, "metadata.sqlite3")
+        util.remove_file(path)
+
+        for num in range(3):
+            self.pathfmt.kwdict["id"] = num
+            self.pathfmt.set_filename(self.pathfmt.kwdict)
+            self.pathfmt.kwdict["filename"] = f"file{num}"
+            self.pathfmt.build_path()
+            self._trigger()
+        self._trigger(("finalize",))
+
+        from gallery_dl.postprocessor.metadata import MetadataDatabase
+        db = MetadataDatabase(path)
+        try:
+            file1 = os.path.join(self.pathfmt.realdirectory, "file1.ext")
+            self.assertEqual(db.get(file1), {
+                "id": 1, "filename": "file1", "extension": "ext"})
+            self.assertIsNone(db.get(file1 + ".part"))
+            self.assertEqual(
+                sorted(os.path.basename(p) for p, _ in db),
+                ["file0.ext", "file1.ext", "file2.ext"])
+        finally:
+            db.close()
+
     def test_metadata_tags(self):
         pp = self._create(
             {"mode": "tags"},
@@ -1174,6 +1441,111 @@ class RenameTest(BasePostprocessorTest):
         self.assertEqual(sorted(os.listdir(path)), ["12345.ext", "file.ext"])
 
 
+@unittest.skipIf(os.name == "nt", "no executable scripts")
+class UgoiraTest(BasePostprocessorTest):
+
+    FRAMES = [
+        {"file": "000000.jpg", "delay": 50},
+        {"file": "000001.jpg", "delay": 100},
+        {"file": "000002.jpg", "delay": 50},
+    ]
+
+    def _create(self, options=None, data=None):
+        # stand-in for ffmpeg: store stdin and arguments in its output file
+        ffmpeg = os.path.join(self.dir.name, "ffmpeg")
+        with open(ffmpeg, "w") as fp:
+            fp.write(f"""#!{sys.executable}
+import sys
+data = sys.stdin.buffer.read()
+with open(sys.argv[-1], "wb") as fp:
+    fp.write(repr(sys.argv[1:-1]).encode() + b"\\n" + data)
+""")
+        os.chmod(ffmpeg, 0o755)
+
+        options = {"ffmpeg-location": ffmpeg, **(options or {})}
+        data = {"_ugoira_frame_data": [f.copy() for f in self.FRAMES],
+                "id": 123, **(data or {})}
+        pp = BasePostprocessorTest._create(self, options, data)
+        pp.log = output.LoggerAdapter(pp.log, Mock(_logger_extra={}))
+        self._trigger(("prepare",))
+        self.pathfmt.temppath = self.pathfmt.realpath + ".part"
+        os.makedirs(self.pathfmt.realdirectory, exist_ok=True)
+        util.remove_file(self.pathfmt.realpath)
+
+        with zipfile.ZipFile(self.pathfmt.temppath, "w") as zfile:
+            for num, frame in enumerate(self.FRAMES):
+                zfile.writestr(frame["file"], str(num) * (num+1))
+        return pp
+
+    def _result(self, path=None):
+        with open(path or self.pathfmt.realpath, "rb") as fp:
+            args, _, data = fp.read().partition(b"\n")
+        return eval(args.decode()), data
+
+    def test_pipe(self):
+        self._create({"mode": "pipe"})
+        self._trigger(("file",))
+        self.assertEqual(self.pathfmt.extension, "webm")
+        self.assertTrue(self.pathfmt.delete)
+
+        args, data = self._result()
+        self.assertEqual(args[:6], [
+            "-f", "image2pipe", "-framerate", "1000/50", "-i", "-"])
+        self.assertEqual(data, b"0" + b"11"*2 + b"222")
+
+    def test_pipe_error(self):
+        pp = self._create({"mode": "pipe", "ffmpeg-location": "/bin/false"})
+        with self.assertLogs(pp.log.logger, "ERROR"):
+            self._trigger(("file",))
+        self.assertEqual(self.pathfmt.realpath, self.pathfmt.temppath)
+
+    def test_processes(self):
+        pp = self._create({"mode": "pipe", "processes": 2})
+        self._trigger(("file",))
+        realpath = self.pathfmt.realpath
+        self.pathfmt.finalize()
+
+        self._trigger(("finalize",))
+        self.assertIsNone(pp.pool)
+        self.assertIs(self.job.deferred.result(), True)
+        self.assertEqual(self._result(realpath)[1], b"0" + b"11"*2 + b"222")
+        self.assertEqual(os.listdir(os.path.dirname(realpath)),
+                         [os.path.basename(realpath)])
+
+    def test_processes_error(self):
+        pp = self._create({"mode": "pipe", "processes": 2,
+                           "ffmpeg-location": "/bin/false"})
+        self._trigger(("file",))
+        temppath = self.pathfmt.temppath
+        self.pathfmt.finalize()
+
+        with self.assertLogs(pp.log.logger, "ERROR"):
+            self._trigger(("finalize",))
+        # no archive entry or later postprocessors for this file
+        self.assertIs(self.job.deferred.result(), False)
+        # downloaded ZIP archive stays available
+        with zipfile.ZipFile(temppath) as zfile:
+            self.assertEqual(len(zfile.namelist()), 3)
+        os.unlink(temppath)
+
+    def test_commands_error(self):
+        pp = self._create({"mode": "pipe"})
+        with patch.object(pp, "_process", side_effect=OSError("x")), \
+                self.assertLogs(pp.log.logger, "ERROR"):
+            self._trigger(("file",))
+        self.assertEqual(self.pathfmt.realpath, self.pathfmt.temppath)
+
+    def test_processes_commands_error(self):
+        pp = self._create({"mode": "pipe", "processes": 2})
+        self.job.deferred = None
+        with patch.object(pp, "_process", side_effect=OSError("x")), \
+                self.assertLogs(pp.log.logger, "ERROR"):
+            self._trigger(("file",))
+        self.assertEqual(self.pathfmt.realpath, self.pathfmt.temppath)
+        self.assertIsNone(self.job.deferred)
+        self.assertIsNone(pp.pool)
+
+
 class ZipTest(BasePostprocessorTest):
 
     def test_zip_default(self):
@@ -1196,6 +1568,89 @@ class ZipTest(BasePostprocessorTest):
         ))
         self.assertTrue(pp.args[0].endswith("/test.zip"))
 
+    def test_zip_stream(self):
+        pp = self._create({"mode": "stream", "batch-size": 2})
+        self.assertEqual(self.job.hooks["file"][0], pp.write_safe)
+        self.assertEqual(self.job.hooks["prepare-after"][0], pp.prepare)
+
+        self._trigger(("prepare-after",))
+        self.assertEqual(self.pathfmt.kwdict["_http_sink"], pp.sink)
+
+        # write two members; abort a third one
+        for name in ("file0.ext", "file1.ext", "file2.ext"):
+            self.pathfmt.filename = name
+            fp = pp.sink(self.pathfmt, 6)
+            self.assertIsNone(pp.sink(self.pathfmt, 6))  # archive in use
+            fp.write(b"foo")
+            fp.write(b"bar")
+            self.assertEqual(fp.tell(), 6)
+            if name == "file2.ext":
+                fp.abort()
+            else:
+                fp.close()
+
+        # existing member
+        self.pathfmt.filename = "file0.ext"
+        self.assertIsNone(pp.sink(self.pathfmt))
+
+        self._trigger(("finalize",))
+        with zipfile.ZipFile(pp.args[0]) as file:
+            self.assertEqual(file.namelist(), ["file0.ext", "file1.ext"])
+            self.assertEqual(file.read("file1.ext"), b"foobar")
+            self.assertIsNone(file.testzip())
+        os.unlink(pp.args[0])
+
+    def test_zip_stream_abort(self):
+        pp = self._create({"mode": "stream"})
+
+        for name, data in (("file0.ext", b"foo"),
+                           ("file1.ext", b"aborted"),
+                           ("file2.ext", b"bar")):
+            self.pathfmt.filename = name
+            fp = pp.sink(self.pathfmt, 6)
+            fp.write(data)
+            if name == "file1.ext":
+                fp.abort()
+            else:
+                fp.close()
+
+        self._trigger(("finalize",))
+        with zipfile.ZipFile(pp.args[0]) as file:
+            self.assertEqual(file.namelist(), ["file0.ext", "file2.ext"])
+            self.assertEqual(file.read("file2.ext"), b"bar")
+            self.assertIsNone(file.testzip())
+        # data of aborted members gets overwritten
+        with open(pp.args[0], "rb") as fp:
+            self.assertNotIn(b"aborted", fp.read())
+        os.unlink(pp.args[0])
+
+    def test_zip_stream_default(self):
+        pp = self._create({"mode": "stream"})
+        self.assertEqual(pp.batch, 1)
+
+    def test_zip_stream_batch(self):
+        pp = self._create({"mode": "stream", "batch-size": 2,
+                           "keep-files": True})
+        self.assertNotIn("prepare-after", self.job.hooks)
+
+        path = f"{self.pathfmt.realdirectory}file.ext"
+        os.makedirs(self.pathfmt.realdirectory, exist_ok=True)
+        with open(path, "w") as fp:
+            fp.write("foobar\n")
+        self.pathfmt.temppath = path
+
+        for i in range(3):
+            self.pathfmt.filename = f"file{i}.ext"
+            self._trigger()
+            # archive gets closed after every 2nd file
+            self.assertEqual(pp.zfile is None, i == 1)
+
+        self._trigger(("finalize",))
+        with zipfile.ZipFile(pp.args[0]) as file:
+            self.assertEqual(len(file.NameToInfo), 3)
+        os.unlink(pp.args[0])
+        os.unlink(path)
+
     def test_zip_options(self):
         pp = self._create({
             "keep-files": True,
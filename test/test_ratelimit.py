@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Copyright 2026 Mike Fährmann
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 2 as
+# published by the Free Software Foundation.
+
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+import time
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from gallery_dl import ratelimit  # noqa E402
+
+
+class TestRateLimit(unittest.TestCase):
+
+    def setUp(self):
+        self.now = 1000.0
+        patcher = patch("time.monotonic", lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_acquire(self):
+        limit = ratelimit.RateLimit()
+
+        self.assertEqual(limit.acquire(2.0), 0.0)
+        self.assertEqual(limit.acquire(2.0), 2.0)
+        self.assertEqual(limit.acquire(2.0), 4.0)
+
+        self.now += 10.0
+        self.assertEqual(limit.acquire(2.0), 0.0)
+
+        self.assertEqual(limit.requests, 4)
+        self.assertEqual(limit.waits, 2)
+        self.assertEqual(limit.waited, 6.0)
+
+    def test_acquire_burst(self):
+        limit = ratelimit.RateLimit()
+
+        self.assertEqual(limit.acquire(2.0, 3), 0.0)
+        self.assertEqual(limit.acquire(2.0, 3), 0.0)
+        self.assertEqual(limit.acquire(2.0, 3), 0.0)
+        self.assertEqual(limit.acquire(2.0, 3), 2.0)
+
+        # one token gets refilled per interval
+        self.now += 4.0
+        self.assertEqual(limit.acquire(2.0, 3), 0.0)
+        self.assertEqual(limit.acquire(2.0, 3), 2.0)
+
+        self.now += 20.0
+        self.assertEqual(limit.acquire(2.0, 3), 0.0)
+        self.assertEqual(limit.acquire(2.0, 3), 0.0)
+        self.assertEqual(limit.acquire(2.0, 3), 0.0)
+        self.assertEqual(limit.acquire(2.0, 3), 2.0)
+
+    def test_release(self):
+        limit = ratelimit.RateLimit()
+
+        self.assertEqual(limit.acquire(2.0), 0.0)
+        self.now += 5.0
+        limit.release(2.0)
+        self.assertEqual(limit.acquire(2.0), 2.0)
+
+    def test_block(self):
+        limit = ratelimit.RateLimit()
+
+        limit.block(30.0)
+        self.assertEqual(limit.acquire(), 30.0)
+        limit.block(10.0)
+        self.assertEqual(limit.acquire(1.0), 30.0)
+
+    def test_update(self):
+        limit = ratelimit.RateLimit()
+
+        response = Response({})
+        self.assertEqual(limit.update(response), 0.0)
+
+        response.headers = {"x-ratelimit-remaining": "5",
+                            "x-ratelimit-reset": "60"}
+        self.assertEqual(limit.update(response), 0.0)
+
+        response.headers = {"x-ratelimit-remaining": "0.0",
+                            "x-ratelimit-reset": "60"}
+        self.assertEqual(limit.update(response), 60.0)
+        self.assertEqual(limit.acquire(), 60.0)
+
+        response.headers = {"x-ratelimit-remaining": "0",
+                            "x-ratelimit-reset": str(time.time() + 120)}
+        self.assertAlmostEqual(limit.update(response), 120.0, 0)
+
+        response.headers = {"x-ratelimit-remaining": "0",
+                            "x-ratelimit-reset": "2020-01-01T00:00:00Z"}
+        self.assertEqual(limit.update(response), 0.0)
+
+    def test_retry_after(self):
+        response = Response({})
+        self.assertEqual(ratelimit.retry_after(response), 0.0)
+
+        response.headers = {"retry-after": "30"}
+        self.assertEqual(ratelimit.retry_after(response), 30.0)
+
+        response.headers = {"retry-after": time.strftime(
+            "%a, %d %b %Y %H:%M:%S GMT", time.gmtime(time.time() + 90))}
+        self.assertAlmostEqual(ratelimit.retry_after(response), 90.0, -1)
+
+        response.headers = {"retry-after": "foo"}
+        self.assertEqual(ratelimit.retry_after(response), 0.0)
+
+    def test_adaptive(self):
+        limit = ratelimit.RateLimit()
+        limit.adaptive = "test:adaptive"
+
+        with patch("gallery_dl.ratelimit._store") as store:
+            # no effect without a previous failure
+            for _ in range(ratelimit.ADAPT_WINDOW):
+                limit.success()
+            self.assertEqual(limit.interval, 0.0)
+            store.assert_not_called()
+
+            limit.failure()
+            self.assertEqual(limit.interval, 1.0)
+            store.assert_called_with("test:adaptive", 1.0)
+
+            # ignore failures during the current interval
+            limit.failure()
+            self.assertEqual(limit.interval, 1.0)
+
+            self.now += 1.0
+            limit.failure()
+            self.assertEqual(limit.interval, 2.0)
+            self.assertEqual(limit.acquire(0.5), 0.0)
+            self.assertEqual(limit.acquire(0.5), 2.0)
+
+            for _ in range(ratelimit.ADAPT_WINDOW - 1):
+                limit.success()
+            self.assertEqual(limit.interval, 2.0)
+            limit.success()
+            self.assertAlmostEqual(limit.interval, 1.0 / 0.6)
+            store.assert_called_with("test:adaptive", limit.interval)
+
+            self.now += 1000.0
+            for _ in range(10):
+                limit.failure()
+                self.now += 1000.0
+            self.assertEqual(limit.interval, ratelimit.ADAPT_MAX)
+
+            limit.interval = 0.0502
+            for _ in range(ratelimit.ADAPT_WINDOW):
+                limit.success()
+            self.assertEqual(limit.interval, 0.0)
+
+    def test_adaptive_persist(self):
+        with patch("gallery_dl.ratelimit._load", return_value=4.0):
+            limit = ratelimit.adaptive("test:persist")
+        self.assertEqual(limit.interval, 4.0)
+        self.assertEqual(limit.adaptive, "test:persist")
+        self.assertIs(ratelimit.adaptive("test:persist"), limit)
+
+    def test_threads(self):
+        limit = ratelimit.RateLimit()
+        results = []
+
+        def acquire():
+            results.append(limit.acquire(1.0))
+
+        threads = [threading.Thread(target=acquire) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(sorted(results), [float(i) for i in range(10)])
+
+    def test_registry(self):
+        limit = ratelimit.get("test:registry")
+        self.assertIs(ratelimit.get("test:registry"), limit)
+        self.assertIsNot(ratelimit.get("test:other"), limit)
+
+        limit.acquire(1.0)
+        limit.acquire(1.0)
+        self.assertEqual(ratelimit.stats()["test:registry"], {
+            "requests": 2,
+            "waits"   : 1,
+            "waited"  : 1.0,
+            "interval": 0.0,
+        })
+
+
+class Response():
+
+    def __init__(self, headers):
+        self.headers = headers
+
+
+if __name__ == "__main__":
+    unittest.main()
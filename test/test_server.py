@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Copyright 2026 Mike Fährmann
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 2 as
+# published by the Free Software Foundation.
+
+import os
+import sys
+import json
+import unittest
+import tempfile
+import threading
+import http.client
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from gallery_dl import server, config, job, ratelimit  # noqa E402
+
+
+class TestServer(unittest.TestCase):
+
+    def setUp(self):
+        config.set(("output",), "mode", "null")
+        self.server = server.Server(job.DataJob)
+        self.server.start()
+
+    def tearDown(self):
+        self.server.stop(True)
+        config.clear()
+
+    def _run(self, data):
+        entry, event = self.server.submit(data)
+        self.assertTrue(event.wait(10))
+        return entry
+
+    def test_submit(self):
+        entry = self._run({"urls": ["noop", "https://example.org/"]})
+
+        self.assertEqual(entry["status"], "finished")
+        self.assertEqual(entry["exit"], 64)
+        self.assertEqual(entry["results"], [
+            {"url": "noop", "status": 0, "data": []},
+            {"url": "https://example.org/", "status": 64},
+        ])
+        self.assertIs(self.server.status(entry["id"]), entry)
+        self.assertEqual(self.server.status(), [entry])
+
+    def test_submit_invalid(self):
+        for data in ({}, {"urls": 1}, {"urls": [None]},
+                     {"url": "noop", "type": "foo"},
+                     {"url": "noop", "options": []}):
+            with self.assertRaises(ValueError):
+                self.server.submit(data)
+
+    def test_submit_options_forbidden(self):
+        for key in ("postprocessors", "extractor.postprocessors",
+                    "extractor.base-directory", "extractor.noop.archive",
+                    "extractor.cookies", "extractor.image-filter",
+                    "extractor.filename", "output.mode", "cache.file",
+                    "downloader.http.postprocessors"):
+            with self.assertRaises(ValueError, msg=key):
+                self.server.submit({"url": "noop", "options": {key: ""}})
+
+        self.assertEqual(self.server.status(), [])
+
+    def test_submit_options_extra(self):
+        srv = server.Server(job.DataJob, options=("foo",))
+        srv.submit({"url": "noop", "options": {"extractor.foo": 1}})
+        with self.assertRaises(ValueError):
+            self.server.submit(
+                {"url": "noop", "options": {"extractor.foo": 1}})
+
+    def test_options(self):
+        def run(entry, jobtype, options):
+            values.append(config.get(("extractor", "noop"), "image-range"))
+            return 0
+
+        values = []
+        self.server.run = run
+        self._run({"url": "noop",
+                   "options": {"extractor.noop.image-range": "1-5"}})
+        self._run({"url": "noop"})
+
+        self.assertEqual(values, ["1-5", None])
+
+    def test_options_local(self):
+        def run(entry, jobtype, options):
+            event.wait(5)
+            return 0
+
+        event = threading.Event()
+        self.server.run = run
+        entry, done = self.server.submit({
+            "url": "noop", "options": {"extractor.noop.image-range": "1-5"}})
+
+        # options are not visible outside of the worker thread
+        self.assertIsNone(config.get(("extractor", "noop"), "image-range"))
+        event.set()
+        self.assertTrue(done.wait(10))
+
+    def test_sessions(self):
+        self._run({"url": "noop", "type": "download"})
+        self.assertEqual(len(self.server.sessions), 1)
+        session = self.server.sessions["noop", None, "null"]
+
+        self._run({"url": "noop", "type": "download"})
+        self.assertIs(self.server.sessions["noop", None, "null"], session)
+
+        self._run({"url": "noop", "type": "download",
+                   "options": {"extractor.timeout": 10}})
+        self.assertEqual(len(self.server.sessions), 2)
+
+    def test_sessions_cookies(self):
+        config.set(("extractor",), "cookies", {"a": "1"})
+        self._run({"url": "noop", "type": "download"})
+        session = self.server.sessions["noop", None, '{"a":"1"}']
+        self.assertEqual(session.cookies.get("a"), "1")
+
+        # cookies get reloaded for a reused session
+        session.cookies.set("a", "2", domain="")
+        self._run({"url": "noop", "type": "download"})
+        self.assertEqual(session.cookies.get("a"), "1")
+
+        # different cookies, different session
+        config.set(("extractor",), "cookies", {"a": "3"})
+        self._run({"url": "noop", "type": "download"})
+        self.assertEqual(len(self.server.sessions), 2)
+
+    def test_history(self):
+        self.server.history = 2
+        for _ in range(4):
+            self._run({"url": "noop"})
+        self.assertEqual(
+            [entry["id"] for entry in self.server.status()], [3, 4])
+
+
+class TestBuildServer(unittest.TestCase):
+
+    def setUp(self):
+        if server.UnixServer is None:
+            raise unittest.SkipTest("no UNIX socket support")
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tempdir.name, "socket")
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def test_unix_socket(self):
+        srv = server.build_server(self.path)
+        srv.server_close()
+        self.assertTrue(os.path.exists(self.path))
+
+        # replace a leftover socket
+        srv = server.build_server(self.path)
+        srv.server_close()
+
+    def test_unix_socket_file(self):
+        with open(self.path, "w") as fp:
+            fp.write("foo")
+
+        with self.assertRaises(ValueError):
+            server.build_server(self.path)
+        with open(self.path) as fp:
+            self.assertEqual(fp.read(), "foo")
+
+
+class TestRequestHandler(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.srv = server.build_server("127.0.0.1:0")
+        cls.srv.token = "TOKEN"
+        cls.srv.gdl = server.Server(job.DataJob)
+        cls.srv.gdl.start()
+        cls.thread = threading.Thread(target=cls.srv.serve_forever)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.srv.shutdown()
+        cls.srv.server_close()
+        cls.srv.gdl.stop(True)
+        cls.thread.join()
+
+    def _request(self, method, path, data=None, headers=None):
+        conn = http.client.HTTPConnection(*self.srv.server_address)
+        if headers is None:
+            headers = {"Authorization": "Bearer TOKEN"}
+        if data is not None:
+            data = json.dumps(data)
+            headers.setdefault("Content-Type", "application/json")
+        conn.request(method, path, data, headers)
+        response = conn.getresponse()
+        result = response.status, json.loads(response.read())
+        conn.close()
+        return result
+
+    def test_jobs(self):
+        status, data = self._request(
+            "POST", "/jobs", {"url": "noop", "wait": True})
+        self.assertEqual(status, 200)
+        self.assertEqual(data["status"], "finished")
+        self.assertEqual(data["exit"], 0)
+
+        status, data2 = self._request("GET", f"/jobs/{data['id']}")
+        self.assertEqual(status, 200)
+        self.assertEqual(data2, data)
+
+        status, data = self._request("GET", "/jobs")
+        self.assertEqual(status, 200)
+        self.assertIsInstance(data, list)
+
+    def test_ratelimits(self):
+        ratelimit.get("test:server").acquire()
+        status, data = self._request("GET", "/ratelimits")
+        self.assertEqual(status, 200)
+        self.assertEqual(data["test:server"]["requests"], 1)
+
+    def test_errors(self):
+        self.assertEqual(self._request("GET", "/foo")[0], 404)
+        self.assertEqual(self._request("GET", "/jobs/foo")[0], 404)
+        self.assertEqual(self._request("GET", "/jobs/9999")[0], 404)
+        self.assertEqual(self._request("POST", "/foo", {})[0], 404)
+        self.assertEqual(self._request("POST", "/jobs", [])[0], 400)
+        self.assertEqual(self._request("POST", "/jobs", {})[0], 400)
+
+    def test_unauthorized(self):
+        jobs = len(self.srv.gdl.status())
+        for headers in ({}, {"Authorization": "Bearer foo"},
+                        {"Authorization": "Basic TOKEN"}):
+            self.assertEqual(self._request(
+                "GET", "/jobs", None, headers)[0], 401)
+            self.assertEqual(self._request(
+                "POST", "/jobs", {"url": "noop"}, headers)[0], 401)
+        self.assertEqual(len(self.srv.gdl.status()), jobs)
+
+    def test_content_type(self):
+        # cross-origin 'simple' requests
+        for ctype in ("text/plain", "application/x-www-form-urlencoded",
+                      "multipart/form-data"):
+            status, _ = self._request("POST", "/jobs", {"url": "noop"}, {
+                "Authorization": "Bearer TOKEN", "Content-Type": ctype})
+            self.assertEqual(status, 415)
+
+        status, _ = self._request("POST", "/jobs", {"url": "noop"}, {
+            "Authorization": "Bearer TOKEN",
+            "Content-Type": "application/json; charset=utf-8"})
+        self.assertEqual(status, 202)
+
+
+if __name__ == "__main__":
+    unittest.main()
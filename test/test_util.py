@@ -20,10 +20,11 @@ import datetime
 import platform
 import tempfile
 import itertools
+import threading
 import http.cookiejar
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from gallery_dl import util, text, dt, exception  # noqa E402
+from gallery_dl import util, text, dt, exception, formatter  # noqa E402
 
 
 class TestRange(unittest.TestCase):
@@ -688,6 +689,51 @@ def hash(value):
         self.assertEqual(expr(value), result)
 
 
+class TestFlags(unittest.TestCase):
+
+    def tearDown(self):
+        util.FLAGS.use(None)
+        util.FLAGS.FILE = None
+
+    def test_process(self):
+        flags = util.Flags()
+
+        flags.FILE = "terminate"
+        with self.assertRaises(exception.TerminateExtraction):
+            flags.process("FILE")
+        self.assertIsNone(flags.FILE)
+
+        flags.DOWNLOAD = False
+        with self.assertRaises(exception.StopDownload):
+            flags.process("DOWNLOAD")
+        self.assertIsNone(flags.DOWNLOAD)
+
+        flags.POST = False
+        self.assertEqual(flags.process("POST"), "skip")
+
+    def test_local(self):
+        flags = util.Flags()
+        util.FLAGS.use(flags)
+        util.FLAGS.FILE = "abort"
+        self.assertEqual(flags.FILE, "abort")
+
+        # other threads use the common flags
+        results = []
+        thread = threading.Thread(
+            target=lambda: results.append(util.FLAGS.FILE))
+        thread.start()
+        thread.join()
+        self.assertEqual(results, [None])
+
+        with self.assertRaises(exception.AbortExtraction):
+            util.FLAGS.process("FILE")
+        self.assertIsNone(flags.FILE)
+
+        util.FLAGS.use(None)
+        self.assertIsNone(util.FLAGS.get())
+        self.assertIsNone(util.FLAGS.FILE)
+
+
 class TestOther(unittest.TestCase):
 
     def test_bencode(self):
@@ -1291,6 +1337,64 @@ value = 123
         except ValueError as exc:
             self.assertIs(exc, exc_orig)
 
+    def test_overlay_dict(self):
+        base = {"id": 123, "title": "foo", "tags": ["a", "b"]}
+        data = util.OverlayDict(base, {"num": 1})
+        data["title"] = "bar"
+        data.update(extension="jpg")
+
+        expected = {"id": 123, "title": "bar", "tags": ["a", "b"],
+                    "num": 1, "extension": "jpg"}
+        self.assertEqual(data, expected)
+        self.assertEqual(dict(data), expected)
+        self.assertEqual({**data}, expected)
+        self.assertEqual(len(data), 5)
+        self.assertEqual(list(data), list(expected))
+        self.assertEqual(list(data.values()), list(expected.values()))
+        self.assertIsInstance(data, dict)
+
+        self.assertIn("id", data)
+        self.assertNotIn("foo", data)
+        self.assertEqual(data["id"], 123)
+        self.assertEqual(data.get("id"), 123)
+        self.assertEqual(data.get("foo", 0), 0)
+        self.assertEqual(data.setdefault("id", 1), 123)
+        with self.assertRaises(KeyError):
+            data["foo"]
+
+        # 'base' stays unchanged
+        self.assertEqual(
+            base, {"id": 123, "title": "foo", "tags": ["a", "b"]})
+        self.assertEqual(dict.__len__(data), 3)
+
+        # copies share 'base'
+        copy = data.copy()
+        copy["num"] = 2
+        self.assertIs(copy.base, base)
+        self.assertEqual(data["num"], 1)
+
+        # transparent use
+        self.assertEqual(
+            util.json_loads(util.json_dumps(data)), expected)
+        self.assertEqual(util.filter_dict(data), expected)
+        self.assertTrue(util.compile_filter("id == 123 and num == 1")(data))
+        self.assertEqual(formatter.parse(
+            "{id}_{title}_{num:>02}.{extension}").format_map(data),
+            "123_bar_01.jpg")
+
+        # removing entries creates an independent copy
+        self.assertEqual(data.pop("id"), 123)
+        self.assertEqual(data.pop("id", None), None)
+        del data["num"]
+        self.assertEqual(data, {"title": "bar", "tags": ["a", "b"],
+                                "extension": "jpg"})
+        self.assertEqual(data.base, {})
+        self.assertEqual(base["id"], 123)
+
+        # no own entries
+        data = util.OverlayDict(base)
+        self.assertEqual(util.json_dumps(data), util.json_dumps(base))
+
     def test_null_response(self):
         response = util.NullResponse("https://example.org")
 